@@ -108,13 +108,14 @@ const DreamHistoryScreen: React.FC = () => {
 
       if (searchQuery.trim().length > 0) {
         // Search functionality
-        const response = await dreamService.searchDreams(searchQuery, pageNum * LIMIT, LIMIT);
+        const response = await dreamService.searchDreams(searchQuery, pageNum * LIMIT, LIMIT, 'card');
         fetchedDreams = response.dreams || response; // Adjust based on API structure
       } else {
         // Regular fetch with filters
         const params: any = {
           skip: pageNum * LIMIT,
           limit: LIMIT,
+          fields: 'card', // 카드에 필요한 필드와 본문 미리보기만 조회
         };
         
         if (selectedFilter === 'lucid') params.dream_type = 'LUCID'; // Check backend enum
@@ -175,7 +176,7 @@ const DreamHistoryScreen: React.FC = () => {
           }}
           style={styles.cardWrapper}
         >
-          <GlassView style={[styles.cardContent, { minHeight: item.body_text && item.body_text.length > 50 ? 200 : 160 }]}>
+          <GlassView style={[styles.cardContent, { minHeight: (item.body_preview ?? item.body_text ?? '').length > 50 ? 200 : 160 }]}>
             <View style={styles.cardHeader}>
               <Text style={styles.dateText}>
                 {new Date(item.created_at).toLocaleDateString('ko-KR', { 
@@ -193,7 +194,7 @@ const DreamHistoryScreen: React.FC = () => {
             </Text>
 
             <Text style={styles.cardPreview} numberOfLines={4}>
-              {item.body_text}
+              {item.body_preview ?? item.body_text}
             </Text>
 
             {item.emotion_tags && item.emotion_tags.length > 0 && (
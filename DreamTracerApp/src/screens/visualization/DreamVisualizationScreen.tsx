@@ -13,6 +13,7 @@ import {
   RefreshControl,
   Image,
   Modal,
+  Dimensions,
 } from 'react-native';
 import { useRoute, useNavigation } from '@react-navigation/native';
 import { useDreamStore } from '../../stores/dreamStore';
@@ -31,10 +32,19 @@ interface DreamVisualization {
   id: string;
   dream_id: string;
   image_path: string;
+  image_url?: string | null;
+  derivatives?: {
+    width: number;
+    height: number;
+    variants: Record<string, Record<string, string>>;
+  } | null;
   art_style: string;
   created_at: string;
 }
 
+// 카드 너비(화면의 47%)에 맞는 썸네일 사용
+const CARD_IMAGE_WIDTH = Dimensions.get('window').width * 0.47;
+
 const DreamVisualizationScreen: React.FC = () => {
   const route = useRoute();
   const navigation = useNavigation();
@@ -291,10 +301,12 @@ const DreamVisualizationScreen: React.FC = () => {
               <View key={visualization.id} style={styles.visualizationCard}>
                 <TouchableOpacity
                   style={styles.imageContainer}
-                  onPress={() => setSelectedImage(visualization.image_path)}
+                  onPress={() => setSelectedImage(
+                    visualizationService.getThumbnailUrl(visualization, Dimensions.get('window').width)
+                  )}
                 >
                   <Image
-                    source={{ uri: visualizationService.getImageUrl(visualization.image_path) }}
+                    source={{ uri: visualizationService.getThumbnailUrl(visualization, CARD_IMAGE_WIDTH) }}
                     style={styles.visualizationImage}
                     resizeMode="cover"
                   />
@@ -5,12 +5,20 @@
 import Config from '../config/config';
 import authService from './authService';
 
+// GET 응답 ETag 캐시 최대 항목 수 (오래 쓰지 않은 항목부터 제거)
+const ETAG_CACHE_SIZE = 100;
+
 class ApiClient {
+    private etagCache = new Map<string, { etag: string; data: unknown }>();
+
     /**
      * Request wrapper with automatic token injection and error handling
+     * GET 응답에 ETag가 있으면 저장해 두고 다음 요청에 If-None-Match로 보내 304면 저장한 본문을 반환
      */
     async request<T>(endpoint: string, options: RequestInit = {}): Promise<T> {
         const url = endpoint.startsWith('http') ? endpoint : `${Config.API_BASE_URL}${endpoint}`;
+        const isGet = !options.method || options.method.toUpperCase() === 'GET';
+        const cached = isGet ? this.etagCache.get(url) : undefined;
 
         try {
             const token = await authService.getToken();
@@ -28,11 +36,20 @@ class ApiClient {
                 headers['Authorization'] = `Bearer ${token}`;
             }
 
+            if (cached && !headers['If-None-Match']) {
+                headers['If-None-Match'] = cached.etag;
+            }
+
             const response = await fetch(url, {
                 ...options,
                 headers,
             });
 
+            if (response.status === 304 && cached) {
+                this.remember(url, cached.etag, cached.data);
+                return cached.data as T;
+            }
+
             if (!response.ok) {
                 const errorData = await response.json().catch(() => ({}));
                 throw new Error(errorData.detail || `API request failed: ${response.status}`);
@@ -43,12 +60,28 @@ class ApiClient {
                 return {} as T;
             }
 
-            return await response.json();
+            const data = await response.json();
+            const etag = isGet ? response.headers?.get('ETag') : null;
+            if (etag) {
+                this.remember(url, etag, data);
+            }
+            return data;
         } catch (error) {
             console.error(`API Request Error (${endpoint}):`, error);
             throw error;
         }
     }
+
+    private remember(url: string, etag: string, data: unknown): void {
+        this.etagCache.delete(url);
+        this.etagCache.set(url, { etag, data });
+        if (this.etagCache.size > ETAG_CACHE_SIZE) {
+            const oldest = this.etagCache.keys().next().value;
+            if (oldest !== undefined) {
+                this.etagCache.delete(oldest);
+            }
+        }
+    }
 }
 
 export default new ApiClient();
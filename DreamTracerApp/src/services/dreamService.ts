@@ -29,6 +29,7 @@ class DreamService {
     end_date?: string;
     dream_type?: string;
     emotion_filter?: string[];
+    fields?: string; // 'card' 또는 쉼표 구분 필드 (생략 시 전체 필드)
   } = {}): Promise<DreamListResponse> {
     const queryParams = new URLSearchParams();
 
@@ -37,6 +38,7 @@ class DreamService {
     if (params.start_date) queryParams.append('start_date', params.start_date);
     if (params.end_date) queryParams.append('end_date', params.end_date);
     if (params.dream_type) queryParams.append('dream_type', params.dream_type);
+    if (params.fields) queryParams.append('fields', params.fields);
 
     if (params.emotion_filter && params.emotion_filter.length > 0) {
       params.emotion_filter.forEach(tag => queryParams.append('emotion_filter', tag));
@@ -114,12 +116,13 @@ class DreamService {
   /**
    * 꿈 내용 검색
    */
-  async searchDreams(query: string, skip: number = 0, limit: number = 20): Promise<DreamListResponse> {
+  async searchDreams(query: string, skip: number = 0, limit: number = 20, fields?: string): Promise<DreamListResponse> {
     const queryParams = new URLSearchParams({
       q: query,
       skip: skip.toString(),
       limit: limit.toString(),
     });
+    if (fields) queryParams.append('fields', fields);
 
     return apiClient.request<DreamListResponse>(`/dreams/search?${queryParams.toString()}`, {
       method: 'GET',
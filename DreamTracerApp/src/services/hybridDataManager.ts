@@ -25,7 +25,7 @@ class HybridDataManager {
       // 네트워크가 사용 가능하면 서버에 동기화
       if (await serverSyncService.isNetworkAvailable()) {
         try {
-          await serverSyncService.syncDreamToServer(localDream);
+          await serverSyncService.syncWithServer();
         } catch (error) {
           console.warn('서버 동기화 실패, 로컬에만 저장됨:', error);
         }
@@ -78,7 +78,7 @@ class HybridDataManager {
       // 네트워크가 사용 가능하면 서버에 동기화
       if (await serverSyncService.isNetworkAvailable()) {
         try {
-          await serverSyncService.syncDreamToServer(updatedDream);
+          await serverSyncService.syncWithServer();
         } catch (error) {
           console.warn('서버 동기화 실패:', error);
         }
@@ -94,15 +94,13 @@ class HybridDataManager {
   // 꿈 데이터 삭제
   async deleteDream(dreamId: string): Promise<void> {
     try {
-      // 로컬에서 삭제
+      // 로컬에서 삭제 (서버 삭제 대기열에 추가됨)
       await localStorageService.deleteLocalDream(dreamId);
 
       // 네트워크가 사용 가능하면 서버에서도 삭제
       if (await serverSyncService.isNetworkAvailable()) {
         try {
-          await apiClient.request(`/dreams/${dreamId}`, {
-            method: 'DELETE',
-          });
+          await serverSyncService.syncWithServer();
         } catch (error) {
           console.warn('서버 삭제 실패:', error);
         }
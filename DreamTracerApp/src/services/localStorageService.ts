@@ -3,12 +3,15 @@
  * 꿈 일기 원본 텍스트, 음성 파일을 로컬에만 저장
  */
 import AsyncStorage from '@react-native-async-storage/async-storage';
-import { LocalDreamData, SyncStatus } from '../types/storage';
+import { LocalDreamData, ServerDreamData, SyncOperation, SyncStatus, SyncTombstone } from '../types/storage';
 
 class LocalStorageService {
   private readonly DREAMS_KEY = 'dreams_local';
   private readonly SYNC_STATUS_KEY = 'sync_status';
   private readonly USER_PLAN_KEY = 'user_plan';
+  private readonly SYNC_CURSOR_KEY = 'sync_cursor';
+  private readonly PENDING_DELETES_KEY = 'sync_pending_deletes';
+  private readonly SERVER_RECORDS_KEY = 'sync_server_records';
 
   // 로컬에 꿈 데이터 저장
   async saveDreamLocally(dreamData: LocalDreamData): Promise<void> {
@@ -53,9 +56,15 @@ class LocalStorageService {
   async deleteLocalDream(dreamId: string): Promise<void> {
     try {
       const dreams = await this.getLocalDreams();
+      const deletedDream = dreams.find(dream => dream.id === dreamId);
       const updatedDreams = dreams.filter(dream => dream.id !== dreamId);
       await AsyncStorage.setItem(this.DREAMS_KEY, JSON.stringify(updatedDreams));
       
+      // 서버에 올라간 적이 있으면 다음 동기화에서 서버 삭제 (올라가기 전 삭제도 멱등이므로 함께 보냄)
+      if (deletedDream) {
+        await this.queueServerDelete({ type: 'delete_dream', client_id: dreamId, id: deletedDream.server_id });
+      }
+      
       // 동기화 상태도 삭제
       await this.removeSyncStatus(dreamId);
     } catch (error) {
@@ -113,6 +122,200 @@ class LocalStorageService {
     }
   }
 
+  // 서버 삭제 대기열에 추가
+  async queueServerDelete(operation: SyncOperation): Promise<void> {
+    try {
+      const pendingDeletes = await this.getPendingDeletes();
+      pendingDeletes[operation.client_id] = operation;
+      await AsyncStorage.setItem(this.PENDING_DELETES_KEY, JSON.stringify(pendingDeletes));
+    } catch (error) {
+      console.error('서버 삭제 대기열 추가 실패:', error);
+    }
+  }
+
+  // 서버 삭제 대기열 조회
+  async getPendingDeletes(): Promise<Record<string, SyncOperation>> {
+    try {
+      const pendingDeletesJson = await AsyncStorage.getItem(this.PENDING_DELETES_KEY);
+      return pendingDeletesJson ? JSON.parse(pendingDeletesJson) : {};
+    } catch (error) {
+      console.error('서버 삭제 대기열 조회 실패:', error);
+      return {};
+    }
+  }
+
+  // 서버에서 처리된 삭제를 대기열에서 제거
+  async clearPendingDeletes(clientIds: string[]): Promise<void> {
+    try {
+      const pendingDeletes = await this.getPendingDeletes();
+      clientIds.forEach(clientId => delete pendingDeletes[clientId]);
+      await AsyncStorage.setItem(this.PENDING_DELETES_KEY, JSON.stringify(pendingDeletes));
+    } catch (error) {
+      console.error('서버 삭제 대기열 정리 실패:', error);
+    }
+  }
+
+  // 동기화 커서 조회/저장 (서버가 준 값을 그대로 보관)
+  async getSyncCursor(): Promise<string | null> {
+    try {
+      return await AsyncStorage.getItem(this.SYNC_CURSOR_KEY);
+    } catch (error) {
+      console.error('동기화 커서 조회 실패:', error);
+      return null;
+    }
+  }
+
+  async setSyncCursor(cursor: string): Promise<void> {
+    try {
+      await AsyncStorage.setItem(this.SYNC_CURSOR_KEY, cursor);
+    } catch (error) {
+      console.error('동기화 커서 저장 실패:', error);
+    }
+  }
+
+  // 서버 변경분 반영 (꿈 목록을 한 번 읽고 한 번 저장)
+  // 서버 필드로 덮어쓰되 로컬 전용 필드(본문, 음성)는 유지, 로컬에서 수정 중인 꿈은 건너뜀 (다음 동기화에서 올라감)
+  async applyServerChanges(serverDreams: ServerDreamData[], tombstones: SyncTombstone[]): Promise<void> {
+    try {
+      const dreams = await this.getLocalDreams();
+      const syncStatuses = await this.getSyncStatuses();
+      const now = new Date().toISOString();
+
+      const deletedIds = new Set<string>();
+      tombstones
+        .filter(tombstone => tombstone.entity_type === 'dream')
+        .forEach(tombstone => {
+          deletedIds.add(tombstone.entity_id);
+          if (tombstone.client_id) {
+            deletedIds.add(tombstone.client_id);
+          }
+        });
+
+      const isPending = (dreamId: string) => {
+        const status = syncStatuses[dreamId]?.status;
+        return status === SyncStatus.PENDING || status === SyncStatus.FAILED;
+      };
+
+      const updatedDreams = dreams.filter(dream => {
+        const deleted = deletedIds.has(dream.id) || (!!dream.server_id && deletedIds.has(dream.server_id));
+        if (deleted) {
+          delete syncStatuses[dream.id];
+        }
+        return !deleted;
+      });
+
+      serverDreams.forEach(serverDream => {
+        const localId = serverDream.client_id || serverDream.id;
+        const index = updatedDreams.findIndex(dream => dream.id === localId || dream.server_id === serverDream.id);
+        const existing = index >= 0 ? updatedDreams[index] : undefined;
+        if (existing && isPending(existing.id)) {
+          return;
+        }
+
+        const merged: LocalDreamData = {
+          ...existing,
+          id: existing?.id || localId,
+          server_id: serverDream.id,
+          user_id: serverDream.user_id,
+          dream_date: serverDream.dream_date,
+          title: serverDream.title,
+          body_text: existing?.body_text || (serverDream as any).body_text || '',
+          audio_file_path: existing?.audio_file_path,
+          lucidity_level: serverDream.lucidity_level,
+          emotion_tags: serverDream.emotion_tags || [],
+          dream_type: serverDream.dream_type,
+          sleep_quality: serverDream.sleep_quality,
+          dream_duration: serverDream.dream_duration,
+          location: serverDream.location,
+          characters: serverDream.characters || [],
+          symbols: serverDream.symbols || [],
+          created_at: existing?.created_at || serverDream.created_at,
+          updated_at: serverDream.updated_at,
+          is_synced: true,
+          sync_error: undefined
+        };
+        if (index >= 0) {
+          updatedDreams[index] = merged;
+        } else {
+          updatedDreams.push(merged);
+        }
+        syncStatuses[merged.id] = { status: SyncStatus.SYNCED, updated_at: now };
+      });
+
+      await AsyncStorage.setItem(this.DREAMS_KEY, JSON.stringify(updatedDreams));
+      await AsyncStorage.setItem(this.SYNC_STATUS_KEY, JSON.stringify(syncStatuses));
+    } catch (error) {
+      console.error('서버 변경분 반영 실패:', error);
+      throw new Error('서버 변경분을 로컬에 반영하는데 실패했습니다');
+    }
+  }
+
+  // 업로드 결과의 서버 ID 기록
+  async setServerIds(serverIds: Record<string, string>): Promise<void> {
+    try {
+      const dreams = await this.getLocalDreams();
+      const updatedDreams = dreams.map(dream =>
+        serverIds[dream.id] ? { ...dream, server_id: serverIds[dream.id], is_synced: true } : dream
+      );
+      await AsyncStorage.setItem(this.DREAMS_KEY, JSON.stringify(updatedDreams));
+    } catch (error) {
+      console.error('서버 ID 기록 실패:', error);
+    }
+  }
+
+  // 전체 재동기화 후 서버에 없는 동기화 완료 꿈 제거 (삭제 기록 보존 기간이 지나 놓친 삭제)
+  async removeMissingSyncedDreams(serverIds: Set<string>): Promise<void> {
+    try {
+      const dreams = await this.getLocalDreams();
+      const syncStatuses = await this.getSyncStatuses();
+      const updatedDreams = dreams.filter(dream => {
+        const missing = !!dream.server_id && !serverIds.has(dream.server_id)
+          && syncStatuses[dream.id]?.status === SyncStatus.SYNCED;
+        if (missing) {
+          delete syncStatuses[dream.id];
+        }
+        return !missing;
+      });
+      await AsyncStorage.setItem(this.DREAMS_KEY, JSON.stringify(updatedDreams));
+      await AsyncStorage.setItem(this.SYNC_STATUS_KEY, JSON.stringify(syncStatuses));
+    } catch (error) {
+      console.error('서버에 없는 꿈 정리 실패:', error);
+    }
+  }
+
+  // 서버 분석/시각화 사본 저장 (종류별 ID 맵, 삭제된 꿈과 시각화는 제거)
+  async applyServerRecords(
+    analyses: Record<string, any>[],
+    visualizations: Record<string, any>[],
+    tombstones: SyncTombstone[]
+  ): Promise<void> {
+    try {
+      const recordsJson = await AsyncStorage.getItem(this.SERVER_RECORDS_KEY);
+      const records: { analyses: Record<string, any>; visualizations: Record<string, any> } =
+        recordsJson ? JSON.parse(recordsJson) : { analyses: {}, visualizations: {} };
+
+      analyses.forEach(analysis => { records.analyses[analysis.id] = analysis; });
+      visualizations.forEach(visualization => { records.visualizations[visualization.id] = visualization; });
+
+      tombstones.forEach(tombstone => {
+        if (tombstone.entity_type === 'visualization') {
+          delete records.visualizations[tombstone.entity_id];
+          return;
+        }
+        // 꿈이 삭제되면 분석/시각화도 함께 삭제됨
+        for (const kind of ['analyses', 'visualizations'] as const) {
+          Object.keys(records[kind])
+            .filter(id => records[kind][id].dream_id === tombstone.entity_id)
+            .forEach(id => delete records[kind][id]);
+        }
+      });
+
+      await AsyncStorage.setItem(this.SERVER_RECORDS_KEY, JSON.stringify(records));
+    } catch (error) {
+      console.error('서버 분석/시각화 저장 실패:', error);
+    }
+  }
+
   // 로컬 데이터 백업 (JSON 파일로 내보내기)
   async exportLocalData(): Promise<string> {
     try {
@@ -156,6 +359,9 @@ class LocalStorageService {
     try {
       await AsyncStorage.removeItem(this.DREAMS_KEY);
       await AsyncStorage.removeItem(this.SYNC_STATUS_KEY);
+      await AsyncStorage.removeItem(this.SYNC_CURSOR_KEY);
+      await AsyncStorage.removeItem(this.PENDING_DELETES_KEY);
+      await AsyncStorage.removeItem(this.SERVER_RECORDS_KEY);
     } catch (error) {
       console.error('로컬 데이터 초기화 실패:', error);
       throw new Error('로컬 데이터를 초기화하는데 실패했습니다');
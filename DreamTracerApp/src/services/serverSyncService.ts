@@ -3,12 +3,13 @@
  * 분석 결과, 통계, 커뮤니티 공유 데이터를 서버에 저장
  */
 import {
-  ServerDreamData,
   DreamAnalysisResult,
   CommunityPost,
   UserPlan,
   SubscriptionPlan,
   PLAN_LIMITS,
+  SyncOperation,
+  SyncResponse,
   SyncStatus
 } from '../types/storage';
 import { LocalDreamData } from '../types/storage';
@@ -17,17 +18,21 @@ import authService from './authService';
 
 import { API_CONFIG } from '../config/api';
 
+// 서버 SYNC_MAX_OPERATIONS와 같은 값 (나머지는 다음 동기화에서 전송)
+const MAX_SYNC_OPERATIONS = 500;
+
 class ServerSyncService {
   // private baseUrl = 'https://api.ggumgyeol.com'; // 실제 API URL로 변경
   private baseUrl = API_CONFIG.baseURL;
-
-  // 꿈 데이터를 서버에 동기화 (원본 텍스트 제외)
-  async syncDreamToServer(localDream: LocalDreamData): Promise<ServerDreamData> {
-    try {
-      // 로컬 데이터를 서버 형식으로 변환 (원본 텍스트 제외)
-      const serverDream: Partial<ServerDreamData> = {
-        id: localDream.id,
-        user_id: localDream.user_id,
+  private syncInProgress: Promise<void> | null = null; // 진행 중인 동기화 (동시 호출은 같은 요청을 기다림)
+
+  // 로컬 꿈을 서버 쓰기 작업으로 변환 (원본 텍스트, 음성 제외)
+  private toUpsertOperation(localDream: LocalDreamData): SyncOperation {
+    return {
+      type: 'upsert_dream',
+      client_id: localDream.id,
+      id: localDream.server_id,
+      dream: {
         dream_date: localDream.dream_date,
         title: localDream.title,
         // body_text는 서버에 저장하지 않음 (프라이버시 보호)
@@ -38,41 +43,96 @@ class ServerSyncService {
         dream_duration: localDream.dream_duration,
         location: localDream.location,
         characters: localDream.characters,
-        symbols: localDream.symbols,
-        analysis_status: 'pending',
-        is_shared: false,
-        created_at: localDream.created_at,
-        updated_at: localDream.updated_at
-      };
+        symbols: localDream.symbols
+      }
+    };
+  }
 
-      // 서버에 전송
-      const response = await fetch(`${this.baseUrl}/api/v1/dreams/sync`, {
+  // 델타 동기화: 대기 중인 오프라인 쓰기를 한 요청으로 올리고, 마지막 커서 이후 서버 변경분을 받아 반영
+  // 작업은 로컬 ID 기준으로 멱등 처리되므로 응답을 못 받았으면 다음 동기화에서 그대로 다시 보냄
+  async syncWithServer(): Promise<void> {
+    if (this.syncInProgress) {
+      return this.syncInProgress;
+    }
+    this.syncInProgress = this.runSync().finally(() => {
+      this.syncInProgress = null;
+    });
+    return this.syncInProgress;
+  }
+
+  private async runSync(): Promise<void> {
+    const pendingDreams = await localStorageService.getPendingSyncDreams();
+    const pendingDeletes = Object.values(await localStorageService.getPendingDeletes());
+    const operations = [
+      ...pendingDreams.map(dream => this.toUpsertOperation(dream)),
+      ...pendingDeletes
+    ].slice(0, MAX_SYNC_OPERATIONS);
+
+    let cursor = await localStorageService.getSyncCursor();
+    let fullResync = false;
+    const seenServerIds = new Set<string>();
+    let requestOperations = operations;
+
+    while (true) {
+      const response = await fetch(`${this.baseUrl}/api/v1/sync`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
           'Authorization': `Bearer ${await this.getAuthToken()}`
         },
-        body: JSON.stringify(serverDream)
+        body: JSON.stringify({ cursor, operations: requestOperations })
       });
 
       if (!response.ok) {
         throw new Error(`서버 동기화 실패: ${response.status}`);
       }
 
-      const syncedDream: ServerDreamData = await response.json();
+      const result: SyncResponse = await response.json();
+      await this.applySyncResults(result);
+      await localStorageService.applyServerChanges(result.dreams, result.tombstones);
+      await localStorageService.applyServerRecords(result.analyses, result.visualizations, result.tombstones);
 
-      // 로컬 동기화 상태 업데이트
-      await localStorageService.updateSyncStatus(localDream.id, SyncStatus.SYNCED);
+      fullResync = fullResync || result.full_resync;
+      result.dreams.forEach(dream => seenServerIds.add(dream.id));
 
-      return syncedDream;
-    } catch (error) {
-      // 동기화 실패 시 상태 업데이트
-      await localStorageService.updateSyncStatus(
-        localDream.id,
-        SyncStatus.FAILED,
-        error instanceof Error ? error.message : '알 수 없는 오류'
-      );
-      throw error;
+      // 변경분을 반영한 뒤에 커서 저장 (중간에 실패하면 같은 구간을 다시 받음)
+      cursor = result.cursor;
+      await localStorageService.setSyncCursor(cursor);
+
+      requestOperations = [];
+      if (!result.has_more) {
+        break;
+      }
+    }
+
+    if (fullResync) {
+      await localStorageService.removeMissingSyncedDreams(seenServerIds);
+    }
+  }
+
+  // 작업 결과 반영 (서버 ID 기록, 동기화 상태 갱신, 처리된 삭제 제거)
+  private async applySyncResults(result: SyncResponse): Promise<void> {
+    const serverIds: Record<string, string> = {};
+    const deletedClientIds: string[] = [];
+
+    for (const operationResult of result.results) {
+      if (operationResult.status === 'deleted') {
+        deletedClientIds.push(operationResult.client_id);
+      } else if (operationResult.status === 'failed') {
+        await localStorageService.updateSyncStatus(
+          operationResult.client_id,
+          SyncStatus.FAILED,
+          operationResult.error
+        );
+      } else if (operationResult.id) {
+        serverIds[operationResult.client_id] = operationResult.id;
+        await localStorageService.updateSyncStatus(operationResult.client_id, SyncStatus.SYNCED);
+      }
+    }
+
+    await localStorageService.setServerIds(serverIds);
+    if (deletedClientIds.length > 0) {
+      await localStorageService.clearPendingDeletes(deletedClientIds);
     }
   }
 
@@ -229,15 +289,7 @@ class ServerSyncService {
   // 대기 중인 동기화 실행
   async syncPendingDreams(): Promise<void> {
     try {
-      const pendingDreams = await localStorageService.getPendingSyncDreams();
-
-      for (const dream of pendingDreams) {
-        try {
-          await this.syncDreamToServer(dream);
-        } catch (error) {
-          console.error(`꿈 ${dream.id} 동기화 실패:`, error);
-        }
-      }
+      await this.syncWithServer();
     } catch (error) {
       console.error('대기 중인 동기화 실행 실패:', error);
     }
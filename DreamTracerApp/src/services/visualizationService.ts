@@ -1,6 +1,7 @@
 /**
  * 꿈 시각화 서비스
  */
+import { PixelRatio } from 'react-native';
 import apiClient from './apiClient';
 import Config from '../config/config';
 
@@ -9,38 +10,91 @@ interface VisualizationStyle {
   name: string;
 }
 
+/**
+ * 서버에서 생성한 썸네일/포맷 변환 파생본 (생성 전이면 null)
+ * variants: { "너비": { "avif" | "webp" | "jpeg": 서명 URL } }
+ */
+interface ImageDerivatives {
+  width: number;
+  height: number;
+  variants: Record<string, Record<string, string>>;
+}
+
 interface DreamVisualization {
   id: string;
   dream_id: string;
   image_path: string;
+  image_url?: string | null;
+  derivatives?: ImageDerivatives | null;
   art_style: string;
   created_at: string;
 }
 
+interface VisualizationJob {
+  job_id: string;
+  status: 'pending' | 'processing' | 'completed' | 'failed';
+  visualization?: DreamVisualization | null;
+  error?: string | null;
+}
+
 interface VisualizationGallery {
   visualizations: Array<{
     id: string;
     dream_id: string;
     dream_title: string;
     image_path: string;
+    image_url?: string | null;
+    derivatives?: ImageDerivatives | null;
     art_style: string;
     created_at: string;
   }>;
   total_count: number;
-  page: number;
+  next_cursor: string | null;
+  has_more: boolean;
+  page: number | null;
   page_size: number;
 }
 
 class VisualizationService {
   /**
-   * 꿈 시각화 생성
+   * 꿈 시각화 생성 (서버에서 작업으로 생성되므로 완료될 때까지 작업 상태 폴링)
    */
-  async createDreamVisualization(dreamId: string, artStyle: string): Promise<DreamVisualization> {
-    const result = await apiClient.request<{ visualization: DreamVisualization }>(
+  async createDreamVisualization(
+    dreamId: string,
+    artStyle: string,
+    interval: number = 2000,
+    timeout: number = 5 * 60 * 1000
+  ): Promise<DreamVisualization> {
+    const job = await apiClient.request<VisualizationJob>(
       `/dreams/${dreamId}/visualize?art_style=${artStyle}`,
       { method: 'POST' }
     );
-    return result.visualization;
+    if (job.visualization) {
+      return job.visualization;
+    }
+
+    const deadline = Date.now() + timeout;
+    while (Date.now() < deadline) {
+      await new Promise<void>(resolve => setTimeout(resolve, interval));
+      const status = await this.getVisualizationJob(job.job_id);
+      if (status.status === 'completed' && status.visualization) {
+        return status.visualization;
+      }
+      if (status.status === 'failed') {
+        throw new Error(status.error || '시각화 생성에 실패했습니다');
+      }
+    }
+    throw new Error('시각화 생성 시간이 초과되었습니다');
+  }
+
+  /**
+   * 시각화 생성 작업 상태 조회
+   */
+  async getVisualizationJob(jobId: string): Promise<VisualizationJob> {
+    return apiClient.request<VisualizationJob>(
+      `/visualizations/jobs/${jobId}`,
+      { method: 'GET' }
+    );
   }
 
   /**
@@ -76,26 +130,60 @@ class VisualizationService {
   }
 
   /**
-   * 시각화 갤러리 조회
+   * 시각화 갤러리 조회 (다음 페이지는 이전 응답의 next_cursor 전달)
    */
-  async getVisualizationGallery(skip: number = 0, limit: number = 20): Promise<VisualizationGallery> {
+  async getVisualizationGallery(cursor?: string | null, limit: number = 20): Promise<VisualizationGallery> {
+    const cursorParam = cursor ? `&cursor=${encodeURIComponent(cursor)}` : '';
     return apiClient.request<VisualizationGallery>(
-      `/visualizations/gallery?skip=${skip}&limit=${limit}`,
+      `/visualizations/gallery?limit=${limit}${cursorParam}`,
       { method: 'GET' }
     );
   }
 
   /**
-   * 이미지 URL 생성 (실제 구현에서는 클라우드 스토리지 URL 사용)
+   * 이미지 URL 생성
+   * 서버가 준 서명 URL(/files/...)은 API 주소를 붙여 사용 (인증 헤더 없이 받을 수 있고 immutable 캐시 적용)
    */
   getImageUrl(imagePath: string): string {
     // http로 시작하면 그대로 반환 (이미 전체 URL인 경우)
     if (imagePath.startsWith('http')) {
       return imagePath;
     }
+    if (imagePath.startsWith('/files/')) {
+      return `${Config.API_BASE_URL}${imagePath}`;
+    }
     return `${Config.API_BASE_URL}/static/${imagePath}`;
   }
 
+  /**
+   * 표시 크기에 맞는 파생본 URL (화면 밀도를 고려해 가장 작은 충분한 너비 선택)
+   * 파생본이 아직 없으면 원본 URL 반환
+   */
+  getThumbnailUrl(
+    visualization: { image_path: string; image_url?: string | null; derivatives?: ImageDerivatives | null },
+    displayWidth: number,
+    formats: string[] = ['webp', 'jpeg']
+  ): string {
+    const variants = visualization.derivatives?.variants;
+    if (!variants) {
+      return this.getImageUrl(visualization.image_url || visualization.image_path);
+    }
+
+    const targetWidth = PixelRatio.getPixelSizeForLayoutSize(displayWidth);
+    const widths = Object.keys(variants).map(Number).sort((a, b) => a - b);
+    const candidates = widths.filter(width => width >= targetWidth);
+    // 충분히 큰 파생본이 없으면 가장 큰 것부터 확인
+    const ordered = candidates.length > 0 ? candidates : [...widths].reverse();
+
+    for (const width of ordered) {
+      const format = formats.find(f => variants[String(width)][f]);
+      if (format) {
+        return this.getImageUrl(variants[String(width)][format]);
+      }
+    }
+    return this.getImageUrl(visualization.image_url || visualization.image_path);
+  }
+
   /**
    * 스타일별 한국어 이름 매핑
    */
@@ -8,7 +8,9 @@ export interface Dream {
   dream_date: string;
   title?: string;
   body_text?: string;
+  body_preview?: string; // 목록 카드 응답(fields=card)의 본문 앞부분
   audio_file_path?: string;
+  audio_duration?: number; // 녹음 길이 (초, 서버 추출 후 채워짐)
   lucidity_level?: number; // 1-5
   emotion_tags: string[];
   analysis_status: 'pending' | 'processing' | 'completed' | 'failed';
@@ -65,6 +65,7 @@ export interface LocalDreamData {
   // 로컬 전용 필드
   is_synced: boolean;             // 서버 동기화 여부
   sync_error?: string;            // 동기화 오류 메시지
+  server_id?: string;             // 서버 꿈 ID (동기화 후)
 }
 
 // 서버 저장 데이터 (분석 결과, 통계, 공유 데이터)
@@ -84,6 +85,7 @@ export interface ServerDreamData {
   location?: string;
   characters: string[];
   symbols: string[];
+  client_id?: string;             // 앱 로컬 ID (동기화로 만든 꿈)
   created_at: string;
   updated_at: string;
   // 서버 전용 필드
@@ -143,6 +145,39 @@ export enum StorageLocation {
   HYBRID = 'hybrid'               // 로컬 + 서버 동기화
 }
 
+// 델타 동기화 (POST /sync)
+export interface SyncOperation {
+  type: 'upsert_dream' | 'delete_dream';
+  client_id: string;              // 로컬 꿈 ID (멱등 키)
+  id?: string;                    // 서버 꿈 ID
+  dream?: Partial<ServerDreamData>;
+}
+
+export interface SyncOperationResult {
+  client_id: string;
+  status: 'created' | 'updated' | 'deleted' | 'failed';
+  id?: string;
+  error?: string;
+}
+
+export interface SyncTombstone {
+  entity_type: 'dream' | 'visualization';
+  entity_id: string;
+  client_id?: string;
+  deleted_at: string;
+}
+
+export interface SyncResponse {
+  cursor: string;
+  has_more: boolean;
+  full_resync: boolean;
+  results: SyncOperationResult[];
+  dreams: ServerDreamData[];
+  analyses: DreamAnalysisResult[];
+  visualizations: Record<string, any>[];
+  tombstones: SyncTombstone[];
+}
+
 // 데이터 동기화 상태
 export enum SyncStatus {
   PENDING = 'pending',            // 동기화 대기
@@ -12,8 +12,9 @@ from app.core.database import Base
 from app.models.user import User
 from app.models.dream import Dream
 from app.models.dream_analysis import DreamAnalysis
-from app.models.community import CommunityPost
+from app.models.community import CommunityPost, CommunityEngagementFlush
 from app.models.dream_visualization import DreamVisualization
+from app.models.sync import SyncTombstone
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -2,7 +2,7 @@
 API v1 라우터
 """
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, dreams, users, analysis, visualization, community, subscription
+from app.api.v1.endpoints import auth, dreams, users, analysis, visualization, community, subscription, files, sync
 
 api_router = APIRouter()
 
@@ -14,3 +14,5 @@ api_router.include_router(analysis.router, prefix="", tags=["분석"])
 api_router.include_router(visualization.router, prefix="", tags=["시각화"])
 api_router.include_router(community.router, prefix="", tags=["커뮤니티"])
 api_router.include_router(subscription.router, prefix="", tags=["구독"])
+api_router.include_router(files.router, prefix="/files", tags=["파일"])
+api_router.include_router(sync.router, prefix="/sync", tags=["동기화"])
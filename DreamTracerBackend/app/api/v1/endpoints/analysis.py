@@ -1,15 +1,22 @@
 """
 꿈 분석 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, Header
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from app.schemas.dream import DreamAnalysis
 from app.services.dream_service import DreamService
 from app.core.security import get_current_user
 from app.core.database import get_db
-from app.workers.ai_tasks import analyze_dream_task
-from celery.result import AsyncResult
+from app.core.redis_client import async_redis_client
+from app.core.metrics import record_cache, track_embedding
+from app.core.conditional import etag_headers, etag_matches, make_etag, not_modified
+from app.core.responses import ORJSONResponse, RawJSONResponse
+from app.services.analysis_job_service import analysis_job_service
+from app.services.similarity import similar_pairs
+from app.workers.ai_tasks import daily_insight_key
+from datetime import date
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,24 +25,39 @@ router = APIRouter()
 @router.get("/dreams/{dream_id}/analysis", response_model=DreamAnalysis)
 async def get_dream_analysis(
     dream_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """꿈 분석 결과 조회"""
-    dream_service = DreamService()
+    """
+    꿈 분석 결과 조회
+    ETag는 분석 ID/수정 시각 기준 (변경이 없으면 본문 조회 없이 304)
+    """
     try:
-        # 꿈이 사용자의 것인지 확인
-        dream = await dream_service.get_dream(dream_id, current_user.id, db)
-        
-        # 분석 결과 조회
+        from app.models.dream import Dream
         from app.models.dream_analysis import DreamAnalysis as DreamAnalysisModel
-        analysis = db.query(DreamAnalysisModel).filter(
-            DreamAnalysisModel.dream_id == dream_id
+
+        # 사용자의 꿈인지 확인하면서 분석 버전만 조회
+        version = db.query(DreamAnalysisModel.id, DreamAnalysisModel.updated_at).join(
+            Dream, Dream.id == DreamAnalysisModel.dream_id
+        ).filter(
+            Dream.id == dream_id,
+            Dream.user_id == current_user.id
         ).first()
         
-        if not analysis:
+        if not version:
             raise HTTPException(status_code=404, detail="분석 결과를 찾을 수 없습니다")
         
+        etag = make_etag("analysis", current_user.id, version.id, version.updated_at)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        
+        analysis = db.query(DreamAnalysisModel).filter(
+            DreamAnalysisModel.id == version.id
+        ).first()
+        
+        response.headers.update(etag_headers(etag))
         return DreamAnalysis.from_orm(analysis)
         
     except Exception as e:
@@ -49,24 +71,27 @@ async def request_dream_analysis(
     db: Session = Depends(get_db)
 ):
     """꿈 AI 분석 요청"""
-    dream_service = DreamService()
     try:
         # 꿈이 사용자의 것인지 확인
-        dream = await dream_service.get_dream(dream_id, current_user.id, db)
+        from app.models.dream import Dream
+        dream = db.query(Dream).filter(
+            Dream.id == dream_id,
+            Dream.user_id == current_user.id
+        ).first()
         
-        # 이미 분석 중이거나 완료된 경우 확인
-        if dream.analysis_status == 'processing':
-            raise HTTPException(status_code=400, detail="이미 분석 중입니다")
+        if not dream:
+            raise HTTPException(status_code=404, detail="꿈을 찾을 수 없습니다")
         
+        # 이미 완료된 경우 확인
         if dream.analysis_status == 'completed':
             raise HTTPException(status_code=400, detail="이미 분석이 완료되었습니다")
         
-        # Celery 태스크 시작
-        task = analyze_dream_task.delay(dream_id)
+        # Celery 태스크 시작 (진행 중인 분석이 있으면 같은 태스크 ID 반환)
+        task_id, created = analysis_job_service.enqueue(dream, db)
         
         return {
-            "message": "꿈 분석이 시작되었습니다",
-            "task_id": task.id,
+            "message": "꿈 분석이 시작되었습니다" if created else "이미 분석 중입니다",
+            "task_id": task_id,
             "status": "processing"
         }
         
@@ -74,44 +99,78 @@ async def request_dream_analysis(
         logger.error(f"꿈 분석 요청 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/dreams/{dream_id}/analysis/events")
+async def stream_dream_analysis_events(
+    dream_id: str,
+    request: Request,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """꿈 분석 진행 상황 스트리밍 (Server-Sent Events)"""
+    dream_service = DreamService()
+    try:
+        # 꿈이 사용자의 것인지 확인
+        dream = await dream_service.get_dream(dream_id, current_user.id, db)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail="꿈을 찾을 수 없습니다")
+    
+    # 스트리밍 동안 DB 연결을 점유하지 않도록 세션 반환
+    db.close()
+    
+    return StreamingResponse(
+        analysis_job_service.event_stream(
+            dream_id,
+            last_event_id=last_event_id,
+            current_status=dream.analysis_status,
+            is_disconnected=request.is_disconnected
+        ),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # nginx 버퍼링 비활성화
+        }
+    )
+
 @router.get("/analysis/task/{task_id}")
 async def get_analysis_task_status(task_id: str):
     """분석 태스크 상태 조회"""
     try:
-        task_result = AsyncResult(task_id)
+        status = await analysis_job_service.get_status(task_id)
         
-        if task_result.state == 'PENDING':
+        if status is None or status['stage'] == 'queued':
             return {
                 "task_id": task_id,
                 "status": "pending",
                 "message": "태스크가 대기 중입니다"
             }
-        elif task_result.state == 'PROGRESS':
-            return {
-                "task_id": task_id,
-                "status": "processing",
-                "message": "분석 중입니다",
-                "progress": task_result.info
-            }
-        elif task_result.state == 'SUCCESS':
+        elif status['stage'] == 'completed':
             return {
                 "task_id": task_id,
                 "status": "completed",
                 "message": "분석이 완료되었습니다",
-                "result": task_result.result
+                "result": {
+                    "dream_id": status.get('dream_id'),
+                    "analysis_id": status.get('analysis_id')
+                }
             }
-        elif task_result.state == 'FAILURE':
+        elif status['stage'] == 'failed':
             return {
                 "task_id": task_id,
                 "status": "failed",
                 "message": "분석에 실패했습니다",
-                "error": str(task_result.info)
+                "dream_id": status.get('dream_id')
             }
         else:
             return {
                 "task_id": task_id,
-                "status": task_result.state,
-                "message": "알 수 없는 상태입니다"
+                "status": "processing",
+                "message": "분석 중입니다",
+                "progress": {
+                    "stage": status['stage'],
+                    "current": status['percent'],
+                    "total": 100
+                }
             }
             
     except Exception as e:
@@ -127,13 +186,22 @@ async def get_daily_insights(
     try:
         from app.services.ai_service import ai_service
         
+        # 야간 배치에서 미리 생성된 인사이트가 있으면 캐시된 JSON을 파싱하지 않고 그대로 응답에 삽입
+        try:
+            cached = await async_redis_client.get(daily_insight_key(date.today().isoformat(), str(current_user.id)))
+            record_cache("daily_insight", cached is not None)
+            if cached:
+                return RawJSONResponse(b'{"insight":' + cached.encode('utf-8') + b',"date":"today"}')
+        except Exception as e:
+            logger.warning(f"인사이트 캐시 조회 실패: {str(e)}")
+        
         # 사용자의 일일 인사이트 생성
         insight = await ai_service.generate_daily_insight(str(current_user.id), db)
         
-        return {
+        return ORJSONResponse({
             "insight": insight,
             "date": "today"
-        }
+        })
         
     except Exception as e:
         logger.error(f"일일 인사이트 조회 실패: {str(e)}")
@@ -143,14 +211,20 @@ async def get_daily_insights(
 async def get_dream_patterns(
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db),
-    days: int = Query(30, ge=7, le=365, description="분석할 기간 (일)")
+    days: int = Query(30, ge=7, le=365, description="분석할 기간 (일)"),
+    if_none_match: Optional[str] = Header(None)
 ):
-    """꿈 패턴 분석"""
+    """꿈 패턴 분석 (ETag는 꿈 개수/마지막 수정 시각/기간/오늘 날짜 기준)"""
     try:
         from datetime import datetime, timedelta
         from collections import Counter
         from app.models.dream import Dream
         
+        version = await DreamService().get_stats_version(current_user.id, db)
+        etag = make_etag("patterns", current_user.id, date.today(), days, *version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        
         # 지정된 기간의 꿈들 조회
         start_date = datetime.now() - timedelta(days=days)
         dreams = db.query(Dream).filter(
@@ -160,10 +234,10 @@ async def get_dream_patterns(
         ).all()
         
         if not dreams:
-            return {
+            return ORJSONResponse({
                 "patterns": [],
                 "message": "분석할 꿈 데이터가 없습니다"
-            }
+            }, headers=etag_headers(etag))
         
         # 패턴 분석
         all_emotions = []
@@ -191,7 +265,7 @@ async def get_dream_patterns(
         type_patterns = Counter(dream_types).most_common()
         avg_lucidity = sum(lucidity_levels) / len(lucidity_levels) if lucidity_levels else 0
         
-        return {
+        return ORJSONResponse({
             "analysis_period": f"{days}일",
             "total_dreams": len(dreams),
             "patterns": {
@@ -201,7 +275,7 @@ async def get_dream_patterns(
                 "dream_types": [{"type": dream_type, "count": count} for dream_type, count in type_patterns],
                 "average_lucidity": round(avg_lucidity, 2)
             }
-        }
+        }, headers=etag_headers(etag))
         
     except Exception as e:
         logger.error(f"꿈 패턴 분석 실패: {str(e)}")
@@ -234,50 +308,39 @@ async def get_dream_network(
         for dream in user_dreams:
             dream_text = f"{dream.title or ''} {dream.body_text or ''}"
             if dream_text.strip():
-                embedding = ai_service.embedding_model.encode([dream_text])
+                with track_embedding("dream_network"):
+                    embedding = ai_service.embedding_model.encode([dream_text])
                 dream_embeddings[str(dream.id)] = embedding[0]
         
         # 유사한 꿈들 찾기
         network_connections = []
-        dream_ids = list(dream_embeddings.keys())
-        
-        for i, dream_id1 in enumerate(dream_ids):
-            for dream_id2 in dream_ids[i+1:]:
-                embedding1 = dream_embeddings[dream_id1]
-                embedding2 = dream_embeddings[dream_id2]
-                
-                # 코사인 유사도 계산
-                import numpy as np
-                similarity = np.dot(embedding1, embedding2) / (
-                    np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
-                )
-                
-                if similarity > 0.3:  # 임계값 이상인 경우
-                    # 꿈 정보 조회
-                    dream1 = next(d for d in user_dreams if str(d.id) == dream_id1)
-                    dream2 = next(d for d in user_dreams if str(d.id) == dream_id2)
-                    
-                    network_connections.append({
-                        "dream1": {
-                            "id": str(dream1.id),
-                            "title": dream1.title,
-                            "date": dream1.dream_date.isoformat()
-                        },
-                        "dream2": {
-                            "id": str(dream2.id),
-                            "title": dream2.title,
-                            "date": dream2.dream_date.isoformat()
-                        },
-                        "similarity": round(float(similarity), 3)
-                    })
+        
+        for dream_id1, dream_id2, similarity in similar_pairs(dream_embeddings, 0.3):  # 임계값 이상인 경우
+            # 꿈 정보 조회
+            dream1 = next(d for d in user_dreams if str(d.id) == dream_id1)
+            dream2 = next(d for d in user_dreams if str(d.id) == dream_id2)
+            
+            network_connections.append({
+                "dream1": {
+                    "id": str(dream1.id),
+                    "title": dream1.title,
+                    "date": dream1.dream_date.isoformat()
+                },
+                "dream2": {
+                    "id": str(dream2.id),
+                    "title": dream2.title,
+                    "date": dream2.dream_date.isoformat()
+                },
+                "similarity": round(float(similarity), 3)
+            })
         
         # 유사도 순으로 정렬
         network_connections.sort(key=lambda x: x["similarity"], reverse=True)
         
-        return {
+        return ORJSONResponse({
             "network": network_connections[:10],  # 상위 10개만 반환
             "total_connections": len(network_connections)
-        }
+        })
         
     except Exception as e:
         logger.error(f"꿈 네트워크 분석 실패: {str(e)}")
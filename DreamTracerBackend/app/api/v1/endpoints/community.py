@@ -3,10 +3,10 @@
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Literal, Optional
 from app.schemas.community import (
     CommunityPostCreate, CommunityPostResponse, CommunityPostUpdate,
-    CommunityPostListResponse, CommunitySearchResponse, PopularTagsResponse
+    CommunityPostListResponse, CommunitySearchResponse, PopularTagsResponse, CommunityReactionResponse
 )
 from app.services.community_service import community_service
 from app.core.security import get_current_user
@@ -39,7 +39,9 @@ async def get_community_posts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     tags: Optional[List[str]] = Query(None),
+    tags_match: Literal["all", "any"] = Query("all", description="all: 모든 태그 포함, any: 하나 이상 포함"),
     user_id: Optional[str] = Query(None),
+    sort: Literal["latest", "trending"] = Query("latest", description="latest: 최신순, trending: 인기순 (전체 피드만)"),
     db: Session = Depends(get_db)
 ):
     """커뮤니티 포스트 목록 조회"""
@@ -49,7 +51,9 @@ async def get_community_posts(
             limit=limit,
             db=db,
             tags_filter=tags,
-            user_id=user_id
+            tags_match=tags_match,
+            user_id=user_id,
+            sort=sort
         )
         return CommunityPostListResponse(**result)
     except Exception as e:
@@ -109,6 +113,20 @@ async def delete_community_post(
         logger.error(f"커뮤니티 포스트 삭제 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/community/posts/{post_id}/reactions", response_model=CommunityReactionResponse)
+async def react_to_community_post(
+    post_id: str,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """커뮤니티 포스트 반응"""
+    try:
+        counted = await community_service.add_reaction(post_id, str(current_user.id), db)
+        return CommunityReactionResponse(counted=counted)
+    except Exception as e:
+        logger.error(f"커뮤니티 포스트 반응 실패: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/community/tags/popular", response_model=PopularTagsResponse)
 async def get_popular_tags(
     limit: int = Query(20, ge=1, le=100),
@@ -122,6 +140,19 @@ async def get_popular_tags(
         logger.error(f"인기 태그 조회 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/community/tags/trending", response_model=PopularTagsResponse)
+async def get_trending_tags(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """급상승 태그 조회"""
+    try:
+        tags = await community_service.get_trending_tags(db, limit)
+        return PopularTagsResponse(tags=tags)
+    except Exception as e:
+        logger.error(f"급상승 태그 조회 실패: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.get("/community/search", response_model=CommunitySearchResponse)
 async def search_community_posts(
     q: str = Query(..., min_length=1, description="검색어"),
@@ -142,7 +173,7 @@ async def search_community_posts(
         logger.error(f"커뮤니티 포스트 검색 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/community/posts/user/{user_id}")
+@router.get("/community/posts/user/{user_id}", response_model=CommunityPostListResponse)
 async def get_user_posts(
     user_id: str,
     skip: int = Query(0, ge=0),
@@ -1,20 +1,32 @@
 """
 꿈 관련 API 엔드포인트
 """
-from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, UploadFile, File
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import date
 from app.schemas.dream import (
     DreamCreate, DreamResponse, DreamUpdate, DreamAnalysis,
-    DreamListResponse, DreamStats, AudioUploadResponse
+    DreamListResponse, DreamFieldsListResponse, DreamStats, AudioUploadResponse,
+    DreamImportResponse
 )
-from app.services.dream_service import DreamService
+from app.services.dream_service import DreamService, parse_fields
+from app.core.conditional import etag_headers, etag_matches, make_etag, not_modified
+from app.core.responses import RawJSONResponse
 from app.core.security import get_current_user
 from app.core.database import get_db
 
 router = APIRouter()
 
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (쉼표 구분, card는 목록 카드용 필드 묶음, 생략 시 전체)"
+
+def _list_response(result):
+    """fields= 로 고른 목록은 채운 필드만 바로 직렬화 (response_model 재검증 생략)"""
+    if isinstance(result, DreamFieldsListResponse):
+        return RawJSONResponse(result.model_dump_json(exclude_unset=True).encode("utf-8"))
+    return result
+
 @router.post("/", response_model=DreamResponse)
 async def create_dream(
     dream_data: DreamCreate,
@@ -37,6 +49,7 @@ async def get_dreams(
     end_date: Optional[date] = Query(None),
     dream_type: Optional[str] = Query(None),
     emotion_filter: Optional[List[str]] = Query(None),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -51,22 +64,62 @@ async def get_dreams(
             start_date=start_date,
             end_date=end_date,
             dream_type=dream_type,
-            emotion_filter=emotion_filter
+            emotion_filter=emotion_filter,
+            fields=parse_fields(fields)
         )
-        return dreams
+        return _list_response(dreams)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/import", response_model=DreamImportResponse)
+async def import_dreams(
+    request: Request,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    꿈 기록 일괄 가져오기 (application/x-ndjson, 한 줄에 꿈 하나 - POST /dreams 와 같은 필드)
+    본문을 스트리밍으로 읽어 배치 단위로 저장하고, 잘못된 줄은 건너뛰어 결과에 줄 번호와 함께 표시
+    """
+    dream_service = DreamService()
+    try:
+        return await dream_service.import_dreams(current_user.id, request.stream(), db)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/export")
+async def export_dreams(
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """꿈 기록 전체 내보내기 (NDJSON 스트리밍, /dreams/import 로 다시 가져올 수 있는 형식)"""
+    dream_service = DreamService()
+    return StreamingResponse(
+        dream_service.export_dreams(current_user.id, db),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="dreams.ndjson"'}
+    )
+
 @router.get("/{dream_id}", response_model=DreamResponse)
 async def get_dream(
     dream_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """특정 꿈 상세 조회"""
+    """특정 꿈 상세 조회 (ETag는 updated_at 기준, 변경이 없으면 본문 조회 없이 304)"""
     dream_service = DreamService()
     try:
+        if if_none_match:
+            updated_at = await dream_service.get_dream_version(dream_id, current_user.id, db)
+            if updated_at is not None:
+                etag = make_etag("dream", current_user.id, dream_id, updated_at)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
         dream = await dream_service.get_dream(dream_id, current_user.id, db)
+        response.headers.update(etag_headers(make_etag("dream", current_user.id, dream_id, dream.updated_at)))
         return dream
     except Exception as e:
         raise HTTPException(status_code=404, detail="꿈을 찾을 수 없습니다")
@@ -116,13 +169,22 @@ async def analyze_dream(
 
 @router.get("/stats/overview", response_model=DreamStats)
 async def get_dream_stats(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """사용자의 꿈 통계 조회"""
+    """사용자의 꿈 통계 조회 (ETag는 꿈 개수/마지막 수정 시각/오늘 날짜 기준)"""
     dream_service = DreamService()
     try:
+        # 이번 주/이번 달 집계가 날짜에 따라 바뀌므로 오늘 날짜 포함
+        version = await dream_service.get_stats_version(current_user.id, db)
+        etag = make_etag("stats", current_user.id, date.today(), *version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         stats = await dream_service.get_dream_stats(current_user.id, db)
+        response.headers.update(etag_headers(etag))
         return stats
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -150,6 +212,7 @@ async def search_dreams(
     q: str = Query(..., min_length=1, description="검색어"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -157,8 +220,8 @@ async def search_dreams(
     dream_service = DreamService()
     try:
         results = await dream_service.search_dreams(
-            current_user.id, q, db, skip=skip, limit=limit
+            current_user.id, q, db, skip=skip, limit=limit, fields=parse_fields(fields)
         )
-        return results
+        return _list_response(results)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,84 @@
+"""
+시각화 이미지/오디오 파일 제공 API 엔드포인트
+"""
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.services.file_service import file_service
+from app.core.conditional import etag_matches
+from app.core.config import settings
+from app.core.security import get_current_user, get_optional_current_user
+from app.core.database import get_db
+import logging
+import os
+import stat
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+@router.get("/sign")
+async def sign_file_url(
+    path: str = Query(..., description="파일 경로 (visualizations/..., audio/...)"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """인증 헤더 없이 파일을 받을 수 있는 짧은 수명의 서명 URL 발급 (오디오 플레이어, 공유 등)"""
+    try:
+        file_service.resolve(path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not file_service.can_access(path, current_user.id, db):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    url, expires = file_service.sign(path)
+    return {"url": url, "expires": expires}
+
+@router.api_route("/{file_path:path}", methods=["GET", "HEAD"])
+async def get_file(
+    file_path: str,
+    expires: Optional[int] = Query(None),
+    signature: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    current_user = Depends(get_optional_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    파일 제공 (서명 URL 또는 인증 헤더로 접근)
+    내용 해시 ETag + immutable 캐시, If-None-Match 304, Range 요청(오디오 탐색) 지원
+    본문은 FileResponse가 청크 스트리밍하거나, 서버가 지원하면 zero-copy(pathsend)로 전송
+    """
+    try:
+        real_path = file_service.resolve(file_path)
+    except ValueError:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    if signature is not None:
+        if expires is None or not file_service.verify_signature(file_path, expires, signature):
+            raise HTTPException(status_code=403, detail="만료되었거나 잘못된 서명입니다")
+    elif current_user is None:
+        raise HTTPException(
+            status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"}
+        )
+    elif not file_service.can_access(file_path, current_user.id, db):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    try:
+        stat_result = await run_in_threadpool(os.stat, real_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
+
+    etag = await run_in_threadpool(file_service.etag, real_path, stat_result)
+    headers = {
+        "ETag": etag,
+        # 파일 이름/ETag가 내용 해시이므로 내용이 바뀌지 않음 (사용자 파일이므로 공유 캐시는 제외)
+        "Cache-Control": f"private, max-age={settings.FILE_CACHE_MAX_AGE}, immutable",
+    }
+
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(real_path, headers=headers, stat_result=stat_result)
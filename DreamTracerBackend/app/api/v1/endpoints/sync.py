@@ -0,0 +1,27 @@
+"""
+앱 델타 동기화 API 엔드포인트
+"""
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from app.schemas.sync import SyncRequest, SyncResponse
+from app.services.sync_service import sync_service
+from app.core.security import get_current_user
+from app.core.database import get_db
+
+router = APIRouter()
+
+@router.post("", response_model=SyncResponse)
+async def sync(
+    sync_request: SyncRequest,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    오프라인 쓰기 일괄 적용 + 커서 이후 변경분(꿈, 분석, 시각화, 삭제 기록) 조회
+    operations는 client_id 기준으로 멱등 처리되므로 응답을 받지 못했으면 그대로 다시 보내면 됨
+    has_more가 true이면 받은 커서로 다시 요청
+    """
+    try:
+        return await sync_service.sync(current_user.id, sync_request.cursor, sync_request.operations, db)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -7,14 +7,35 @@ from typing import List, Optional
 from app.schemas.dream import DreamResponse
 from app.services.dream_service import DreamService
 from app.services.visualization_service import visualization_service
+from app.services.visualization_job_service import visualization_job_service
+from app.services.file_service import file_service
 from app.core.security import get_current_user
 from app.core.database import get_db
+from app.core.responses import ORJSONResponse
 from app.models.dream_visualization import DreamVisualization
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+def _visualization_payload(visualization: DreamVisualization) -> dict:
+    return {
+        "id": str(visualization.id),
+        "dream_id": str(visualization.dream_id),
+        "image_path": visualization.image_path,
+        "image_url": file_service.signed_url(visualization.image_path),
+        "derivatives": file_service.signed_derivatives(visualization.derivatives),
+        "art_style": visualization.art_style,
+        "created_at": visualization.created_at.isoformat()
+    }
+
+def _completed_visualization(status: dict, db: Session) -> Optional[DreamVisualization]:
+    if status.get('stage') != 'completed':
+        return None
+    return db.query(DreamVisualization).filter(
+        DreamVisualization.id == status.get('visualization_id')
+    ).first()
+
 @router.post("/dreams/{dream_id}/visualize")
 async def create_dream_visualization(
     dream_id: str,
@@ -22,7 +43,10 @@ async def create_dream_visualization(
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """꿈 시각화 생성"""
+    """
+    꿈 시각화 생성 요청 (Celery 작업으로 생성, 작업 ID 즉시 반환)
+    같은 꿈/스타일/내용의 요청은 진행 중인 작업이나 완료된 결과를 재사용
+    """
     try:
         # 꿈이 사용자의 것인지 확인
         dream_service = DreamService()
@@ -36,26 +60,66 @@ async def create_dream_visualization(
                 detail=f"지원하지 않는 스타일입니다. 사용 가능한 스타일: {list(available_styles.keys())}"
             )
         
-        # 시각화 생성
-        visualization = await visualization_service.generate_dream_visualization(
-            dream, art_style, db
-        )
+        # 시각화 작업 추가 (동일 입력이면 기존 작업 ID 반환)
+        job_id, created = visualization_job_service.enqueue(dream, art_style, db)
+        
+        visualization = None
+        if not created:
+            status = await visualization_job_service.get_status(job_id)
+            visualization = _completed_visualization(status or {}, db)
+        
+        if visualization:
+            message = "이미 생성된 시각화입니다"
+        elif created:
+            message = "꿈 시각화 생성이 시작되었습니다"
+        else:
+            message = "이미 시각화를 생성 중입니다"
         
         return {
-            "message": "꿈 시각화가 생성되었습니다",
-            "visualization": {
-                "id": str(visualization.id),
-                "dream_id": str(visualization.dream_id),
-                "image_path": visualization.image_path,
-                "art_style": visualization.art_style,
-                "created_at": visualization.created_at.isoformat()
-            }
+            "message": message,
+            "job_id": job_id,
+            "status": "completed" if visualization else "processing",
+            "visualization": _visualization_payload(visualization) if visualization else None
         }
         
     except Exception as e:
-        logger.error(f"꿈 시각화 생성 실패: {str(e)}")
+        logger.error(f"꿈 시각화 생성 요청 실패: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/visualizations/jobs/{job_id}")
+async def get_visualization_job_status(
+    job_id: str,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """시각화 생성 작업 상태 조회"""
+    status = await visualization_job_service.get_status(job_id)
+    if status is None or status.get('user_id') != str(current_user.id):
+        raise HTTPException(status_code=404, detail="시각화 작업을 찾을 수 없습니다")
+    
+    if status['stage'] == 'completed':
+        visualization = _completed_visualization(status, db)
+        if not visualization:
+            raise HTTPException(status_code=404, detail="시각화가 삭제되었습니다")
+        return {
+            "job_id": job_id,
+            "status": "completed",
+            "visualization": _visualization_payload(visualization)
+        }
+    if status['stage'] == 'failed':
+        return {
+            "job_id": job_id,
+            "status": "failed",
+            "message": "시각화 생성에 실패했습니다",
+            "error": status.get('error')
+        }
+    return {
+        "job_id": job_id,
+        "status": "pending" if status['stage'] == 'queued' else "processing",
+        "dream_id": status.get('dream_id'),
+        "art_style": status.get('art_style')
+    }
+
 @router.get("/dreams/{dream_id}/visualizations")
 async def get_dream_visualizations(
     dream_id: str,
@@ -71,18 +135,20 @@ async def get_dream_visualizations(
         # 시각화 목록 조회
         visualizations = await visualization_service.get_dream_visualizations(dream_id, db)
         
-        return {
+        return ORJSONResponse({
             "dream_id": dream_id,
             "visualizations": [
                 {
                     "id": str(v.id),
                     "image_path": v.image_path,
+                    "image_url": file_service.signed_url(v.image_path),
+                    "derivatives": file_service.signed_derivatives(v.derivatives),
                     "art_style": v.art_style,
                     "created_at": v.created_at.isoformat()
                 }
                 for v in visualizations
             ]
-        }
+        })
         
     except Exception as e:
         logger.error(f"꿈 시각화 조회 실패: {str(e)}")
@@ -136,36 +202,37 @@ async def delete_visualization(
 async def get_visualization_gallery(
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db),
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    skip: int = Query(0, ge=0, description="cursor가 없을 때의 오프셋 (이전 클라이언트 호환)"),
     limit: int = Query(20, ge=1, le=100)
 ):
     """사용자의 시각화 갤러리 조회"""
     try:
-        # 사용자의 모든 시각화 조회
-        visualizations = db.query(DreamVisualization).join(
-            DreamVisualization.dream
-        ).filter(
-            DreamVisualization.dream.has(user_id=current_user.id)
-        ).order_by(
-            DreamVisualization.created_at.desc()
-        ).offset(skip).limit(limit).all()
+        page = await visualization_service.get_gallery_page(
+            current_user.id, db, limit=limit, cursor=cursor, skip=skip
+        )
+        total_count = await visualization_service.get_gallery_count(current_user.id, db)
         
-        return {
+        return ORJSONResponse({
             "visualizations": [
                 {
                     "id": str(v.id),
                     "dream_id": str(v.dream_id),
-                    "dream_title": v.dream.title if v.dream else "제목 없음",
+                    "dream_title": v.dream_title or "제목 없음",
                     "image_path": v.image_path,
+                    "image_url": file_service.signed_url(v.image_path),
+                    "derivatives": file_service.signed_derivatives(v.derivatives),
                     "art_style": v.art_style,
                     "created_at": v.created_at.isoformat()
                 }
-                for v in visualizations
+                for v in page["visualizations"]
             ],
-            "total_count": len(visualizations),
-            "page": (skip // limit) + 1,
+            "total_count": total_count,
+            "next_cursor": page["next_cursor"],
+            "has_more": page["has_more"],
+            "page": (skip // limit) + 1 if not cursor else None,
             "page_size": limit
-        }
+        })
         
     except Exception as e:
         logger.error(f"시각화 갤러리 조회 실패: {str(e)}")
@@ -0,0 +1,192 @@
+"""
+압축 정수 집합 비트맵 (Roaring 방식)
+상위 16비트로 나눈 청크마다 원소가 적으면 정렬 리스트, 많으면 65536비트 정수 비트셋 컨테이너를 사용
+"""
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Union
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+ARRAY_MAX = 4096  # 이보다 원소가 많은 청크는 비트셋 (8KB 고정 크기가 리스트보다 작아지는 지점)
+
+Container = Union[List[int], int]
+
+def _cardinality(container: Container) -> int:
+    return len(container) if isinstance(container, list) else container.bit_count()
+
+def _to_bits(container: Container) -> int:
+    if isinstance(container, int):
+        return container
+    buffer = bytearray(1 << (CHUNK_BITS - 3))
+    for value in container:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, "little")
+
+def _positions(bits: int) -> List[int]:
+    """비트셋의 켜진 비트 위치 (오름차순)"""
+    digits = bin(bits)[:1:-1]  # 낮은 비트부터
+    positions = []
+    index = digits.find("1")
+    while index != -1:
+        positions.append(index)
+        index = digits.find("1", index + 1)
+    return positions
+
+def _normalize(container: Container):
+    """원소 수에 맞는 컨테이너로 변환 (비었으면 None)"""
+    if isinstance(container, int):
+        if not container:
+            return None
+        return _positions(container) if container.bit_count() <= ARRAY_MAX else container
+    if not container:
+        return None
+    return _to_bits(container) if len(container) > ARRAY_MAX else container
+
+def _and(left: Container, right: Container):
+    if isinstance(left, list) and isinstance(right, list):
+        return _normalize(sorted(set(left).intersection(right)))
+    if isinstance(left, list):
+        return _normalize([value for value in left if right >> value & 1])
+    if isinstance(right, list):
+        return _normalize([value for value in right if left >> value & 1])
+    return _normalize(left & right)
+
+def _and_cardinality(left: Container, right: Container) -> int:
+    if isinstance(left, list) and isinstance(right, list):
+        return len(set(left).intersection(right))
+    if isinstance(left, list):
+        return sum(right >> value & 1 for value in left)
+    if isinstance(right, list):
+        return sum(left >> value & 1 for value in right)
+    return (left & right).bit_count()
+
+def _or(left: Container, right: Container):
+    if isinstance(left, list) and isinstance(right, list) and len(left) + len(right) <= ARRAY_MAX:
+        return sorted(set(left).union(right))
+    return _normalize(_to_bits(left) | _to_bits(right))
+
+class RoaringBitmap:
+    """음이 아닌 정수 집합 (교집합/합집합/개수 연산은 청크 단위로 처리)"""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, values: Iterable[int] = ()):
+        self._chunks: Dict[int, Container] = {}
+        for value in values:
+            self.add(value)
+
+    @classmethod
+    def _from_chunks(cls, chunks: Dict[int, Container]) -> "RoaringBitmap":
+        bitmap = cls()
+        bitmap._chunks = chunks
+        return bitmap
+
+    def add(self, value: int) -> None:
+        key, low = value >> CHUNK_BITS, value & CHUNK_MASK
+        container = self._chunks.get(key)
+        if container is None:
+            self._chunks[key] = [low]
+        elif isinstance(container, int):
+            self._chunks[key] = container | (1 << low)
+        else:
+            index = bisect_left(container, low)
+            if index == len(container) or container[index] != low:
+                container.insert(index, low)
+                if len(container) > ARRAY_MAX:
+                    self._chunks[key] = _to_bits(container)
+
+    def discard(self, value: int) -> None:
+        key, low = value >> CHUNK_BITS, value & CHUNK_MASK
+        container = self._chunks.get(key)
+        if container is None:
+            return
+        if isinstance(container, int):
+            container = _normalize(container & ~(1 << low))
+        else:
+            index = bisect_left(container, low)
+            if index < len(container) and container[index] == low:
+                container.pop(index)
+            container = _normalize(container)
+        if container is None:
+            del self._chunks[key]
+        else:
+            self._chunks[key] = container
+
+    def __contains__(self, value: int) -> bool:
+        container = self._chunks.get(value >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = value & CHUNK_MASK
+        if isinstance(container, int):
+            return bool(container >> low & 1)
+        index = bisect_left(container, low)
+        return index < len(container) and container[index] == low
+
+    def __len__(self) -> int:
+        return sum(_cardinality(container) for container in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        chunks = {}
+        for key in self._chunks.keys() & other._chunks.keys():
+            container = _and(self._chunks[key], other._chunks[key])
+            if container is not None:
+                chunks[key] = container
+        return self._from_chunks(chunks)
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        chunks = {key: list(container) if isinstance(container, list) else container
+                  for key, container in self._chunks.items()}
+        for key, container in other._chunks.items():
+            chunks[key] = _or(chunks[key], container) if key in chunks else (
+                list(container) if isinstance(container, list) else container
+            )
+        return self._from_chunks(chunks)
+
+    def and_cardinality(self, other: "RoaringBitmap") -> int:
+        """교집합 크기 (교집합 비트맵을 만들지 않음)"""
+        return sum(
+            _and_cardinality(self._chunks[key], other._chunks[key])
+            for key in self._chunks.keys() & other._chunks.keys()
+        )
+
+    @classmethod
+    def intersection(cls, *bitmaps: "RoaringBitmap") -> "RoaringBitmap":
+        """작은 비트맵부터 교집합 (중간 결과가 빨리 작아지도록)"""
+        if not bitmaps:
+            return cls()
+        ordered = sorted(bitmaps, key=len)
+        result = ordered[0]
+        for bitmap in ordered[1:]:
+            if not result:
+                break
+            result = result & bitmap
+        return result if len(ordered) > 1 else result | cls()
+
+    @classmethod
+    def union(cls, *bitmaps: "RoaringBitmap") -> "RoaringBitmap":
+        result = cls()
+        for bitmap in bitmaps:
+            result = result | bitmap
+        return result
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._chunks):
+            container = self._chunks[key]
+            for low in (container if isinstance(container, list) else _positions(container)):
+                yield key << CHUNK_BITS | low
+
+    def descending(self) -> Iterator[int]:
+        """큰 값부터 순회"""
+        for key in sorted(self._chunks, reverse=True):
+            container = self._chunks[key]
+            for low in reversed(container if isinstance(container, list) else _positions(container)):
+                yield key << CHUNK_BITS | low
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, RoaringBitmap) and list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return f"<RoaringBitmap(size={len(self)}, chunks={len(self._chunks)})>"
@@ -0,0 +1,31 @@
+"""
+조건부 요청 (ETag / If-None-Match)
+"""
+from typing import Any, Dict, Optional
+from fastapi import Response
+import hashlib
+
+# 매번 재검증 (변경이 없으면 304로 본문 없이 응답)
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+
+def make_etag(*parts: Any) -> str:
+    """
+    리소스 버전 값들(ID, updated_at, 개수 등)로 만든 약한 ETag
+    본문 바이트가 아닌 버전 기준이므로 직렬화/압축 결과와 무관하게 W/ 사용
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두사 무시, * 허용)"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in candidates or opaque in [tag[2:] if tag.startswith('W/') else tag for tag in candidates]
+
+def etag_headers(etag: str, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+def not_modified(etag: str, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Response:
+    return Response(status_code=304, headers=etag_headers(etag, cache_control))
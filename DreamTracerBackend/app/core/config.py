@@ -55,11 +55,120 @@ class Settings(BaseSettings):
     
     # Gemini API 설정
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    GEMINI_API_ENDPOINT: str = os.getenv("GEMINI_API_ENDPOINT", "")  # 비어 있으면 기본 엔드포인트 (부하 테스트 시 가짜 서버 주소)
+    GEMINI_REQUEST_TIMEOUT: int = int(os.getenv("GEMINI_REQUEST_TIMEOUT", 60))  # Gemini 요청 하나의 제한 시간 (초, 재시도 없음)
+    
+    # 임베딩 설정 (sentence-transformers | hashing - hashing은 모델 없이 동작하는 테스트용 인코더)
+    EMBEDDING_BACKEND: str = os.getenv("EMBEDDING_BACKEND", "sentence-transformers")
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "jhgan/ko-sbert-nli")
+    
+    # 오디오 업로드 설정
+    AUDIO_UPLOAD_DIR: str = os.getenv("AUDIO_UPLOAD_DIR", "uploads/audio")
+    AUDIO_MAX_UPLOAD_BYTES: int = int(os.getenv("AUDIO_MAX_UPLOAD_BYTES", 50 * 1024 * 1024))  # 50MB
+    AUDIO_UPLOAD_CHUNK_SIZE: int = int(os.getenv("AUDIO_UPLOAD_CHUNK_SIZE", 1024 * 1024))  # 1MB
+    
+    # 파일 제공 설정 (서명 URL 유효 시간 - 같은 시간 구간 안에서는 같은 URL을 발급해 클라이언트 캐시 유지)
+    FILE_URL_TTL: int = int(os.getenv("FILE_URL_TTL", 60 * 60))  # 1시간
+    FILE_CACHE_MAX_AGE: int = int(os.getenv("FILE_CACHE_MAX_AGE", 365 * 24 * 60 * 60))  # 내용 해시 기반이므로 1년
+    
+    # 응답 압축 (이 크기 미만 응답은 압축하지 않음, brotli가 설치되어 있고 클라이언트가 지원하면 br 우선)
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+    GZIP_COMPRESS_LEVEL: int = int(os.getenv("GZIP_COMPRESS_LEVEL", 6))
+    BROTLI_QUALITY: int = int(os.getenv("BROTLI_QUALITY", 4))
     
     # Celery 설정
     CELERY_BROKER_URL: str = os.getenv("CELERY_BROKER_URL", "redis://localhost:6379/0")
     CELERY_RESULT_BACKEND: str = os.getenv("CELERY_RESULT_BACKEND", "redis://localhost:6379/0")
     
+    CELERY_RESULT_EXPIRES: int = int(os.getenv("CELERY_RESULT_EXPIRES", 60 * 60))  # 1시간
+    ANALYSIS_STATUS_TTL: int = int(os.getenv("ANALYSIS_STATUS_TTL", 60 * 60))  # 분석 작업 상태 보존 (1시간)
+    
+    # Celery 워커 메트릭 사이드카 포트 (0이면 비활성화)
+    CELERY_METRICS_PORT: int = int(os.getenv("CELERY_METRICS_PORT", 9540))
+    
+    # 느린 쿼리/N+1 감지 설정
+    SLOW_QUERY_THRESHOLD_MS: int = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+    SLOW_QUERY_LOG_PARAMETERS: bool = os.getenv("SLOW_QUERY_LOG_PARAMETERS", "true").lower() == "true"
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", 10))  # 요청 내 같은 쿼리 반복 횟수
+    
+    # 요청 프로파일링 (X-Profile-Token 헤더로 활성화, 토큰이 비어 있으면 비활성화)
+    PROFILING_TOKEN: str = os.getenv("PROFILING_TOKEN", "")
+    PROFILING_OUTPUT_DIR: str = os.getenv("PROFILING_OUTPUT_DIR", "profiles")
+    PROFILING_INTERVAL: float = float(os.getenv("PROFILING_INTERVAL", 0.001))  # 샘플링 간격 (초)
+    
+    # 같은 꿈/스타일/내용의 시각화 요청에 완료된 결과를 재사용하는 기간
+    VISUALIZATION_RESULT_TTL: int = int(os.getenv("VISUALIZATION_RESULT_TTL", 7 * 24 * 60 * 60))  # 7일
+    VISUALIZATION_STATUS_TTL: int = int(os.getenv("VISUALIZATION_STATUS_TTL", 60 * 60))  # 진행 중/실패한 작업 상태 보존 (1시간)
+    
+    # 시각화 이미지 파생본 (썸네일 너비 목록, 원본 크기 포함 변환 포맷 - jpeg는 썸네일에만 적용)
+    VISUALIZATION_THUMBNAIL_WIDTHS: str = os.getenv("VISUALIZATION_THUMBNAIL_WIDTHS", "256,512")
+    VISUALIZATION_DERIVATIVE_FORMATS: str = os.getenv("VISUALIZATION_DERIVATIVE_FORMATS", "avif,webp,jpeg")
+    VISUALIZATION_DERIVATIVE_QUALITY: int = int(os.getenv("VISUALIZATION_DERIVATIVE_QUALITY", 75))
+    
+    # 시각화 갤러리 전체 개수 캐시 (생성/삭제 시 무효화)
+    GALLERY_COUNT_CACHE_TTL: int = int(os.getenv("GALLERY_COUNT_CACHE_TTL", 10 * 60))
+    
+    # 커뮤니티 피드 앞부분 캐시 (전체/태그별 최신 포스트 ID 수, ID 목록·개수 TTL - 갱신 누락 오차 상한, 포스트 본문 TTL)
+    COMMUNITY_FEED_CACHE_SIZE: int = int(os.getenv("COMMUNITY_FEED_CACHE_SIZE", 100))
+    COMMUNITY_FEED_CACHE_TTL: int = int(os.getenv("COMMUNITY_FEED_CACHE_TTL", 30 * 60))
+    COMMUNITY_POST_CACHE_TTL: int = int(os.getenv("COMMUNITY_POST_CACHE_TTL", 60 * 60))
+    
+    # 커뮤니티 태그 역색인 (변경 로그 최대 길이, 전체 재구성 주기(초), 검색 결과 태그 패싯 수, 패싯 계산에 쓰는 최신 검색 결과 수,
+    # 재구성/패싯 계산 시 DB에서 한 번에 읽는 행 수)
+    COMMUNITY_TAG_INDEX_STREAM_MAXLEN: int = int(os.getenv("COMMUNITY_TAG_INDEX_STREAM_MAXLEN", 10000))
+    COMMUNITY_TAG_INDEX_MAX_AGE: int = int(os.getenv("COMMUNITY_TAG_INDEX_MAX_AGE", 60 * 60))
+    COMMUNITY_TAG_FACET_LIMIT: int = int(os.getenv("COMMUNITY_TAG_FACET_LIMIT", 10))
+    COMMUNITY_TAG_FACET_SCAN_LIMIT: int = int(os.getenv("COMMUNITY_TAG_FACET_SCAN_LIMIT", 5000))
+    TAG_INDEX_BATCH_SIZE: int = int(os.getenv("TAG_INDEX_BATCH_SIZE", 1000))
+    
+    # 커뮤니티 인기 순위 (점수 반감기·감쇠 주기(초), 순위 유지 개수, 작성/조회/반응 가중치)
+    COMMUNITY_TRENDING_HALF_LIFE: int = int(os.getenv("COMMUNITY_TRENDING_HALF_LIFE", 6 * 60 * 60))
+    COMMUNITY_TRENDING_DECAY_INTERVAL: int = int(os.getenv("COMMUNITY_TRENDING_DECAY_INTERVAL", 5 * 60))
+    COMMUNITY_TRENDING_SIZE: int = int(os.getenv("COMMUNITY_TRENDING_SIZE", 1000))
+    COMMUNITY_TRENDING_POST_WEIGHT: float = float(os.getenv("COMMUNITY_TRENDING_POST_WEIGHT", 2.0))
+    COMMUNITY_TRENDING_VIEW_WEIGHT: float = float(os.getenv("COMMUNITY_TRENDING_VIEW_WEIGHT", 1.0))
+    COMMUNITY_TRENDING_REACTION_WEIGHT: float = float(os.getenv("COMMUNITY_TRENDING_REACTION_WEIGHT", 3.0))
+    # 같은 사용자의 반응 중복 방지 기간(초), 참여 카운터 DB 반영 주기(초)
+    COMMUNITY_REACTION_DEDUPE_TTL: int = int(os.getenv("COMMUNITY_REACTION_DEDUPE_TTL", 7 * 24 * 60 * 60))
+    COMMUNITY_ENGAGEMENT_FLUSH_INTERVAL: int = int(os.getenv("COMMUNITY_ENGAGEMENT_FLUSH_INTERVAL", 60))
+    
+    # 꿈 목록 카드 미리보기 길이 (fields=card 응답의 body_preview 글자 수)
+    DREAM_PREVIEW_LENGTH: int = int(os.getenv("DREAM_PREVIEW_LENGTH", 200))
+    
+    # 꿈 기록 NDJSON 가져오기/내보내기 (INSERT/커밋 배치 크기, 줄 최대 크기, 결과에 담을 오류 수, 내보내기 커서 배치 크기)
+    DREAM_IMPORT_BATCH_SIZE: int = int(os.getenv("DREAM_IMPORT_BATCH_SIZE", 1000))
+    DREAM_IMPORT_MAX_LINE_BYTES: int = int(os.getenv("DREAM_IMPORT_MAX_LINE_BYTES", 64 * 1024))
+    DREAM_IMPORT_MAX_ERRORS: int = int(os.getenv("DREAM_IMPORT_MAX_ERRORS", 100))
+    DREAM_EXPORT_BATCH_SIZE: int = int(os.getenv("DREAM_EXPORT_BATCH_SIZE", 500))
+    
+    # 앱 델타 동기화 (종류별 한 번에 내려줄 변경 수, 늦게 커밋된 변경을 다시 훑는 겹침 구간(초),
+    # 삭제 기록 보존 기간 - 이보다 오래된 커서는 전체 재동기화, 요청당 최대 오프라인 쓰기 수)
+    SYNC_PAGE_SIZE: int = int(os.getenv("SYNC_PAGE_SIZE", 500))
+    SYNC_WATERMARK_OVERLAP_SECONDS: int = int(os.getenv("SYNC_WATERMARK_OVERLAP_SECONDS", 60))
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", 90))
+    SYNC_MAX_OPERATIONS: int = int(os.getenv("SYNC_MAX_OPERATIONS", 500))
+    
+    # 큐별 작업 시간 제한 (초) - llm: LLM 호출, embed: 임베딩/네트워크 계산, maintenance: 정리 작업
+    CELERY_LLM_TIME_LIMIT: int = int(os.getenv("CELERY_LLM_TIME_LIMIT", 5 * 60))
+    CELERY_LLM_SOFT_TIME_LIMIT: int = int(os.getenv("CELERY_LLM_SOFT_TIME_LIMIT", 4 * 60))
+    CELERY_EMBED_TIME_LIMIT: int = int(os.getenv("CELERY_EMBED_TIME_LIMIT", 60 * 60))
+    CELERY_EMBED_SOFT_TIME_LIMIT: int = int(os.getenv("CELERY_EMBED_SOFT_TIME_LIMIT", 55 * 60))
+    CELERY_MAINTENANCE_TIME_LIMIT: int = int(os.getenv("CELERY_MAINTENANCE_TIME_LIMIT", 30 * 60))
+    CELERY_MAINTENANCE_SOFT_TIME_LIMIT: int = int(os.getenv("CELERY_MAINTENANCE_SOFT_TIME_LIMIT", 25 * 60))
+    # llm 큐에서 대기하는 동안 중복 방지 잠금 유지 시간 (초) - 작업이 시작되면 CELERY_LLM_TIME_LIMIT으로 다시 설정
+    CELERY_LLM_QUEUE_TTL: int = int(os.getenv("CELERY_LLM_QUEUE_TTL", 60 * 60))
+    
+    # 일일 인사이트 배치 설정
+    INSIGHT_WINDOW_DAYS: int = int(os.getenv("INSIGHT_WINDOW_DAYS", 7))
+    INSIGHT_CHUNK_SIZE: int = int(os.getenv("INSIGHT_CHUNK_SIZE", 100))  # 태스크당 사용자 수
+    INSIGHT_LLM_CONCURRENCY: int = int(os.getenv("INSIGHT_LLM_CONCURRENCY", 8))  # 태스크당 동시 LLM 호출 수
+    INSIGHT_CACHE_TTL: int = int(os.getenv("INSIGHT_CACHE_TTL", 2 * 24 * 60 * 60))  # 2일
+    
+    # 데이터 정리 작업 설정
+    CLEANUP_BATCH_SIZE: int = int(os.getenv("CLEANUP_BATCH_SIZE", 1000))
+    ANALYSIS_RETENTION_DAYS: int = int(os.getenv("ANALYSIS_RETENTION_DAYS", 30))
+    DREAM_RETENTION_DAYS: int = int(os.getenv("DREAM_RETENTION_DAYS", 365))
+    
     class Config:
         case_sensitive = True
 
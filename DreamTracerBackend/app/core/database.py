@@ -1,7 +1,7 @@
 """
 데이터베이스 연결 설정
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, select, delete
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -18,3 +18,36 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def delete_in_batches(db, model, *criteria, batch_size: int = 1000, before_delete=None) -> int:
+    """
+    조건에 맞는 행을 기본키 순서대로 일정 크기씩 나눠 삭제
+    배치마다 커밋하므로 테이블 잠금과 메모리 사용량이 배치 크기로 제한됨
+    before_delete(ids)는 배치마다 삭제 직전 같은 트랜잭션에서 호출 (삭제 기록 등)
+    """
+    deleted_count = 0
+    cursor = None  # 마지막으로 처리한 기본키 (진행 커서)
+    
+    while True:
+        batch_query = select(model.id).where(*criteria).order_by(model.id).limit(batch_size)
+        if cursor is not None:
+            batch_query = batch_query.where(model.id > cursor)
+        
+        ids = db.execute(batch_query).scalars().all()
+        if not ids:
+            break
+        
+        if before_delete is not None:
+            before_delete(ids)
+        
+        # 조회와 삭제 사이에 상태가 바뀐 행은 조건 재확인으로 제외
+        result = db.execute(
+            delete(model).where(model.id.in_(ids), *criteria).execution_options(synchronize_session=False)
+        )
+        db.commit()
+        
+        deleted_count += result.rowcount
+        cursor = ids[-1]
+    
+    return deleted_count
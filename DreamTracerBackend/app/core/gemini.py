@@ -0,0 +1,50 @@
+"""
+Google Gemini 클라이언트 설정
+"""
+import google.generativeai as genai
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+from app.core.config import settings
+import time
+
+# 현재 LLM 작업의 마감 시각 (time.monotonic 기준, 없으면 요청별 제한 시간만 적용)
+# llm 큐는 threads 풀이라 Celery 시간 제한이 강제되지 않으므로 작업 안의 Gemini 호출 시간을 직접 제한
+_llm_deadline: ContextVar[Optional[float]] = ContextVar("llm_deadline", default=None)
+
+def configure_gemini() -> None:
+    """
+    Gemini API 키와 엔드포인트 설정
+    GEMINI_API_ENDPOINT가 있으면 REST 전송으로 해당 주소를 사용 (부하 테스트용 가짜 서버 등)
+    """
+    if settings.GEMINI_API_ENDPOINT:
+        genai.configure(
+            api_key=settings.GEMINI_API_KEY,
+            transport="rest",
+            client_options={"api_endpoint": settings.GEMINI_API_ENDPOINT}
+        )
+    else:
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+
+@contextmanager
+def llm_deadline(seconds: float) -> Iterator[None]:
+    """블록 안의 Gemini 호출이 모두 seconds 안에 끝나도록 마감 시각 설정 (asyncio.run 안의 코루틴에도 전달됨)"""
+    token = _llm_deadline.set(time.monotonic() + seconds)
+    try:
+        yield
+    finally:
+        _llm_deadline.reset(token)
+
+def generate_content(model: genai.GenerativeModel, prompt: str) -> Any:
+    """
+    제한 시간을 둔 Gemini 호출 (GEMINI_REQUEST_TIMEOUT과 작업 마감까지 남은 시간 중 작은 값, 재시도 없음)
+    마감이 지났으면 호출하지 않고 TimeoutError
+    """
+    timeout = settings.GEMINI_REQUEST_TIMEOUT
+    deadline = _llm_deadline.get()
+    if deadline is not None:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("LLM 작업 제한 시간을 초과했습니다")
+        timeout = min(timeout, remaining)
+    return model.generate_content(prompt, request_options={"timeout": timeout, "retry": None})
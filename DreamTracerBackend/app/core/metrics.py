@@ -0,0 +1,306 @@
+"""
+Prometheus 메트릭 정의 및 수집
+API(/metrics), Celery 워커(사이드카 HTTP 포트) 공용
+"""
+from prometheus_client import (
+    Counter, Gauge, Histogram, CollectorRegistry, CONTENT_TYPE_LATEST, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from collections import Counter as StatementCounter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+from app.core.config import settings
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# 요청 지연 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# LLM 호출 지연 구간 (초) - 수 초 ~ 수십 초
+LLM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+# API
+HTTP_REQUEST_DURATION = Histogram(
+    "dreamtracer_http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "dreamtracer_http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum"
+)
+
+# 데이터베이스 (요청 단위)
+DB_QUERIES_PER_REQUEST = Histogram(
+    "dreamtracer_db_queries_per_request",
+    "요청당 실행된 DB 쿼리 수",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100)
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "dreamtracer_db_time_per_request_seconds",
+    "요청당 DB 쿼리 총 실행 시간",
+    ["route"],
+    buckets=LATENCY_BUCKETS
+)
+SLOW_QUERIES = Counter(
+    "dreamtracer_db_slow_queries_total",
+    "임계값(SLOW_QUERY_THRESHOLD_MS)을 넘은 쿼리 수",
+    ["route"]
+)
+N_PLUS_ONE_REQUESTS = Counter(
+    "dreamtracer_db_n_plus_one_requests_total",
+    "같은 쿼리를 N_PLUS_ONE_THRESHOLD회 이상 반복한 요청 수",
+    ["route"]
+)
+
+# LLM / 임베딩
+LLM_CALL_DURATION = Histogram(
+    "dreamtracer_llm_call_duration_seconds",
+    "LLM API 호출 시간",
+    ["provider", "operation"],
+    buckets=LLM_BUCKETS
+)
+LLM_CALL_ERRORS = Counter(
+    "dreamtracer_llm_call_errors_total",
+    "LLM API 호출 실패 수",
+    ["provider", "operation"]
+)
+EMBEDDING_DURATION = Histogram(
+    "dreamtracer_embedding_duration_seconds",
+    "문장 임베딩 계산 시간",
+    ["operation"],
+    buckets=LATENCY_BUCKETS
+)
+EMBEDDING_ERRORS = Counter(
+    "dreamtracer_embedding_errors_total",
+    "문장 임베딩 계산 실패 수",
+    ["operation"]
+)
+
+# 캐시 (적중률 = hit / (hit + miss))
+CACHE_REQUESTS = Counter(
+    "dreamtracer_cache_requests_total",
+    "캐시 조회 수",
+    ["cache", "result"]
+)
+
+# Celery
+CELERY_TASK_DURATION = Histogram(
+    "dreamtracer_celery_task_duration_seconds",
+    "Celery 작업 실행 시간",
+    ["task", "state"],
+    buckets=LLM_BUCKETS + (300.0, 600.0, 1800.0, 3600.0)
+)
+
+# 현재 요청의 DB 사용량 (미들웨어가 설정, 엔진 이벤트가 누적)
+_request_db_stats: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_db_stats", default=None)
+
+def start_request_db_stats(scope: Optional[dict] = None) -> Dict[str, Any]:
+    """현재 요청의 DB 사용량 집계 시작"""
+    stats = {"count": 0, "time": 0.0, "statements": StatementCounter(), "scope": scope}
+    _request_db_stats.set(stats)
+    return stats
+
+def current_request_db_stats() -> Optional[Dict[str, Any]]:
+    return _request_db_stats.get()
+
+def _route_of(scope: Optional[dict]) -> str:
+    """라우트 템플릿 (라우팅 전이거나 매칭되지 않으면 unmatched)"""
+    if scope is None:
+        return "unmatched"
+    return getattr(scope.get("route"), "path", "unmatched")
+
+def _endpoint_of(stats: Optional[Dict[str, Any]]) -> str:
+    """로그용 호출 엔드포인트 (요청 밖에서 실행된 쿼리는 background)"""
+    if stats is None or stats.get("scope") is None:
+        return "background"
+    scope = stats["scope"]
+    return f"{scope.get('method')} {_route_of(scope)}"
+
+def _truncate(value: Any, limit: int = 500) -> str:
+    text = str(value)
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats["count"] += 1
+        stats["time"] += elapsed
+        # 바인드 파라미터를 쓰므로 같은 쿼리는 같은 문장 문자열을 가짐
+        stats["statements"][statement] += 1
+
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        endpoint = _endpoint_of(stats)
+        SLOW_QUERIES.labels(_route_of(stats["scope"]) if stats else "background").inc()
+        params = _truncate(parameters) if settings.SLOW_QUERY_LOG_PARAMETERS else "(생략)"
+        logger.warning(
+            f"느린 쿼리 {elapsed * 1000:.1f}ms [{endpoint}]: {_truncate(statement, 1000)} | 파라미터: {params}"
+        )
+
+def report_n_plus_one(stats: Dict[str, Any]) -> None:
+    """요청 안에서 같은 쿼리가 임계값 이상 반복되면 N+1 의심으로 기록"""
+    repeated = [
+        (statement, count) for statement, count in stats["statements"].items()
+        if count >= settings.N_PLUS_ONE_THRESHOLD
+    ]
+    if not repeated:
+        return
+    N_PLUS_ONE_REQUESTS.labels(_route_of(stats["scope"])).inc()
+    for statement, count in repeated:
+        logger.warning(f"N+1 쿼리 의심 [{_endpoint_of(stats)}] {count}회 반복: {_truncate(statement)}")
+
+@contextmanager
+def track_llm_call(provider: str, operation: str):
+    """LLM 호출 시간/실패 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        LLM_CALL_ERRORS.labels(provider, operation).inc()
+        raise
+    finally:
+        LLM_CALL_DURATION.labels(provider, operation).observe(time.perf_counter() - start)
+
+@contextmanager
+def track_embedding(operation: str):
+    """임베딩 계산 시간/실패 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        EMBEDDING_ERRORS.labels(operation).inc()
+        raise
+    finally:
+        EMBEDDING_DURATION.labels(operation).observe(time.perf_counter() - start)
+
+def record_cache(cache: str, hit: bool) -> None:
+    """캐시 적중/미적중 기록"""
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+class PrometheusMiddleware:
+    """
+    요청별 지연 시간, 처리 중인 요청 수, DB 쿼리 수/시간 수집 (ASGI 미들웨어)
+    라우트 라벨은 경로 템플릿(/dreams/{dream_id})을 사용해 카디널리티를 제한
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.labels(method).inc()
+        db_stats = start_request_db_stats(scope)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(method, route, str(status["code"])).observe(time.perf_counter() - start)
+            HTTP_REQUESTS_IN_PROGRESS.labels(method).dec()
+            DB_QUERIES_PER_REQUEST.labels(route).observe(db_stats["count"])
+            DB_TIME_PER_REQUEST.labels(route).observe(db_stats["time"])
+            report_n_plus_one(db_stats)
+
+class CeleryQueueDepthCollector:
+    """스크레이프 시점에 브로커(Redis)의 큐 길이를 조회하는 수집기"""
+
+    def __init__(self, queue_names):
+        self.queue_names = list(queue_names)
+
+    def collect(self):
+        gauge = GaugeMetricFamily(
+            "dreamtracer_celery_queue_depth",
+            "Celery 큐에 대기 중인 작업 수",
+            labels=["queue"]
+        )
+        try:
+            import redis
+
+            client = redis.Redis.from_url(settings.CELERY_BROKER_URL)
+            pipe = client.pipeline()
+            for name in self.queue_names:
+                pipe.llen(name)
+            for name, depth in zip(self.queue_names, pipe.execute()):
+                gauge.add_metric([name], depth)
+        except Exception as e:
+            logger.warning(f"Celery 큐 길이 조회 실패: {str(e)}")
+        yield gauge
+
+def build_registry() -> Optional[CollectorRegistry]:
+    """
+    노출용 레지스트리 생성
+    PROMETHEUS_MULTIPROC_DIR이 설정된 경우(gunicorn/uvicorn 다중 워커, Celery prefork) 프로세스별 값을 합산
+    """
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return None
+
+def render_metrics(registry: Optional[CollectorRegistry] = None):
+    """Prometheus 텍스트 포맷 (본문, Content-Type)"""
+    if registry is None:
+        from prometheus_client import REGISTRY
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+def register_celery_metrics(celery_app, queue_names) -> None:
+    """
+    Celery 작업 실행 시간 수집 및 워커 사이드카 /metrics 포트 기동
+    포트는 CELERY_METRICS_PORT (0이면 비활성화)
+    """
+    from celery import signals
+
+    task_start_times: Dict[str, float] = {}
+
+    @signals.task_prerun.connect(weak=False)
+    def _task_prerun(task_id=None, task=None, **kwargs):
+        task_start_times[task_id] = time.perf_counter()
+
+    @signals.task_postrun.connect(weak=False)
+    def _task_postrun(task_id=None, task=None, state=None, **kwargs):
+        start = task_start_times.pop(task_id, None)
+        if start is not None and task is not None:
+            CELERY_TASK_DURATION.labels(task.name, state or "UNKNOWN").observe(time.perf_counter() - start)
+
+    @signals.worker_ready.connect(weak=False)
+    def _start_metrics_server(**kwargs):
+        from prometheus_client import REGISTRY, start_http_server
+
+        if not settings.CELERY_METRICS_PORT:
+            return
+        registry = build_registry() or REGISTRY
+        registry.register(CeleryQueueDepthCollector(queue_names))
+        start_http_server(settings.CELERY_METRICS_PORT, registry=registry)
+        logger.info(f"Celery 메트릭 서버 시작: 포트 {settings.CELERY_METRICS_PORT}")
@@ -0,0 +1,109 @@
+"""
+요청 단위 온디맨드 프로파일링
+X-Profile-Token 헤더가 PROFILING_TOKEN과 일치하는 /api/v1 요청에만 샘플링 프로파일러(pyinstrument)를 붙임
+"""
+from app.core.config import settings
+from datetime import datetime
+from typing import Optional
+import hmac
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+PROFILE_OUTPUT_HEADER = b"x-profile-output"  # inline: 응답 대신 프로파일 반환, file(기본): 저장 후 경로를 헤더로 전달
+
+class ProfilingMiddleware:
+    """
+    권한 있는 요청에 샘플링 프로파일러를 붙여 플레임 그래프(HTML/speedscope)를 저장하거나 반환
+    PROFILING_TOKEN이 비어 있거나 pyinstrument가 설치되지 않은 경우 아무 것도 하지 않음
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    def _requested_token(self, scope) -> Optional[bytes]:
+        """요청 헤더의 토큰 (쿼리 문자열은 접근 로그/리퍼러에 남으므로 받지 않음)"""
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_TOKEN_HEADER:
+                return value
+        return None
+
+    def _should_profile(self, scope) -> bool:
+        if scope["type"] != "http" or not settings.PROFILING_TOKEN:
+            return False
+        if not scope["path"].startswith(settings.API_V1_STR):
+            return False
+        token = self._requested_token(scope)
+        # 바이트로 비교 (compare_digest는 ASCII가 아닌 문자열을 받으면 TypeError)
+        return token is not None and hmac.compare_digest(token, settings.PROFILING_TOKEN.encode("utf-8"))
+
+    def _output_mode(self, scope) -> str:
+        for name, value in scope.get("headers", []):
+            if name == PROFILE_OUTPUT_HEADER:
+                return value.decode("latin-1").lower()
+        return "file"
+
+    async def __call__(self, scope, receive, send):
+        if not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning("pyinstrument가 설치되지 않아 프로파일링을 건너뜀")
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{datetime.utcnow():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+        inline = self._output_mode(scope) == "inline"
+
+        async def send_wrapper(message):
+            if inline:
+                # 원래 응답은 버리고 프로파일 결과를 대신 반환
+                return
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        profiler = Profiler(interval=settings.PROFILING_INTERVAL, async_mode="enabled")
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            path = self._save(profiler, profile_id, scope)
+
+        if inline:
+            body = profiler.output_html().encode("utf-8")
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"text/html; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"x-profile-id", profile_id.encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+        logger.info(f"요청 프로파일 저장: {scope['method']} {scope['path']} -> {path}")
+
+    def _save(self, profiler, profile_id: str, scope) -> Optional[str]:
+        """HTML과 speedscope(JSON) 형식으로 저장"""
+        try:
+            from pyinstrument.renderers import SpeedscopeRenderer
+
+            os.makedirs(settings.PROFILING_OUTPUT_DIR, exist_ok=True)
+            base = os.path.join(settings.PROFILING_OUTPUT_DIR, profile_id)
+            with open(f"{base}.html", "w", encoding="utf-8") as f:
+                f.write(profiler.output_html())
+            with open(f"{base}.speedscope.json", "w", encoding="utf-8") as f:
+                f.write(profiler.output(renderer=SpeedscopeRenderer()))
+            return f"{base}.html"
+        except Exception as e:
+            logger.error(f"프로파일 저장 실패: {scope['path']}, 오류: {str(e)}")
+            return None
@@ -0,0 +1,21 @@
+"""
+Redis 연결 설정
+"""
+import redis
+import redis.asyncio
+from app.core.config import settings
+
+# 연결은 첫 명령 실행 시점에 생성됨
+redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# API 요청 처리용 비동기 클라이언트 (이벤트 루프를 막지 않음)
+async_redis_client = redis.asyncio.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+# 잠금 해제용 스크립트: 키 값이 주어진 값일 때만 삭제 (만료 후 다른 작업이 잡은 잠금은 그대로 둠)
+# 사용: client.eval(RELEASE_KEY_SCRIPT, 1, key, value)
+RELEASE_KEY_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
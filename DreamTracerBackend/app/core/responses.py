@@ -0,0 +1,27 @@
+"""
+JSON 응답 직렬화 (orjson)
+"""
+from typing import Any
+from fastapi.responses import JSONResponse
+import orjson
+
+def dumps(content: Any) -> bytes:
+    """orjson 직렬화 (UUID/datetime/date/numpy 기본 지원, 정수 키 허용)"""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+class ORJSONResponse(JSONResponse):
+    """
+    orjson 기반 JSON 응답
+    앱 기본 응답 클래스로 쓰면 response_model이 없는 엔드포인트의 json.dumps 단계를 대체
+    엔드포인트에서 직접 반환하면 jsonable_encoder 변환 단계도 건너뜀
+    (response_model이 있는 엔드포인트는 FastAPI가 Pydantic으로 바로 직렬화)
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+class RawJSONResponse(JSONResponse):
+    """이미 직렬화된 JSON 바이트를 그대로 보내는 응답 (캐시된 페이로드용)"""
+
+    def render(self, content: bytes) -> bytes:
+        return content
@@ -18,6 +18,8 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # OAuth2 스키마
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
+# 인증 헤더가 없어도 되는 엔드포인트용 (서명 URL 등 다른 방식으로 인가)
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login", auto_error=False)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
@@ -74,6 +76,15 @@ def get_current_user(
     
     return UserProfile.from_orm(user)
 
+def get_optional_current_user(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> Optional[UserProfile]:
+    """인증 헤더가 있으면 현재 사용자 정보, 없으면 None"""
+    if token is None:
+        return None
+    return get_current_user(token, db)
+
 def get_current_active_user(
     current_user: UserProfile = Depends(get_current_user)
 ) -> UserProfile:
@@ -1,7 +1,7 @@
 """
 커뮤니티 모델
 """
-from sqlalchemy import Column, Text, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, Boolean, ForeignKey, DateTime, Integer
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -17,6 +17,9 @@ class CommunityPost(Base):
     content = Column(Text, nullable=False)
     tags = Column(JSONB, nullable=True)  # 태그 배열
     is_anonymous = Column(Boolean, nullable=False, default=True)
+    # 참여 카운터 (Redis에 모았다가 주기 작업이 반영하므로 최대 COMMUNITY_ENGAGEMENT_FLUSH_INTERVAL 늦음)
+    view_count = Column(Integer, nullable=False, default=0, server_default="0")
+    reaction_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # 관계 설정
@@ -25,3 +28,13 @@ class CommunityPost(Base):
     
     def __repr__(self):
         return f"<CommunityPost(id={self.id}, user_id={self.user_id}, anonymous={self.is_anonymous})>"
+
+class CommunityEngagementFlush(Base):
+    """DB에 반영한 참여 카운터 묶음 (반영 후 Redis 정리 전에 실패해도 같은 묶음을 다시 반영하지 않도록 같은 트랜잭션에 기록)"""
+    __tablename__ = "community_engagement_flushes"
+    
+    batch_id = Column(String(36), primary_key=True)
+    flushed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<CommunityEngagementFlush(batch_id={self.batch_id})>"
@@ -1,7 +1,7 @@
 """
 꿈 모델
 """
-from sqlalchemy import Column, String, Text, Date, SmallInteger, Boolean, ForeignKey, DateTime, Integer, JSON
+from sqlalchemy import Column, String, Text, Date, SmallInteger, Boolean, ForeignKey, DateTime, Integer, Float, JSON, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -10,6 +10,12 @@ from app.core.database import Base
 
 class Dream(Base):
     __tablename__ = "dreams"
+    __table_args__ = (
+        # 오프라인 기록 재전송 시 같은 꿈을 다시 만들지 않도록 사용자별 클라이언트 ID 고유
+        UniqueConstraint("user_id", "client_id", name="uq_dreams_user_id_client_id"),
+        # 동기화: 사용자별 변경분을 (updated_at, id) 키셋으로 조회
+        Index("ix_dreams_user_id_updated_at", "user_id", "updated_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -17,6 +23,7 @@ class Dream(Base):
     title = Column(String(100), nullable=True)
     body_text = Column(Text, nullable=True)
     audio_file_path = Column(String(512), nullable=True)
+    audio_duration = Column(Float, nullable=True)  # 녹음 길이 (초, 업로드 후 백그라운드 작업이 추출)
     lucidity_level = Column(SmallInteger, nullable=True)  # 1-5 범위
     emotion_tags = Column(JSON, nullable=True)  # 감정 태그 배열
     analysis_status = Column(String(20), nullable=False, default='pending')  # 'pending', 'processing', 'completed', 'failed'
@@ -27,6 +34,7 @@ class Dream(Base):
     location = Column(String(100), nullable=True)  # 꿈의 장소
     characters = Column(JSON, nullable=True)  # 꿈에 등장한 인물들
     symbols = Column(JSON, nullable=True)  # 꿈의 상징들
+    client_id = Column(String(64), nullable=True)  # 앱에서 만든 로컬 ID (동기화 멱등 키)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
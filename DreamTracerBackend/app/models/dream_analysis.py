@@ -20,6 +20,7 @@ class DreamAnalysis(Base):
     reflective_question = Column(Text, nullable=True)
     deja_vu_analysis = Column(JSONB, nullable=True)  # 데자뷰 분석 결과
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # 재분석으로 덮어쓴 시각 (ETag/동기화 기준)
     
     # 관계 설정
     dream = relationship("Dream", back_populates="analysis")
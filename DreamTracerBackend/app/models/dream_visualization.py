@@ -1,7 +1,7 @@
 """
 꿈 시각화 모델
 """
-from sqlalchemy import Column, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Text, ForeignKey, DateTime, Index, JSON
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -10,13 +10,23 @@ from app.core.database import Base
 
 class DreamVisualization(Base):
     __tablename__ = "dream_visualizations"
+    __table_args__ = (
+        # 꿈별 시각화 최신순 조회
+        Index("ix_dream_visualizations_dream_id_created_at", "dream_id", "created_at", "id"),
+        # 갤러리 조회: 사용자별 시각화를 최신순으로 (created_at, id) 키셋 페이지네이션 (꿈 조인 없이 인덱스 순서대로)
+        Index("ix_dream_visualizations_user_id_created_at", "user_id", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     dream_id = Column(UUID(as_uuid=True), ForeignKey("dreams.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # 꿈 작성자 (갤러리 조회용 비정규화)
     image_path = Column(String(512), nullable=False)
     art_style = Column(String(50), nullable=False)  # 'realistic', 'surreal', 'watercolor', 'digital_art'
     prompt_used = Column(Text, nullable=True)
+    content_hash = Column(String(64), nullable=True, index=True)  # 원본 이미지 SHA-256 (파생본 파일 이름)
+    derivatives = Column(JSON, nullable=True)  # 썸네일/포맷별 파생본 경로 {"너비": {"포맷": 경로}}
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # 파생본 추가 등 (동기화 기준)
     
     # 관계 설정
     dream = relationship("Dream", back_populates="visualizations")
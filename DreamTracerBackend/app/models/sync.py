@@ -0,0 +1,26 @@
+"""
+동기화 삭제 기록 모델
+"""
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import uuid
+from app.core.database import Base
+
+class SyncTombstone(Base):
+    """삭제된 꿈/시각화 기록 (앱이 델타 동기화로 로컬 사본을 지울 수 있도록 보존 기간 동안 유지)"""
+    __tablename__ = "sync_tombstones"
+    __table_args__ = (
+        # 사용자별 삭제 기록을 (deleted_at, id) 키셋으로 조회
+        Index("ix_sync_tombstones_user_id_deleted_at", "user_id", "deleted_at", "id"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    entity_type = Column(String(20), nullable=False)  # 'dream', 'visualization' (꿈 삭제 시 분석/시각화는 함께 삭제된 것으로 처리)
+    entity_id = Column(UUID(as_uuid=True), nullable=False)
+    client_id = Column(String(64), nullable=True)  # 꿈의 클라이언트 ID
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    
+    def __repr__(self):
+        return f"<SyncTombstone(type={self.entity_type}, entity_id={self.entity_id})>"
@@ -44,8 +44,14 @@ class CommunityPostResponse(BaseModel):
     content: str
     tags: List[str] = []
     is_anonymous: bool
+    view_count: int = 0
+    reaction_count: int = 0
     created_at: datetime
     
+    @validator('id', 'user_id', 'dream_id', pre=True)
+    def stringify_uuid(cls, v):
+        return str(v) if v is not None else v
+    
     class Config:
         from_attributes = True
 
@@ -67,7 +73,12 @@ class CommunitySearchResponse(BaseModel):
     has_next: bool
     has_previous: bool
     query: str
+    tag_facets: List[Dict[str, Any]] = []  # 검색 결과 전체의 태그별 포스트 수 (많은 순)
 
 class PopularTagsResponse(BaseModel):
     """인기 태그 응답 스키마"""
     tags: List[Dict[str, Any]]
+
+class CommunityReactionResponse(BaseModel):
+    """포스트 반응 응답 스키마"""
+    counted: bool  # 이미 반응한 사용자면 False (중복 반영 안 함)
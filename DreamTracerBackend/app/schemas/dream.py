@@ -78,6 +78,7 @@ class DreamResponse(BaseModel):
     title: Optional[str] = None
     body_text: Optional[str] = None
     audio_file_path: Optional[str] = None
+    audio_duration: Optional[float] = None  # 녹음 길이 (초, 추출 전에는 None)
     lucidity_level: Optional[int] = None
     emotion_tags: Optional[List[str]] = []
     analysis_status: str
@@ -88,12 +89,54 @@ class DreamResponse(BaseModel):
     location: Optional[str] = None
     characters: Optional[List[str]] = []
     symbols: Optional[List[str]] = []
+    client_id: Optional[str] = None  # 앱 로컬 ID (동기화로 만든 꿈)
     created_at: datetime
     updated_at: datetime
 
+    @validator('id', 'user_id', pre=True)
+    def stringify_uuid(cls, v):
+        return str(v) if v is not None else v
+
     class Config:
         from_attributes = True
 
+class DreamListItem(BaseModel):
+    """
+    꿈 목록 항목 스키마 (fields= 로 요청한 필드만 채움)
+    채워지지 않은 필드는 exclude_unset 직렬화에서 생략됨
+    """
+    id: Optional[str] = None
+    user_id: Optional[str] = None
+    dream_date: Optional[date] = None
+    title: Optional[str] = None
+    body_text: Optional[str] = None
+    body_preview: Optional[str] = None  # 본문 앞부분 (카드 미리보기용)
+    audio_file_path: Optional[str] = None
+    audio_duration: Optional[float] = None
+    lucidity_level: Optional[int] = None
+    emotion_tags: Optional[List[str]] = None
+    analysis_status: Optional[str] = None
+    is_shared: Optional[bool] = None
+    dream_type: Optional[str] = None
+    sleep_quality: Optional[int] = None
+    dream_duration: Optional[int] = None
+    location: Optional[str] = None
+    characters: Optional[List[str]] = None
+    symbols: Optional[List[str]] = None
+    client_id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @validator('id', 'user_id', pre=True)
+    def stringify_uuid(cls, v):
+        return str(v) if v is not None else v
+
+# 목록 카드에 필요한 필드 (fields=card)
+DREAM_CARD_FIELDS = (
+    "id", "dream_date", "title", "body_preview", "lucidity_level",
+    "emotion_tags", "analysis_status", "dream_type", "created_at"
+)
+
 class DreamAnalysis(BaseModel):
     """꿈 분석 결과 스키마"""
     id: str
@@ -106,6 +149,10 @@ class DreamAnalysis(BaseModel):
     deja_vu_analysis: Optional[Dict[str, Any]] = None
     created_at: datetime
 
+    @validator('id', 'dream_id', pre=True)
+    def stringify_uuid(cls, v):
+        return str(v) if v is not None else v
+
     class Config:
         from_attributes = True
 
@@ -118,6 +165,26 @@ class DreamListResponse(BaseModel):
     has_next: bool
     has_previous: bool
 
+class DreamFieldsListResponse(BaseModel):
+    """필드를 골라 조회한 꿈 목록 응답 스키마 (fields= 지정 시)"""
+    dreams: List[DreamListItem]
+    total_count: int
+    page: int
+    page_size: int
+    has_next: bool
+    has_previous: bool
+
+class DreamImportError(BaseModel):
+    """가져오기 실패 줄"""
+    line: int
+    error: str
+
+class DreamImportResponse(BaseModel):
+    """꿈 기록 일괄 가져오기 결과 스키마"""
+    imported: int
+    failed: int
+    errors: List[DreamImportError] = []  # 앞쪽 실패 줄만 (최대 DREAM_IMPORT_MAX_ERRORS개)
+
 class DreamStats(BaseModel):
     """꿈 통계 스키마"""
     total_dreams: int
@@ -133,5 +200,6 @@ class AudioUploadResponse(BaseModel):
     """오디오 업로드 응답 스키마"""
     audio_file_path: str
     file_size: int
-    duration: Optional[float] = None
+    duration: Optional[float] = None  # 백그라운드 추출 후 이 경로를 쓰는 꿈의 audio_duration에 기록
     upload_url: Optional[str] = None  # 클라우드 스토리지 업로드 URL
+    content_hash: Optional[str] = None  # 파일 SHA-256 해시
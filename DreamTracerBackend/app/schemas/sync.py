@@ -0,0 +1,61 @@
+"""
+앱 델타 동기화 Pydantic 스키마
+"""
+from pydantic import BaseModel, Field, validator
+from typing import Optional, List, Dict, Any, Literal
+from datetime import datetime
+from app.core.config import settings
+from app.schemas.dream import DreamResponse, DreamAnalysis
+
+class SyncOperation(BaseModel):
+    """
+    오프라인에서 쌓인 쓰기 하나
+    client_id(앱 로컬 ID)가 멱등 키 - 같은 작업을 다시 보내도 꿈이 중복 생성되지 않음
+    """
+    type: Literal["upsert_dream", "delete_dream"]
+    client_id: str = Field(..., min_length=1, max_length=64)
+    id: Optional[str] = None  # 서버 꿈 ID (이미 서버에 있는 꿈을 수정/삭제할 때)
+    dream: Optional[Dict[str, Any]] = None  # upsert_dream 내용 (DreamCreate 필드, 작업별로 검증)
+
+class SyncRequest(BaseModel):
+    """동기화 요청 스키마"""
+    cursor: Optional[str] = None  # 직전 응답의 커서 (없으면 처음부터)
+    operations: List[SyncOperation] = []
+
+    @validator('operations')
+    def validate_operations(cls, v):
+        if len(v) > settings.SYNC_MAX_OPERATIONS:
+            raise ValueError(f'한 번에 최대 {settings.SYNC_MAX_OPERATIONS}개의 작업까지 보낼 수 있습니다')
+        return v
+
+class SyncOperationResult(BaseModel):
+    """작업 처리 결과 (요청 순서와 같음)"""
+    client_id: str
+    status: Literal["created", "updated", "deleted", "failed"]
+    id: Optional[str] = None  # 서버 꿈 ID
+    error: Optional[str] = None
+
+class SyncTombstoneItem(BaseModel):
+    """삭제 기록 (꿈 삭제 시 그 꿈의 분석/시각화도 함께 삭제된 것으로 처리)"""
+    entity_type: str  # 'dream', 'visualization'
+    entity_id: str
+    client_id: Optional[str] = None
+    deleted_at: datetime
+
+    @validator('entity_id', pre=True)
+    def stringify_uuid(cls, v):
+        return str(v) if v is not None else v
+
+    class Config:
+        from_attributes = True
+
+class SyncResponse(BaseModel):
+    """동기화 응답 스키마"""
+    cursor: str  # 다음 동기화 요청에 그대로 보낼 커서
+    has_more: bool  # 아직 내려받을 변경이 남음 (operations 없이 바로 다시 요청)
+    full_resync: bool = False  # 커서가 삭제 기록 보존 기간보다 오래됨 - 로컬 서버 사본을 이번 결과로 교체
+    results: List[SyncOperationResult] = []
+    dreams: List[DreamResponse] = []
+    analyses: List[DreamAnalysis] = []
+    visualizations: List[Dict[str, Any]] = []
+    tombstones: List[SyncTombstoneItem] = []
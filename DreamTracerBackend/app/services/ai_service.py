@@ -2,7 +2,6 @@
 AI 분석 서비스 - 현대적 다학제적 꿈 분석 시스템 통합
 """
 import google.generativeai as genai
-from sentence_transformers import SentenceTransformer
 import networkx as nx
 import numpy as np
 from typing import List, Dict, Any, Optional
@@ -10,7 +9,11 @@ from sqlalchemy.orm import Session
 from app.models.dream import Dream
 from app.models.dream_analysis import DreamAnalysis
 from app.core.config import settings
+from app.core.gemini import configure_gemini, generate_content
 from app.services.modern_dream_analysis import ModernDreamAnalysisSystem
+from app.services.similarity import cosine_similarity
+from app.services.embedding import load_embedding_model
+from app.core.metrics import track_llm_call, track_embedding
 import logging
 import json
 import uuid
@@ -20,11 +23,11 @@ logger = logging.getLogger(__name__)
 class AIService:
     def __init__(self):
         # Google Gemini API 설정
-        genai.configure(api_key=settings.GEMINI_API_KEY)
+        configure_gemini()
         self.model = genai.GenerativeModel('gemini-pro')
         
         # 한국어 문장 임베딩 모델 로드
-        self.embedding_model = SentenceTransformer('jhgan/ko-sbert-nli')
+        self.embedding_model = load_embedding_model()
         
         # 꿈 네트워크 그래프
         self.dream_network = nx.Graph()
@@ -50,8 +53,8 @@ class AIService:
             reflective_question = await self._generate_reflective_question(dream, basic_analysis)
             
             # 분석 결과를 데이터베이스에 저장
-            analysis = DreamAnalysis(
-                dream_id=dream.id,
+            analysis = self._save_analysis(
+                dream, db,
                 summary_text=basic_analysis.get('summary'),
                 keywords=basic_analysis.get('keywords', []),
                 emotional_flow_text=basic_analysis.get('emotional_flow'),
@@ -60,10 +63,6 @@ class AIService:
                 deja_vu_analysis=deja_vu_analysis
             )
             
-            db.add(analysis)
-            db.commit()
-            db.refresh(analysis)
-            
             # 꿈 분석 상태 업데이트
             dream.analysis_status = 'completed'
             db.commit()
@@ -78,6 +77,18 @@ class AIService:
             db.commit()
             raise e
     
+    def _save_analysis(self, dream: Dream, db: Session, **fields: Any) -> DreamAnalysis:
+        """꿈 분석 결과 저장 (꿈당 하나 - 이전 분석이 있으면 새 결과로 덮어씀)"""
+        analysis = db.query(DreamAnalysis).filter(DreamAnalysis.dream_id == dream.id).first()
+        if analysis is None:
+            analysis = DreamAnalysis(dream_id=dream.id)
+            db.add(analysis)
+        for field, value in fields.items():
+            setattr(analysis, field, value)
+        db.commit()
+        db.refresh(analysis)
+        return analysis
+    
     async def _analyze_basic_content(self, dream: Dream) -> Dict[str, Any]:
         """
         기본 꿈 내용 분석 (요약, 키워드, 감정 흐름)
@@ -115,7 +126,8 @@ class AIService:
             }}
             """
             
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", "analyze_basic_content"):
+                response = generate_content(self.model, prompt)
             result_text = response.text
             
             # JSON 파싱 시도
@@ -179,7 +191,8 @@ class AIService:
             }}
             """
             
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", "analyze_symbols"):
+                response = generate_content(self.model, prompt)
             result_text = response.text
             
             try:
@@ -209,7 +222,8 @@ class AIService:
             if not dream_text.strip():
                 return {"related_dreams": [], "similarity_scores": []}
             
-            current_embedding = self.embedding_model.encode([dream_text])
+            with track_embedding("deja_vu"):
+                current_embedding = self.embedding_model.encode([dream_text])
             
             # 사용자의 다른 꿈들 조회
             user_dreams = db.query(Dream).filter(
@@ -225,12 +239,11 @@ class AIService:
             similarities = []
             for other_dream in user_dreams:
                 other_text = f"{other_dream.title or ''} {other_dream.body_text or ''}"
-                other_embedding = self.embedding_model.encode([other_text])
+                with track_embedding("deja_vu"):
+                    other_embedding = self.embedding_model.encode([other_text])
                 
                 # 코사인 유사도 계산
-                similarity = np.dot(current_embedding[0], other_embedding[0]) / (
-                    np.linalg.norm(current_embedding[0]) * np.linalg.norm(other_embedding[0])
-                )
+                similarity = cosine_similarity(current_embedding[0], other_embedding[0])
                 
                 if similarity > 0.3:  # 임계값 이상인 경우만 포함
                     similarities.append({
@@ -278,7 +291,8 @@ class AIService:
             질문만 답변해주세요.
             """
             
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", "generate_reflective_question"):
+                response = generate_content(self.model, prompt)
             question = response.text.strip()
             
             # 질문이 너무 길면 자르기
@@ -350,7 +364,8 @@ class AIService:
             }}
             """
             
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", "generate_daily_insight"):
+                response = generate_content(self.model, prompt)
             result_text = response.text
             
             try:
@@ -399,8 +414,8 @@ class AIService:
             analysis_result = self.modern_analysis_system.analyze_dream(dream_text, user_profile)
             
             # 분석 결과를 데이터베이스에 저장
-            analysis = DreamAnalysis(
-                dream_id=dream.id,
+            analysis = self._save_analysis(
+                dream, db,
                 summary_text=analysis_result['comprehensive_insights'][0] if analysis_result['comprehensive_insights'] else "현대적 분석이 완료되었습니다.",
                 keywords=analysis_result['analyses'].get('cognitive', {}).get('cognitive_functions', []),
                 emotional_flow_text=analysis_result['analyses'].get('emotional', {}).get('insights', ['감정 분석이 완료되었습니다.'])[0],
@@ -410,10 +425,6 @@ class AIService:
                 created_at=datetime.utcnow()
             )
             
-            db.add(analysis)
-            db.commit()
-            db.refresh(analysis)
-            
             # 꿈 분석 상태 업데이트
             dream.analysis_status = 'completed'
             db.commit()
@@ -0,0 +1,179 @@
+"""
+꿈 분석 작업 관리 서비스
+"""
+from sqlalchemy.orm import Session
+from app.models.dream import Dream
+from app.core.config import settings
+from app.core.redis_client import RELEASE_KEY_SCRIPT, redis_client, async_redis_client
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 분석 진행 단계 (completed/failed 이후에는 이벤트 스트림 종료)
+TERMINAL_STAGES = ('completed', 'failed')
+
+class AnalysisJobService:
+    def __init__(self):
+        # 큐에서 대기하는 동안의 잠금 유지 시간 (작업이 시작되면 최대 실행 시간으로 다시 설정)
+        self.queue_lock_ttl = settings.CELERY_LLM_QUEUE_TTL
+        self.lock_ttl = settings.CELERY_LLM_TIME_LIMIT
+        # 진행 이벤트 보존 개수/시간 (재연결 시 Last-Event-ID 이후부터 재전송)
+        self.events_maxlen = 100
+        self.events_ttl = 24 * 60 * 60
+        # 이벤트가 없을 때 keep-alive 주석을 보내는 간격 (밀리초)
+        self.events_block_ms = 15000
+        # 작업 상태 해시 보존 시간 (초)
+        self.status_ttl = settings.ANALYSIS_STATUS_TTL
+
+    def lock_key(self, dream_id: str) -> str:
+        """
+        꿈별 분석 잠금 키 (꿈당 분석 결과가 하나이므로 내용이 바뀌어도 동시에 하나만 실행)
+        진행 중에 내용이 바뀐 경우 완료 후 다시 요청하면 새 분석 결과로 덮어씀 (작업이 끝나면 성공/실패 모두 해제)
+        """
+        return f"analysis:lock:{dream_id}"
+
+    def enqueue(self, dream: Dream, db: Session) -> Tuple[str, bool]:
+        """
+        꿈 분석 작업을 한 번만 큐에 추가
+        같은 꿈에 대한 동시 요청은 같은 태스크 ID를 공유
+        반환값: (태스크 ID, 새로 추가되었는지 여부)
+        """
+        dream_id = str(dream.id)
+        key = self.lock_key(dream_id)
+        task_id = str(uuid.uuid4())
+
+        # SET NX: 먼저 잠금을 잡은 요청만 태스크를 생성
+        if not redis_client.set(key, task_id, nx=True, ex=self.queue_lock_ttl):
+            existing_task_id = redis_client.get(key)
+            if existing_task_id:
+                logger.info(f"진행 중인 분석 작업 재사용: {dream_id}, 태스크 ID: {existing_task_id}")
+                return existing_task_id, False
+            # 조회 직전에 잠금이 만료된 경우 다시 시도
+            return self.enqueue(dream, db)
+
+        try:
+            dream.analysis_status = 'processing'
+            db.commit()
+
+            # 새 분석이 시작되므로 이전 분석의 이벤트 기록은 제거
+            redis_client.delete(self.events_key(dream_id))
+            self.publish_progress(dream_id, 'queued', 0, '분석 대기 중...', task_id=task_id)
+
+            from app.workers.ai_tasks import analyze_dream_task
+            analyze_dream_task.apply_async(args=[dream_id], kwargs={'lock_key': key}, task_id=task_id)
+        except Exception:
+            # 큐 추가에 실패하면 다음 요청이 다시 시도할 수 있도록 잠금 해제
+            self.release(key, task_id)
+            raise
+
+        logger.info(f"분석 작업 추가: {dream_id}, 태스크 ID: {task_id}")
+        return task_id, True
+
+    def refresh(self, lock_key: str, task_id: str) -> None:
+        """작업 시작 시 잠금 만료를 최대 실행 시간으로 다시 설정 (잠금이 남아 있을 때만)"""
+        redis_client.set(lock_key, task_id, xx=True, ex=self.lock_ttl)
+
+    def release(self, lock_key: str, task_id: str) -> None:
+        """분석 작업 잠금 해제 (잠금이 아직 task_id를 가리킬 때만 - 늦게 끝난 이전 작업이 새 잠금을 지우지 않도록)"""
+        redis_client.eval(RELEASE_KEY_SCRIPT, 1, lock_key, task_id)
+
+    def events_key(self, dream_id: str) -> str:
+        return f"analysis:events:{dream_id}"
+
+    def status_key(self, task_id: str) -> str:
+        return f"analysis:job:{task_id}"
+
+    def publish_progress(
+        self,
+        dream_id: str,
+        stage: str,
+        percent: int,
+        message: str,
+        task_id: Optional[str] = None,
+        **extra: Any
+    ) -> None:
+        """
+        분석 진행 이벤트 발행 (워커에서 호출)
+        Redis Stream에 추가하므로 늦게 연결한 클라이언트도 이전 이벤트를 받을 수 있음
+        task_id가 있으면 작업 상태 해시(단계, 진행률, ID만 저장)도 함께 갱신
+        """
+        try:
+            key = self.events_key(dream_id)
+            data = {'stage': stage, 'percent': percent, 'message': message, **extra}
+            if task_id:
+                data['task_id'] = task_id
+
+            pipe = redis_client.pipeline()
+            pipe.xadd(
+                key,
+                {'stage': stage, 'data': json.dumps(data, ensure_ascii=False)},
+                maxlen=self.events_maxlen,
+                approximate=True
+            )
+            pipe.expire(key, self.events_ttl)
+
+            if task_id:
+                status = {'stage': stage, 'percent': percent, 'dream_id': dream_id}
+                if extra.get('analysis_id'):
+                    status['analysis_id'] = extra['analysis_id']
+                status_key = self.status_key(task_id)
+                pipe.hset(status_key, mapping=status)
+                pipe.expire(status_key, self.status_ttl)
+
+            pipe.execute()
+        except Exception as e:
+            # 진행 이벤트 실패가 분석 자체를 실패시키지 않도록 함
+            logger.warning(f"분석 진행 이벤트 발행 실패: {dream_id}, 오류: {str(e)}")
+
+    async def get_status(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (만료되었거나 없는 작업이면 None)"""
+        status = await async_redis_client.hgetall(self.status_key(task_id))
+        if not status:
+            return None
+        status['percent'] = int(status.get('percent', 0))
+        return status
+
+    async def event_stream(
+        self,
+        dream_id: str,
+        last_event_id: Optional[str] = None,
+        current_status: Optional[str] = None,
+        is_disconnected=None
+    ) -> AsyncIterator[str]:
+        """
+        분석 진행 이벤트를 SSE 형식으로 전달
+        클라이언트가 응답을 소비해야 다음 이벤트를 읽으므로 느린 클라이언트에 자연스럽게 배압이 걸림
+        """
+        key = self.events_key(dream_id)
+        cursor = last_event_id or '0-0'
+
+        # 이벤트 기록이 만료되었지만 이미 끝난 분석이면 최종 상태만 전송
+        if current_status in TERMINAL_STAGES and not await async_redis_client.exists(key):
+            data = json.dumps({'stage': current_status, 'percent': 100 if current_status == 'completed' else 0}, ensure_ascii=False)
+            yield f"event: {current_status}\ndata: {data}\n\n"
+            return
+
+        yield "retry: 3000\n\n"
+        while True:
+            if is_disconnected is not None and await is_disconnected():
+                return
+
+            entries = await async_redis_client.xread({key: cursor}, count=20, block=self.events_block_ms)
+            if not entries:
+                # 프록시가 유휴 연결을 끊지 않도록 keep-alive 주석 전송
+                yield ": keep-alive\n\n"
+                continue
+
+            for _, messages in entries:
+                for event_id, fields in messages:
+                    cursor = event_id
+                    stage = fields.get('stage', 'progress')
+                    yield f"id: {event_id}\nevent: {stage}\ndata: {fields.get('data', '{}')}\n\n"
+                    if stage in TERMINAL_STAGES:
+                        return
+
+# 전역 분석 작업 서비스 인스턴스
+analysis_job_service = AnalysisJobService()
@@ -2,17 +2,66 @@
 커뮤니티 서비스
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import desc, and_, or_
 from app.models.community import CommunityPost
 from app.models.dream import Dream
 from app.models.user import User
 from app.schemas.community import CommunityPostCreate, CommunityPostResponse, CommunityPostUpdate
+from app.core.config import settings
+from app.core.metrics import record_cache
+from app.core.redis_client import async_redis_client
+from app.services.tag_index_service import tag_index_service
+from app.services.trending_service import trending_service
 from typing import List, Optional, Dict, Any
+import json
 import logging
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# 목록 응답에 필요한 컬럼만 행으로 조회 (ORM 엔티티 생성 생략)
+POST_LIST_COLUMNS = (
+    CommunityPost.id,
+    CommunityPost.user_id,
+    CommunityPost.dream_id,
+    CommunityPost.content,
+    CommunityPost.tags,
+    CommunityPost.is_anonymous,
+    CommunityPost.created_at,
+)
+
+def _post_list_item(row) -> Dict[str, Any]:
+    """목록 행을 응답 항목으로 변환 (익명 포스트는 사용자 정보 숨김)"""
+    user_id = str(row.user_id)
+    return {
+        "id": str(row.id),
+        "content": row.content,
+        "tags": row.tags or [],
+        "is_anonymous": row.is_anonymous,
+        "created_at": row.created_at.isoformat(),
+        "dream_id": str(row.dream_id) if row.dream_id else None,
+        "user": {
+            "id": None if row.is_anonymous else user_id,
+            "name": "익명" if row.is_anonymous else f"사용자{user_id[:8]}"
+        }
+    }
+
+def feed_ids_key(tag: Optional[str] = None) -> str:
+    """최신 포스트 ID 목록 캐시 키 (전체 또는 태그별, 최신순 COMMUNITY_FEED_CACHE_SIZE개)"""
+    return f"community:feed:tag:{tag}:ids" if tag else "community:feed:ids"
+
+def feed_count_key(tag: Optional[str] = None) -> str:
+    """피드 전체 포스트 수 캐시 키 (ID 목록과 함께 만들고 함께 만료)"""
+    return f"community:feed:tag:{tag}:count" if tag else "community:feed:count"
+
+def post_cache_key(post_id: str) -> str:
+    """목록 항목 캐시 키"""
+    return f"community:post:{post_id}"
+
+def _feed_scopes(tags: Optional[List[str]]) -> List[Optional[str]]:
+    """포스트가 속한 피드 (전체 + 태그별)"""
+    return [None] + list(dict.fromkeys(tags or []))
+
 class CommunityService:
     def __init__(self):
         pass
@@ -47,6 +96,9 @@ class CommunityService:
             db.add(db_post)
             db.commit()
             db.refresh(db_post)
+            await self._add_to_feeds(db_post)
+            await tag_index_service.publish("upsert", db_post.id, db_post.tags)
+            await trending_service.record_post(db_post.id, db_post.tags)
             
             logger.info(f"커뮤니티 포스트 생성: {db_post.id}")
             return CommunityPostResponse.from_orm(db_post)
@@ -62,17 +114,42 @@ class CommunityService:
         limit: int = 20, 
         db: Session = None,
         tags_filter: Optional[List[str]] = None,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        tags_match: str = "all",
+        sort: str = "latest"
     ) -> Dict[str, Any]:
         """
-        커뮤니티 포스트 목록 조회
+        커뮤니티 포스트 목록 조회 (tags_match: "all"이면 모든 태그, "any"면 하나 이상 포함한 포스트)
+        전체/단일 태그 피드의 앞부분(COMMUNITY_FEED_CACHE_SIZE개 이내)은 Redis 캐시에서 응답
+        그 밖의 태그 필터는 태그 역색인 비트맵 연산으로 페이지 ID를 구한 뒤 해당 행만 조회
+        sort="trending"이면 전체 피드를 인기 순위(Redis 정렬 집합) 순으로 응답
         """
         try:
+            unique_tags = list(dict.fromkeys(tags_filter or []))
+            if sort == "trending":
+                if unique_tags or user_id:
+                    raise ValueError("인기순 정렬은 전체 피드에서만 사용할 수 있습니다")
+                trending = await self._get_trending_page(skip, limit, db)
+                if trending is not None:
+                    return trending
+            
+            if not user_id and len(unique_tags) <= 1 and skip + limit <= settings.COMMUNITY_FEED_CACHE_SIZE:
+                cached = await self._get_cached_feed_page(unique_tags[0] if unique_tags else None, skip, limit, db)
+                if cached is not None:
+                    return cached
+            
+            if unique_tags and not user_id:
+                indexed = await self._get_indexed_page(unique_tags, tags_match == "all", skip, limit, db)
+                if indexed is not None:
+                    return indexed
+            
             query = db.query(CommunityPost)
             
             # 태그 필터
-            if tags_filter:
-                for tag in tags_filter:
+            if unique_tags and tags_match == "any":
+                query = query.filter(or_(*[CommunityPost.tags.contains([tag]) for tag in unique_tags]))
+            else:
+                for tag in unique_tags:
                     query = query.filter(CommunityPost.tags.contains([tag]))
             
             # 사용자 필터 (특정 사용자의 포스트만)
@@ -83,38 +160,222 @@ class CommunityService:
             total_count = query.count()
             
             # 정렬 및 페이지네이션
-            posts = query.order_by(desc(CommunityPost.created_at)).offset(skip).limit(limit).all()
+            posts = query.with_entities(*POST_LIST_COLUMNS).order_by(
+                desc(CommunityPost.created_at)
+            ).offset(skip).limit(limit).all()
             
             # 응답 데이터 구성
-            posts_data = []
-            for post in posts:
-                post_data = {
-                    "id": str(post.id),
-                    "content": post.content,
-                    "tags": post.tags or [],
-                    "is_anonymous": post.is_anonymous,
-                    "created_at": post.created_at.isoformat(),
-                    "dream_id": str(post.dream_id) if post.dream_id else None,
-                    "user": {
-                        "id": str(post.user_id) if not post.is_anonymous else None,
-                        "name": "익명" if post.is_anonymous else f"사용자{str(post.user_id)[:8]}"
-                    }
-                }
-                posts_data.append(post_data)
+            posts_data = [_post_list_item(post) for post in posts]
             
-            return {
-                "posts": posts_data,
-                "total_count": total_count,
-                "page": (skip // limit) + 1,
-                "page_size": limit,
-                "has_next": skip + limit < total_count,
-                "has_previous": skip > 0
-            }
+            return self._page(posts_data, total_count, skip, limit)
             
         except Exception as e:
             logger.error(f"커뮤니티 포스트 목록 조회 실패: {str(e)}")
             raise e
     
+    def _page(self, posts_data: List[Dict[str, Any]], total_count: int, skip: int, limit: int) -> Dict[str, Any]:
+        return {
+            "posts": posts_data,
+            "total_count": total_count,
+            "page": (skip // limit) + 1,
+            "page_size": limit,
+            "has_next": skip + limit < total_count,
+            "has_previous": skip > 0
+        }
+    
+    async def _get_indexed_page(
+        self,
+        tags: List[str],
+        match_all: bool,
+        skip: int,
+        limit: int,
+        db: Session
+    ) -> Optional[Dict[str, Any]]:
+        """태그 역색인으로 필터 결과 개수와 최신순 페이지 ID를 구하고 그 행만 조회 (색인/Redis 오류 시 None)"""
+        try:
+            await tag_index_service.ensure_current(db)
+            matched = tag_index_service.match(tags, match_all)
+            page_ids = tag_index_service.page(matched, skip, limit)
+        except Exception as e:
+            logger.warning(f"태그 색인 조회 실패: {tags}, 오류: {str(e)}")
+            return None
+        
+        rows = db.query(*POST_LIST_COLUMNS).filter(CommunityPost.id.in_(page_ids)).all() if page_ids else []
+        # 색인 순서(최신순)대로 정렬 (다른 프로세스에서 막 삭제된 포스트는 빠짐)
+        rows_by_id = {row.id: row for row in rows}
+        posts_data = [_post_list_item(rows_by_id[post_id]) for post_id in page_ids if post_id in rows_by_id]
+        return self._page(posts_data, len(matched), skip, limit)
+    
+    async def _get_trending_page(self, skip: int, limit: int, db: Session) -> Optional[Dict[str, Any]]:
+        """
+        인기 순위 페이지 ID의 본문을 캐시/DB에서 조회 (삭제된 포스트는 순위에서 제거, Redis 오류 시 None)
+        순위가 비어 있으면 DB 카운터로 다시 채우고, 그래도 비어 있으면 None (최신순으로 대체)
+        """
+        try:
+            post_ids, total_count = await trending_service.get_page(skip, limit)
+            if not total_count and await trending_service.seed_from_db(db):
+                post_ids, total_count = await trending_service.get_page(skip, limit)
+            if not total_count:
+                return None
+            posts_data = await self._get_cached_posts(post_ids, db)
+        except Exception as e:
+            logger.warning(f"인기 순위 조회 실패, 최신순으로 대체: {str(e)}")
+            return None
+        
+        if len(posts_data) < len(post_ids):
+            found = {item["id"] for item in posts_data}
+            await trending_service.remove_posts([post_id for post_id in post_ids if post_id not in found])
+        return self._page(posts_data, total_count, skip, limit)
+    
+    async def _get_cached_feed_page(
+        self,
+        tag: Optional[str],
+        skip: int,
+        limit: int,
+        db: Session
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 최신 ID 목록과 포스트 본문으로 피드 페이지 구성 (본문이 모두 캐시에 있으면 DB 조회 없음)
+        ID 목록이 없거나 삭제로 페이지 범위를 채우지 못하면 최신 목록을 DB에서 다시 만들어 응답
+        (Redis는 빈 리스트를 지우므로 빈 피드는 캐시하지 않음 - 개수만 남아 있어도 목록이 없으면 다시 만듦)
+        Redis 오류 시 None (DB 조회로 대체)
+        """
+        try:
+            pipe = async_redis_client.pipeline(transaction=False)
+            pipe.lrange(feed_ids_key(tag), 0, settings.COMMUNITY_FEED_CACHE_SIZE - 1)
+            pipe.get(feed_count_key(tag))
+            post_ids, total_count = await pipe.execute()
+            
+            # 생성과 목록 재구성이 겹치면 같은 ID가 두 번 들어갈 수 있으므로 중복 제거
+            post_ids = list(dict.fromkeys(post_ids))
+            hit = bool(post_ids) and total_count is not None and len(post_ids) >= min(int(total_count), skip + limit)
+            record_cache("community_feed", hit)
+            if not hit:
+                posts_data, total_count = await self._rebuild_feed(tag, db)
+                return self._page(posts_data[skip:skip + limit], total_count, skip, limit)
+            
+            page_ids = post_ids[skip:skip + limit]
+            posts_data = await self._get_cached_posts(page_ids, db)
+            if len(posts_data) < len(page_ids):
+                # 캐시 밖에서 삭제된 포스트 (사용자 탈퇴 등) - 다음 요청에서 목록 재구성
+                await async_redis_client.delete(feed_ids_key(tag), feed_count_key(tag))
+                return None
+            return self._page(posts_data, int(total_count), skip, limit)
+            
+        except Exception as e:
+            logger.warning(f"커뮤니티 피드 캐시 조회 실패: {tag}, 오류: {str(e)}")
+            return None
+    
+    async def _get_cached_posts(self, post_ids: List[str], db: Session) -> List[Dict[str, Any]]:
+        """포스트 본문 캐시 조회 (없는 것만 DB에서 한 번에 조회 후 캐시), DB에도 없는 포스트는 빠짐"""
+        if not post_ids:
+            return []
+        cached = await async_redis_client.mget([post_cache_key(post_id) for post_id in post_ids])
+        posts = {post_id: json.loads(value) for post_id, value in zip(post_ids, cached) if value}
+        
+        missing = [post_id for post_id in post_ids if post_id not in posts]
+        record_cache("community_post", not missing)
+        if missing:
+            rows = db.query(*POST_LIST_COLUMNS).filter(
+                CommunityPost.id.in_([uuid.UUID(post_id) for post_id in missing])
+            ).all()
+            loaded = [_post_list_item(row) for row in rows]
+            await self._cache_posts(loaded)
+            posts.update((item["id"], item) for item in loaded)
+        return [posts[post_id] for post_id in post_ids if post_id in posts]
+    
+    async def _cache_posts(self, posts_data: List[Dict[str, Any]], pipe=None) -> None:
+        """목록 항목 본문 캐시 저장 (pipe가 있으면 그 파이프라인에 추가만 함)"""
+        if not posts_data:
+            return
+        target = pipe if pipe is not None else async_redis_client.pipeline(transaction=False)
+        for item in posts_data:
+            target.set(post_cache_key(item["id"]), json.dumps(item, ensure_ascii=False), ex=settings.COMMUNITY_POST_CACHE_TTL)
+        if pipe is None:
+            await target.execute()
+    
+    async def _rebuild_feed(self, tag: Optional[str], db: Session):
+        """DB에서 최신 COMMUNITY_FEED_CACHE_SIZE개와 전체 개수를 조회해 ID 목록/개수/본문 캐시를 다시 만듦"""
+        query = db.query(CommunityPost)
+        if tag:
+            query = query.filter(CommunityPost.tags.contains([tag]))
+        total_count = query.count()
+        rows = query.with_entities(*POST_LIST_COLUMNS).order_by(
+            desc(CommunityPost.created_at)
+        ).limit(settings.COMMUNITY_FEED_CACHE_SIZE).all()
+        posts_data = [_post_list_item(row) for row in rows]
+        
+        pipe = async_redis_client.pipeline(transaction=True)
+        pipe.delete(feed_ids_key(tag), feed_count_key(tag))
+        if posts_data:
+            pipe.rpush(feed_ids_key(tag), *[item["id"] for item in posts_data])
+            pipe.expire(feed_ids_key(tag), settings.COMMUNITY_FEED_CACHE_TTL)
+            pipe.set(feed_count_key(tag), total_count, ex=settings.COMMUNITY_FEED_CACHE_TTL)
+        await self._cache_posts(posts_data, pipe)
+        await pipe.execute()
+        return posts_data, total_count
+    
+    async def _add_to_feeds(self, post: CommunityPost) -> None:
+        """
+        새 포스트를 전체/태그 피드 앞에 추가 (캐시된 피드만, 없는 피드는 다음 조회 때 DB에서 만듦)
+        ID 목록과 개수는 같은 TTL로 함께 만들어지므로 목록이 있을 때만 개수를 올리고, 목록이 없으면 남은 개수도 지움
+        """
+        try:
+            item = _post_list_item(post)
+            scopes = _feed_scopes(post.tags)
+            pipe = async_redis_client.pipeline(transaction=False)
+            for tag in scopes:
+                pipe.lpushx(feed_ids_key(tag), item["id"])
+                pipe.ltrim(feed_ids_key(tag), 0, settings.COMMUNITY_FEED_CACHE_SIZE - 1)
+            await self._cache_posts([item], pipe)
+            results = await pipe.execute()
+            
+            pipe = async_redis_client.pipeline(transaction=False)
+            for tag, pushed in zip(scopes, results[0::2]):
+                if pushed:
+                    pipe.incr(feed_count_key(tag))
+                else:
+                    pipe.delete(feed_count_key(tag))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"커뮤니티 피드 캐시 추가 실패: {post.id}, 오류: {str(e)}")
+    
+    async def _remove_from_feeds(self, post_id: str, tags: Optional[List[str]]) -> None:
+        """
+        삭제된 포스트를 피드와 본문 캐시에서 제거 (캐시된 피드의 개수도 내림)
+        마지막 포스트가 빠져 목록이 사라진 피드는 개수도 지워 다음 조회 때 다시 만듦
+        """
+        try:
+            scopes = _feed_scopes(tags)
+            pipe = async_redis_client.pipeline(transaction=False)
+            for tag in scopes:
+                pipe.exists(feed_ids_key(tag))
+                pipe.lrem(feed_ids_key(tag), 0, post_id)
+                pipe.exists(feed_ids_key(tag))
+            pipe.delete(post_cache_key(post_id))
+            results = await pipe.execute()
+            
+            pipe = async_redis_client.pipeline(transaction=False)
+            for tag, cached, remaining in zip(scopes, results[0:-1:3], results[2:-1:3]):
+                if cached and remaining:
+                    pipe.decr(feed_count_key(tag))
+                elif cached:
+                    pipe.delete(feed_count_key(tag))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"커뮤니티 피드 캐시 제거 실패: {post_id}, 오류: {str(e)}")
+    
+    async def _refresh_cached_post(self, post: CommunityPost, changed_tags: List[str]) -> None:
+        """수정된 포스트 본문 캐시 갱신, 태그가 바뀌었으면 해당 태그 피드는 다음 조회 때 다시 만듦"""
+        try:
+            pipe = async_redis_client.pipeline(transaction=False)
+            await self._cache_posts([_post_list_item(post)], pipe)
+            for tag in changed_tags:
+                pipe.delete(feed_ids_key(tag), feed_count_key(tag))
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"커뮤니티 포스트 캐시 갱신 실패: {post.id}, 오류: {str(e)}")
+    
     async def get_post(self, post_id: str, db: Session) -> Optional[CommunityPostResponse]:
         """
         특정 커뮤니티 포스트 조회
@@ -125,6 +386,7 @@ class CommunityService:
             if not post:
                 return None
             
+            await trending_service.record_engagement(post.id, "view", post.tags)
             return CommunityPostResponse.from_orm(post)
             
         except Exception as e:
@@ -153,7 +415,9 @@ class CommunityService:
             if post_update.content is not None:
                 post.content = post_update.content
             
+            changed_tags = []
             if post_update.tags is not None:
+                changed_tags = list(set(post.tags or []) ^ set(post_update.tags))
                 post.tags = post_update.tags
             
             if post_update.is_anonymous is not None:
@@ -161,6 +425,9 @@ class CommunityService:
             
             db.commit()
             db.refresh(post)
+            await self._refresh_cached_post(post, changed_tags)
+            if changed_tags:
+                await tag_index_service.publish("upsert", post.id, post.tags)
             
             logger.info(f"커뮤니티 포스트 수정: {post_id}")
             return CommunityPostResponse.from_orm(post)
@@ -182,8 +449,12 @@ class CommunityService:
             if not post:
                 raise ValueError("포스트를 찾을 수 없거나 권한이 없습니다")
             
+            deleted_id, tags = str(post.id), post.tags
             db.delete(post)
             db.commit()
+            await self._remove_from_feeds(deleted_id, tags)
+            await tag_index_service.publish("delete", deleted_id)
+            await trending_service.remove_posts([deleted_id])
             
             logger.info(f"커뮤니티 포스트 삭제: {post_id}")
             return True
@@ -193,11 +464,43 @@ class CommunityService:
             logger.error(f"커뮤니티 포스트 삭제 실패: {str(e)}")
             raise e
     
+    async def add_reaction(self, post_id: str, user_id: str, db: Session) -> bool:
+        """
+        포스트 반응 기록 (같은 사용자는 COMMUNITY_REACTION_DEDUPE_TTL 동안 한 번만), 반영했으면 True
+        """
+        try:
+            post = db.query(CommunityPost.id, CommunityPost.tags).filter(CommunityPost.id == post_id).first()
+            
+            if not post:
+                raise ValueError("포스트를 찾을 수 없습니다")
+            
+            return await trending_service.add_reaction(post.id, user_id, post.tags)
+            
+        except Exception as e:
+            logger.error(f"커뮤니티 포스트 반응 실패: {str(e)}")
+            raise e
+    
+    async def get_trending_tags(self, db: Session, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        급상승 태그 조회 (시간 감쇠된 참여 점수 순, Redis 오류 시 전체 기간 인기 태그)
+        """
+        try:
+            return await trending_service.get_tags(limit)
+        except Exception as e:
+            logger.warning(f"급상승 태그 조회 실패, 인기 태그로 대체: {str(e)}")
+            return await self.get_popular_tags(db, limit)
+    
     async def get_popular_tags(self, db: Session, limit: int = 20) -> List[Dict[str, Any]]:
         """
-        인기 태그 조회
+        인기 태그 조회 (태그 역색인의 비트맵 크기, 색인 조회 실패 시 DB 집계)
         """
         try:
+            try:
+                await tag_index_service.ensure_current(db)
+                return tag_index_service.tag_counts(limit=limit)
+            except Exception as e:
+                logger.warning(f"태그 색인 인기 태그 조회 실패, DB 집계로 대체: {str(e)}")
+            
             # 모든 포스트의 태그를 수집
             posts = db.query(CommunityPost).filter(CommunityPost.tags.isnot(None)).all()
             
@@ -237,24 +540,13 @@ class CommunityService:
             )
             
             total_count = posts_query.count()
-            posts = posts_query.order_by(desc(CommunityPost.created_at)).offset(skip).limit(limit).all()
+            posts = posts_query.with_entities(*POST_LIST_COLUMNS).order_by(
+                desc(CommunityPost.created_at)
+            ).offset(skip).limit(limit).all()
             
             # 응답 데이터 구성
-            posts_data = []
-            for post in posts:
-                post_data = {
-                    "id": str(post.id),
-                    "content": post.content,
-                    "tags": post.tags or [],
-                    "is_anonymous": post.is_anonymous,
-                    "created_at": post.created_at.isoformat(),
-                    "dream_id": str(post.dream_id) if post.dream_id else None,
-                    "user": {
-                        "id": str(post.user_id) if not post.is_anonymous else None,
-                        "name": "익명" if post.is_anonymous else f"사용자{str(post.user_id)[:8]}"
-                    }
-                }
-                posts_data.append(post_data)
+            posts_data = [_post_list_item(post) for post in posts]
+            tag_facets = await self._get_tag_facets(posts_query, total_count, db)
             
             return {
                 "posts": posts_data,
@@ -263,12 +555,33 @@ class CommunityService:
                 "page_size": limit,
                 "has_next": skip + limit < total_count,
                 "has_previous": skip > 0,
-                "query": query
+                "query": query,
+                "tag_facets": tag_facets
             }
             
         except Exception as e:
             logger.error(f"커뮤니티 포스트 검색 실패: {str(e)}")
             raise e
+    
+    async def _get_tag_facets(self, posts_query, total_count: int, db: Session) -> List[Dict[str, Any]]:
+        """
+        검색 결과의 태그별 포스트 수 (결과 ID 비트맵과 태그 비트맵의 교집합 크기, 실패 시 빈 목록)
+        결과가 많으면 최신 COMMUNITY_TAG_FACET_SCAN_LIMIT개 안에서만 셈 (흔한 검색어에 전체 ID를 읽지 않도록)
+        """
+        if not total_count:
+            return []
+        try:
+            await tag_index_service.ensure_current(db)
+            post_ids = posts_query.with_entities(CommunityPost.id).order_by(
+                desc(CommunityPost.created_at)
+            ).limit(settings.COMMUNITY_TAG_FACET_SCAN_LIMIT).execution_options(
+                yield_per=settings.TAG_INDEX_BATCH_SIZE
+            )
+            matched = tag_index_service.bitmap_for(post_id for post_id, in post_ids)
+            return tag_index_service.tag_counts(within=matched, limit=settings.COMMUNITY_TAG_FACET_LIMIT)
+        except Exception as e:
+            logger.warning(f"검색 결과 태그 패싯 계산 실패: {str(e)}")
+            return []
 
 # 전역 커뮤니티 서비스 인스턴스
 community_service = CommunityService()
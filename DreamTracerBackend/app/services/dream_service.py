@@ -2,47 +2,171 @@
 꿈 서비스
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import func, desc, and_, insert, select
 from app.models.dream import Dream
 from app.models.dream_analysis import DreamAnalysis
+from app.models.sync import SyncTombstone
 from app.schemas.dream import (
     DreamCreate, DreamUpdate, DreamResponse, DreamAnalysis as DreamAnalysisSchema,
-    DreamListResponse, DreamStats, AudioUploadResponse
+    DreamListResponse, DreamStats, AudioUploadResponse,
+    DreamListItem, DreamFieldsListResponse, DREAM_CARD_FIELDS,
+    DreamImportError, DreamImportResponse
 )
-from typing import List, Optional, Dict, Any
+from app.core.config import settings
+from app.core.responses import dumps
+from app.services.file_service import file_service
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Iterator, List, Optional, Dict, Any, Union
 from datetime import datetime, date, timedelta
+import hashlib
+import json
 import logging
 import os
 import uuid
 
 logger = logging.getLogger(__name__)
 
+# 목록 행 일괄 검증용 어댑터 (요청마다 스키마를 다시 만들지 않도록 모듈 로드 시 생성)
+dream_list_adapter = TypeAdapter(List[DreamResponse])
+dream_item_list_adapter = TypeAdapter(List[DreamListItem])
+
+# 목록 응답 필드별 조회 컬럼 (body_preview는 본문 앞부분만 DB에서 잘라서 조회)
+DREAM_LIST_COLUMNS = {
+    name: getattr(Dream, name) for name in DreamResponse.model_fields
+}
+DREAM_LIST_COLUMNS["body_preview"] = func.substr(
+    Dream.body_text, 1, settings.DREAM_PREVIEW_LENGTH
+).label("body_preview")
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    fields= 쿼리 파싱 (쉼표 구분 필드 이름, "card"는 목록 카드 필드 묶음)
+    비어 있으면 None (전체 필드), id는 항상 포함
+    """
+    if not fields:
+        return None
+    names = ["id"]
+    for name in (field.strip() for field in fields.split(',')):
+        if not name:
+            continue
+        expanded = DREAM_CARD_FIELDS if name == "card" else (name,)
+        for field in expanded:
+            if field not in DREAM_LIST_COLUMNS:
+                raise ValueError(f"알 수 없는 필드입니다: {field}")
+            if field not in names:
+                names.append(field)
+    return names
+
+# 내보내기 컬럼 (가져오기 입력과 같은 필드 이름 - 내보낸 파일을 그대로 다시 가져올 수 있음)
+DREAM_EXPORT_COLUMNS = [
+    DREAM_LIST_COLUMNS[name] for name in DreamResponse.model_fields if name != "user_id"
+]
+
+def audio_duration_path(stored_path: str) -> str:
+    """오디오 길이 추출 결과 파일 경로 (오디오 파일 옆)"""
+    return f"{stored_path}.json"
+
+def read_audio_duration(user_id, audio_file_path: Optional[str]) -> Optional[float]:
+    """
+    업로드한 오디오의 추출된 길이 (초)
+    사용자 본인의 audio/ 경로가 아니거나 아직 추출 전이면 None (추출 작업이 끝나면 꿈에 직접 기록)
+    """
+    if not audio_file_path or not audio_file_path.startswith(f"audio/{user_id}/"):
+        return None
+    try:
+        with open(audio_duration_path(file_service.resolve(audio_file_path))) as meta_file:
+            return json.load(meta_file).get('duration')
+    except (ValueError, OSError):
+        return None
+
+async def iter_ndjson_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[tuple]:
+    """
+    바이트 청크 스트림을 (줄 번호, 줄) 단위로 분리 (빈 줄 제외)
+    max_line_bytes를 넘는 줄은 None으로 내보내고 다음 줄바꿈까지 버림 (버퍼 크기 일정)
+    """
+    buffer = b""
+    line_number = 0
+    skipping = False
+    async for chunk in chunks:
+        lines = (buffer + chunk).split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            line_number += 1
+            if skipping or len(line) > max_line_bytes:
+                skipping = False
+                yield line_number, None
+            elif line.strip():
+                yield line_number, line
+        if len(buffer) > max_line_bytes:
+            buffer = b""
+            skipping = True
+    if skipping:
+        yield line_number + 1, None
+    elif buffer.strip():
+        yield line_number + 1, buffer
+
 class DreamService:
     def __init__(self):
         pass
 
+    def _dream_values(self, user_id: str, dream_data: DreamCreate) -> Dict[str, Any]:
+        """DreamCreate를 Dream 컬럼 값으로 변환"""
+        # 감정 태그를 문자열 리스트로 변환
+        emotion_tags = [tag.value if hasattr(tag, 'value') else str(tag) for tag in dream_data.emotion_tags] if dream_data.emotion_tags else []
+        
+        return dict(
+            user_id=user_id,
+            dream_date=dream_data.dream_date,
+            title=dream_data.title,
+            body_text=dream_data.body_text,
+            audio_file_path=dream_data.audio_file_path,
+            audio_duration=read_audio_duration(user_id, dream_data.audio_file_path),
+            lucidity_level=dream_data.lucidity_level,
+            emotion_tags=emotion_tags,
+            is_shared=dream_data.is_shared,
+            dream_type=dream_data.dream_type,
+            sleep_quality=dream_data.sleep_quality,
+            dream_duration=dream_data.dream_duration,
+            location=dream_data.location,
+            characters=dream_data.characters or [],
+            symbols=dream_data.symbols or []
+        )
+
+    def _list_page(
+        self,
+        query,
+        skip: int,
+        limit: int,
+        fields: Optional[List[str]]
+    ) -> Union[DreamListResponse, DreamFieldsListResponse]:
+        """
+        필요한 컬럼만 행으로 조회해 한 번에 검증 (ORM 엔티티 생성 없음)
+        fields가 없으면 DreamResponse 전체 필드, 있으면 해당 필드만 채운 DreamListItem
+        """
+        total_count = query.count()
+
+        columns = [DREAM_LIST_COLUMNS[name] for name in (fields or DreamResponse.model_fields)]
+        rows = query.with_entities(*columns).order_by(
+            desc(Dream.dream_date)
+        ).offset(skip).limit(limit).all()
+        rows = [row._asdict() for row in rows]
+
+        page_info = dict(
+            total_count=total_count,
+            page=(skip // limit) + 1,
+            page_size=limit,
+            has_next=skip + limit < total_count,
+            has_previous=skip > 0
+        )
+        if fields is None:
+            return DreamListResponse(dreams=dream_list_adapter.validate_python(rows), **page_info)
+        return DreamFieldsListResponse(dreams=dream_item_list_adapter.validate_python(rows), **page_info)
+
     async def create_dream(self, user_id: str, dream_data: DreamCreate, db: Session) -> DreamResponse:
         """새 꿈 기록 생성"""
         try:
-            # 감정 태그를 문자열 리스트로 변환
-            emotion_tags = [tag.value if hasattr(tag, 'value') else str(tag) for tag in dream_data.emotion_tags] if dream_data.emotion_tags else []
-            
-            db_dream = Dream(
-                user_id=user_id,
-                dream_date=dream_data.dream_date,
-                title=dream_data.title,
-                body_text=dream_data.body_text,
-                audio_file_path=dream_data.audio_file_path,
-                lucidity_level=dream_data.lucidity_level,
-                emotion_tags=emotion_tags,
-                is_shared=dream_data.is_shared,
-                dream_type=dream_data.dream_type,
-                sleep_quality=dream_data.sleep_quality,
-                dream_duration=dream_data.dream_duration,
-                location=dream_data.location,
-                characters=dream_data.characters or [],
-                symbols=dream_data.symbols or []
-            )
+            db_dream = Dream(**self._dream_values(user_id, dream_data))
             
             db.add(db_dream)
             db.commit()
@@ -65,9 +189,10 @@ class DreamService:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         dream_type: Optional[str] = None,
-        emotion_filter: Optional[List[str]] = None
-    ) -> DreamListResponse:
-        """사용자의 꿈 목록 조회 (필터링 및 페이지네이션)"""
+        emotion_filter: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None
+    ) -> Union[DreamListResponse, DreamFieldsListResponse]:
+        """사용자의 꿈 목록 조회 (필터링 및 페이지네이션, fields 지정 시 해당 필드만 조회)"""
         try:
             query = db.query(Dream).filter(Dream.user_id == user_id)
             
@@ -86,25 +211,7 @@ class DreamService:
                 for emotion in emotion_filter:
                     query = query.filter(Dream.emotion_tags.contains([emotion]))
             
-            # 총 개수 조회
-            total_count = query.count()
-            
-            # 정렬 및 페이지네이션
-            dreams = query.order_by(desc(Dream.dream_date)).offset(skip).limit(limit).all()
-            
-            # 페이지네이션 정보 계산
-            has_next = skip + limit < total_count
-            has_previous = skip > 0
-            page = (skip // limit) + 1
-            
-            return DreamListResponse(
-                dreams=[DreamResponse.from_orm(dream) for dream in dreams],
-                total_count=total_count,
-                page=page,
-                page_size=limit,
-                has_next=has_next,
-                has_previous=has_previous
-            )
+            return self._list_page(query, skip, limit, fields)
             
         except Exception as e:
             logger.error(f"꿈 목록 조회 실패: {str(e)}")
@@ -127,6 +234,24 @@ class DreamService:
             logger.error(f"꿈 조회 실패: {str(e)}")
             raise
 
+    async def get_dream_version(self, dream_id: str, user_id: str, db: Session) -> Optional[datetime]:
+        """꿈 상세 ETag용 버전 (updated_at 컬럼만 조회, 없으면 None)"""
+        row = db.query(Dream.updated_at).filter(
+            Dream.id == dream_id,
+            Dream.user_id == user_id
+        ).first()
+        return row.updated_at if row else None
+
+    async def get_stats_version(self, user_id: str, db: Session) -> tuple:
+        """
+        통계 ETag용 버전 (꿈 개수, 마지막 수정 시각)
+        생성/수정/삭제와 분석 상태 변경 시 둘 중 하나가 바뀜
+        """
+        total, last_updated = db.query(
+            func.count(Dream.id), func.max(Dream.updated_at)
+        ).filter(Dream.user_id == user_id).one()
+        return total, last_updated
+
     async def update_dream(self, dream_id: str, user_id: str, dream_update: DreamUpdate, db: Session) -> DreamResponse:
         """꿈 기록 수정"""
         try:
@@ -147,6 +272,7 @@ class DreamService:
             
             if dream_update.audio_file_path is not None:
                 dream.audio_file_path = dream_update.audio_file_path
+                dream.audio_duration = read_audio_duration(user_id, dream_update.audio_file_path)
             
             if dream_update.lucidity_level is not None:
                 dream.lucidity_level = dream_update.lucidity_level
@@ -198,6 +324,10 @@ class DreamService:
             if not dream:
                 raise ValueError("꿈을 찾을 수 없습니다")
             
+            # 앱 동기화가 다른 기기의 로컬 사본도 지울 수 있도록 삭제 기록
+            db.add(SyncTombstone(
+                user_id=dream.user_id, entity_type="dream", entity_id=dream.id, client_id=dream.client_id
+            ))
             db.delete(dream)
             db.commit()
             
@@ -220,13 +350,9 @@ class DreamService:
             if not dream:
                 raise ValueError("꿈을 찾을 수 없습니다")
             
-            # 분석 상태 업데이트
-            dream.analysis_status = 'processing'
-            db.commit()
-            
-            # Celery 작업 큐에 AI 분석 작업 추가
-            from app.workers.ai_tasks import analyze_dream_task
-            task = analyze_dream_task.delay(dream_id)
+            # Celery 작업 큐에 AI 분석 작업 추가 (진행 중인 같은 요청이 있으면 재사용)
+            from app.services.analysis_job_service import analysis_job_service
+            task_id, _ = analysis_job_service.enqueue(dream, db)
             
             # 임시 분석 결과 반환 (실제 분석은 백그라운드에서 진행)
             analysis = DreamAnalysisSchema(
@@ -235,13 +361,13 @@ class DreamService:
                 summary_text="분석 중입니다...",
                 keywords=["분석중"],
                 emotional_flow_text="감정 분석 중입니다...",
-                symbol_analysis={"status": "processing", "task_id": task.id},
+                symbol_analysis={"status": "processing", "task_id": task_id},
                 reflective_question="분석이 완료되면 질문이 제공됩니다.",
                 deja_vu_analysis={"status": "processing"},
                 created_at=datetime.utcnow()
             )
             
-            logger.info(f"꿈 분석 요청: {dream_id}, 태스크 ID: {task.id}")
+            logger.info(f"꿈 분석 요청: {dream_id}, 태스크 ID: {task_id}")
             return analysis
             
         except Exception as e:
@@ -312,41 +438,140 @@ class DreamService:
             raise
 
     async def upload_audio(self, user_id: str, audio_file, db: Session) -> AudioUploadResponse:
-        """오디오 파일 업로드"""
+        """오디오 파일 업로드 (고정 크기 청크 스트리밍, 메모리 사용량 일정)"""
+        upload_dir = os.path.join(settings.AUDIO_UPLOAD_DIR, str(user_id))
+        tmp_path = os.path.join(upload_dir, f".{uuid.uuid4()}.part")
         try:
-            # 파일 정보 추출
-            file_size = len(audio_file)
-            file_extension = audio_file.filename.split('.')[-1] if audio_file.filename else 'wav'
+            file_extension = audio_file.filename.split('.')[-1] if audio_file.filename and '.' in audio_file.filename else 'wav'
+            os.makedirs(upload_dir, exist_ok=True)
             
-            # 고유한 파일명 생성
-            file_id = str(uuid.uuid4())
-            filename = f"{user_id}/{file_id}.{file_extension}"
+            # 청크 단위로 임시 파일에 기록하면서 해시와 크기 계산
+            hasher = hashlib.sha256()
+            file_size = 0
+            with open(tmp_path, "wb") as buffer:
+                while True:
+                    chunk = await audio_file.read(settings.AUDIO_UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    file_size += len(chunk)
+                    if file_size > settings.AUDIO_MAX_UPLOAD_BYTES:
+                        raise ValueError(
+                            f"오디오 파일은 최대 {settings.AUDIO_MAX_UPLOAD_BYTES // (1024 * 1024)}MB까지 업로드할 수 있습니다"
+                        )
+                    hasher.update(chunk)
+                    await run_in_threadpool(buffer.write, chunk)
+            
+            if file_size == 0:
+                raise ValueError("빈 오디오 파일입니다")
+            
+            # 콘텐츠 해시 기반 파일명 (같은 파일 재업로드 시 중복 저장하지 않음)
+            content_hash = hasher.hexdigest()
+            filename = f"{user_id}/{content_hash}.{file_extension}"
+            stored_path = os.path.join(settings.AUDIO_UPLOAD_DIR, filename)
+            
+            if os.path.exists(stored_path):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, stored_path)
             
             # TODO: 실제 클라우드 스토리지 업로드 구현
             # 예: AWS S3, Google Cloud Storage 등
             audio_file_path = f"audio/{filename}"
             
-            # 임시로 로컬 저장 (개발 환경)
-            upload_dir = "uploads/audio"
-            os.makedirs(upload_dir, exist_ok=True)
-            
-            with open(f"{upload_dir}/{filename}", "wb") as buffer:
-                content = await audio_file.read()
-                buffer.write(content)
-            
-            # TODO: 오디오 파일 길이 추출 (ffmpeg 등 사용)
-            duration = None
-            
-            return AudioUploadResponse(
-                audio_file_path=audio_file_path,
-                file_size=file_size,
-                duration=duration,
-                upload_url=None  # 클라우드 스토리지 URL
-            )
-            
         except Exception as e:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             logger.error(f"오디오 업로드 실패: {str(e)}")
             raise
+        
+        # 오디오 길이 추출은 백그라운드 작업으로 처리 (큐 등록 실패는 길이만 비어 있고 업로드는 성공)
+        duration = read_audio_duration(user_id, audio_file_path)  # 같은 파일 재업로드면 이미 추출됨
+        if duration is None:
+            try:
+                from app.workers.tasks import extract_audio_duration
+                extract_audio_duration.delay(stored_path, audio_file_path)
+            except Exception as e:
+                logger.warning(f"오디오 길이 추출 작업 등록 실패: {audio_file_path}, 오류: {str(e)}")
+        
+        return AudioUploadResponse(
+            audio_file_path=audio_file_path,
+            file_size=file_size,
+            duration=duration,
+            upload_url=None,  # 클라우드 스토리지 URL
+            content_hash=content_hash
+        )
+
+    async def import_dreams(self, user_id: str, chunks: AsyncIterator[bytes], db: Session) -> DreamImportResponse:
+        """
+        NDJSON 꿈 기록 일괄 가져오기 (한 줄에 DreamCreate 하나)
+        요청 본문을 스트리밍으로 읽으며 줄마다 검증하고, DREAM_IMPORT_BATCH_SIZE개씩 모아
+        executemany INSERT 후 커밋 (메모리 사용량은 배치 크기로 일정)
+        잘못된 줄은 건너뛰고 오류 목록에 기록 (앞쪽 DREAM_IMPORT_MAX_ERRORS개만)
+        """
+        imported = 0
+        failed = 0
+        errors: List[DreamImportError] = []
+        batch: List[Dict[str, Any]] = []
+
+        def fail(line_number: int, message: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < settings.DREAM_IMPORT_MAX_ERRORS:
+                errors.append(DreamImportError(line=line_number, error=message))
+
+        try:
+            async for line_number, line in iter_ndjson_lines(chunks, settings.DREAM_IMPORT_MAX_LINE_BYTES):
+                if line is None:
+                    fail(line_number, f"줄 길이가 {settings.DREAM_IMPORT_MAX_LINE_BYTES}바이트를 넘습니다")
+                    continue
+                try:
+                    dream_data = DreamCreate.model_validate_json(line)
+                except ValidationError as e:
+                    fail(line_number, "; ".join(
+                        f"{'.'.join(str(loc) for loc in error['loc']) or '줄'}: {error['msg']}" for error in e.errors()
+                    ))
+                    continue
+
+                batch.append(self._dream_values(user_id, dream_data))
+                if len(batch) >= settings.DREAM_IMPORT_BATCH_SIZE:
+                    await run_in_threadpool(self._insert_batch, batch, db)
+                    imported += len(batch)
+                    batch = []
+
+            if batch:
+                await run_in_threadpool(self._insert_batch, batch, db)
+                imported += len(batch)
+
+            logger.info(f"꿈 기록 가져오기 완료: 사용자 {user_id}, 성공 {imported}개, 실패 {failed}개")
+            return DreamImportResponse(imported=imported, failed=failed, errors=errors)
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"꿈 기록 가져오기 실패 (커밋된 {imported}개 이후): {str(e)}")
+            raise
+
+    def _insert_batch(self, rows: List[Dict[str, Any]], db: Session) -> None:
+        """배치 INSERT (드라이버의 다중 VALUES executemany) 후 커밋"""
+        db.execute(insert(Dream), rows)
+        db.commit()
+
+    def export_dreams(self, user_id: str, db: Session) -> Iterator[bytes]:
+        """
+        꿈 기록 NDJSON 내보내기 (가져오기와 같은 형식)
+        서버 측 커서로 DREAM_EXPORT_BATCH_SIZE개씩 받아 바로 내보내므로 전체를 메모리에 올리지 않음
+        동기 제너레이터 - StreamingResponse가 스레드풀에서 순회
+        """
+        result = db.execute(
+            select(*DREAM_EXPORT_COLUMNS)
+            .where(Dream.user_id == user_id)
+            .order_by(Dream.dream_date, Dream.id)
+            .execution_options(yield_per=settings.DREAM_EXPORT_BATCH_SIZE)
+        )
+        try:
+            for rows in result.partitions():
+                yield b"".join(dumps(row._asdict()) + b"\n" for row in rows)
+        finally:
+            result.close()
 
     async def search_dreams(
         self, 
@@ -354,9 +579,10 @@ class DreamService:
         query: str, 
         db: Session,
         skip: int = 0,
-        limit: int = 20
-    ) -> DreamListResponse:
-        """꿈 내용 검색"""
+        limit: int = 20,
+        fields: Optional[List[str]] = None
+    ) -> Union[DreamListResponse, DreamFieldsListResponse]:
+        """꿈 내용 검색 (fields 지정 시 해당 필드만 조회)"""
         try:
             # 제목과 내용에서 검색
             search_query = f"%{query}%"
@@ -367,21 +593,7 @@ class DreamService:
                 )
             )
             
-            total_count = dreams_query.count()
-            dreams = dreams_query.order_by(desc(Dream.dream_date)).offset(skip).limit(limit).all()
-            
-            has_next = skip + limit < total_count
-            has_previous = skip > 0
-            page = (skip // limit) + 1
-            
-            return DreamListResponse(
-                dreams=[DreamResponse.from_orm(dream) for dream in dreams],
-                total_count=total_count,
-                page=page,
-                page_size=limit,
-                has_next=has_next,
-                has_previous=has_previous
-            )
+            return self._list_page(dreams_query, skip, limit, fields)
             
         except Exception as e:
             logger.error(f"꿈 검색 실패: {str(e)}")
@@ -0,0 +1,46 @@
+"""
+꿈 텍스트 임베딩 모델 로딩
+"""
+from app.core.config import settings
+from typing import List
+import numpy as np
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+class HashingEncoder:
+    """
+    문자 n-gram 해싱 기반 결정적 인코더 (SentenceTransformer.encode와 같은 인터페이스)
+    모델 다운로드나 GPU 없이 동작하므로 부하 테스트/오프라인 환경에서 사용
+    겹치는 글자가 많은 문장일수록 유사도가 높게 나옴
+    """
+
+    def __init__(self, dimension: int = 768, ngram: int = 2):
+        self.dimension = dimension
+        self.ngram = ngram
+
+    def _vector(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimension, dtype=np.float32)
+        compact = "".join(text.split())
+        for i in range(max(len(compact) - self.ngram + 1, 1)):
+            digest = hashlib.blake2b(compact[i:i + self.ngram].encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest, "big")
+            vector[bucket % self.dimension] += 1.0 if bucket & (1 << 63) else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        return np.stack([self._vector(text) for text in texts])
+
+def load_embedding_model():
+    """설정(EMBEDDING_BACKEND)에 따른 임베딩 모델 반환"""
+    if settings.EMBEDDING_BACKEND == "hashing":
+        logger.info("해싱 인코더 사용 (EMBEDDING_BACKEND=hashing)")
+        return HashingEncoder()
+    if settings.EMBEDDING_BACKEND != "sentence-transformers":
+        raise ValueError(f"지원하지 않는 임베딩 백엔드: {settings.EMBEDDING_BACKEND}")
+
+    # 모델 로딩에 수 초가 걸리고 torch를 끌어오므로 필요할 때만 import
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(settings.EMBEDDING_MODEL)
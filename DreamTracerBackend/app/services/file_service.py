@@ -0,0 +1,120 @@
+"""
+시각화 이미지/오디오 파일 제공 서비스 (경로 확인, 접근 권한, ETag, 서명 URL)
+"""
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from app.models.dream import Dream
+from app.models.dream_visualization import DreamVisualization
+from app.core.config import settings
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import quote
+import base64
+import hashlib
+import hmac
+import os
+import re
+import time
+
+# 파일 이름이 내용 해시로 시작하면(오디오, 시각화 파생본) 해시 계산 없이 ETag로 사용
+CONTENT_ADDRESSED_NAME = re.compile(r"^([0-9a-f]{64})(?:_\d+w)?\.\w+$")
+
+@lru_cache(maxsize=4096)
+def _file_sha256(real_path: str, mtime_ns: int, size: int) -> str:
+    """파일 내용 SHA-256 (수정 시각/크기가 같으면 캐시 사용)"""
+    hasher = hashlib.sha256()
+    with open(real_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+class FileService:
+    def __init__(self):
+        # 논리 경로 접두사 → 저장 디렉토리
+        self.roots = {
+            'visualizations': 'visualizations',
+            'audio': settings.AUDIO_UPLOAD_DIR,
+        }
+        self.url_ttl = settings.FILE_URL_TTL
+
+    def resolve(self, path: str) -> str:
+        """
+        논리 경로(visualizations/..., audio/{user_id}/...)를 실제 파일 경로로 변환
+        알 수 없는 접두사나 저장 디렉토리 밖을 가리키는 경로는 ValueError
+        """
+        prefix, _, rest = path.partition('/')
+        root = self.roots.get(prefix)
+        if root is None or not rest:
+            raise ValueError("잘못된 파일 경로입니다")
+        real_root = os.path.realpath(root)
+        real_path = os.path.realpath(os.path.join(real_root, rest))
+        if not real_path.startswith(real_root + os.sep):
+            raise ValueError("잘못된 파일 경로입니다")
+        return real_path
+
+    def can_access(self, path: str, user_id: str, db: Session) -> bool:
+        """사용자가 파일 소유자인지 확인 (오디오는 경로의 사용자 ID, 시각화는 꿈 소유자)"""
+        prefix, _, rest = path.partition('/')
+        if prefix == 'audio':
+            return rest.split('/', 1)[0] == str(user_id)
+
+        conditions = [DreamVisualization.image_path == path]
+        match = CONTENT_ADDRESSED_NAME.match(os.path.basename(path))
+        if match:
+            # 파생본은 원본 내용 해시로 소유 시각화를 찾음
+            conditions.append(DreamVisualization.content_hash == match.group(1))
+        owned = db.query(DreamVisualization.id).join(
+            Dream, Dream.id == DreamVisualization.dream_id
+        ).filter(
+            Dream.user_id == user_id,
+            or_(*conditions)
+        ).first()
+        return owned is not None
+
+    def etag(self, real_path: str, stat_result: os.stat_result) -> str:
+        """내용 해시 기반 강한 ETag"""
+        name = os.path.basename(real_path)
+        if CONTENT_ADDRESSED_NAME.match(name):
+            # 같은 원본의 파생본끼리 구분되도록 너비/확장자까지 포함
+            return f'"{name}"'
+        return f'"{_file_sha256(real_path, stat_result.st_mtime_ns, stat_result.st_size)}"'
+
+    def _signature(self, path: str, expires: int) -> str:
+        digest = hmac.new(
+            settings.SECRET_KEY.encode(), f"{path}\n{expires}".encode(), hashlib.sha256
+        ).digest()
+        return base64.urlsafe_b64encode(digest[:24]).decode()
+
+    def sign(self, path: str, now: Optional[float] = None) -> Tuple[str, int]:
+        """
+        서명 URL 발급 (인증 헤더 없이 파일을 받을 수 있는 짧은 수명의 URL, API 기준 경로)
+        만료 시각을 TTL 구간 경계로 올려, 같은 구간의 요청에는 같은 URL을 주어 클라이언트 이미지 캐시가 유지됨
+        유효 기간은 TTL 이상 2×TTL 미만
+        """
+        now = int(now if now is not None else time.time())
+        expires = (now // self.url_ttl + 2) * self.url_ttl
+        query = f"expires={expires}&signature={self._signature(path, expires)}"
+        return f"/files/{quote(path)}?{query}", expires
+
+    def signed_url(self, path: Optional[str]) -> Optional[str]:
+        return self.sign(path)[0] if path else None
+
+    def verify_signature(self, path: str, expires: int, signature: str, now: Optional[float] = None) -> bool:
+        if expires < (now if now is not None else time.time()):
+            return False
+        return hmac.compare_digest(self._signature(path, expires), signature)
+
+    def signed_derivatives(self, derivatives: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """파생본 정보의 경로를 서명 URL로 바꾼 사본 (응답용)"""
+        if not derivatives:
+            return derivatives
+        return {
+            **derivatives,
+            'variants': {
+                width: {fmt: self.signed_url(path) for fmt, path in formats.items()}
+                for width, formats in derivatives.get('variants', {}).items()
+            }
+        }
+
+# 전역 파일 서비스 인스턴스
+file_service = FileService()
@@ -0,0 +1,123 @@
+"""
+시각화 이미지 파생본(썸네일, WebP/AVIF) 생성 서비스
+"""
+from app.core.config import settings
+from typing import Any, Dict, Iterable, List, Optional
+import hashlib
+import io
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# 포맷별 확장자와 Pillow 저장 옵션
+FORMAT_OPTIONS = {
+    'avif': ('avif', 'AVIF', {'speed': 6}),
+    'webp': ('webp', 'WEBP', {'method': 4}),
+    'jpeg': ('jpg', 'JPEG', {'optimize': True, 'progressive': True}),
+}
+
+def _parse_list(value: str) -> List[str]:
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+class ImageDerivativeService:
+    def __init__(
+        self,
+        widths: Optional[Iterable[int]] = None,
+        formats: Optional[Iterable[str]] = None,
+        quality: Optional[int] = None
+    ):
+        self.widths = sorted(set(widths or [int(w) for w in _parse_list(settings.VISUALIZATION_THUMBNAIL_WIDTHS)]))
+        self.formats = [f for f in (formats or _parse_list(settings.VISUALIZATION_DERIVATIVE_FORMATS)) if f in FORMAT_OPTIONS]
+        self.quality = quality or settings.VISUALIZATION_DERIVATIVE_QUALITY
+
+    def content_hash(self, data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def derivative_path(self, image_path: str, content_hash: str, width: int, fmt: str) -> str:
+        """원본과 같은 디렉토리에 내용 해시로 이름 붙인 파생본 경로 (같은 이미지는 같은 파일)"""
+        extension = FORMAT_OPTIONS[fmt][0]
+        return os.path.join(os.path.dirname(image_path), f"{content_hash}_{width}w.{extension}")
+
+    def supported_formats(self) -> List[str]:
+        """설치된 Pillow가 인코딩할 수 있는 포맷 (AVIF는 Pillow 11.3 이상 또는 플러그인 필요)"""
+        from PIL import features
+        supported = []
+        for fmt in self.formats:
+            if fmt == 'jpeg' or features.check(fmt):
+                supported.append(fmt)
+            else:
+                logger.warning(f"{fmt} 인코딩을 지원하지 않는 Pillow입니다. 해당 포맷 파생본을 건너뜁니다")
+        return supported
+
+    def generate(self, image_path: str) -> Dict[str, Any]:
+        """
+        원본 이미지의 썸네일/포맷 변환 파생본 생성
+        썸네일은 설정된 포맷 모두, 원본 크기는 jpeg를 제외한 포맷만 생성 (원본 자체가 대체 이미지)
+        원본보다 큰 썸네일은 만들지 않고, 이미 있는 파일은 다시 인코딩하지 않음
+        반환값: {"content_hash", "width", "height", "variants": {"너비": {"포맷": 경로}}}
+        """
+        from PIL import Image, ImageOps
+
+        with open(image_path, 'rb') as f:
+            data = f.read()
+        content_hash = self.content_hash(data)
+
+        with Image.open(io.BytesIO(data)) as source:
+            source = ImageOps.exif_transpose(source)
+            width, height = source.size
+            formats = self.supported_formats()
+
+            targets = [(w, formats) for w in self.widths if w < width]
+            targets.append((width, [f for f in formats if f != 'jpeg']))
+
+            variants: Dict[str, Dict[str, str]] = {}
+            for target_width, target_formats in targets:
+                if not target_formats:
+                    continue
+                resized = None
+                for fmt in target_formats:
+                    path = self.derivative_path(image_path, content_hash, target_width, fmt)
+                    if not os.path.exists(path):
+                        if resized is None:
+                            resized = self._resize(source, target_width, height * target_width // width)
+                        self._save(resized, path, fmt)
+                    variants.setdefault(str(target_width), {})[fmt] = path
+
+        logger.info(f"이미지 파생본 생성 완료: {image_path}, {sum(len(v) for v in variants.values())}개")
+        return {
+            "content_hash": content_hash,
+            "width": width,
+            "height": height,
+            "variants": variants
+        }
+
+    def _resize(self, image, width: int, height: int):
+        from PIL import Image
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'transparency' in image.info else 'RGB')
+        if image.width == width:
+            return image
+        return image.resize((width, max(height, 1)), Image.Resampling.LANCZOS)
+
+    def _save(self, image, path: str, fmt: str) -> None:
+        """임시 파일에 쓴 뒤 이름을 바꿔, 동시에 같은 파생본을 만들어도 불완전한 파일이 보이지 않게 함"""
+        _, pil_format, options = FORMAT_OPTIONS[fmt]
+        if fmt == 'jpeg' and image.mode != 'RGB':
+            image = image.convert('RGB')
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            image.save(tmp_path, format=pil_format, quality=self.quality, **options)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def paths(self, derivatives: Optional[Dict[str, Any]]) -> List[str]:
+        """파생본 정보에 기록된 모든 파일 경로"""
+        if not derivatives:
+            return []
+        return [path for formats in derivatives.get('variants', {}).values() for path in formats.values()]
+
+# 전역 이미지 파생본 서비스 인스턴스
+image_derivative_service = ImageDerivativeService()
@@ -0,0 +1,26 @@
+"""
+꿈 임베딩 유사도 계산
+꿈 네트워크(ai_tasks.update_dream_network, /analysis/network)와 데자뷰 분석에서 공용으로 사용
+"""
+from typing import Dict, List, Tuple
+import numpy as np
+
+def cosine_similarity(embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+    """두 임베딩의 코사인 유사도"""
+    return np.dot(embedding1, embedding2) / (
+        np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
+    )
+
+def similar_pairs(embeddings: Dict[str, np.ndarray], threshold: float) -> List[Tuple[str, str, float]]:
+    """
+    유사도가 임계값을 넘는 꿈 쌍 목록 (id1, id2, 유사도)
+    embeddings의 삽입 순서대로 모든 쌍을 비교
+    """
+    pairs = []
+    dream_ids = list(embeddings.keys())
+    for i, dream_id1 in enumerate(dream_ids):
+        for dream_id2 in dream_ids[i+1:]:
+            similarity = cosine_similarity(embeddings[dream_id1], embeddings[dream_id2])
+            if similarity > threshold:
+                pairs.append((dream_id1, dream_id2, similarity))
+    return pairs
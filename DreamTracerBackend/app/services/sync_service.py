@@ -0,0 +1,250 @@
+"""
+앱 델타 동기화 서비스
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy import delete, insert, literal, select, tuple_
+from sqlalchemy.exc import IntegrityError
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis
+from app.models.dream_visualization import DreamVisualization
+from app.models.sync import SyncTombstone
+from app.schemas.dream import DreamCreate, DreamResponse
+from app.schemas.sync import SyncOperation, SyncOperationResult, SyncResponse, SyncTombstoneItem
+from app.services.dream_service import DreamService, DREAM_LIST_COLUMNS, dream_list_adapter
+from app.services.file_service import file_service
+from app.core.config import settings
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import base64
+import json
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 변경 종류 (커서에 종류별 마지막 위치를 따로 기록)
+SYNC_STREAMS = ("dreams", "analyses", "visualizations", "tombstones")
+
+# 겹침 구간으로 되돌린 위치의 id (같은 시각의 모든 행보다 앞)
+NIL_UUID = uuid.UUID(int=0)
+
+# 꿈 응답 필드 컬럼 (목록과 같은 행 → 일괄 검증 경로)
+SYNC_DREAM_COLUMNS = [DREAM_LIST_COLUMNS[name] for name in DreamResponse.model_fields]
+
+Position = Optional[Tuple[datetime, uuid.UUID]]
+
+def _utc(value: datetime) -> datetime:
+    """시간대 없는 값(SQLite 등)은 UTC로 간주"""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+def encode_sync_cursor(synced_at: datetime, positions: Dict[str, Position]) -> str:
+    """동기화 시각과 종류별 마지막 (시각, id) 위치를 커서로 인코딩"""
+    raw = {
+        "synced_at": _utc(synced_at).isoformat(),
+        "positions": {
+            stream: [_utc(position[0]).isoformat(), str(position[1])]
+            for stream, position in positions.items() if position
+        }
+    }
+    return base64.urlsafe_b64encode(json.dumps(raw, separators=(",", ":")).encode()).decode().rstrip("=")
+
+def decode_sync_cursor(cursor: str) -> Tuple[datetime, Dict[str, Position]]:
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        positions = {
+            stream: (datetime.fromisoformat(timestamp), uuid.UUID(entity_id))
+            for stream, (timestamp, entity_id) in raw["positions"].items() if stream in SYNC_STREAMS
+        }
+        return datetime.fromisoformat(raw["synced_at"]), positions
+    except (ValueError, UnicodeDecodeError, KeyError, TypeError):
+        raise ValueError("잘못된 동기화 커서입니다")
+
+def dream_tombstones_insert(*criteria):
+    """조건에 맞는 꿈들의 삭제 기록 INSERT ... SELECT (배치 삭제 직전에 같은 트랜잭션에서 실행)"""
+    return insert(SyncTombstone).from_select(
+        ["id", "user_id", "entity_type", "entity_id", "client_id"],
+        select(
+            Dream.id,  # 꿈 ID를 그대로 삭제 기록 ID로 사용 (꿈 하나에 기록 하나)
+            Dream.user_id,
+            literal("dream"),
+            Dream.id,
+            Dream.client_id
+        ).where(*criteria)
+    )
+
+class SyncService:
+    def __init__(self):
+        self.dream_service = DreamService()
+
+    async def sync(self, user_id: str, cursor: Optional[str], operations: List[SyncOperation], db: Session) -> SyncResponse:
+        """
+        오프라인 쓰기 적용 후 커서 이후의 변경분(꿈, 분석, 시각화, 삭제 기록) 반환
+        앱 실행 시 꿈 목록/분석/시각화를 각각 요청하는 대신 한 번의 왕복으로 동기화
+        """
+        try:
+            now = datetime.now(timezone.utc)
+            positions: Dict[str, Position] = {}
+            full_resync = False
+            if cursor:
+                synced_at, positions = decode_sync_cursor(cursor)
+                # 삭제 기록이 정리된 기간을 건너뛴 커서는 삭제를 놓칠 수 있으므로 처음부터 다시 동기화
+                if _utc(synced_at) < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+                    positions = {}
+                    full_resync = True
+
+            results = self._apply_operations(user_id, operations, db)
+
+            # 늦게 커밋된 트랜잭션(시작 시각이 updated_at)을 놓치지 않도록 다 따라잡은 종류는 겹침 구간만큼 되돌림
+            watermark = now - timedelta(seconds=settings.SYNC_WATERMARK_OVERLAP_SECONDS)
+            changes = {}
+            has_more = False
+            for stream in SYNC_STREAMS:
+                rows, positions[stream], more = self._pull(stream, user_id, positions.get(stream), watermark, db)
+                changes[stream] = rows
+                has_more = has_more or more
+
+            logger.info(
+                f"동기화: 사용자 {user_id}, 작업 {len(operations)}개, "
+                f"변경 {sum(len(rows) for rows in changes.values())}개, 남음 {has_more}"
+            )
+            return SyncResponse(
+                cursor=encode_sync_cursor(now, positions),
+                has_more=has_more,
+                full_resync=full_resync,
+                results=results,
+                dreams=dream_list_adapter.validate_python([row._asdict() for row in changes["dreams"]]),
+                analyses=changes["analyses"],
+                visualizations=[self._visualization_payload(row) for row in changes["visualizations"]],
+                tombstones=[SyncTombstoneItem.from_orm(row) for row in changes["tombstones"]]
+            )
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"동기화 실패: 사용자 {user_id}, 오류: {str(e)}")
+            raise
+
+    def _apply_operations(self, user_id: str, operations: List[SyncOperation], db: Session) -> List[SyncOperationResult]:
+        """작업을 순서대로 각각 세이브포인트 안에서 적용 (실패한 작업만 되돌리고 나머지는 한 번에 커밋)"""
+        results = []
+        for operation in operations:
+            try:
+                with db.begin_nested():
+                    if operation.type == "delete_dream":
+                        results.append(self._delete_dream(user_id, operation, db))
+                    else:
+                        results.append(self._upsert_dream(user_id, operation, db))
+            except (ValueError, IntegrityError) as e:
+                logger.warning(f"동기화 작업 실패: {operation.client_id}, 오류: {str(e)}")
+                results.append(SyncOperationResult(client_id=operation.client_id, status="failed", error=str(e)))
+        if operations:
+            db.commit()
+        return results
+
+    def _find_dream(self, user_id: str, operation: SyncOperation, db: Session) -> Optional[Dream]:
+        """서버 ID가 있으면 ID로, 없으면 클라이언트 ID로 사용자의 꿈 조회"""
+        if operation.id:
+            return db.query(Dream).filter(Dream.id == uuid.UUID(operation.id), Dream.user_id == user_id).first()
+        return db.query(Dream).filter(Dream.client_id == operation.client_id, Dream.user_id == user_id).first()
+
+    def _upsert_dream(self, user_id: str, operation: SyncOperation, db: Session) -> SyncOperationResult:
+        """
+        클라이언트 ID 기준 생성 또는 수정 (재전송해도 같은 꿈)
+        수정은 보낸 필드만 반영 - 앱이 서버에 올리지 않는 필드(본문 등)는 유지
+        """
+        dream_data = DreamCreate.model_validate(operation.dream or {})
+        values = self.dream_service._dream_values(user_id, dream_data)
+
+        dream = self._find_dream(user_id, operation, db)
+        if dream is None:
+            dream = Dream(**values, client_id=operation.client_id)
+            db.add(dream)
+            status = "created"
+        else:
+            for field in dream_data.model_fields_set:
+                setattr(dream, field, values[field])
+            if "audio_file_path" in dream_data.model_fields_set:
+                dream.audio_duration = values["audio_duration"]
+            if dream.client_id is None:
+                dream.client_id = operation.client_id
+            status = "updated"
+        db.flush()
+        return SyncOperationResult(client_id=operation.client_id, status=status, id=str(dream.id))
+
+    def _delete_dream(self, user_id: str, operation: SyncOperation, db: Session) -> SyncOperationResult:
+        """삭제 (이미 없는 꿈도 성공으로 처리) 및 삭제 기록 추가"""
+        dream = self._find_dream(user_id, operation, db)
+        if dream is None:
+            return SyncOperationResult(client_id=operation.client_id, status="deleted", id=operation.id)
+
+        db.add(SyncTombstone(
+            user_id=dream.user_id, entity_type="dream", entity_id=dream.id, client_id=dream.client_id
+        ))
+        # 분석/시각화는 외래 키 ON DELETE CASCADE로 함께 삭제
+        db.execute(delete(Dream).where(Dream.id == dream.id).execution_options(synchronize_session=False))
+        db.expunge(dream)
+        return SyncOperationResult(client_id=operation.client_id, status="deleted", id=str(dream.id))
+
+    def _stream_query(self, stream: str, user_id: str, db: Session):
+        """종류별 사용자 변경분 쿼리와 정렬 기준 (시각, id) 컬럼"""
+        if stream == "dreams":
+            query = db.query(*SYNC_DREAM_COLUMNS)
+            return query.filter(Dream.user_id == user_id), Dream.updated_at, Dream.id
+        if stream == "analyses":
+            # 재분석은 같은 행을 덮어쓰므로 수정 시각 기준
+            query = db.query(DreamAnalysis).join(Dream, Dream.id == DreamAnalysis.dream_id)
+            return query.filter(Dream.user_id == user_id), DreamAnalysis.updated_at, DreamAnalysis.id
+        if stream == "visualizations":
+            query = db.query(
+                DreamVisualization.id,
+                DreamVisualization.dream_id,
+                DreamVisualization.image_path,
+                DreamVisualization.art_style,
+                DreamVisualization.derivatives,
+                DreamVisualization.created_at,
+                DreamVisualization.updated_at
+            ).join(Dream, Dream.id == DreamVisualization.dream_id)
+            return query.filter(Dream.user_id == user_id), DreamVisualization.updated_at, DreamVisualization.id
+        query = db.query(SyncTombstone).filter(SyncTombstone.user_id == user_id)
+        return query, SyncTombstone.deleted_at, SyncTombstone.id
+
+    def _pull(
+        self,
+        stream: str,
+        user_id: str,
+        position: Position,
+        watermark: datetime,
+        db: Session
+    ) -> Tuple[List[Any], Position, bool]:
+        """
+        위치 이후 변경을 (시각, id) 키셋으로 SYNC_PAGE_SIZE개까지 조회
+        다 따라잡았으면 위치를 워터마크 이전으로 제한 (겹친 행은 앱이 id로 덮어씀)
+        """
+        query, timestamp_column, id_column = self._stream_query(stream, user_id, db)
+        if position:
+            query = query.filter(tuple_(timestamp_column, id_column) > tuple_(*position))
+
+        # 남은 변경 여부 확인을 위해 하나 더 조회
+        rows = query.order_by(timestamp_column, id_column).limit(settings.SYNC_PAGE_SIZE + 1).all()
+        has_more = len(rows) > settings.SYNC_PAGE_SIZE
+        rows = rows[:settings.SYNC_PAGE_SIZE]
+
+        if rows:
+            position = (getattr(rows[-1], timestamp_column.key), rows[-1].id)
+        if not has_more and position and _utc(position[0]) > watermark:
+            position = (watermark, NIL_UUID)
+        return rows, position, has_more
+
+    def _visualization_payload(self, row) -> Dict[str, Any]:
+        return {
+            "id": str(row.id),
+            "dream_id": str(row.dream_id),
+            "image_path": row.image_path,
+            "image_url": file_service.signed_url(row.image_path),
+            "derivatives": file_service.signed_derivatives(row.derivatives),
+            "art_style": row.art_style,
+            "created_at": row.created_at.isoformat(),
+            "updated_at": row.updated_at.isoformat()
+        }
+
+# 전역 동기화 서비스 인스턴스
+sync_service = SyncService()
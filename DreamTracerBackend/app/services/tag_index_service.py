@@ -0,0 +1,204 @@
+"""
+커뮤니티 태그 역색인 서비스
+태그 이름 → 정수 태그 ID 사전과 태그별 포스트 번호 비트맵을 프로세스 메모리에 유지
+여러 태그 AND/OR 필터와 태그별 개수(인기 태그, 검색 결과 태그 패싯)를 비트맵 연산으로 처리
+"""
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from app.models.community import CommunityPost
+from app.core.bitmap import RoaringBitmap
+from app.core.config import settings
+from app.core.redis_client import async_redis_client
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 포스트 생성/태그 수정/삭제 변경 로그 (API 프로세스마다 이어서 읽어 자기 색인에 반영)
+TAG_INDEX_CHANGES_KEY = "community:tag_index:changes"
+
+def _stream_id(entry_id: str) -> Tuple[int, int]:
+    milliseconds, sequence = entry_id.split("-")
+    return int(milliseconds), int(sequence)
+
+class TagIndexService:
+    def __init__(self):
+        # 재구성은 한 번에 하나만 (동시에 만료를 본 요청들이 전체 스캔을 반복하지 않도록)
+        self._rebuild_lock = asyncio.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.tag_ids: Dict[str, int] = {}  # 태그 이름 → 태그 ID
+        self.tag_names: List[str] = []  # 태그 ID → 태그 이름
+        self.tag_bitmaps: List[RoaringBitmap] = []  # 태그 ID → 포스트 번호 비트맵
+        self.posts = RoaringBitmap()  # 남아 있는 모든 포스트 번호
+        # 포스트 번호: 작성 순서대로 붙이는 정수 (클수록 최신, 프로세스마다 다를 수 있음)
+        self.post_ids: List[Optional[uuid.UUID]] = []
+        self.post_numbers: Dict[uuid.UUID, int] = {}
+        self.post_tags: Dict[int, Tuple[int, ...]] = {}
+        self.last_change_id = "0-0"  # 반영한 마지막 변경 로그 ID
+        self.built_at: Optional[float] = None
+
+    def _tag_id(self, tag: str) -> int:
+        tag_id = self.tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self.tag_ids[tag] = len(self.tag_names)
+            self.tag_names.append(tag)
+            self.tag_bitmaps.append(RoaringBitmap())
+        return tag_id
+
+    def _set_post(self, post_id: uuid.UUID, tags: Iterable[str]) -> None:
+        """포스트 추가 또는 태그 교체 (같은 변경을 두 번 반영해도 결과 동일)"""
+        number = self.post_numbers.get(post_id)
+        if number is None:
+            number = self.post_numbers[post_id] = len(self.post_ids)
+            self.post_ids.append(post_id)
+            self.posts.add(number)
+        for tag_id in self.post_tags.get(number, ()):
+            self.tag_bitmaps[tag_id].discard(number)
+        tag_ids = tuple(self._tag_id(tag) for tag in dict.fromkeys(tags or []))
+        for tag_id in tag_ids:
+            self.tag_bitmaps[tag_id].add(number)
+        self.post_tags[number] = tag_ids
+
+    def _remove_post(self, post_id: uuid.UUID) -> None:
+        number = self.post_numbers.pop(post_id, None)
+        if number is None:
+            return
+        for tag_id in self.post_tags.pop(number, ()):
+            self.tag_bitmaps[tag_id].discard(number)
+        self.posts.discard(number)
+        self.post_ids[number] = None
+
+    def _build(self, db: Session, last_change_id: str) -> "TagIndexService":
+        """
+        DB에서 새 색인을 만들어 반환 (작성 순서대로 번호 부여, id와 태그 컬럼만 스트리밍 조회)
+        현재 색인은 건드리지 않으므로 스레드에서 실행하는 동안에도 조회는 이전 색인으로 응답
+        """
+        started = time.perf_counter()
+        built = TagIndexService()
+        rows = db.query(CommunityPost.id, CommunityPost.tags).order_by(
+            CommunityPost.created_at, CommunityPost.id
+        ).execution_options(yield_per=settings.TAG_INDEX_BATCH_SIZE)
+        for post_id, tags in rows:
+            built._set_post(post_id, tags)
+        built.last_change_id = last_change_id
+        built.built_at = time.monotonic()
+        logger.info(
+            f"태그 색인 재구성: 포스트 {len(built.posts)}개, 태그 {len(built.tag_names)}개, "
+            f"{(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return built
+
+    def _replace(self, built: "TagIndexService") -> None:
+        """새로 만든 색인으로 교체 (이벤트 루프에서 호출하므로 조회 중간에 바뀌지 않음)"""
+        for name, value in vars(built).items():
+            if name != "_rebuild_lock":
+                setattr(self, name, value)
+
+    def rebuild(self, db: Session, last_change_id: str = "0-0") -> None:
+        """DB에서 전체 색인 재구성"""
+        self._replace(self._build(db, last_change_id))
+
+    def _apply_change(self, fields: Dict[str, str]) -> None:
+        post_id = uuid.UUID(fields["post_id"])
+        if fields["op"] == "delete":
+            self._remove_post(post_id)
+        else:
+            self._set_post(post_id, json.loads(fields.get("tags") or "[]"))
+
+    async def ensure_current(self, db: Session) -> None:
+        """
+        조회 전에 다른 프로세스의 변경 로그를 이어서 반영
+        색인이 없거나 오래됐거나(COMMUNITY_TAG_INDEX_MAX_AGE), 읽지 않은 변경이 로그에서 잘려 나갔으면 재구성
+        재구성(전체 스캔)은 스레드 풀에서 한 번에 하나만 실행하고, 잠금을 기다린 요청은 다시 확인 후 변경만 반영
+        """
+        latest_id = await self._apply_changes()
+        if latest_id is None:
+            return
+        async with self._rebuild_lock:
+            latest_id = await self._apply_changes()
+            if latest_id is None:
+                return
+            # 로그 위치를 먼저 잡고 DB를 읽음 (사이에 들어온 변경은 다음 조회에서 다시 반영해도 결과 동일)
+            self._replace(await run_in_threadpool(self._build, db, latest_id))
+
+    async def _apply_changes(self) -> Optional[str]:
+        """읽지 않은 변경을 반영, 재구성이 필요하면 반영하지 않고 현재 로그의 마지막 ID 반환"""
+        pipe = async_redis_client.pipeline(transaction=False)
+        pipe.xrange(TAG_INDEX_CHANGES_KEY, count=1)
+        pipe.xrevrange(TAG_INDEX_CHANGES_KEY, count=1)
+        pipe.xlen(TAG_INDEX_CHANGES_KEY)
+        pipe.xrange(TAG_INDEX_CHANGES_KEY, min=f"({self.last_change_id}")
+        first, latest, length, changes = await pipe.execute()
+
+        latest_id = latest[0][0] if latest else "0-0"
+        expired = self.built_at is None or time.monotonic() - self.built_at > settings.COMMUNITY_TAG_INDEX_MAX_AGE
+        if first and not expired:
+            if self.last_change_id == "0-0":
+                # 빈 로그에서 만든 색인: 로그가 최대 길이에 닿았으면 앞부분이 잘렸을 수 있음
+                expired = length >= settings.COMMUNITY_TAG_INDEX_STREAM_MAXLEN
+            else:
+                # 마지막으로 반영한 변경이 로그에서 잘렸으면 그 뒤 변경도 잘렸을 수 있음
+                expired = _stream_id(first[0][0]) > _stream_id(self.last_change_id)
+
+        if expired:
+            return latest_id
+
+        for entry_id, fields in changes:
+            self._apply_change(fields)
+            self.last_change_id = entry_id
+        return None
+
+    async def publish(self, op: str, post_id, tags: Optional[List[str]] = None) -> None:
+        """포스트 변경 기록 (op: 'upsert' 또는 'delete') - 실패해도 COMMUNITY_TAG_INDEX_MAX_AGE 뒤 재구성으로 반영"""
+        try:
+            await async_redis_client.xadd(
+                TAG_INDEX_CHANGES_KEY,
+                {"op": op, "post_id": str(post_id), "tags": json.dumps(tags or [], ensure_ascii=False)},
+                maxlen=settings.COMMUNITY_TAG_INDEX_STREAM_MAXLEN,
+                approximate=True
+            )
+        except Exception as e:
+            logger.warning(f"태그 색인 변경 기록 실패: {post_id}, 오류: {str(e)}")
+
+    def match(self, tags: List[str], match_all: bool = True) -> RoaringBitmap:
+        """태그 필터 결과 비트맵 (match_all이면 모든 태그, 아니면 하나 이상)"""
+        bitmaps = [self.tag_bitmaps[self.tag_ids[tag]] for tag in dict.fromkeys(tags) if tag in self.tag_ids]
+        if match_all:
+            if len(bitmaps) < len(set(tags)):
+                return RoaringBitmap()  # 없는 태그가 있으면 결과 없음
+            return RoaringBitmap.intersection(*bitmaps)
+        return RoaringBitmap.union(*bitmaps)
+
+    def page(self, bitmap: RoaringBitmap, skip: int, limit: int) -> List[uuid.UUID]:
+        """최신순 페이지의 포스트 ID (번호가 클수록 최신)"""
+        post_ids = []
+        for index, number in enumerate(bitmap.descending()):
+            if index >= skip + limit:
+                break
+            if index >= skip:
+                post_ids.append(self.post_ids[number])
+        return post_ids
+
+    def bitmap_for(self, post_ids: Iterable[uuid.UUID]) -> RoaringBitmap:
+        """포스트 ID 목록을 번호 비트맵으로 변환 (색인에 아직 없는 포스트는 제외)"""
+        return RoaringBitmap(
+            number for number in (self.post_numbers.get(post_id) for post_id in post_ids) if number is not None
+        )
+
+    def tag_counts(self, within: Optional[RoaringBitmap] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """태그별 포스트 수 상위 목록 (within이 있으면 그 포스트들 안에서의 개수 - 검색 결과 패싯)"""
+        counts = [
+            (tag_id, len(bitmap) if within is None else bitmap.and_cardinality(within))
+            for tag_id, bitmap in enumerate(self.tag_bitmaps)
+        ]
+        counts = sorted((item for item in counts if item[1] > 0), key=lambda item: (-item[1], item[0]))
+        return [{"tag": self.tag_names[tag_id], "count": count} for tag_id, count in counts[:limit]]
+
+# 전역 태그 색인 서비스 인스턴스 (API 프로세스마다 하나)
+tag_index_service = TagIndexService()
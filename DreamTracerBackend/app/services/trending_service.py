@@ -0,0 +1,234 @@
+"""
+커뮤니티 인기(트렌딩) 순위 서비스
+조회/반응마다 Redis 정렬 집합의 포스트·태그 점수를 올리고, 주기 작업이 모든 점수를 반감기에 맞춰 감쇠
+참여 카운터는 Redis 해시에 모았다가 주기 작업이 DB에 한 번에 반영 (write-behind)
+"""
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import bindparam, desc, update
+from sqlalchemy.orm import Session
+from app.models.community import CommunityEngagementFlush, CommunityPost
+from app.core.config import settings
+from app.core.redis_client import RELEASE_KEY_SCRIPT, async_redis_client, redis_client
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+TRENDING_POSTS_KEY = "community:trending:posts"
+TRENDING_TAGS_KEY = "community:trending:tags"
+TRENDING_DECAYED_AT_KEY = "community:trending:decayed_at"  # 마지막 감쇠 시각 (유닉스 초)
+TRENDING_SEEDED_KEY = "community:trending:seeded"  # 빈 순위를 DB에서 다시 채운 표시 (감쇠 주기 동안 반복하지 않음)
+# DB 반영 대기 카운터 ("{post_id}:{kind}" → 증가량), 반영 중에는 FLUSHING 키로 옮겨 둠
+PENDING_ENGAGEMENT_KEY = "community:engagement:pending"
+FLUSHING_ENGAGEMENT_KEY = "community:engagement:flushing"
+FLUSHING_BATCH_KEY = "community:engagement:flushing_batch"  # FLUSHING 묶음 ID (DB 반영 기록과 대조)
+ENGAGEMENT_FLUSH_LOCK_KEY = "community:engagement:flush_lock"  # 반영 작업은 한 번에 하나만
+
+FLUSH_BATCH_RETENTION = timedelta(days=1)  # 반영 기록 보존 기간 (이보다 오래 남은 FLUSHING 묶음은 없음)
+
+# 참여 종류 → 카운터 컬럼
+ENGAGEMENT_COLUMNS = {"view": "view_count", "reaction": "reaction_count"}
+
+TRENDING_MIN_SCORE = 0.01  # 감쇠 후 이보다 낮은 점수는 순위에서 제거
+
+def reaction_key(post_id, user_id) -> str:
+    """사용자별 반응 중복 방지 키"""
+    return f"community:reaction:{post_id}:{user_id}"
+
+def _engagement_weight(kind: str) -> float:
+    return {
+        "post": settings.COMMUNITY_TRENDING_POST_WEIGHT,
+        "view": settings.COMMUNITY_TRENDING_VIEW_WEIGHT,
+        "reaction": settings.COMMUNITY_TRENDING_REACTION_WEIGHT,
+    }[kind]
+
+class TrendingService:
+    def __init__(self):
+        pass
+
+    def _add_score(self, pipe, post_id, tags: Optional[List[str]], kind: str) -> None:
+        weight = _engagement_weight(kind)
+        pipe.zincrby(TRENDING_POSTS_KEY, weight, str(post_id))
+        for tag in dict.fromkeys(tags or []):
+            pipe.zincrby(TRENDING_TAGS_KEY, weight, tag)
+
+    async def record_post(self, post_id, tags: Optional[List[str]]) -> None:
+        """새 포스트를 기본 점수로 순위에 추가"""
+        try:
+            pipe = async_redis_client.pipeline(transaction=False)
+            self._add_score(pipe, post_id, tags, "post")
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"인기 순위 포스트 추가 실패: {post_id}, 오류: {str(e)}")
+
+    async def record_engagement(self, post_id, kind: str, tags: Optional[List[str]]) -> None:
+        """
+        조회/반응 기록 (kind: ENGAGEMENT_COLUMNS 키)
+        순위 점수는 바로 올리고 DB 카운터는 대기 해시에 모아 flush_engagement에서 반영
+        """
+        try:
+            pipe = async_redis_client.pipeline(transaction=False)
+            pipe.hincrby(PENDING_ENGAGEMENT_KEY, f"{post_id}:{kind}", 1)
+            self._add_score(pipe, post_id, tags, kind)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"포스트 참여 기록 실패: {post_id}, 종류: {kind}, 오류: {str(e)}")
+
+    async def add_reaction(self, post_id, user_id, tags: Optional[List[str]]) -> bool:
+        """반응 기록 (같은 사용자의 반응은 COMMUNITY_REACTION_DEDUPE_TTL 동안 한 번만 반영)"""
+        try:
+            first = await async_redis_client.set(
+                reaction_key(post_id, user_id), 1, nx=True, ex=settings.COMMUNITY_REACTION_DEDUPE_TTL
+            )
+        except Exception as e:
+            logger.warning(f"포스트 반응 기록 실패: {post_id}, 오류: {str(e)}")
+            return False
+        if not first:
+            return False
+        await self.record_engagement(post_id, "reaction", tags)
+        return True
+
+    async def remove_posts(self, post_ids: List[str]) -> None:
+        """삭제된 포스트를 순위에서 제거"""
+        if not post_ids:
+            return
+        try:
+            await async_redis_client.zrem(TRENDING_POSTS_KEY, *post_ids)
+        except Exception as e:
+            logger.warning(f"인기 순위 포스트 제거 실패: {post_ids}, 오류: {str(e)}")
+
+    async def get_page(self, skip: int, limit: int) -> Tuple[List[str], int]:
+        """점수 높은 순 페이지의 포스트 ID와 순위에 있는 전체 포스트 수"""
+        pipe = async_redis_client.pipeline(transaction=False)
+        pipe.zrevrange(TRENDING_POSTS_KEY, skip, skip + limit - 1)
+        pipe.zcard(TRENDING_POSTS_KEY)
+        post_ids, total_count = await pipe.execute()
+        return post_ids, total_count
+
+    async def get_tags(self, limit: int) -> List[Dict[str, Any]]:
+        """점수 높은 순 태그 목록"""
+        tags = await async_redis_client.zrevrange(TRENDING_TAGS_KEY, 0, limit - 1, withscores=True)
+        return [{"tag": tag, "score": round(score, 2)} for tag, score in tags]
+
+    async def seed_from_db(self, db: Session) -> int:
+        """
+        순위가 비었을 때(배포 직후, Redis 초기화) 최근 COMMUNITY_TRENDING_SIZE개 포스트의 DB 카운터로 점수를 채움
+        점수 = 작성/조회/반응 가중치 합을 작성 후 경과 시간만큼 반감기로 감쇠 (실시간 점수의 근사), 채운 포스트 수 반환
+        여러 요청이 동시에 비어 있는 순위를 봐도 COMMUNITY_TRENDING_DECAY_INTERVAL 동안 한 번만 실행
+        """
+        if not await async_redis_client.set(
+            TRENDING_SEEDED_KEY, 1, nx=True, ex=settings.COMMUNITY_TRENDING_DECAY_INTERVAL
+        ):
+            return 0
+        rows = db.query(
+            CommunityPost.id, CommunityPost.tags, CommunityPost.view_count,
+            CommunityPost.reaction_count, CommunityPost.created_at
+        ).order_by(desc(CommunityPost.created_at)).limit(settings.COMMUNITY_TRENDING_SIZE).all()
+
+        now = datetime.now(timezone.utc)
+        post_scores: Dict[str, float] = {}
+        tag_scores: Dict[str, float] = {}
+        for row in rows:
+            created_at = row.created_at if row.created_at.tzinfo else row.created_at.replace(tzinfo=timezone.utc)
+            age = max((now - created_at).total_seconds(), 0)
+            score = (
+                _engagement_weight("post")
+                + row.view_count * _engagement_weight("view")
+                + row.reaction_count * _engagement_weight("reaction")
+            ) * 0.5 ** (age / settings.COMMUNITY_TRENDING_HALF_LIFE)
+            if score < TRENDING_MIN_SCORE:
+                continue
+            post_scores[str(row.id)] = score
+            for tag in dict.fromkeys(row.tags or []):
+                tag_scores[tag] = tag_scores.get(tag, 0) + score
+
+        if post_scores:
+            # 그 사이 실시간으로 올라간 점수는 덮어쓰지 않음
+            pipe = async_redis_client.pipeline(transaction=False)
+            pipe.zadd(TRENDING_POSTS_KEY, post_scores, nx=True)
+            if tag_scores:
+                pipe.zadd(TRENDING_TAGS_KEY, tag_scores, nx=True)
+            await pipe.execute()
+        logger.info(f"인기 순위 DB에서 다시 채움: 포스트 {len(post_scores)}개")
+        return len(post_scores)
+
+    def decay(self) -> float:
+        """
+        모든 포스트/태그 점수에 지난 감쇠 이후 경과 시간만큼의 감쇠 계수를 곱함 (반감기 COMMUNITY_TRENDING_HALF_LIFE)
+        실행이 밀리거나 빠져도 경과 시간으로 계산하므로 결과 동일, 낮은 점수와 COMMUNITY_TRENDING_SIZE 밖 항목은 제거
+        """
+        now = time.time()
+        last = redis_client.set(TRENDING_DECAYED_AT_KEY, now, get=True)
+        if last is None:
+            return 1.0
+        factor = 0.5 ** (max(now - float(last), 0) / settings.COMMUNITY_TRENDING_HALF_LIFE)
+        pipe = redis_client.pipeline(transaction=True)
+        for key in (TRENDING_POSTS_KEY, TRENDING_TAGS_KEY):
+            pipe.zunionstore(key, {key: factor})
+            pipe.zremrangebyscore(key, "-inf", f"({TRENDING_MIN_SCORE}")
+            pipe.zremrangebyrank(key, 0, -(settings.COMMUNITY_TRENDING_SIZE + 1))
+        pipe.execute()
+        return factor
+
+    def flush_engagement(self, db: Session) -> int:
+        """
+        대기 카운터를 포스트별로 합쳐 한 번의 executemany UPDATE로 DB에 반영, 반영한 포스트 수 반환
+        동시에 실행된 작업은 잠금을 잡지 못하면 아무 것도 하지 않음 (잠금 TTL: maintenance 큐 시간 제한)
+        """
+        token = str(uuid.uuid4())
+        if not redis_client.set(ENGAGEMENT_FLUSH_LOCK_KEY, token, nx=True, ex=settings.CELERY_MAINTENANCE_TIME_LIMIT):
+            logger.info("다른 참여 카운터 반영 작업이 진행 중이라 건너뜀")
+            return 0
+        try:
+            return self._flush_engagement(db)
+        finally:
+            redis_client.eval(RELEASE_KEY_SCRIPT, 1, ENGAGEMENT_FLUSH_LOCK_KEY, token)
+
+    def _flush_engagement(self, db: Session) -> int:
+        """
+        대기 해시를 묶음 ID와 함께 FLUSHING 키로 옮긴 뒤 반영하므로 그동안 들어온 기록은 다음 실행에서 반영
+        DB 반영에 실패하면 FLUSHING 키가 남아 다음 실행에서 먼저 반영
+        묶음 ID를 카운터와 같은 트랜잭션에 기록하므로, 커밋 후 FLUSHING 키를 지우기 전에 실패해도 다시 반영하지 않음
+        """
+        if not redis_client.exists(FLUSHING_ENGAGEMENT_KEY):
+            if not redis_client.exists(PENDING_ENGAGEMENT_KEY):
+                return 0
+            pipe = redis_client.pipeline(transaction=True)
+            pipe.rename(PENDING_ENGAGEMENT_KEY, FLUSHING_ENGAGEMENT_KEY)
+            pipe.set(FLUSHING_BATCH_KEY, str(uuid.uuid4()))
+            pipe.execute()
+        # 묶음 ID 없이 남은 FLUSHING 키 (묶음 ID 기록 전 버전)는 새 ID로 반영
+        batch_id = redis_client.get(FLUSHING_BATCH_KEY) or str(uuid.uuid4())
+        if db.get(CommunityEngagementFlush, batch_id) is not None:
+            logger.info(f"이미 반영한 참여 카운터 묶음 정리: {batch_id}")
+            redis_client.delete(FLUSHING_ENGAGEMENT_KEY, FLUSHING_BATCH_KEY)
+            return 0
+
+        counts: Dict[str, Dict[str, int]] = {}
+        for field, count in redis_client.hgetall(FLUSHING_ENGAGEMENT_KEY).items():
+            post_id, kind = field.rsplit(":", 1)
+            if kind in ENGAGEMENT_COLUMNS:
+                post_counts = counts.setdefault(post_id, dict.fromkeys(ENGAGEMENT_COLUMNS.values(), 0))
+                post_counts[ENGAGEMENT_COLUMNS[kind]] += int(count)
+
+        if counts:
+            table = CommunityPost.__table__
+            statement = update(table).where(table.c.id == bindparam("b_id")).values({
+                column: table.c[column] + bindparam(f"b_{column}") for column in ENGAGEMENT_COLUMNS.values()
+            })
+            db.execute(statement, [
+                {"b_id": uuid.UUID(post_id), **{f"b_{column}": count for column, count in post_counts.items()}}
+                for post_id, post_counts in counts.items()
+            ])
+            db.query(CommunityEngagementFlush).filter(
+                CommunityEngagementFlush.flushed_at < datetime.now(timezone.utc) - FLUSH_BATCH_RETENTION
+            ).delete(synchronize_session=False)
+            db.add(CommunityEngagementFlush(batch_id=batch_id))
+            db.commit()
+        redis_client.delete(FLUSHING_ENGAGEMENT_KEY, FLUSHING_BATCH_KEY)
+        return len(counts)
+
+# 전역 인기 순위 서비스 인스턴스
+trending_service = TrendingService()
@@ -0,0 +1,136 @@
+"""
+꿈 시각화 생성 작업 관리 서비스
+"""
+from sqlalchemy.orm import Session
+from app.models.dream import Dream
+from app.models.dream_visualization import DreamVisualization
+from app.core.config import settings
+from app.core.redis_client import RELEASE_KEY_SCRIPT, redis_client, async_redis_client
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+class VisualizationJobService:
+    def __init__(self):
+        # 큐에서 대기하는 동안의 중복 방지 키 유지 시간 (작업이 시작되면 최대 실행 시간으로 다시 설정)
+        self.queue_lock_ttl = settings.CELERY_LLM_QUEUE_TTL
+        self.lock_ttl = settings.CELERY_LLM_TIME_LIMIT
+        # 완료된 결과를 같은 입력에 재사용하는 기간 (초)
+        self.result_ttl = settings.VISUALIZATION_RESULT_TTL
+        # 작업 상태 해시 보존 시간 (초)
+        self.status_ttl = settings.VISUALIZATION_STATUS_TTL
+
+    def content_hash(self, dream: Dream) -> str:
+        """시각화 프롬프트에 들어가는 내용의 해시 (내용이 바뀌면 새 시각화로 취급)"""
+        content = "\n".join([
+            dream.title or '',
+            dream.body_text or '',
+            dream.dream_type or '',
+            dream.location or '',
+            ','.join(dream.emotion_tags or []),
+            ','.join(dream.characters or []),
+            ','.join(dream.symbols or []),
+        ])
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+    def job_key(self, dream_id: str, art_style: str, content_hash: str) -> str:
+        """(꿈 ID, 스타일, 내용 해시) → 작업 ID"""
+        return f"visualization:dedup:{dream_id}:{art_style}:{content_hash}"
+
+    def status_key(self, job_id: str) -> str:
+        return f"visualization:job:{job_id}"
+
+    def enqueue(self, dream: Dream, art_style: str, db: Session) -> Tuple[str, bool]:
+        """
+        시각화 생성 작업을 한 번만 큐에 추가
+        같은 꿈/스타일/내용에 대한 요청은 진행 중이거나 완료된 같은 작업 ID를 공유
+        반환값: (작업 ID, 새로 추가되었는지 여부)
+        """
+        dream_id = str(dream.id)
+        key = self.job_key(dream_id, art_style, self.content_hash(dream))
+        job_id = str(uuid.uuid4())
+
+        # SET NX: 먼저 키를 잡은 요청만 작업을 생성
+        if not redis_client.set(key, job_id, nx=True, ex=self.queue_lock_ttl):
+            existing_job_id = redis_client.get(key)
+            if existing_job_id and self._reusable(existing_job_id, db):
+                logger.info(f"시각화 작업 재사용: {dream_id}, 스타일: {art_style}, 작업 ID: {existing_job_id}")
+                return existing_job_id, False
+            # 조회 직전에 만료되었거나 결과가 삭제된 경우 다시 시도
+            # (확인한 작업 ID일 때만 삭제 - 동시에 다시 시도한 요청의 새 키를 지우지 않도록)
+            if existing_job_id:
+                self._release(key, existing_job_id)
+            return self.enqueue(dream, art_style, db)
+
+        try:
+            self.update_status(job_id, 'queued', dream_id=dream_id, user_id=str(dream.user_id), art_style=art_style)
+
+            from app.workers.visualization_tasks import generate_visualization_task
+            generate_visualization_task.apply_async(
+                args=[dream_id, art_style], kwargs={'job_key': key}, task_id=job_id
+            )
+        except Exception:
+            # 큐 추가에 실패하면 다음 요청이 다시 시도할 수 있도록 키 해제
+            self._release(key, job_id)
+            raise
+
+        logger.info(f"시각화 작업 추가: {dream_id}, 스타일: {art_style}, 작업 ID: {job_id}")
+        return job_id, True
+
+    def _release(self, key: str, job_id: str) -> None:
+        """중복 방지 키가 아직 job_id를 가리킬 때만 삭제"""
+        redis_client.eval(RELEASE_KEY_SCRIPT, 1, key, job_id)
+
+    def _reusable(self, job_id: str, db: Session) -> bool:
+        """진행 중이거나, 완료되었고 결과 시각화가 아직 남아 있는 작업인지 확인"""
+        status = redis_client.hgetall(self.status_key(job_id))
+        if not status:
+            # 상태 기록 전 (다른 요청이 막 큐에 추가하는 중)
+            return True
+        if status.get('stage') == 'failed':
+            return False
+        if status.get('stage') == 'completed':
+            return db.query(DreamVisualization.id).filter(
+                DreamVisualization.id == status.get('visualization_id')
+            ).first() is not None
+        return True
+
+    def update_status(self, job_id: str, stage: str, ttl: Optional[int] = None, **fields: Any) -> None:
+        """작업 상태 해시 갱신 (워커에서도 호출, 실패해도 작업 자체는 계속 진행)"""
+        try:
+            key = self.status_key(job_id)
+            pipe = redis_client.pipeline()
+            pipe.hset(key, mapping={'stage': stage, **{name: value for name, value in fields.items() if value is not None}})
+            pipe.expire(key, ttl or self.status_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"시각화 작업 상태 갱신 실패: {job_id}, 오류: {str(e)}")
+
+    def start(self, job_id: str, job_key: Optional[str]) -> None:
+        """시작 기록 후 중복 방지 키 만료를 최대 실행 시간으로 다시 설정 (키가 남아 있을 때만)"""
+        self.update_status(job_id, 'generating')
+        if job_key:
+            redis_client.set(job_key, job_id, xx=True, ex=self.lock_ttl)
+
+    def complete(self, job_id: str, job_key: Optional[str], visualization_id: str) -> None:
+        """완료 기록 후 같은 입력이 결과를 재사용하도록 중복 방지 키 유지 기간 연장"""
+        self.update_status(job_id, 'completed', ttl=self.result_ttl, visualization_id=visualization_id)
+        if job_key:
+            redis_client.set(job_key, job_id, ex=self.result_ttl)
+
+    def fail(self, job_id: str, job_key: Optional[str], error: str) -> None:
+        """실패 기록 후 재요청을 허용하도록 중복 방지 키 해제"""
+        self.update_status(job_id, 'failed', error=error[:500])
+        if job_key:
+            self._release(job_key, job_id)
+
+    async def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 조회 (만료되었거나 없는 작업이면 None)"""
+        status = await async_redis_client.hgetall(self.status_key(job_id))
+        return status or None
+
+# 전역 시각화 작업 서비스 인스턴스
+visualization_job_service = VisualizationJobService()
@@ -2,11 +2,18 @@
 꿈 시각화 서비스
 """
 import google.generativeai as genai
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import func, tuple_
 from sqlalchemy.orm import Session
 from app.models.dream import Dream
 from app.models.dream_visualization import DreamVisualization
+from app.models.sync import SyncTombstone
 from app.core.config import settings
+from app.core.gemini import configure_gemini, generate_content
+from app.core.metrics import track_llm_call, record_cache
+from app.core.redis_client import async_redis_client, redis_client
+from app.services.image_derivatives import image_derivative_service
+import base64
 import logging
 import json
 import uuid
@@ -15,10 +22,27 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+def gallery_count_key(user_id: str) -> str:
+    """사용자 시각화 갤러리 전체 개수 캐시 키"""
+    return f"visualizations:gallery:count:{user_id}"
+
+def encode_gallery_cursor(created_at: datetime, visualization_id) -> str:
+    """마지막 항목의 (created_at, id)를 다음 페이지 커서로 인코딩"""
+    raw = f"{created_at.isoformat()}|{visualization_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_gallery_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, visualization_id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(visualization_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("잘못된 갤러리 커서입니다")
+
 class VisualizationService:
     def __init__(self):
         # Google Gemini API 설정
-        genai.configure(api_key=settings.GEMINI_API_KEY)
+        configure_gemini()
         self.model = genai.GenerativeModel('gemini-pro')
         
         # 미술 스타일 정의
@@ -58,6 +82,7 @@ class VisualizationService:
             # 데이터베이스에 시각화 결과 저장
             visualization = DreamVisualization(
                 dream_id=dream.id,
+                user_id=dream.user_id,
                 image_path=image_path,
                 art_style=art_style,
                 prompt_used=image_prompt
@@ -67,6 +92,7 @@ class VisualizationService:
                 db.add(visualization)
                 db.commit()
                 db.refresh(visualization)
+                self.invalidate_gallery_count(str(dream.user_id))
             
             logger.info(f"꿈 시각화 생성 완료: {dream.id}, 스타일: {art_style}")
             return visualization
@@ -108,7 +134,8 @@ class VisualizationService:
             프롬프트만 답변해주세요.
             """
             
-            response = self.model.generate_content(prompt)
+            with track_llm_call("gemini", "visualization_prompt"):
+                response = generate_content(self.model, prompt)
             return response.text.strip()
             
         except Exception as e:
@@ -237,9 +264,23 @@ class VisualizationService:
             if os.path.exists(visualization.image_path):
                 os.remove(visualization.image_path)
             
-            # 데이터베이스에서 삭제
+            # 파생본은 내용 해시로 공유되므로 같은 이미지를 쓰는 다른 시각화가 없을 때만 삭제
+            shared = visualization.content_hash and db.query(DreamVisualization.id).filter(
+                DreamVisualization.content_hash == visualization.content_hash,
+                DreamVisualization.id != visualization.id
+            ).first()
+            if not shared:
+                for path in image_derivative_service.paths(visualization.derivatives):
+                    if os.path.exists(path):
+                        os.remove(path)
+            
+            user_id = db.query(Dream.user_id).filter(Dream.id == visualization.dream_id).scalar()
+            
+            # 데이터베이스에서 삭제 (앱 동기화용 삭제 기록과 함께)
+            db.add(SyncTombstone(user_id=user_id, entity_type="visualization", entity_id=visualization.id))
             db.delete(visualization)
             db.commit()
+            self.invalidate_gallery_count(str(user_id))
             
             logger.info(f"시각화 삭제 완료: {visualization_id}")
             return True
@@ -248,5 +289,86 @@ class VisualizationService:
             logger.error(f"시각화 삭제 실패: {visualization_id}, 오류: {str(e)}")
             raise e
 
+    async def get_gallery_page(
+        self,
+        user_id: str,
+        db: Session,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        skip: int = 0
+    ) -> Dict[str, Any]:
+        """
+        사용자의 시각화 갤러리 한 페이지 조회
+        사용자별 (user_id, created_at, id) 인덱스 순서대로 읽고 꿈 제목은 기본 키 조인으로 함께 가져옴
+        (created_at, id) 키셋으로 페이지를 나눔
+        cursor가 없으면 skip(이전 클라이언트 호환용 오프셋)부터 조회
+        """
+        query = db.query(
+            DreamVisualization.id,
+            DreamVisualization.dream_id,
+            DreamVisualization.image_path,
+            DreamVisualization.art_style,
+            DreamVisualization.derivatives,
+            DreamVisualization.created_at,
+            Dream.title.label("dream_title")
+        ).join(
+            Dream, Dream.id == DreamVisualization.dream_id
+        ).filter(
+            DreamVisualization.user_id == user_id
+        )
+        
+        if cursor:
+            created_at, visualization_id = decode_gallery_cursor(cursor)
+            query = query.filter(
+                tuple_(DreamVisualization.created_at, DreamVisualization.id) < tuple_(created_at, visualization_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+        
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        rows = query.order_by(
+            DreamVisualization.created_at.desc(),
+            DreamVisualization.id.desc()
+        ).limit(limit + 1).all()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        return {
+            "visualizations": rows,
+            "next_cursor": encode_gallery_cursor(rows[-1].created_at, rows[-1].id) if has_more else None,
+            "has_more": has_more
+        }
+    
+    async def get_gallery_count(self, user_id: str, db: Session) -> int:
+        """
+        사용자의 전체 시각화 개수 (Redis 캐시, 생성/삭제 시 무효화)
+        꿈 삭제로 함께 지워진 시각화는 캐시 만료(GALLERY_COUNT_CACHE_TTL) 후 반영
+        """
+        key = gallery_count_key(str(user_id))
+        try:
+            cached = await async_redis_client.get(key)
+            record_cache("gallery_count", cached is not None)
+            if cached is not None:
+                return int(cached)
+        except Exception as e:
+            logger.warning(f"갤러리 개수 캐시 조회 실패: {str(e)}")
+        
+        total_count = db.query(func.count(DreamVisualization.id)).filter(
+            DreamVisualization.user_id == user_id
+        ).scalar()
+        
+        try:
+            await async_redis_client.set(key, total_count, ex=settings.GALLERY_COUNT_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"갤러리 개수 캐시 저장 실패: {str(e)}")
+        return total_count
+    
+    def invalidate_gallery_count(self, user_id: str) -> None:
+        try:
+            redis_client.delete(gallery_count_key(user_id))
+        except Exception as e:
+            logger.warning(f"갤러리 개수 캐시 무효화 실패: {user_id}, 오류: {str(e)}")
+
 # 전역 시각화 서비스 인스턴스
 visualization_service = VisualizationService()
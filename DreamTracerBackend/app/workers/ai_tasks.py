@@ -1,27 +1,43 @@
 """
 AI 분석 Celery 태스크
 """
-from celery import current_task
+from celery import group
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from sqlalchemy import select
+from typing import List, Optional
 from app.workers.celery_app import celery_app
 from app.services.ai_service import ai_service
-from app.core.database import SessionLocal
+from app.services.analysis_job_service import analysis_job_service
+from app.services.similarity import similar_pairs
+from app.core.config import settings
+from app.core.database import SessionLocal, delete_in_batches
+from app.core.gemini import llm_deadline
+from app.core.redis_client import redis_client
+from app.core.metrics import track_embedding
 from app.models.dream import Dream
 from app.models.dream_analysis import DreamAnalysis
+import asyncio
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
-@celery_app.task(bind=True, acks_late=True)
-def analyze_dream_task(self, dream_id: str):
+@celery_app.task(bind=True, acks_late=True, ignore_result=True)
+def analyze_dream_task(self, dream_id: str, lock_key: Optional[str] = None):
     """
     비동기적으로 꿈을 분석하는 Celery 태스크
+    진행 상태는 결과 백엔드 대신 작업 상태 해시(TTL)와 진행 이벤트로만 기록
+    lock_key: 중복 요청 방지 잠금 키 (시작 시 만료 연장, 끝나면 성공/실패 모두 해제하여 재요청 허용)
     """
+    task_id = self.request.id
     try:
+        # 큐 대기 시간 기준으로 잡은 잠금을 실행 시간 기준으로 다시 설정
+        if lock_key:
+            analysis_job_service.refresh(lock_key, task_id)
+        
         # 태스크 상태 업데이트
-        current_task.update_state(
-            state='PROGRESS',
-            meta={'current': 0, 'total': 100, 'status': '분석 시작...'}
-        )
+        analysis_job_service.publish_progress(dream_id, 'started', 0, '분석 시작...', task_id=task_id)
         
         db = SessionLocal()
         try:
@@ -31,27 +47,18 @@ def analyze_dream_task(self, dream_id: str):
                 raise ValueError(f"꿈을 찾을 수 없습니다: {dream_id}")
             
             # 분석 상태 업데이트
-            current_task.update_state(
-                state='PROGRESS',
-                meta={'current': 20, 'total': 100, 'status': '기본 내용 분석 중...'}
-            )
+            analysis_job_service.publish_progress(dream_id, 'analyzing', 20, '기본 내용 분석 중...', task_id=task_id)
             
-            # AI 분석 수행
-            analysis = ai_service.analyze_dream(dream, db)
+            # AI 분석 수행 (threads 풀은 시간 제한을 강제하지 않으므로 Gemini 호출을 소프트 제한 안에 끝냄)
+            with llm_deadline(settings.CELERY_LLM_SOFT_TIME_LIMIT):
+                analysis = asyncio.run(ai_service.analyze_dream(dream, db))
             
             # 완료 상태 업데이트
-            current_task.update_state(
-                state='SUCCESS',
-                meta={'current': 100, 'total': 100, 'status': '분석 완료'}
+            analysis_job_service.publish_progress(
+                dream_id, 'completed', 100, '분석 완료', task_id=task_id, analysis_id=str(analysis.id)
             )
             
             logger.info(f"꿈 분석 태스크 완료: {dream_id}")
-            return {
-                'dream_id': dream_id,
-                'analysis_id': str(analysis.id),
-                'status': 'completed',
-                'summary': analysis.summary_text
-            }
             
         finally:
             db.close()
@@ -60,10 +67,7 @@ def analyze_dream_task(self, dream_id: str):
         logger.error(f"꿈 분석 태스크 실패: {dream_id}, 오류: {str(e)}")
         
         # 실패 상태 업데이트
-        current_task.update_state(
-            state='FAILURE',
-            meta={'current': 0, 'total': 100, 'status': f'분석 실패: {str(e)}'}
-        )
+        analysis_job_service.publish_progress(dream_id, 'failed', 0, f'분석 실패: {str(e)}', task_id=task_id)
         
         # 꿈 분석 상태를 실패로 업데이트
         db = SessionLocal()
@@ -76,47 +80,54 @@ def analyze_dream_task(self, dream_id: str):
             db.close()
         
         raise e
+    
+    finally:
+        # 성공/실패 모두 잠금 해제 (완료 후 다시 요청하면 새 분석으로 덮어씀)
+        if lock_key:
+            analysis_job_service.release(lock_key, task_id)
 
-@celery_app.task
+def daily_insight_key(run_date: str, user_id: str) -> str:
+    """일일 인사이트 캐시 키 (배치 진행 상황 기록도 겸함)"""
+    return f"insights:daily:{run_date}:{user_id}"
+
+@celery_app.task(ignore_result=True)
 def generate_daily_insights():
     """
     매일 사용자에게 개인화된 인사이트를 생성하는 Celery Beat 태스크
+    기간 내 꿈을 기록한 사용자만 골라 청크 단위 태스크로 분산 실행
     """
     try:
         logger.info("일일 인사이트 생성 시작...")
         
+        run_date = date.today().isoformat()
+        window_start = date.today() - timedelta(days=settings.INSIGHT_WINDOW_DAYS)
+        
         db = SessionLocal()
         try:
-            # 모든 활성 사용자 조회
-            from app.models.user import User
-            users = db.query(User).all()
-            
-            insights_generated = 0
-            for user in users:
-                try:
-                    # 사용자별 인사이트 생성
-                    insight = ai_service.generate_daily_insight(str(user.id), db)
-                    
-                    # TODO: 인사이트를 사용자에게 푸시 알림으로 전송
-                    # 또는 별도 테이블에 저장
-                    
-                    insights_generated += 1
-                    logger.info(f"사용자 {user.id} 인사이트 생성 완료")
-                    
-                except Exception as e:
-                    logger.error(f"사용자 {user.id} 인사이트 생성 실패: {str(e)}")
-                    continue
-            
-            logger.info(f"일일 인사이트 생성 완료: {insights_generated}개")
-            return {
-                'status': 'success',
-                'insights_generated': insights_generated,
-                'total_users': len(users)
-            }
-            
+            # 기간 내 꿈이 있는 사용자 ID만 조회
+            user_rows = db.query(Dream.user_id).filter(
+                Dream.dream_date >= window_start,
+                Dream.body_text.isnot(None)
+            ).distinct().yield_per(1000)
+            user_ids = [str(user_id) for (user_id,) in user_rows]
         finally:
             db.close()
-            
+        
+        chunk_size = settings.INSIGHT_CHUNK_SIZE
+        chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+        
+        if chunks:
+            group(
+                generate_insights_for_users.s(chunk, run_date) for chunk in chunks
+            ).apply_async()
+        
+        logger.info(f"일일 인사이트 태스크 분배 완료: 사용자 {len(user_ids)}명, 청크 {len(chunks)}개")
+        return {
+            'status': 'dispatched',
+            'total_users': len(user_ids),
+            'chunks': len(chunks)
+        }
+        
     except Exception as e:
         logger.error(f"일일 인사이트 생성 실패: {str(e)}")
         return {
@@ -124,34 +135,74 @@ def generate_daily_insights():
             'error': str(e)
         }
 
-@celery_app.task
+@celery_app.task(bind=True, acks_late=True, ignore_result=True, max_retries=3, default_retry_delay=60)
+def generate_insights_for_users(self, user_ids: List[str], run_date: str):
+    """
+    사용자 청크에 대한 일일 인사이트 생성
+    이미 생성된 사용자는 건너뛰므로 재시도/재실행 시 중단 지점부터 이어서 진행
+    """
+    pending_ids = [
+        user_id for user_id in user_ids
+        if not redis_client.exists(daily_insight_key(run_date, user_id))
+    ]
+    
+    def _generate(user_id: str) -> bool:
+        db = SessionLocal()
+        try:
+            insight = asyncio.run(ai_service.generate_daily_insight(user_id, db))
+            
+            # /analysis/insights/daily 조회는 이 캐시를 그대로 응답 (요청 시 LLM 호출 없음)
+            redis_client.set(
+                daily_insight_key(run_date, user_id),
+                json.dumps(insight, ensure_ascii=False),
+                ex=settings.INSIGHT_CACHE_TTL
+            )
+            return True
+        except Exception as e:
+            logger.error(f"사용자 {user_id} 인사이트 생성 실패: {str(e)}")
+            return False
+        finally:
+            db.close()
+    
+    # LLM 호출은 I/O 대기가 대부분이므로 제한된 수의 스레드로 동시 실행
+    with ThreadPoolExecutor(max_workers=settings.INSIGHT_LLM_CONCURRENCY) as executor:
+        results = list(executor.map(_generate, pending_ids))
+    
+    generated = sum(results)
+    failed = len(results) - generated
+    logger.info(f"인사이트 청크 완료: 생성 {generated}, 실패 {failed}, 생략 {len(user_ids) - len(pending_ids)}")
+    
+    if failed:
+        # 실패한 사용자만 다시 처리됨 (성공한 사용자는 캐시 키로 건너뜀)
+        raise self.retry(exc=RuntimeError(f"인사이트 생성 실패 {failed}건"))
+    
+    return {
+        'status': 'success',
+        'generated': generated,
+        'skipped': len(user_ids) - len(pending_ids)
+    }
+
+@celery_app.task(ignore_result=True)
 def cleanup_old_analyses():
     """
     오래된 분석 결과를 정리하는 태스크
+    관련된 꿈이 삭제된 분석 결과만 배치 단위로 삭제 (NOT EXISTS 안티 조인)
     """
     try:
         logger.info("오래된 분석 결과 정리 시작...")
         
         db = SessionLocal()
         try:
-            from datetime import datetime, timedelta
-            
-            # 30일 이상 된 분석 결과 조회
-            cutoff_date = datetime.now() - timedelta(days=30)
-            
-            old_analyses = db.query(DreamAnalysis).filter(
-                DreamAnalysis.created_at < cutoff_date
-            ).all()
-            
-            deleted_count = 0
-            for analysis in old_analyses:
-                # 관련된 꿈이 삭제된 경우에만 분석 결과 삭제
-                dream = db.query(Dream).filter(Dream.id == analysis.dream_id).first()
-                if not dream:
-                    db.delete(analysis)
-                    deleted_count += 1
+            cutoff_date = datetime.now() - timedelta(days=settings.ANALYSIS_RETENTION_DAYS)
             
-            db.commit()
+            dream_exists = select(Dream.id).where(Dream.id == DreamAnalysis.dream_id).exists()
+            deleted_count = delete_in_batches(
+                db,
+                DreamAnalysis,
+                DreamAnalysis.created_at < cutoff_date,
+                ~dream_exists,
+                batch_size=settings.CLEANUP_BATCH_SIZE
+            )
             
             logger.info(f"오래된 분석 결과 정리 완료: {deleted_count}개 삭제")
             return {
@@ -169,7 +220,7 @@ def cleanup_old_analyses():
             'error': str(e)
         }
 
-@celery_app.task
+@celery_app.task(ignore_result=True)
 def update_dream_network():
     """
     꿈 네트워크 그래프를 업데이트하는 태스크
@@ -203,26 +254,15 @@ def update_dream_network():
             for dream in dreams:
                 dream_text = f"{dream.title or ''} {dream.body_text or ''}"
                 if dream_text.strip():
-                    embedding = ai_service.embedding_model.encode([dream_text])
+                    with track_embedding("dream_network"):
+                        embedding = ai_service.embedding_model.encode([dream_text])
                     dream_embeddings[str(dream.id)] = embedding[0]
             
-            # 유사도 계산 및 엣지 추가
-            dream_ids = list(dream_embeddings.keys())
-            for i, dream_id1 in enumerate(dream_ids):
-                for dream_id2 in dream_ids[i+1:]:
-                    embedding1 = dream_embeddings[dream_id1]
-                    embedding2 = dream_embeddings[dream_id2]
-                    
-                    # 코사인 유사도 계산
-                    similarity = np.dot(embedding1, embedding2) / (
-                        np.linalg.norm(embedding1) * np.linalg.norm(embedding2)
-                    )
-                    
-                    # 임계값 이상인 경우 엣지 추가
-                    if similarity > 0.5:
-                        ai_service.dream_network.add_edge(
-                            dream_id1, dream_id2, weight=similarity
-                        )
+            # 유사도 계산 및 엣지 추가 (임계값 이상인 경우)
+            for dream_id1, dream_id2, similarity in similar_pairs(dream_embeddings, 0.5):
+                ai_service.dream_network.add_edge(
+                    dream_id1, dream_id2, weight=similarity
+                )
             
             logger.info(f"꿈 네트워크 업데이트 완료: {len(dreams)}개 노드, {ai_service.dream_network.number_of_edges()}개 엣지")
             return {
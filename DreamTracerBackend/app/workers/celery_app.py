@@ -2,16 +2,45 @@
 Celery 애플리케이션 설정
 """
 from celery import Celery
+from kombu import Queue
 from app.core.config import settings
+from app.core.metrics import register_celery_metrics
 
 # Celery 앱 생성
 celery_app = Celery(
     "dreamtracer",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.workers.tasks"]
+    include=["app.workers.tasks", "app.workers.ai_tasks", "app.workers.visualization_tasks"]
 )
 
+# 작업 유형별 큐
+# - llm: LLM API 호출 위주 (I/O 대기) → threads 풀, 높은 동시성
+#   (threads 풀은 시간 제한을 강제하지 않으므로 작업이 llm_deadline으로 Gemini 호출 시간을 직접 제한)
+# - embed: 임베딩/네트워크 계산 (CPU) → prefork 풀, 코어 수 이하 동시성
+# - maintenance: 정리/배치 분배 작업 → prefork 풀, 낮은 동시성
+QUEUE_TIME_LIMITS = {
+    "llm": (settings.CELERY_LLM_TIME_LIMIT, settings.CELERY_LLM_SOFT_TIME_LIMIT),
+    "embed": (settings.CELERY_EMBED_TIME_LIMIT, settings.CELERY_EMBED_SOFT_TIME_LIMIT),
+    "maintenance": (settings.CELERY_MAINTENANCE_TIME_LIMIT, settings.CELERY_MAINTENANCE_SOFT_TIME_LIMIT),
+}
+
+TASK_QUEUES = {
+    "app.workers.ai_tasks.analyze_dream_task": "llm",
+    "app.workers.ai_tasks.generate_insights_for_users": "llm",
+    "app.workers.tasks.analyze_dream_ai": "llm",
+    "app.workers.visualization_tasks.generate_visualization_task": "llm",
+    "app.workers.ai_tasks.update_dream_network": "embed",
+    "app.workers.visualization_tasks.generate_visualization_derivatives": "embed",
+    "app.workers.ai_tasks.generate_daily_insights": "maintenance",
+    "app.workers.ai_tasks.cleanup_old_analyses": "maintenance",
+    "app.workers.tasks.cleanup_old_dreams": "maintenance",
+    "app.workers.tasks.cleanup_sync_tombstones": "maintenance",
+    "app.workers.tasks.decay_community_trending": "maintenance",
+    "app.workers.tasks.flush_community_engagement": "maintenance",
+    "app.workers.tasks.extract_audio_duration": "maintenance",
+}
+
 # Celery 설정
 celery_app.conf.update(
     task_serializer="json",
@@ -20,20 +49,51 @@ celery_app.conf.update(
     timezone="Asia/Seoul",
     enable_utc=True,
     task_track_started=True,
-    task_time_limit=30 * 60,  # 30분
+    result_expires=settings.CELERY_RESULT_EXPIRES,
+    task_time_limit=30 * 60,  # 30분 (큐에 속하지 않은 작업의 기본값)
     task_soft_time_limit=25 * 60,  # 25분
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    task_queues=[Queue(name) for name in QUEUE_TIME_LIMITS],
+    task_default_queue="llm",
+    task_routes={task: {"queue": queue} for task, queue in TASK_QUEUES.items()},
+    # 작업이 속한 큐의 시간 제한 적용
+    task_annotations={
+        task: {
+            "time_limit": QUEUE_TIME_LIMITS[queue][0],
+            "soft_time_limit": QUEUE_TIME_LIMITS[queue][1],
+        }
+        for task, queue in TASK_QUEUES.items()
+    },
 )
 
+# 작업 실행 시간/큐 길이 메트릭
+register_celery_metrics(celery_app, QUEUE_TIME_LIMITS.keys())
+
 # 주기적 작업 설정
 celery_app.conf.beat_schedule = {
     "cleanup-old-dreams": {
         "task": "app.workers.tasks.cleanup_old_dreams",
         "schedule": 86400.0,  # 24시간마다 실행
     },
+    "cleanup-sync-tombstones": {
+        "task": "app.workers.tasks.cleanup_sync_tombstones",
+        "schedule": 86400.0,  # 24시간마다 실행
+    },
+    "decay-community-trending": {
+        "task": "app.workers.tasks.decay_community_trending",
+        "schedule": float(settings.COMMUNITY_TRENDING_DECAY_INTERVAL),
+    },
+    "flush-community-engagement": {
+        "task": "app.workers.tasks.flush_community_engagement",
+        "schedule": float(settings.COMMUNITY_ENGAGEMENT_FLUSH_INTERVAL),
+    },
+    "cleanup-old-analyses": {
+        "task": "app.workers.ai_tasks.cleanup_old_analyses",
+        "schedule": 86400.0,  # 24시간마다 실행
+    },
     "generate-daily-insights": {
-        "task": "app.workers.tasks.generate_daily_insights",
+        "task": "app.workers.ai_tasks.generate_daily_insights",
         "schedule": 86400.0,  # 24시간마다 실행
     },
 }
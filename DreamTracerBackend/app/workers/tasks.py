@@ -4,8 +4,16 @@ Celery 작업 정의
 from celery import current_task
 from app.workers.celery_app import celery_app
 from app.services.ai_service import AIService
-from app.services.dream_service import DreamService
-from app.core.database import SessionLocal
+from app.services.dream_service import DreamService, audio_duration_path
+from app.core.config import settings
+from app.core.database import SessionLocal, delete_in_batches
+from app.models.dream import Dream
+from app.models.sync import SyncTombstone
+from app.services.sync_service import dream_tombstones_insert
+from app.services.trending_service import trending_service
+from sqlalchemy import or_
+from datetime import date, datetime, timedelta, timezone
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -52,38 +60,133 @@ def analyze_dream_ai(self, dream_id: str):
         )
         raise
 
-@celery_app.task
+@celery_app.task(ignore_result=True)
 def cleanup_old_dreams():
     """
     오래된 꿈 데이터 정리 작업
+    보존 기간이 지난 빈 꿈 기록(제목, 내용, 음성 모두 없음)을 배치 단위로 삭제
     """
     try:
         db = SessionLocal()
         try:
-            # 1년 이상 된 꿈 데이터 정리 로직
-            # TODO: 실제 정리 로직 구현
-            logger.info("오래된 꿈 데이터 정리 완료")
-            return {'status': 'success', 'message': '정리 완료'}
+            cutoff_date = date.today() - timedelta(days=settings.DREAM_RETENTION_DAYS)
+            criteria = (
+                Dream.dream_date < cutoff_date,
+                Dream.title.is_(None),
+                or_(Dream.body_text.is_(None), Dream.body_text == ''),
+                Dream.audio_file_path.is_(None),
+            )
+            
+            deleted_count = delete_in_batches(
+                db,
+                Dream,
+                *criteria,
+                batch_size=settings.CLEANUP_BATCH_SIZE,
+                # 앱 동기화용 삭제 기록 (삭제와 같은 조건으로 같은 트랜잭션에서 기록)
+                before_delete=lambda ids: db.execute(dream_tombstones_insert(Dream.id.in_(ids), *criteria))
+            )
+            
+            logger.info(f"오래된 꿈 데이터 정리 완료: {deleted_count}개 삭제")
+            return {'status': 'success', 'deleted_count': deleted_count}
         finally:
             db.close()
     except Exception as e:
         logger.error(f"데이터 정리 실패: {str(e)}")
         raise
 
-@celery_app.task
-def generate_daily_insights():
+@celery_app.task(ignore_result=True)
+def cleanup_sync_tombstones():
     """
-    일일 인사이트 생성 작업
+    보존 기간이 지난 동기화 삭제 기록 정리 작업
+    이보다 오래된 커서로 동기화하는 앱은 전체 재동기화로 처리됨
     """
     try:
         db = SessionLocal()
         try:
-            # 일일 인사이트 생성 로직
-            # TODO: 실제 인사이트 생성 로직 구현
-            logger.info("일일 인사이트 생성 완료")
-            return {'status': 'success', 'message': '인사이트 생성 완료'}
+            cutoff = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+            
+            deleted_count = delete_in_batches(
+                db,
+                SyncTombstone,
+                SyncTombstone.deleted_at < cutoff,
+                batch_size=settings.CLEANUP_BATCH_SIZE
+            )
+            
+            logger.info(f"동기화 삭제 기록 정리 완료: {deleted_count}개 삭제")
+            return {'status': 'success', 'deleted_count': deleted_count}
         finally:
             db.close()
     except Exception as e:
-        logger.error(f"인사이트 생성 실패: {str(e)}")
+        logger.error(f"동기화 삭제 기록 정리 실패: {str(e)}")
         raise
+
+@celery_app.task(ignore_result=True)
+def decay_community_trending():
+    """
+    커뮤니티 인기 포스트/태그 점수 시간 감쇠 작업
+    """
+    try:
+        factor = trending_service.decay()
+        logger.info(f"인기 순위 점수 감쇠 완료: 계수 {factor:.4f}")
+        return {'status': 'success', 'factor': factor}
+    except Exception as e:
+        logger.error(f"인기 순위 점수 감쇠 실패: {str(e)}")
+        raise
+
+@celery_app.task(ignore_result=True)
+def flush_community_engagement():
+    """
+    Redis에 모인 커뮤니티 포스트 조회/반응 카운터를 DB에 반영하는 작업
+    """
+    try:
+        db = SessionLocal()
+        try:
+            updated_count = trending_service.flush_engagement(db)
+            if updated_count:
+                logger.info(f"포스트 참여 카운터 반영 완료: {updated_count}개 포스트")
+            return {'status': 'success', 'updated_count': updated_count}
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"포스트 참여 카운터 반영 실패: {str(e)}")
+        raise
+
+@celery_app.task(ignore_result=True)
+def extract_audio_duration(file_path: str, audio_file_path: str):
+    """
+    업로드된 오디오 파일의 길이 추출 작업
+    이미 이 파일을 쓰는 꿈에는 바로 기록하고, 이후 만들어질 꿈을 위해 파일 옆 메타데이터(.json)로도 저장
+    """
+    try:
+        duration = None
+        if file_path.lower().endswith('.wav'):
+            import wave
+            with wave.open(file_path, 'rb') as wav_file:
+                frames = wav_file.getnframes()
+                rate = wav_file.getframerate()
+                duration = frames / float(rate) if rate else None
+        else:
+            try:
+                import mutagen
+                audio = mutagen.File(file_path)
+                if audio is not None and audio.info is not None:
+                    duration = float(audio.info.length)
+            except ImportError:
+                logger.warning("mutagen이 설치되지 않아 오디오 길이를 추출할 수 없습니다")
+        
+        with open(audio_duration_path(file_path), 'w') as meta_file:
+            json.dump({'duration': duration}, meta_file)
+        
+        db = SessionLocal()
+        try:
+            db.query(Dream).filter(Dream.audio_file_path == audio_file_path).update(
+                {Dream.audio_duration: duration}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        
+        logger.info(f"오디오 길이 추출 완료: {file_path}, {duration}초")
+        
+    except Exception as e:
+        logger.error(f"오디오 길이 추출 실패: {file_path}, 오류: {str(e)}")
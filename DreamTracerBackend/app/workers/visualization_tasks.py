@@ -0,0 +1,90 @@
+"""
+꿈 시각화 Celery 태스크
+"""
+from typing import Optional
+from app.workers.celery_app import celery_app
+from app.services.visualization_service import visualization_service
+from app.services.visualization_job_service import visualization_job_service
+from app.services.image_derivatives import image_derivative_service
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.core.gemini import llm_deadline
+from app.models.dream import Dream
+from app.models.dream_visualization import DreamVisualization
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+@celery_app.task(bind=True, acks_late=True, ignore_result=True)
+def generate_visualization_task(self, dream_id: str, art_style: str, job_key: Optional[str] = None):
+    """
+    꿈 시각화 생성 (프롬프트 생성 → Gemini 호출 → 이미지 저장)
+    진행 상태는 결과 백엔드 대신 작업 상태 해시로만 기록
+    job_key: 중복 방지 키 (시작 시 실행 시간만큼, 완료 시 결과 재사용 기간만큼 연장, 실패 시 해제하여 재요청 허용)
+    """
+    job_id = self.request.id
+    try:
+        visualization_job_service.start(job_id, job_key)
+        
+        db = SessionLocal()
+        try:
+            dream = db.query(Dream).filter(Dream.id == dream_id).first()
+            if not dream:
+                raise ValueError(f"꿈을 찾을 수 없습니다: {dream_id}")
+            
+            # threads 풀은 시간 제한을 강제하지 않으므로 Gemini 호출을 소프트 제한 안에 끝냄
+            with llm_deadline(settings.CELERY_LLM_SOFT_TIME_LIMIT):
+                visualization = asyncio.run(
+                    visualization_service.generate_dream_visualization(dream, art_style, db)
+                )
+        finally:
+            db.close()
+        
+        visualization_job_service.complete(job_id, job_key, str(visualization.id))
+        logger.info(f"꿈 시각화 태스크 완료: {dream_id}, 스타일: {art_style}")
+        
+    except Exception as e:
+        logger.error(f"꿈 시각화 태스크 실패: {dream_id}, 스타일: {art_style}, 오류: {str(e)}")
+        visualization_job_service.fail(job_id, job_key, str(e))
+        raise e
+    
+    # 썸네일/포맷 변환은 CPU 작업이므로 embed 큐에서 처리
+    # (이미 완료된 작업이므로 큐 추가에 실패해도 원본 이미지로 응답, 실패로 기록하지 않음)
+    try:
+        generate_visualization_derivatives.delay(str(visualization.id))
+    except Exception as e:
+        logger.warning(f"시각화 파생본 작업 추가 실패: {visualization.id}, 오류: {str(e)}")
+
+@celery_app.task(acks_late=True, ignore_result=True)
+def generate_visualization_derivatives(visualization_id: str):
+    """
+    시각화 이미지의 썸네일과 WebP/AVIF 파생본 생성 후 경로 기록
+    파일 이름이 원본 내용 해시이므로 같은 이미지에 대해 다시 실행되어도 인코딩을 반복하지 않음
+    """
+    db = SessionLocal()
+    try:
+        visualization = db.query(DreamVisualization).filter(
+            DreamVisualization.id == visualization_id
+        ).first()
+        if not visualization:
+            logger.warning(f"파생본 생성 대상 시각화 없음: {visualization_id}")
+            return
+        
+        try:
+            derivatives = image_derivative_service.generate(visualization.image_path)
+        except (OSError, ValueError) as e:
+            # 읽을 수 없는 이미지(삭제됨, 개발용 더미 파일 등)는 재시도하지 않고 원본만 제공
+            logger.warning(f"이미지 파생본 생성 불가: {visualization_id}, 오류: {str(e)}")
+            return
+        
+        visualization.content_hash = derivatives.pop("content_hash")
+        visualization.derivatives = derivatives
+        db.commit()
+        logger.info(f"시각화 파생본 기록 완료: {visualization_id}")
+        
+    except Exception as e:
+        logger.error(f"시각화 파생본 생성 실패: {visualization_id}, 오류: {str(e)}")
+        raise e
+    finally:
+        db.close()
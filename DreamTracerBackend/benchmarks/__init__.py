@@ -0,0 +1,3 @@
+"""
+꿈결 백엔드 마이크로벤치마크 (python -m benchmarks)
+"""
@@ -0,0 +1,72 @@
+"""
+꿈결 백엔드 마이크로벤치마크
+
+사용법 (DreamTracerBackend 디렉토리에서):
+    python -m benchmarks                                   # 전체 실행, 기준값과 비교
+    python -m benchmarks --quick                           # 느린 벤치마크(N=10,000) 제외
+    python -m benchmarks -k similarity -o results.json     # 이름 필터, 결과 저장
+    python -m benchmarks --save-baseline                   # 현재 결과를 기준값으로 저장
+    python -m benchmarks --fail-on-regression              # 회귀 시 종료 코드 1 (CI용)
+"""
+from benchmarks import bench_analysis, bench_compression, bench_serialization, bench_similarity
+from benchmarks.harness import (
+    BenchmarkSuite, build_report, compare_reports, format_comparison, load_report, save_report
+)
+import argparse
+import logging
+import os
+import sys
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def build_suite(args) -> BenchmarkSuite:
+    suite = BenchmarkSuite(repeat=args.repeat, max_time=args.max_time)
+    for module in (bench_analysis, bench_similarity, bench_serialization, bench_compression):
+        module.register(suite)
+    return suite
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="꿈결 백엔드 마이크로벤치마크")
+    parser.add_argument("-k", "--filter", help="이름에 이 문자열이 포함된 벤치마크만 실행")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="비교할 기준 결과 JSON")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준 파일로 저장")
+    parser.add_argument("--quick", action="store_true", help="느린 벤치마크 제외")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    parser.add_argument("--max-time", type=float, default=10.0, help="벤치마크당 반복 측정 시간 예산 (초)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 중앙값 증가율 (0.2 = 20%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="회귀가 있으면 종료 코드 1")
+    args = parser.parse_args(argv)
+
+    # 분석기 내부 로그가 측정에 섞이지 않도록 비활성화
+    logging.disable(logging.CRITICAL)
+
+    results = build_suite(args).run(pattern=args.filter, quick=args.quick)
+    report = build_report(results)
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.save_baseline:
+        save_report(report, args.baseline)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n기준 파일 없음: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+
+    rows = compare_reports(report, load_report(args.baseline), args.tolerance)
+    print(f"\n기준값 비교 ({args.baseline})")
+    print(format_comparison(rows))
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (허용 {args.tolerance:.0%})")
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+ModernDreamAnalysisSystem 및 개별 분석기 벤치마크
+"""
+from app.services.modern_dream_analysis import ModernDreamAnalysisSystem
+from benchmarks.fixtures import TEXT_LENGTHS, dream_text, user_profile
+
+# 신규 사용자(히스토리 없음)와 히스토리가 쌓인 사용자 (_build_user_profile은 최대 50개 사용)
+HISTORY_SIZES = {"new_user": 0, "history": 50}
+# 개별 분석기용 히스토리 크기
+# PatternAnalyzer.analyze_changes는 히스토리 5개 이상이면 미구현 메서드(analyze_emotion_trend 등)를 호출해 실패하므로
+# 단독 측정은 실패 없이 끝까지 실행되는 최대 크기로 함 (전체 시스템 측정은 실제 경로 그대로 폴백 포함)
+ANALYZER_HISTORY_SIZE = 4
+
+def register(suite) -> None:
+    system = ModernDreamAnalysisSystem()
+
+    for length, sentences in TEXT_LENGTHS.items():
+        text = dream_text(sentences)
+        for profile_name, history_size in HISTORY_SIZES.items():
+            profile = user_profile(history_size)
+            suite.add(
+                f"analysis.modern.{length}.{profile_name}",
+                lambda _, text=text, profile=profile: system.analyze_dream(text, profile),
+                chars=len(text),
+                history=history_size
+            )
+
+        profile = user_profile(ANALYZER_HISTORY_SIZE)
+        for name, analyzer in system.analyzers.items():
+            suite.add(
+                f"analysis.{name}.{length}",
+                lambda _, analyzer=analyzer, text=text, profile=profile: analyzer.analyze(text, profile),
+                chars=len(text),
+                history=ANALYZER_HISTORY_SIZE
+            )
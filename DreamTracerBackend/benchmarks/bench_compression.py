@@ -0,0 +1,56 @@
+"""
+응답 압축 벤치마크 (CompressionMiddleware의 gzip/brotli 설정별 CPU 시간과 압축 후 크기)
+결과의 params.bytes가 전송 크기, params.raw_bytes가 원본 크기
+"""
+from typing import List
+from pydantic import TypeAdapter
+from app.core.responses import dumps
+from app.schemas.dream import DreamResponse
+from benchmarks.fixtures import dream_rows, gallery_payload, network_payload
+import zlib
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVELS = (1, 6, 9)
+BROTLI_QUALITIES = (1, 4, 11)
+
+def gzip_compress(body: bytes, level: int) -> bytes:
+    """GZipResponder와 같은 방식 (gzip 헤더 포함 단일 스트림)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+def brotli_compress(body: bytes, quality: int) -> bytes:
+    """BrotliResponder와 같은 설정"""
+    compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+    return compressor.process(body) + compressor.finish()
+
+def register(suite) -> None:
+    dream_list = TypeAdapter(List[DreamResponse]).dump_json(
+        [DreamResponse.model_validate(row) for row in dream_rows(100)]
+    )
+    bodies = {
+        "dream_list.n100": dream_list,
+        "gallery.n20": dumps(gallery_payload(20)),
+        "network.n1000": dumps(network_payload(1_000)),
+    }
+
+    for name, body in bodies.items():
+        for level in GZIP_LEVELS:
+            suite.add(
+                f"compression.{name}.gzip{level}",
+                lambda _, body=body, level=level: gzip_compress(body, level),
+                raw_bytes=len(body),
+                bytes=len(gzip_compress(body, level))
+            )
+        if brotli is None:
+            continue
+        for quality in BROTLI_QUALITIES:
+            suite.add(
+                f"compression.{name}.brotli{quality}",
+                lambda _, body=body, quality=quality: brotli_compress(body, quality),
+                raw_bytes=len(body),
+                bytes=len(brotli_compress(body, quality))
+            )
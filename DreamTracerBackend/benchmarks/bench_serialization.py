@@ -0,0 +1,90 @@
+"""
+API 응답 직렬화 벤치마크 (꿈 목록 DreamResponse/카드 필드, response_model 없는 dict 응답, 캐시된 인사이트)
+"""
+from typing import List
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app.core.responses import dumps
+from app.core.config import settings
+from app.schemas.dream import DREAM_CARD_FIELDS, DreamListItem, DreamResponse
+from benchmarks.fixtures import daily_insight, dream_rows, gallery_payload, network_payload, patterns_payload
+import json
+
+# 기본 페이지 크기(20), 최대 페이지 크기(100), 대량 내보내기 수준(1,000)
+SIZES = (20, 100, 1_000)
+
+dream_list_adapter = TypeAdapter(List[DreamResponse])
+dream_item_list_adapter = TypeAdapter(List[DreamListItem])
+
+def card_rows(rows) -> List[dict]:
+    """fields=card 조회 결과 행 (카드 컬럼만, 본문은 미리보기 길이로 자름)"""
+    cards = []
+    for row in rows:
+        card = {name: getattr(row, name, None) for name in DREAM_CARD_FIELDS}
+        card["body_preview"] = row.body_text[:settings.DREAM_PREVIEW_LENGTH]
+        cards.append(card)
+    return cards
+
+def fastapi_default(content) -> bytes:
+    """response_model 없는 엔드포인트의 FastAPI 기본 경로: jsonable_encoder 후 JSONResponse(json.dumps)"""
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+def register(suite) -> None:
+    for size in SIZES:
+        rows = dream_rows(size)
+        models = [DreamResponse.model_validate(row) for row in rows]
+
+        suite.add(
+            f"serialization.dream_list.validate.n{size}",
+            lambda _, rows=rows: [DreamResponse.model_validate(row) for row in rows],
+            n=size
+        )
+        suite.add(
+            f"serialization.dream_list.dump_json.n{size}",
+            lambda _, models=models: dream_list_adapter.dump_json(models),
+            n=size
+        )
+        suite.add(
+            f"serialization.dream_list.fastapi.n{size}",
+            lambda _, models=models: fastapi_default(models),
+            n=size
+        )
+
+        # 목록 카드 필드만 조회한 행을 한 번에 검증 후 채운 필드만 직렬화 (fields=card)
+        cards = card_rows(rows)
+        full_bytes = len(dream_list_adapter.dump_json(models))
+        card_bytes = len(dream_item_list_adapter.dump_json(
+            dream_item_list_adapter.validate_python(cards), exclude_unset=True
+        ))
+        suite.add(
+            f"serialization.dream_list.card.n{size}",
+            lambda _, cards=cards: dream_item_list_adapter.dump_json(
+                dream_item_list_adapter.validate_python(cards), exclude_unset=True
+            ),
+            n=size, bytes=card_bytes, full_bytes=full_bytes
+        )
+
+    # dict 응답: 기본 경로 vs ORJSONResponse 직접 반환 (jsonable_encoder 생략)
+    payloads = {
+        "network.n10": network_payload(10),
+        "network.n1000": network_payload(1_000),
+        "patterns": patterns_payload(),
+        "gallery.n20": gallery_payload(20),
+        "gallery.n100": gallery_payload(100),
+    }
+    for name, payload in payloads.items():
+        suite.add(f"serialization.{name}.fastapi", lambda _, payload=payload: fastapi_default(payload), bytes=len(dumps(payload)))
+        suite.add(f"serialization.{name}.orjson", lambda _, payload=payload: dumps(payload), bytes=len(dumps(payload)))
+
+    # 캐시된 일일 인사이트: 파싱 후 재직렬화 vs 캐시 바이트를 그대로 삽입
+    cached = json.dumps(daily_insight(), ensure_ascii=False)
+    suite.add(
+        "serialization.daily_insight.reparse",
+        lambda _: fastapi_default({"insight": json.loads(cached), "date": "today"})
+    )
+    suite.add(
+        "serialization.daily_insight.raw",
+        lambda _: b'{"insight":' + cached.encode("utf-8") + b',"date":"today"}'
+    )
@@ -0,0 +1,41 @@
+"""
+꿈 유사도/네트워크 구성 벤치마크 (스텁 인코더 사용)
+"""
+import networkx as nx
+from app.services.similarity import similar_pairs
+from benchmarks.fixtures import StubEncoder, dream_embeddings
+
+SIZES = (10, 100, 1_000, 10_000)
+# 이 크기 이상은 쌍 비교가 수 분 걸리므로 --quick 실행에서 제외
+SLOW_SIZE = 10_000
+
+def build_network(embeddings):
+    """ai_tasks.update_dream_network의 그래프 구성 단계"""
+    graph = nx.Graph()
+    graph.add_nodes_from(embeddings)
+    for dream_id1, dream_id2, similarity in similar_pairs(embeddings, 0.5):
+        graph.add_edge(dream_id1, dream_id2, weight=similarity)
+    return graph
+
+def register(suite) -> None:
+    encoder = StubEncoder()
+
+    for size in SIZES:
+        setup = lambda size=size: dream_embeddings(size, encoder)
+        suite.add(
+            f"similarity.pairs.n{size}",
+            lambda embeddings: similar_pairs(embeddings, 0.3),
+            setup=setup,
+            slow=size >= SLOW_SIZE,
+            n=size
+        )
+        suite.add(
+            f"similarity.network.n{size}",
+            build_network,
+            setup=setup,
+            slow=size >= SLOW_SIZE,
+            n=size
+        )
+
+    texts = [f"꿈 {i}" for i in range(100)]
+    suite.add("similarity.stub_encode.n100", lambda _: encoder.encode(texts), n=100)
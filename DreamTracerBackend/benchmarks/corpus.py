@@ -0,0 +1,293 @@
+"""
+대규모 합성 꿈 코퍼스 생성기 (PostgreSQL)
+
+사용자, 꿈(분석기 어휘 기반 한국어 본문), 분석 결과, 시각화, 커뮤니티 포스트를 지정한 규모로 생성
+사용자별 꿈 개수는 로그정규 분포를 따르므로 소수의 헤비 유저와 다수의 라이트 유저가 섞임
+
+사용법 (DreamTracerBackend 디렉토리에서):
+    python -m benchmarks.corpus --users 10000 --dreams 1000000 --create-tables
+    python -m benchmarks.corpus --dreams 100000 --truncate --database-url postgresql://.../dreamtracer_bench
+"""
+from benchmarks.fixtures import DREAM_SENTENCES
+from benchmarks.harness import add_database_arguments, check_database_url
+from app.core.config import settings
+from app.core.database import Base
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis
+from app.models.dream_visualization import DreamVisualization
+from app.models.sync import SyncTombstone
+from app.models.community import CommunityPost
+from app.schemas.dream import EmotionType
+from app.services.modern_dream_analysis import (
+    CognitiveAnalyzer, EmotionalAnalyzer, PatternAnalyzer, SymbolicAnalyzer
+)
+from sqlalchemy import create_engine, text
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, List
+import argparse
+import itertools
+import logging
+import random
+import time as clock
+import uuid
+
+logger = logging.getLogger(__name__)
+
+TABLES = [User.__table__, Dream.__table__, DreamAnalysis.__table__, DreamVisualization.__table__, CommunityPost.__table__,
+          SyncTombstone.__table__]
+
+# VisualizationService.art_styles와 동일 (서비스 import 시 Gemini 클라이언트가 초기화되므로 복사)
+ART_STYLES = [
+    'realistic', 'impressionist', 'surreal', 'watercolor', 'oil_painting',
+    'digital_art', 'anime', 'fantasy', 'minimalist', 'abstract'
+]
+DREAM_TYPES = [("normal", 0.6), ("lucid", 0.1), ("nightmare", 0.15), ("recurring", 0.15)]
+UNANALYZED_STATUSES = [("pending", 0.8), ("failed", 0.2)]  # 분석 결과가 없는 꿈의 상태 분포
+CHARACTERS = ['친구', '가족', '엄마', '아빠', '동생', '선생님', '동료', '연인', '모르는 사람', '할머니']
+TITLES = ['이상한 꿈', '다시 꾼 꿈', '무서운 꿈', '행복한 꿈', '하늘을 나는 꿈', '길을 잃은 꿈', '옛날 집 꿈', '바다 꿈']
+REFLECTIVE_QUESTIONS = [
+    "최근 무언가로부터 벗어나고 싶다고 느낀 적이 있나요?",
+    "꿈속의 장소는 당신에게 어떤 기억을 떠올리게 하나요?",
+    "꿈에서 느낀 감정을 현실에서도 느낀 적이 있나요?",
+]
+
+def _has_batchim(word: str) -> bool:
+    """마지막 글자에 받침이 있는지 (조사 선택용)"""
+    last = word[-1]
+    return "가" <= last <= "힣" and (ord(last) - ord("가")) % 28 != 0
+
+def _particle(word: str, with_batchim: str, without_batchim: str) -> str:
+    return word + (with_batchim if _has_batchim(word) else without_batchim)
+
+class Lexicon:
+    """분석기(modern_dream_analysis)가 인식하는 어휘 모음"""
+
+    def __init__(self):
+        pattern = PatternAnalyzer()
+        emotional = EmotionalAnalyzer()
+        cognitive = CognitiveAnalyzer()
+        symbolic = SymbolicAnalyzer()
+
+        self.locations = pattern.common_locations
+        self.symbols = sorted(set(pattern.common_symbols) | set(symbolic.korean_symbols))
+        self.emotions = sorted({words[0] for words in emotional.emotion_patterns.values()} | set(pattern.common_emotions))
+        self.intensities = list(itertools.chain.from_iterable(emotional.emotion_intensity.values()))
+        self.thoughts = list(itertools.chain.from_iterable(cognitive.keywords.values()))
+
+class CorpusGenerator:
+    """결정적(seed 고정) 합성 데이터 생성기"""
+
+    def __init__(self, seed: int = 42, days: int = 730, analysis_ratio: float = 0.7,
+                 visualization_ratio: float = 0.15, share_ratio: float = 0.1):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.lexicon = Lexicon()
+        self.days = days
+        self.analysis_ratio = analysis_ratio
+        self.visualization_ratio = visualization_ratio
+        self.share_ratio = share_ratio
+        self.today = date.today()
+        self.emotion_tags = [emotion.value for emotion in EmotionType]
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def _weighted(self, choices):
+        values, weights = zip(*choices)
+        return self.rng.choices(values, weights=weights)[0]
+
+    def sentence(self) -> str:
+        rng, lex = self.rng, self.lexicon
+        location, symbol = rng.choice(lex.locations), rng.choice(lex.symbols)
+        templates = [
+            lambda: f"{location}에서 {_particle(symbol, '을', '를')} 보았다.",
+            lambda: f"{rng.choice(lex.intensities)} {rng.choice(lex.emotions)} 같은 감정이 밀려왔다.",
+            lambda: f"{_particle(rng.choice(CHARACTERS), '과', '와')} 함께 {location}에 있었다.",
+            lambda: f"문득 '{rng.choice(lex.thoughts)}'라는 말이 떠올랐다.",
+            lambda: f"{_particle(symbol, '이', '가')} 계속 나를 따라왔다.",
+            lambda: rng.choice(DREAM_SENTENCES),
+        ]
+        return rng.choice(templates)()
+
+    def body_text(self) -> str:
+        # 대부분 짧은 기록, 일부는 긴 기록 (문장 수 2~40)
+        count = min(40, max(2, int(self.rng.lognormvariate(1.8, 0.6))))
+        return " ".join(self.sentence() for _ in range(count))
+
+    def users(self, count: int) -> List[Dict[str, Any]]:
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                "id": self._uuid(),
+                "email": f"synthetic+{self.seed}-{i}@example.com",
+                "auth_provider": self.rng.choice(["firebase", "google", "apple"]),
+                "subscription_plan": "plus" if self.rng.random() < 0.1 else "free",
+                "notification_settings": None,
+                "created_at": now - timedelta(days=self.rng.randint(0, self.days)),
+                "updated_at": now,
+            }
+            for i in range(count)
+        ]
+
+    def user_weights(self, count: int) -> List[float]:
+        """사용자별 꿈 기록 빈도 (로그정규, 헤비 유저가 꼬리를 이룸)"""
+        return [self.rng.lognormvariate(0, 1.2) for _ in range(count)]
+
+    def dream(self, user_id: uuid.UUID) -> Dict[str, Any]:
+        rng, lex = self.rng, self.lexicon
+        body = self.body_text()
+        dream_date = self.today - timedelta(days=int(rng.triangular(0, self.days, 0)))  # 최근일수록 많음
+        created_at = datetime.combine(dream_date, time(rng.randint(5, 11), rng.randint(0, 59)), tzinfo=timezone.utc)
+        analyzed = rng.random() < self.analysis_ratio
+        return {
+            "id": self._uuid(),
+            "user_id": user_id,
+            "dream_date": dream_date,
+            "title": rng.choice(TITLES) if rng.random() < 0.8 else None,
+            "body_text": body,
+            "audio_file_path": None,
+            "lucidity_level": rng.randint(1, 5),
+            "emotion_tags": rng.sample(self.emotion_tags, rng.randint(1, 3)),
+            "analysis_status": "completed" if analyzed else self._weighted(UNANALYZED_STATUSES),
+            "is_shared": rng.random() < self.share_ratio,
+            "dream_type": self._weighted(DREAM_TYPES),
+            "sleep_quality": rng.randint(1, 5),
+            "dream_duration": rng.randint(1, 120),
+            "location": rng.choice(lex.locations),
+            "characters": rng.sample(CHARACTERS, rng.randint(0, 3)),
+            "symbols": [symbol for symbol in lex.symbols if symbol in body][:5],
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+
+    def analysis(self, dream: Dict[str, Any]) -> Dict[str, Any]:
+        body = dream["body_text"]
+        return {
+            "id": self._uuid(),
+            "dream_id": dream["id"],
+            "summary_text": body[:120],
+            "keywords": dream["symbols"] + [dream["location"]],
+            "emotional_flow_text": f"{', '.join(dream['emotion_tags'])} 감정이 이어지는 꿈입니다.",
+            "symbol_analysis": {"symbols": [{"symbol": s, "meaning": "합성 데이터"} for s in dream["symbols"]]},
+            "reflective_question": self.rng.choice(REFLECTIVE_QUESTIONS),
+            "deja_vu_analysis": {"related_dreams": [], "similarity_scores": []},
+            "created_at": dream["created_at"] + timedelta(minutes=1),
+        }
+
+    def visualization(self, dream: Dict[str, Any]) -> Dict[str, Any]:
+        visualization_id = self._uuid()
+        art_style = self.rng.choice(ART_STYLES)
+        return {
+            "id": visualization_id,
+            "dream_id": dream["id"],
+            "user_id": dream["user_id"],
+            "image_path": f"uploads/visualizations/{visualization_id}.png",
+            "art_style": art_style,
+            "prompt_used": f"{art_style} style, {dream['location']}, {' '.join(dream['symbols'])}",
+            "created_at": dream["created_at"] + timedelta(minutes=self.rng.randint(2, 60 * 24)),
+        }
+
+    def post(self, dream: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "id": self._uuid(),
+            "user_id": dream["user_id"],
+            "dream_id": dream["id"],
+            "content": dream["body_text"][:500],
+            "tags": (dream["symbols"] + dream["emotion_tags"])[:5],
+            "is_anonymous": self.rng.random() < 0.7,
+            "created_at": dream["created_at"] + timedelta(hours=self.rng.randint(1, 48)),
+        }
+
+    def dream_batch(self, user_ids: List[uuid.UUID], cum_weights: List[float], size: int) -> Dict[str, List[Dict[str, Any]]]:
+        """꿈 size개와 그에 딸린 분석/시각화/포스트 생성"""
+        batch = {"dreams": [], "analyses": [], "visualizations": [], "posts": []}
+        for user_id in self.rng.choices(user_ids, cum_weights=cum_weights, k=size):
+            dream = self.dream(user_id)
+            batch["dreams"].append(dream)
+            if dream["analysis_status"] == "completed":
+                batch["analyses"].append(self.analysis(dream))
+            if self.rng.random() < self.visualization_ratio:
+                for _ in range(self.rng.randint(1, 2)):
+                    batch["visualizations"].append(self.visualization(dream))
+            if dream["is_shared"]:
+                batch["posts"].append(self.post(dream))
+        return batch
+
+def generate(engine, users: int, dreams: int, batch_size: int, generator: CorpusGenerator) -> Dict[str, int]:
+    """코퍼스 생성 후 테이블별 삽입 행 수 반환 (배치마다 커밋)"""
+    counts = {"users": 0, "dreams": 0, "analyses": 0, "visualizations": 0, "posts": 0}
+    started = clock.perf_counter()
+
+    user_rows = generator.users(users)
+    with engine.begin() as conn:
+        for offset in range(0, len(user_rows), batch_size):
+            conn.execute(User.__table__.insert(), user_rows[offset:offset + batch_size])
+    counts["users"] = len(user_rows)
+
+    user_ids = [row["id"] for row in user_rows]
+    cum_weights = list(itertools.accumulate(generator.user_weights(users)))
+
+    for offset in range(0, dreams, batch_size):
+        batch = generator.dream_batch(user_ids, cum_weights, min(batch_size, dreams - offset))
+        with engine.begin() as conn:
+            conn.execute(Dream.__table__.insert(), batch["dreams"])
+            if batch["analyses"]:
+                conn.execute(DreamAnalysis.__table__.insert(), batch["analyses"])
+            if batch["visualizations"]:
+                conn.execute(DreamVisualization.__table__.insert(), batch["visualizations"])
+            if batch["posts"]:
+                conn.execute(CommunityPost.__table__.insert(), batch["posts"])
+
+        for key in batch:
+            counts[key] += len(batch[key])
+        elapsed = clock.perf_counter() - started
+        logger.info(f"꿈 {counts['dreams']:,}/{dreams:,}개 생성 ({counts['dreams'] / elapsed:,.0f}개/초)")
+
+    # 플래너 통계 갱신 (대량 삽입 직후 실행 계획이 왜곡되지 않도록)
+    with engine.begin() as conn:
+        for table in TABLES:
+            conn.execute(text(f"ANALYZE {table.name}"))
+
+    return counts
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="대규모 합성 꿈 코퍼스 생성기")
+    add_database_arguments(parser)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--dreams", type=int, default=1_000_000)
+    parser.add_argument("--days", type=int, default=730, help="꿈 날짜 분포 기간 (일)")
+    parser.add_argument("--analysis-ratio", type=float, default=0.7, help="분석 완료된 꿈 비율")
+    parser.add_argument("--visualization-ratio", type=float, default=0.15, help="시각화가 있는 꿈 비율")
+    parser.add_argument("--share-ratio", type=float, default=0.1, help="커뮤니티에 공유된 꿈 비율")
+    parser.add_argument("--batch-size", type=int, default=10_000, help="트랜잭션당 꿈 개수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--create-tables", action="store_true", help="테이블이 없으면 생성")
+    parser.add_argument("--truncate", action="store_true", help="생성 전에 기존 데이터를 모두 삭제")
+    args = parser.parse_args(argv)
+    check_database_url(parser, args, settings.DATABASE_URL)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    engine = create_engine(args.database_url)
+
+    if args.create_tables:
+        Base.metadata.create_all(engine, tables=TABLES)
+    if args.truncate:
+        with engine.begin() as conn:
+            conn.execute(text(f"TRUNCATE {', '.join(table.name for table in TABLES)} CASCADE"))
+        logger.info("기존 데이터 삭제 완료")
+
+    generator = CorpusGenerator(
+        seed=args.seed,
+        days=args.days,
+        analysis_ratio=args.analysis_ratio,
+        visualization_ratio=args.visualization_ratio,
+        share_ratio=args.share_ratio
+    )
+    started = clock.perf_counter()
+    counts = generate(engine, args.users, args.dreams, args.batch_size, generator)
+    summary = ", ".join(f"{key} {value:,}" for key, value in counts.items())
+    logger.info(f"코퍼스 생성 완료 ({clock.perf_counter() - started:.1f}초): {summary}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""
+대규모 데이터 기준 주요 조회 쿼리 벤치마크 (PostgreSQL)
+
+benchmarks.corpus로 생성한 데이터베이스에서 실제 서비스/엔드포인트 코드를 실행해
+지연 시간(중앙값, p95)과 호출당 쿼리 수를 측정하고, 실행된 SELECT 문의 EXPLAIN (ANALYZE, BUFFERS) 계획을 기록
+
+사용법 (DreamTracerBackend 디렉토리에서):
+    python -m benchmarks.db_scale -o db_scale.json
+    python -m benchmarks.db_scale -k dreams. --repeat 50 --baseline db_scale_baseline.json
+"""
+from benchmarks.harness import add_database_arguments, build_report, check_database_url, compare_reports, format_comparison, format_seconds, load_report, save_report
+from app.core.config import settings
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis
+from app.models.dream_visualization import DreamVisualization
+from app.models.community import CommunityPost
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.orm import sessionmaker
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable, Dict, List
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+class QueryCase:
+    def __init__(self, name: str, run: Callable[[Any, Any], Awaitable[Any]], per_user: bool = True):
+        self.name = name
+        self.run = run
+        self.per_user = per_user  # False면 사용자와 무관한 전역 조회 (한 번만 측정)
+
+# 서비스/엔드포인트는 호출 시점에 import (선택 의존성이 없는 환경에서도 나머지 케이스는 실행되도록)
+async def _dreams_list(db, user):
+    from app.services.dream_service import DreamService
+    return await DreamService().get_user_dreams(user.id, skip=0, limit=20, db=db)
+
+async def _dreams_list_card(db, user):
+    from app.services.dream_service import DreamService, parse_fields
+    return await DreamService().get_user_dreams(user.id, skip=0, limit=20, db=db, fields=parse_fields("card"))
+
+async def _dreams_list_deep_page(db, user):
+    from app.services.dream_service import DreamService
+    return await DreamService().get_user_dreams(user.id, skip=200, limit=20, db=db)
+
+async def _dreams_list_emotion_filter(db, user):
+    from app.services.dream_service import DreamService
+    return await DreamService().get_user_dreams(user.id, skip=0, limit=20, db=db, emotion_filter=["happy"])
+
+async def _dreams_search(db, user):
+    from app.services.dream_service import DreamService
+    return await DreamService().search_dreams(user.id, "바다", db)
+
+async def _dreams_stats(db, user):
+    from app.services.dream_service import DreamService
+    return await DreamService().get_dream_stats(user.id, db)
+
+async def _analysis_patterns(db, user):
+    from app.api.v1.endpoints.analysis import get_dream_patterns
+    return await get_dream_patterns(current_user=user, db=db, days=30, if_none_match=None)
+
+async def _visualizations_gallery(db, user):
+    from app.api.v1.endpoints.visualization import get_visualization_gallery
+    return await get_visualization_gallery(current_user=user, db=db, cursor=None, skip=0, limit=20)
+
+async def _community_feed(db, user):
+    from app.services.community_service import community_service
+    return await community_service.get_posts(skip=0, limit=20, db=db)
+
+async def _community_popular_tags(db, user):
+    from app.services.community_service import community_service
+    return await community_service.get_popular_tags(db)
+
+QUERY_CASES = [
+    QueryCase("dreams.list", _dreams_list),
+    QueryCase("dreams.list.card", _dreams_list_card),
+    QueryCase("dreams.list.deep_page", _dreams_list_deep_page),
+    QueryCase("dreams.list.emotion_filter", _dreams_list_emotion_filter),
+    QueryCase("dreams.search", _dreams_search),
+    QueryCase("dreams.stats", _dreams_stats),
+    QueryCase("analysis.patterns", _analysis_patterns),
+    QueryCase("visualizations.gallery", _visualizations_gallery),
+    QueryCase("community.feed", _community_feed, per_user=False),
+    QueryCase("community.popular_tags", _community_popular_tags, per_user=False),
+]
+
+class StatementRecorder:
+    """실행된 SQL 문과 파라미터 수집 (드라이버 형식 그대로 저장해 EXPLAIN에 재사용)"""
+
+    def __init__(self, engine):
+        self.recording = False
+        self.statements: List[tuple] = []
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.recording:
+            self.statements.append((statement, parameters))
+
+    def start(self) -> None:
+        self.statements = []
+        self.recording = True
+
+    def stop(self) -> List[tuple]:
+        self.recording = False
+        return self.statements
+
+def sample_users(db) -> Dict[str, SimpleNamespace]:
+    """꿈 개수 기준 헤비(최대), 중간(중앙값), 라이트(하위 10%) 사용자 선택"""
+    rows = db.execute(
+        select(Dream.user_id, func.count(Dream.id).label("dreams"))
+        .group_by(Dream.user_id)
+        .order_by(func.count(Dream.id).desc())
+    ).all()
+    if not rows:
+        raise RuntimeError("꿈 데이터가 없습니다 (python -m benchmarks.corpus로 먼저 생성)")
+
+    buckets = {"heavy": rows[0], "median": rows[len(rows) // 2], "light": rows[int(len(rows) * 0.9)]}
+    return {name: SimpleNamespace(id=row.user_id, dream_count=row.dreams) for name, row in buckets.items()}
+
+def _walk_plan(node: Dict[str, Any]):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _walk_plan(child)
+
+def explain(engine, statement: str, parameters) -> Dict[str, Any]:
+    """EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) 실행 후 요약과 전체 계획 반환 (롤백되는 트랜잭션에서 실행)"""
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            raw = conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters).scalar()
+        finally:
+            transaction.rollback()
+
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    nodes = list(_walk_plan(plan["Plan"]))
+    return {
+        "statement": statement,
+        "total_cost": plan["Plan"]["Total Cost"],
+        "execution_time_ms": plan.get("Execution Time"),
+        "seq_scans": sorted({node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"}),
+        "node_types": [node["Node Type"] for node in nodes],
+        "plan": plan,
+    }
+
+def run_case(engine, session_factory, recorder: StatementRecorder, case: QueryCase, user, bucket: str,
+             repeat: int, warmup: int, with_explain: bool) -> Dict[str, Any]:
+    loop = asyncio.new_event_loop()
+
+    def call() -> List[tuple]:
+        db = session_factory()
+        try:
+            recorder.start()
+            loop.run_until_complete(case.run(db, user))
+        finally:
+            statements = recorder.stop()
+            db.close()
+        return statements
+
+    try:
+        for _ in range(warmup):
+            call()
+
+        timings = []
+        statements = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            statements = call()
+            timings.append(time.perf_counter() - started)
+    finally:
+        loop.close()
+
+    timings.sort()
+    result = {
+        "name": f"{case.name}.{bucket}",
+        "params": {"bucket": bucket, "user_id": str(user.id) if user else None, "user_dreams": user.dream_count if user else None},
+        "number": 1,
+        "repeat": repeat,
+        "min": timings[0],
+        "median": statistics.median(timings),
+        "mean": statistics.mean(timings),
+        "stdev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "queries": len(statements),
+    }
+    if with_explain:
+        seen = set()
+        result["explain"] = []
+        for statement, parameters in statements:
+            if statement in seen or not statement.lstrip().upper().startswith("SELECT"):
+                continue
+            seen.add(statement)
+            result["explain"].append(explain(engine, statement, parameters))
+    return result
+
+def database_summary(db) -> Dict[str, Any]:
+    return {
+        "server_version": db.execute(text("SHOW server_version")).scalar(),
+        "rows": {
+            model.__tablename__: db.execute(select(func.count()).select_from(model)).scalar()
+            for model in (User, Dream, DreamAnalysis, DreamVisualization, CommunityPost)
+        },
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="대규모 데이터 기준 주요 조회 쿼리 벤치마크")
+    add_database_arguments(parser)
+    parser.add_argument("-k", "--filter", help="이름에 이 문자열이 포함된 케이스만 실행")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로 (EXPLAIN 계획 포함)")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--no-explain", action="store_true", help="EXPLAIN ANALYZE 생략")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 중앙값 증가율")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+    check_database_url(parser, args, settings.DATABASE_URL)
+
+    logging.basicConfig(level=logging.WARNING)
+    engine = create_engine(args.database_url)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+    recorder = StatementRecorder(engine)
+
+    with session_factory() as db:
+        users = sample_users(db)
+        summary = database_summary(db)
+    print(f"데이터: {', '.join(f'{table} {count:,}' for table, count in summary['rows'].items())}")
+    print(f"샘플 사용자: {', '.join(f'{name} {user.dream_count:,}개' for name, user in users.items())}\n")
+
+    results = []
+    for case in QUERY_CASES:
+        if args.filter and args.filter not in case.name:
+            continue
+        targets = users.items() if case.per_user else [("global", None)]
+        for bucket, user in targets:
+            try:
+                result = run_case(engine, session_factory, recorder, case, user, bucket,
+                                  args.repeat, args.warmup, not args.no_explain)
+            except Exception as e:
+                print(f"{case.name + '.' + bucket:<45} 실패: {str(e)[:200]}")
+                continue
+            seq_scans = sorted({table for plan in result.get("explain", []) for table in plan["seq_scans"]})
+            note = f"  Seq Scan: {', '.join(seq_scans)}" if seq_scans else ""
+            print(
+                f"{result['name']:<45} {format_seconds(result['median']):>10} p95 {format_seconds(result['p95']):>10}"
+                f"  쿼리 {result['queries']}개{note}"
+            )
+            results.append(result)
+
+    report = build_report(results, database=summary)
+    if args.output:
+        save_report(report, args.output)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        rows = compare_reports(report, load_report(args.baseline), args.tolerance)
+        print(f"\n기준값 비교 ({args.baseline})")
+        print(format_comparison(rows))
+        if args.fail_on_regression and any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+벤치마크용 합성 데이터 (꿈 텍스트, 사용자 프로필, 스텁 인코더, API 응답 형태)
+"""
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List
+import hashlib
+import random
+import uuid
+import numpy as np
+
+# 분석기가 인식하는 상징/감정/장소 단어가 고루 섞이도록 구성
+DREAM_SENTENCES = [
+    "어릴 적 살던 집에 다시 돌아가 있었다.",
+    "끝없이 이어진 길을 따라 걷다가 바다에 도착했다.",
+    "모르는 사람이 나를 쫓아와서 너무 무서웠다.",
+    "하늘을 비행하며 도시를 내려다보니 기쁨이 밀려왔다.",
+    "높은 곳에서 떨어짐을 느끼고 깜짝 놀람과 함께 깨어났다.",
+    "학교 복도에서 친구를 만났는데 아무 말도 하지 않았다.",
+    "물이 차오르는 방 안에서 출구를 찾고 있었다.",
+    "숲 속에서 커다란 동물이 조용히 나를 바라보고 있었다.",
+    "가족과 함께 차를 타고 산으로 여행을 떠났다.",
+    "직장에서 중요한 시험을 보는데 답이 떠오르지 않아 불안했다.",
+    "돌아가신 할머니가 웃으며 괜찮다고 말해주셔서 평온했다.",
+    "고양이 한 마리가 창문 밖에서 슬픔에 잠긴 얼굴로 울고 있었다.",
+    "꿈속에서 이것이 꿈이라는 것을 알아차리고 하늘로 날아올랐다.",
+    "화남이 치밀어 올라 문을 세게 닫았는데 문이 사라졌다.",
+]
+
+# 텍스트 길이별 문장 수 (short ≈ 50자, medium ≈ 500자, long ≈ 5,000자)
+TEXT_LENGTHS = {"short": 2, "medium": 20, "long": 200}
+
+def dream_text(sentences: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(DREAM_SENTENCES) for _ in range(sentences))
+
+def user_profile(history_size: int, seed: int = 0) -> Dict[str, Any]:
+    """AIService._build_user_profile과 같은 형태의 사용자 프로필"""
+    rng = random.Random(seed)
+    today = date(2024, 1, 1)
+    return {
+        "user_id": str(uuid.UUID(int=seed)),
+        "cultural_background": "korean",
+        "dream_history": [
+            {
+                "id": str(uuid.UUID(int=seed * 10_000 + i)),
+                "title": f"꿈 {i}",
+                "body_text": dream_text(rng.randint(2, 20), seed=seed + i),
+                "emotion_tags": ["happy"] if i % 2 else ["anxious"],
+                "symbols": [],
+                "lucidity_level": rng.randint(1, 5),
+                "dream_date": (today - timedelta(days=i)).isoformat(),
+            }
+            for i in range(history_size)
+        ],
+        "preferences": {"preferred_analysis_type": "balanced"},
+    }
+
+class StubEncoder:
+    """
+    SentenceTransformer.encode와 같은 인터페이스의 결정적 인코더
+    텍스트 해시로 주제(클러스터)를 정해 같은 주제끼리는 유사도가 높게 나오도록 함
+    """
+
+    def __init__(self, dimension: int = 384, topics: int = 100, noise: float = 0.6, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        self.dimension = dimension
+        self.noise = noise
+        self.centers = rng.standard_normal((topics, dimension)).astype(np.float32)
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        vectors = []
+        for text in texts:
+            digest = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+            rng = np.random.default_rng(digest)
+            center = self.centers[digest % len(self.centers)]
+            vectors.append(center + self.noise * rng.standard_normal(self.dimension).astype(np.float32))
+        return np.stack(vectors)
+
+def dream_embeddings(count: int, encoder: StubEncoder) -> Dict[str, np.ndarray]:
+    """꿈 ID → 임베딩 (ai_tasks.update_dream_network와 같은 형태)"""
+    return {
+        str(uuid.UUID(int=i)): encoder.encode([f"꿈 {i} {DREAM_SENTENCES[i % len(DREAM_SENTENCES)]}"])[0]
+        for i in range(count)
+    }
+
+def dream_rows(count: int) -> List[SimpleNamespace]:
+    """DreamResponse.model_validate(from_attributes)에 넣을 ORM 객체 대용"""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        SimpleNamespace(
+            id=str(uuid.UUID(int=i)),
+            user_id=str(uuid.UUID(int=1)),
+            dream_date=date(2024, 1, 1) - timedelta(days=i),
+            title=f"꿈 {i}",
+            body_text=dream_text(10, seed=i),
+            audio_file_path=None,
+            lucidity_level=i % 5 + 1,
+            emotion_tags=["happy", "peaceful"],
+            analysis_status="completed",
+            is_shared=bool(i % 2),
+            dream_type="normal",
+            sleep_quality=3,
+            dream_duration=30,
+            location="집",
+            characters=["친구", "가족"],
+            symbols=["물", "길"],
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+def network_payload(count: int) -> Dict[str, Any]:
+    """/analysis/network 응답 형태 (연결 count개)"""
+    connections = [
+        {
+            "dream1": {"id": str(uuid.UUID(int=i)), "title": f"꿈 {i}", "date": (date(2024, 1, 1) - timedelta(days=i)).isoformat()},
+            "dream2": {"id": str(uuid.UUID(int=i + 1)), "title": f"꿈 {i + 1}", "date": (date(2024, 1, 1) - timedelta(days=i + 1)).isoformat()},
+            "similarity": round(0.9 - i * 0.0001, 3),
+        }
+        for i in range(count)
+    ]
+    return {"network": connections, "total_connections": count}
+
+def patterns_payload() -> Dict[str, Any]:
+    """/analysis/patterns 응답 형태"""
+    return {
+        "analysis_period": "30일",
+        "total_dreams": 30,
+        "patterns": {
+            "emotions": [{"emotion": emotion, "count": 10 - i} for i, emotion in enumerate(["happy", "anxious", "peaceful", "sad", "angry"])],
+            "symbols": [{"symbol": symbol, "count": 8 - i} for i, symbol in enumerate(["물", "길", "집", "하늘", "문"])],
+            "characters": [{"character": character, "count": 6 - i} for i, character in enumerate(["친구", "가족", "낯선 사람"])],
+            "dream_types": [{"type": dream_type, "count": 7} for dream_type in ["normal", "lucid", "nightmare", "recurring"]],
+            "average_lucidity": 2.87,
+        },
+    }
+
+def gallery_payload(count: int) -> Dict[str, Any]:
+    """/visualizations/gallery 응답 형태 (서명 URL과 파생본 포함)"""
+    def signed(path: str) -> str:
+        return f"/files/{path}?expires=1704070800&signature={hashlib.sha256(path.encode()).hexdigest()[:32]}"
+
+    items = []
+    for i in range(count):
+        content_hash = hashlib.sha256(str(i).encode()).hexdigest()
+        image_path = f"visualizations/dream_visualization_{uuid.UUID(int=i)}.jpg"
+        variants = {
+            str(width): {fmt: signed(f"visualizations/{content_hash}_{width}w.{ext}") for fmt, ext in formats}
+            for width, formats in (
+                (256, [("avif", "avif"), ("webp", "webp"), ("jpeg", "jpg")]),
+                (512, [("avif", "avif"), ("webp", "webp"), ("jpeg", "jpg")]),
+                (1024, [("avif", "avif"), ("webp", "webp")]),
+            )
+        }
+        items.append({
+            "id": str(uuid.UUID(int=i)),
+            "dream_id": str(uuid.UUID(int=i + 1_000_000)),
+            "dream_title": f"꿈 {i}",
+            "image_path": image_path,
+            "image_url": signed(image_path),
+            "derivatives": {"width": 1024, "height": 1024, "variants": variants},
+            "art_style": "surreal",
+            "created_at": datetime(2024, 1, 1, 12, 0, 0).isoformat(),
+        })
+    return {
+        "visualizations": items,
+        "total_count": count * 3,
+        "next_cursor": "MjAyNC0wMS0wMVQxMjowMDowMHwwMDAwMDAwMC0wMDAwLTAwMDAtMDAwMC0wMDAwMDAwMDAwMDA",
+        "has_more": True,
+        "page": None,
+        "page_size": count,
+    }
+
+def daily_insight() -> Dict[str, Any]:
+    """야간 배치가 Redis에 저장하는 일일 인사이트 형태"""
+    return {
+        "insight": dream_text(3),
+        "pattern": dream_text(1, seed=1),
+        "recommendation": dream_text(2, seed=2),
+    }
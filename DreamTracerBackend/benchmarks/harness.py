@@ -0,0 +1,180 @@
+"""
+벤치마크 실행/결과 비교 도구
+"""
+from dataclasses import dataclass, field, asdict, is_dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+@dataclass
+class Benchmark:
+    name: str
+    func: Callable[[Any], Any]
+    setup: Optional[Callable[[], Any]] = None  # 측정에서 제외되는 준비 작업, 반환값이 func의 인자
+    params: Dict[str, Any] = field(default_factory=dict)
+    slow: bool = False  # --quick 실행에서 제외
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    params: Dict[str, Any]
+    number: int  # 반복 측정 1회당 호출 수
+    repeat: int
+    min: float  # 호출 1회당 초
+    median: float
+    mean: float
+    stdev: float
+
+class BenchmarkSuite:
+    """
+    timeit 방식(autorange 후 반복 측정)의 간단한 벤치마크 실행기
+    느린 벤치마크는 시간 예산(max_time)을 넘으면 반복 횟수를 줄임
+    """
+
+    def __init__(self, repeat: int = 5, min_time: float = 0.2, max_time: float = 10.0):
+        self.repeat = repeat
+        self.min_time = min_time
+        self.max_time = max_time
+        self.benchmarks: List[Benchmark] = []
+
+    def add(self, name: str, func: Callable[[Any], Any], setup: Optional[Callable[[], Any]] = None,
+            slow: bool = False, **params) -> None:
+        self.benchmarks.append(Benchmark(name=name, func=func, setup=setup, params=params, slow=slow))
+
+    def _autorange(self, func, arg) -> Tuple[int, float]:
+        """한 번의 측정이 min_time 이상 걸리도록 호출 수 결정"""
+        number = 1
+        while True:
+            elapsed = self._time(func, arg, number)
+            if elapsed >= self.min_time or number >= 1_000_000:
+                return number, elapsed
+            number *= 10 if elapsed < self.min_time / 10 else 2
+
+    def _time(self, func, arg, number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            func(arg)
+        return time.perf_counter() - start
+
+    def run_one(self, benchmark: Benchmark) -> BenchmarkResult:
+        arg = benchmark.setup() if benchmark.setup else None
+        number, first = self._autorange(benchmark.func, arg)
+
+        timings = [first / number]
+        spent = first
+        while len(timings) < self.repeat and spent < self.max_time:
+            elapsed = self._time(benchmark.func, arg, number)
+            timings.append(elapsed / number)
+            spent += elapsed
+
+        return BenchmarkResult(
+            name=benchmark.name,
+            params=benchmark.params,
+            number=number,
+            repeat=len(timings),
+            min=min(timings),
+            median=statistics.median(timings),
+            mean=statistics.mean(timings),
+            stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0
+        )
+
+    def run(self, pattern: Optional[str] = None, quick: bool = False, progress: Callable[[str], None] = print) -> List[BenchmarkResult]:
+        results = []
+        for benchmark in self.benchmarks:
+            if pattern and pattern not in benchmark.name:
+                continue
+            if quick and benchmark.slow:
+                continue
+            result = self.run_one(benchmark)
+            progress(f"{result.name:<55} {format_seconds(result.median):>10}  (±{format_seconds(result.stdev)}, {result.repeat}x{result.number})")
+            results.append(result)
+        return results
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+    return f"{seconds / 1e-9:.0f}ns"
+
+def add_database_arguments(parser: argparse.ArgumentParser) -> None:
+    """대상 DB 인자 (애플리케이션 DB를 실수로 대상으로 삼지 않도록 기본값 없이 필수)"""
+    parser.add_argument("--database-url", required=True, help="대상 PostgreSQL (벤치마크 전용 DB)")
+    parser.add_argument("--allow-app-database", action="store_true",
+                        help="설정의 DATABASE_URL과 같은 DB여도 실행")
+
+def check_database_url(parser: argparse.ArgumentParser, args: argparse.Namespace, app_database_url: str) -> None:
+    """대상 DB가 애플리케이션 DB(호스트/포트/DB 이름 기준)와 같으면 --allow-app-database 없이는 종료"""
+    from sqlalchemy.engine import make_url
+
+    def _target(url: str) -> Tuple[Optional[str], Optional[int], Optional[str]]:
+        url = make_url(url)
+        return url.host, url.port or 5432, url.database  # 포트 생략 시 PostgreSQL 기본 포트
+
+    if not args.allow_app_database and _target(args.database_url) == _target(app_database_url):
+        parser.error("--database-url이 애플리케이션 DATABASE_URL과 같은 DB입니다 (의도한 경우 --allow-app-database)")
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+def build_report(results: List[Any], **metadata) -> Dict[str, Any]:
+    """기계 판독용 결과 (JSON), results는 BenchmarkResult 또는 같은 키를 가진 dict"""
+    return {
+        "metadata": {
+            "created_at": datetime.utcnow().isoformat(),
+            "git_commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            **metadata,
+        },
+        "results": [asdict(result) if is_dataclass(result) else result for result in results]
+    }
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    같은 이름의 벤치마크끼리 중앙값 비교
+    ratio = 현재 / 기준 (1보다 크면 느려짐), tolerance를 넘으면 회귀로 표시
+    """
+    baseline_by_name = {result["name"]: result for result in baseline.get("results", [])}
+    rows = []
+    for result in current.get("results", []):
+        base = baseline_by_name.get(result["name"])
+        if base is None or not base["median"]:
+            continue
+        ratio = result["median"] / base["median"]
+        rows.append({
+            "name": result["name"],
+            "baseline": base["median"],
+            "current": result["median"],
+            "ratio": ratio,
+            "regression": ratio > 1 + tolerance,
+            "improvement": ratio < 1 - tolerance,
+        })
+    return rows
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':<55} {'baseline':>10} {'current':>10} {'ratio':>7}"]
+    for row in rows:
+        mark = " (회귀)" if row["regression"] else " (개선)" if row["improvement"] else ""
+        lines.append(
+            f"{row['name']:<55} {format_seconds(row['baseline']):>10} {format_seconds(row['current']):>10} {row['ratio']:>6.2f}x{mark}"
+        )
+    return "\n".join(lines)
@@ -1,9 +1,12 @@
 """
 꿈결(DreamTracer) FastAPI 메인 애플리케이션
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import PrometheusMiddleware, build_registry, render_metrics
+from app.core.profiling import ProfilingMiddleware
 from app.api.v1.api import api_router
 
 app = FastAPI(
@@ -22,6 +25,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (brotli/gzip, 작은 응답과 이미지/오디오/SSE는 제외)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_COMPRESS_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY
+)
+
+# 온디맨드 요청 프로파일링 (PROFILING_TOKEN 설정 시)
+app.add_middleware(ProfilingMiddleware)
+
+# 요청 메트릭 수집
+app.add_middleware(PrometheusMiddleware)
+
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -33,6 +50,14 @@ async def root():
 async def health_check():
     return {"status": "healthy", "service": "꿈결 API"}
 
+metrics_registry = build_registry()
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭"""
+    body, content_type = render_metrics(metrics_registry)
+    return Response(content=body, media_type=content_type)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,255 @@
+"""
+공용 테스트 픽스처 (SQLite 인메모리 DB, Redis 명령을 흉내내는 테스트용 Redis)
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import patch
+from app.models.user import User
+from app.models.dream import Dream  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401
+from app.models.dream_visualization import DreamVisualization  # noqa: F401
+from app.models.community import CommunityEngagementFlush, CommunityPost
+import uuid
+
+@compiles(JSONB, "sqlite")
+def compile_jsonb_sqlite(type_, compiler, **kw):
+    """JSONB 컬럼 테이블을 SQLite에 만들기 위한 타입 매핑"""
+    return "JSON"
+
+@pytest.fixture
+def db_tables():
+    """테스트 DB에 만들 테이블 (모듈에서 같은 이름의 픽스처로 바꿔 지정)"""
+    return [User.__table__, CommunityPost.__table__, CommunityEngagementFlush.__table__]
+
+@pytest.fixture
+def engine(db_tables):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.metadata.create_all(engine, tables=db_tables)
+    return engine
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    db.commit()
+    return user
+
+def _bound(value):
+    """점수 범위 경계 ("(" 접두사는 경계 제외)"""
+    value = str(value)
+    return (float(value[1:]), True) if value.startswith("(") else (float(value), False)
+
+def _stream_id(entry_id: str):
+    milliseconds, sequence = entry_id.split("-")
+    return int(milliseconds), int(sequence)
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 순서대로 실행"""
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((getattr(self.redis, name), args, kwargs))
+
+    def execute(self):
+        return [command(*args, **kwargs) for command, args, kwargs in self.commands]
+
+class FakeAsyncPipeline(FakePipeline):
+    async def execute(self):
+        return super().execute()
+
+class FakeRedis:
+    """
+    서비스가 쓰는 문자열·리스트·해시·정렬 집합·스트림 명령만 흉내내는 테스트용 Redis
+    값은 store에 그대로 저장 (문자열 str, 리스트 list, 해시/정렬 집합 dict, 스트림 (ID, 필드) 목록)
+    Redis처럼 비어 있는 리스트/해시/정렬 집합은 키를 지움
+    """
+    def __init__(self):
+        self.store = {}
+        self.stream_sequence = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def _store(self, key, value):
+        if value:
+            self.store[key] = value
+        else:
+            self.store.pop(key, None)
+
+    # 문자열/키
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def set(self, key, value, ex=None, nx=False, get=False):
+        previous = self.store.get(key)
+        if nx and previous is not None:
+            return None
+        self.store[key] = str(value)
+        return previous if get else True
+
+    def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+    def exists(self, *keys):
+        return sum(key in self.store for key in keys)
+
+    def expire(self, key, seconds):
+        return key in self.store
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) + 1)
+        return int(self.store[key])
+
+    def decr(self, key):
+        self.store[key] = str(int(self.store.get(key, 0)) - 1)
+        return int(self.store[key])
+
+    def rename(self, source, destination):
+        self.store[destination] = self.store.pop(source)
+
+    def eval(self, script, numkeys, key, value):
+        """RELEASE_KEY_SCRIPT (값이 같을 때만 삭제)"""
+        if self.store.get(key) == value:
+            del self.store[key]
+            return 1
+        return 0
+
+    # 리스트
+    def rpush(self, key, *values):
+        self.store.setdefault(key, []).extend(values)
+        return len(self.store[key])
+
+    def lpushx(self, key, value):
+        if key not in self.store:
+            return 0
+        self.store[key].insert(0, value)
+        return len(self.store[key])
+
+    def ltrim(self, key, start, end):
+        if key in self.store:
+            self._store(key, self.store[key][start:None if end == -1 else end + 1])
+
+    def lrem(self, key, count, value):
+        if key in self.store:
+            self._store(key, [item for item in self.store[key] if item != value])
+
+    def lrange(self, key, start, end):
+        return self.store.get(key, [])[start:None if end == -1 else end + 1]
+
+    # 해시
+    def hincrby(self, key, field, amount):
+        hash_ = self.store.setdefault(key, {})
+        hash_[field] = str(int(hash_.get(field, 0)) + amount)
+        return int(hash_[field])
+
+    def hgetall(self, key):
+        return dict(self.store.get(key, {}))
+
+    # 정렬 집합
+    def zadd(self, key, mapping, nx=False):
+        zset = self.store.setdefault(key, {})
+        for member, score in mapping.items():
+            if not (nx and member in zset):
+                zset[member] = score
+
+    def zincrby(self, key, amount, member):
+        zset = self.store.setdefault(key, {})
+        zset[member] = zset.get(member, 0) + amount
+        return zset[member]
+
+    def _ranked(self, key):
+        return sorted(self.store.get(key, {}).items(), key=lambda item: (item[1], item[0]), reverse=True)
+
+    def zrevrange(self, key, start, end, withscores=False):
+        ranked = self._ranked(key)[start:None if end == -1 else end + 1]
+        return ranked if withscores else [member for member, _ in ranked]
+
+    def zcard(self, key):
+        return len(self.store.get(key, {}))
+
+    def zrem(self, key, *members):
+        zset = dict(self.store.get(key, {}))
+        for member in members:
+            zset.pop(member, None)
+        self._store(key, zset)
+
+    def zunionstore(self, destination, weights):
+        (key, weight), = weights.items()
+        self._store(destination, {member: score * weight for member, score in self.store.get(key, {}).items()})
+
+    def zremrangebyscore(self, key, low, high):
+        (low, low_open), (high, high_open) = _bound(low), _bound(high)
+        self._store(key, {
+            member: score for member, score in self.store.get(key, {}).items()
+            if not ((score > low if low_open else score >= low) and (score < high if high_open else score <= high))
+        })
+
+    def zremrangebyrank(self, key, start, end):
+        ascending = self._ranked(key)[::-1]
+        removed = ascending[start:len(ascending) + end + 1 if end < 0 else end + 1]
+        self.zrem(key, *[member for member, _ in removed])
+
+    # 스트림 (ID는 "1-{순번}")
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self.stream_sequence += 1
+        entry_id = f"1-{self.stream_sequence}"
+        entries = self.store.setdefault(key, [])
+        entries.append((entry_id, fields))
+        if maxlen is not None:
+            del entries[:-maxlen]
+        return entry_id
+
+    def xlen(self, key):
+        return len(self.store.get(key, []))
+
+    def xrange(self, key, min="-", max="+", count=None):
+        entries = self.store.get(key, [])
+        if min.startswith("("):
+            after = _stream_id(min[1:])
+            entries = [entry for entry in entries if _stream_id(entry[0]) > after]
+        return entries[:count] if count else list(entries)
+
+    def xrevrange(self, key, max="+", min="-", count=None):
+        entries = self.store.get(key, [])[::-1]
+        return entries[:count] if count else entries
+
+class FakeAsyncRedis:
+    """같은 저장소를 쓰는 비동기 클라이언트"""
+    def __init__(self, redis):
+        self.redis = redis
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self.redis)
+
+    def __getattr__(self, name):
+        method = getattr(self.redis, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+@pytest.fixture
+def fake_redis():
+    """커뮤니티 피드/태그 색인/인기 순위 서비스의 Redis 클라이언트를 테스트용 Redis로 교체"""
+    fake = FakeRedis()
+    async_fake = FakeAsyncRedis(fake)
+    with patch("app.services.community_service.async_redis_client", async_fake), \
+            patch("app.services.tag_index_service.async_redis_client", async_fake), \
+            patch("app.services.trending_service.async_redis_client", async_fake), \
+            patch("app.services.trending_service.redis_client", fake):
+        yield fake
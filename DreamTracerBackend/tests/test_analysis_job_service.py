@@ -0,0 +1,136 @@
+"""
+분석 작업 관리 서비스 테스트
+"""
+import pytest
+from unittest.mock import Mock, patch
+from app.services.analysis_job_service import AnalysisJobService
+
+class FakeRedis:
+    """SET NX/XX와 만료 시간만 흉내내는 테스트용 Redis"""
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    def set(self, key, value, nx=False, xx=False, ex=None):
+        if (nx and key in self.store) or (xx and key not in self.store):
+            return None
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def eval(self, script, numkeys, key, value):
+        """RELEASE_KEY_SCRIPT (값이 같을 때만 삭제)"""
+        if self.store.get(key) == value:
+            del self.store[key]
+            return 1
+        return 0
+
+class FakeAsyncRedis:
+    """Stream 조회만 흉내내는 테스트용 비동기 Redis"""
+    def __init__(self, messages):
+        self.messages = messages
+
+    async def exists(self, key):
+        return 1 if self.messages else 0
+
+    async def xread(self, streams, count=None, block=None):
+        (key, cursor), = streams.items()
+        pending = [m for m in self.messages if m[0] > cursor][:count]
+        return [(key, pending)] if pending else []
+
+class TestAnalysisJobService:
+    def setup_method(self):
+        self.service = AnalysisJobService()
+        self.mock_db = Mock()
+        self.dream = Mock(id="dream-123", title="바다 꿈", body_text="바다에서 수영하는 꿈")
+        self.fake_redis = FakeRedis()
+        self.mock_tasks = Mock()
+
+    def _enqueue(self):
+        with patch("app.services.analysis_job_service.redis_client", self.fake_redis), \
+             patch.dict("sys.modules", {"app.workers.ai_tasks": self.mock_tasks}):
+            return self.service.enqueue(self.dream, self.mock_db)
+
+    def test_concurrent_requests_share_task(self):
+        """같은 꿈에 대한 중복 요청은 같은 태스크 ID를 공유"""
+        first_id, first_created = self._enqueue()
+        second_id, second_created = self._enqueue()
+
+        assert first_created is True
+        assert second_created is False
+        assert first_id == second_id
+        self.mock_tasks.analyze_dream_task.apply_async.assert_called_once()
+        assert self.dream.analysis_status == 'processing'
+
+    def test_changed_content_shares_in_flight_task(self):
+        """진행 중에 내용이 바뀌어도 같은 꿈은 분석을 하나만 실행 (꿈당 분석 결과 하나)"""
+        first_id, _ = self._enqueue()
+        self.dream.body_text = "산에서 길을 잃는 꿈"
+        second_id, second_created = self._enqueue()
+
+        assert second_created is False
+        assert first_id == second_id
+        assert list(self.fake_redis.store) == ["analysis:lock:dream-123"]
+
+    def test_lock_released_when_enqueue_fails(self):
+        """큐 추가 실패 시 잠금 해제"""
+        self.mock_tasks.analyze_dream_task.apply_async.side_effect = RuntimeError("broker down")
+        with pytest.raises(RuntimeError):
+            self._enqueue()
+        assert self.fake_redis.store == {}
+
+    def test_lock_refreshed_on_start_and_released_by_owner(self):
+        """큐 대기 시간으로 잡은 잠금을 시작 시 실행 시간으로 다시 설정하고, 끝나면 자기 잠금만 해제"""
+        task_id, _ = self._enqueue()
+        key = self.service.lock_key("dream-123")
+        assert self.fake_redis.ttls[key] == self.service.queue_lock_ttl
+
+        with patch("app.services.analysis_job_service.redis_client", self.fake_redis):
+            self.service.refresh(key, task_id)
+            assert self.fake_redis.ttls[key] == self.service.lock_ttl
+
+            # 잠금이 만료된 뒤 늦게 끝난 이전 작업은 새 작업의 잠금을 지우지 않음
+            self.fake_redis.store[key] = "newer-task"
+            self.service.release(key, task_id)
+            assert self.fake_redis.store[key] == "newer-task"
+
+            self.service.release(key, "newer-task")
+            assert key not in self.fake_redis.store
+
+            # 만료된 잠금은 시작 시 다시 만들지 않음
+            self.service.refresh(key, task_id)
+            assert key not in self.fake_redis.store
+
+    @pytest.mark.asyncio
+    async def test_event_stream_resumes_after_last_event_id(self):
+        """Last-Event-ID 이후 이벤트만 전송하고 완료 시 종료"""
+        fake_async_redis = FakeAsyncRedis([
+            ("1-0", {"stage": "queued", "data": '{"percent": 0}'}),
+            ("2-0", {"stage": "analyzing", "data": '{"percent": 20}'}),
+            ("3-0", {"stage": "completed", "data": '{"percent": 100}'}),
+        ])
+        with patch("app.services.analysis_job_service.async_redis_client", fake_async_redis):
+            events = [
+                chunk async for chunk in self.service.event_stream("dream-123", last_event_id="1-0")
+            ]
+
+        assert events[0].startswith("retry:")
+        assert events[1].startswith("id: 2-0\nevent: analyzing")
+        assert events[2].startswith("id: 3-0\nevent: completed")
+        assert len(events) == 3
+
+    @pytest.mark.asyncio
+    async def test_event_stream_finished_without_history(self):
+        """이벤트 기록이 없는 완료된 분석은 최종 상태만 전송"""
+        with patch("app.services.analysis_job_service.async_redis_client", FakeAsyncRedis([])):
+            events = [
+                chunk async for chunk in self.service.event_stream("dream-123", current_status="completed")
+            ]
+
+        assert events == ['event: completed\ndata: {"stage": "completed", "percent": 100}\n\n']
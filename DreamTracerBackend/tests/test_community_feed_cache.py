@@ -0,0 +1,113 @@
+"""
+커뮤니티 피드 앞부분 Redis 캐시 테스트
+"""
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import event
+from app.models.user import User
+from app.models.community import CommunityPost
+from app.core.config import settings
+from app.schemas.community import CommunityPostCreate, CommunityPostUpdate
+from app.services.community_service import CommunityService, feed_count_key, feed_ids_key, post_cache_key
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    db.add_all([
+        CommunityPost(user_id=user.id, content=f"꿈 이야기 {i}", tags=["바다"] if i % 2 else [],
+                      is_anonymous=True, created_at=datetime(2024, 1, 1) + timedelta(hours=i))
+        for i in range(30)
+    ])
+    db.commit()
+    return user
+
+def count_queries(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+@pytest.mark.asyncio
+async def test_first_page_served_from_cache_after_rebuild(engine, db, user, fake_redis):
+    service = CommunityService()
+    first = await service.get_posts(skip=0, limit=20, db=db)
+    assert first["total_count"] == 30 and first["has_next"]
+    assert first["posts"][0]["content"] == "꿈 이야기 29"
+    assert len(fake_redis.store[feed_ids_key()]) == 30
+
+    statements = count_queries(engine)
+    second = await service.get_posts(skip=0, limit=20, db=db)
+    assert second == first
+    assert statements == []
+
+    # 캐시 범위를 넘는 페이지와 사용자 필터는 DB 조회
+    await service.get_posts(skip=settings.COMMUNITY_FEED_CACHE_SIZE, limit=20, db=db)
+    assert statements
+
+@pytest.mark.asyncio
+async def test_create_update_delete_keep_feed_current(engine, db, user, fake_redis):
+    service = CommunityService()
+    await service.get_posts(skip=0, limit=20, db=db)
+    # 캐시된 태그 피드 (SQLite는 JSONB 포함 연산이 없어 DB에서 다시 만들 수 없으므로 직접 채움)
+    sea_ids = [str(post.id) for post in db.query(CommunityPost).order_by(CommunityPost.created_at.desc()) if post.tags]
+    fake_redis.store[feed_ids_key("바다")] = list(sea_ids)
+    fake_redis.store[feed_count_key("바다")] = "15"
+    fake_redis.store[feed_count_key("숲")] = "0"  # 목록 없이 개수만 남은 피드
+
+    created = await service.create_post(
+        user.id, CommunityPostCreate(content="새로 꾼 바다와 숲 꿈 이야기", tags=["바다", "숲"]), db
+    )
+    new_id = str(created.id)
+    assert fake_redis.store[feed_ids_key()][0] == new_id
+    assert fake_redis.store[feed_ids_key("바다")] == [new_id] + sea_ids
+    assert fake_redis.store[feed_count_key()] == "31" and fake_redis.store[feed_count_key("바다")] == "16"
+    # 캐시되지 않은 피드는 만들지 않고, 목록 없이 남은 개수는 지워 다음 조회 때 DB에서 다시 만듦
+    assert feed_ids_key("숲") not in fake_redis.store and feed_count_key("숲") not in fake_redis.store
+
+    statements = count_queries(engine)
+    tagged = await service.get_posts(skip=0, limit=20, db=db, tags_filter=["바다"])
+    assert tagged["posts"][0]["id"] == new_id and tagged["total_count"] == 16
+    assert statements == []
+
+    # SQLite는 문자열을 UUID 컬럼에 바인딩하지 못하므로 UUID로 전달
+    await service.update_post(uuid.UUID(new_id), user.id, CommunityPostUpdate(content="내용을 고친 바다 꿈 이야기"), db)
+    feed = await service.get_posts(skip=0, limit=20, db=db)
+    assert feed["posts"][0]["content"] == "내용을 고친 바다 꿈 이야기"
+
+    await service.delete_post(uuid.UUID(new_id), user.id, db)
+    assert new_id not in fake_redis.store[feed_ids_key()]
+    assert fake_redis.store[feed_count_key("바다")] == "15"
+    assert post_cache_key(new_id) not in fake_redis.store
+
+@pytest.mark.asyncio
+async def test_empty_feed_not_cached(engine, db, fake_redis):
+    service = CommunityService()
+    assert (await service.get_posts(skip=0, limit=20, db=db))["total_count"] == 0
+    assert feed_ids_key() not in fake_redis.store and feed_count_key() not in fake_redis.store
+
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    db.commit()
+    created = await service.create_post(user.id, CommunityPostCreate(content="첫 번째 꿈 이야기"), db)
+    first = await service.get_posts(skip=0, limit=20, db=db)
+    assert [post["id"] for post in first["posts"]] == [str(created.id)] and first["total_count"] == 1
+    statements = count_queries(engine)
+    assert await service.get_posts(skip=0, limit=20, db=db) == first
+    assert statements == []
+
+    # 마지막 포스트가 빠져 목록이 사라지면 개수도 지워 빈 캐시로 응답하지 않음
+    await service.delete_post(uuid.UUID(created.id), user.id, db)
+    assert feed_ids_key() not in fake_redis.store and feed_count_key() not in fake_redis.store
+    assert (await service.get_posts(skip=0, limit=20, db=db))["total_count"] == 0
+
+@pytest.mark.asyncio
+async def test_missing_post_bodies_loaded_in_one_query(engine, db, user, fake_redis):
+    service = CommunityService()
+    first = await service.get_posts(skip=0, limit=5, db=db)
+    for post in first["posts"][:3]:
+        del fake_redis.store[post_cache_key(post["id"])]
+
+    statements = count_queries(engine)
+    assert await service.get_posts(skip=0, limit=5, db=db) == first
+    assert len(statements) == 1
@@ -0,0 +1,68 @@
+"""
+응답 압축 미들웨어와 JSON 응답 클래스 테스트
+"""
+import json
+import uuid
+import pytest
+from datetime import date, datetime
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+from app.core.compression import CompressionMiddleware, accepted_encodings
+from app.core.responses import ORJSONResponse, RawJSONResponse
+
+brotli = pytest.importorskip("brotli")
+
+LARGE = {"items": [{"id": i, "text": "꿈속에서 바다를 걸었다"} for i in range(200)]}
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    async def large():
+        return ORJSONResponse(LARGE)
+
+    @app.get("/small")
+    async def small():
+        return {"ok": True}
+
+    @app.get("/image")
+    async def image():
+        return Response(b"\0" * 4096, media_type="image/webp")
+
+    return TestClient(app)
+
+def test_accepted_encodings_parses_q_values():
+    assert accepted_encodings("gzip, deflate, br;q=0") == {"gzip": 1.0, "deflate": 1.0, "br": 0.0}
+    assert accepted_encodings("br;q=0.5 , gzip;q=bad") == {"br": 0.5, "gzip": 0.0}
+    assert accepted_encodings("") == {}
+
+def test_prefers_brotli_and_falls_back_to_gzip(client):
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+    assert response.headers["content-encoding"] == "br"
+    assert "Accept-Encoding" in response.headers["vary"]
+
+    response = client.get("/large", headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == LARGE
+
+def test_brotli_body_round_trip(client):
+    with client.stream("GET", "/large", headers={"Accept-Encoding": "br"}) as response:
+        raw = b"".join(response.iter_raw())
+    assert json.loads(brotli.decompress(raw)) == LARGE
+    assert int(response.headers["content-length"]) == len(raw)
+
+def test_small_and_binary_responses_are_not_compressed(client):
+    assert "content-encoding" not in client.get("/small", headers={"Accept-Encoding": "br, gzip"}).headers
+    assert "content-encoding" not in client.get("/image", headers={"Accept-Encoding": "br, gzip"}).headers
+    assert "content-encoding" not in client.get("/large", headers={"Accept-Encoding": "identity"}).headers
+
+def test_json_response_classes():
+    dream_id = uuid.UUID(int=1)
+    body = ORJSONResponse({"id": dream_id, "date": date(2024, 1, 2), "at": datetime(2024, 1, 2, 3, 4), 5: "키"}).body
+    assert json.loads(body) == {"id": str(dream_id), "date": "2024-01-02", "at": "2024-01-02T03:04:00", "5": "키"}
+
+    raw = RawJSONResponse(b'{"insight":{"a":1}}')
+    assert raw.body == b'{"insight":{"a":1}}'
+    assert raw.media_type == "application/json"
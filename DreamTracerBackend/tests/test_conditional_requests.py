@@ -0,0 +1,99 @@
+"""
+조건부 GET (ETag / If-None-Match) 테스트
+"""
+import asyncio
+import uuid
+import pytest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from fastapi import Response
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_visualization import DreamVisualization  # noqa: F401
+from app.models.community import CommunityPost  # noqa: F401
+from app.api.v1.endpoints import dreams
+from app.core.conditional import etag_matches, make_etag
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.metadata.create_all(engine, tables=[User.__table__, Dream.__table__])
+    return engine
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def dream(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    dream = Dream(
+        user_id=user.id, dream_date=date.today(), title="바다 꿈", body_text="바다를 걸었다",
+        emotion_tags=["happy"], characters=[], symbols=[], updated_at=datetime(2024, 1, 1, 8, 0)
+    )
+    db.add_all([user, dream])
+    db.commit()
+    return dream
+
+def call(endpoint, dream, **kwargs):
+    """엔드포인트 함수 직접 호출 (SQLite는 문자열 경로 파라미터를 UUID 컬럼에 바인딩하지 못함)"""
+    response = Response()
+    kwargs.setdefault("if_none_match", None)
+    result = asyncio.run(endpoint(response=response, current_user=SimpleNamespace(id=dream.user_id), **kwargs))
+    return result, response
+
+def count_selects(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+def test_etag_matching():
+    etag = make_etag("dream", 1, datetime(2024, 1, 1))
+    assert etag.startswith('W/"') and etag == make_etag("dream", 1, datetime(2024, 1, 1))
+    assert etag != make_etag("dream", 1, datetime(2024, 1, 2))
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", {etag[2:]}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('W/"other"', etag)
+
+def test_dream_detail_not_modified_skips_full_row(engine, dream, db):
+    first, response = call(dreams.get_dream, dream, dream_id=dream.id, db=db)
+    etag = response.headers["etag"]
+    assert first.title == "바다 꿈"
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    statements = count_selects(engine)
+    cached, _ = call(dreams.get_dream, dream, dream_id=dream.id, db=db, if_none_match=etag)
+    assert cached.status_code == 304
+    assert cached.body == b""
+    assert cached.headers["etag"] == etag
+    assert len(statements) == 1 and "body_text" not in statements[0]
+
+    dream.title = "수정한 꿈"
+    dream.updated_at = datetime(2024, 1, 2, 8, 0)
+    db.commit()
+    changed, response = call(dreams.get_dream, dream, dream_id=dream.id, db=db, if_none_match=etag)
+    assert changed.title == "수정한 꿈"
+    assert response.headers["etag"] != etag
+
+def test_stats_etag_changes_with_dreams(dream, db):
+    _, response = call(dreams.get_dream_stats, dream, db=db)
+    etag = response.headers["etag"]
+    cached, _ = call(dreams.get_dream_stats, dream, db=db, if_none_match=etag)
+    assert cached.status_code == 304
+
+    db.add(Dream(
+        user_id=dream.user_id, dream_date=date.today() - timedelta(days=1),
+        emotion_tags=[], characters=[], symbols=[], updated_at=datetime(2024, 1, 3, 8, 0)
+    ))
+    db.commit()
+    stats, response = call(dreams.get_dream_stats, dream, db=db, if_none_match=etag)
+    assert stats.total_dreams == 2
+    assert response.headers["etag"] != etag
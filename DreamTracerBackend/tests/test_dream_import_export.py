@@ -0,0 +1,114 @@
+"""
+꿈 기록 NDJSON 가져오기/내보내기 테스트
+"""
+import json
+import uuid
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_visualization import DreamVisualization  # noqa: F401
+from app.models.community import CommunityPost  # noqa: F401
+from app.api.v1.endpoints import dreams
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.services.dream_service import iter_ndjson_lines
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.metadata.create_all(engine, tables=[User.__table__, Dream.__table__])
+    return engine
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    db.commit()
+    return user
+
+@pytest.fixture
+def client(db, user):
+    app = FastAPI()
+    app.include_router(dreams.router, prefix="/dreams")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user.id)
+    return TestClient(app)
+
+def ndjson(records) -> bytes:
+    return b"".join(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n" for record in records)
+
+async def collect(chunks, max_line_bytes=16):
+    async def stream():
+        for chunk in chunks:
+            yield chunk
+    return [item async for item in iter_ndjson_lines(stream(), max_line_bytes)]
+
+@pytest.mark.asyncio
+async def test_iter_ndjson_lines_splits_chunks_and_skips_long_lines():
+    assert await collect([b'{"a":', b'1}\n\n{"b"', b':2}']) == [(1, b'{"a":1}'), (3, b'{"b":2}')]
+    assert await collect([b"x" * 10, b"x" * 10, b"x\n{}\n"]) == [(1, None), (2, b"{}")]
+    assert await collect([b"y" * 40 + b"\n", b"{}"]) == [(1, None), (2, b"{}")]
+
+def test_import_in_batches_and_report_bad_lines(client, db, engine, monkeypatch):
+    monkeypatch.setattr(settings, "DREAM_IMPORT_BATCH_SIZE", 100)
+    records = [
+        {"dream_date": str(date(2024, 1, 1) + timedelta(days=i)), "title": f"꿈 {i}",
+         "body_text": "바다를 걸었다", "emotion_tags": ["happy"]}
+        for i in range(250)
+    ]
+    body = ndjson(records[:120]) + b"not json\n" + ndjson([{"title": "날짜 없음"}]) + ndjson(records[120:])
+
+    inserts = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record_insert(conn, cursor, statement, *args):
+        if statement.startswith("INSERT"):
+            inserts.append(statement)
+
+    response = client.post("/dreams/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    result = response.json()
+    assert result["imported"] == 250
+    assert result["failed"] == 2
+    assert [error["line"] for error in result["errors"]] == [121, 122]
+    assert "dream_date" in result["errors"][1]["error"]
+    assert db.query(Dream).count() == 250
+    assert db.query(Dream).filter(Dream.title == "꿈 249").one().emotion_tags == ["happy"]
+    # 줄마다가 아니라 배치마다 INSERT
+    assert len(inserts) == 3
+
+def test_export_round_trips_through_import(client, db, user):
+    db.add_all([
+        Dream(user_id=user.id, dream_date=date(2024, 1, day), title=f"꿈 {day}", body_text="하늘을 날았다",
+              emotion_tags=["peaceful"], characters=[], symbols=["하늘"])
+        for day in (3, 1, 2)
+    ])
+    db.commit()
+
+    response = client.get("/dreams/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.content.splitlines()]
+    assert [line["title"] for line in lines] == ["꿈 1", "꿈 2", "꿈 3"]
+    assert "user_id" not in lines[0]
+    assert lines[0]["symbols"] == ["하늘"]
+
+    imported = client.post("/dreams/import", content=response.content).json()
+    assert imported == {"imported": 3, "failed": 0, "errors": []}
+    assert db.query(Dream).count() == 6
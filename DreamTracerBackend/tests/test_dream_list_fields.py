@@ -0,0 +1,112 @@
+"""
+꿈 목록 컬럼 조회와 fields= 선택 필드 응답 테스트
+"""
+import uuid
+import pytest
+from datetime import date, datetime
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_visualization import DreamVisualization  # noqa: F401
+from app.models.community import CommunityPost  # noqa: F401
+from app.api.v1.endpoints import dreams
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import get_current_user
+from app.schemas.dream import DREAM_CARD_FIELDS
+from app.services.community_service import _post_list_item
+from app.services.dream_service import DreamService, parse_fields
+
+LONG_BODY = "바다 위를 걷다가 하늘로 날아올랐다. " * 100
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.metadata.create_all(engine, tables=[User.__table__, Dream.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    db.add_all([
+        Dream(
+            user_id=user.id, dream_date=date(2024, 1, day), title=f"꿈 {day}",
+            body_text=LONG_BODY, emotion_tags=["happy"], analysis_status="completed",
+            is_shared=False, characters=[], symbols=[]
+        )
+        for day in range(1, 26)
+    ])
+    db.commit()
+    return user
+
+def test_parse_fields():
+    assert parse_fields(None) is None
+    assert parse_fields("") is None
+    assert parse_fields("title, dream_date,title") == ["id", "title", "dream_date"]
+    assert parse_fields("card") == list(DREAM_CARD_FIELDS)
+    with pytest.raises(ValueError):
+        parse_fields("title,password")
+
+@pytest.mark.asyncio
+async def test_full_list_from_rows(db, user):
+    result = await DreamService().get_user_dreams(user.id, skip=0, limit=20, db=db)
+
+    assert result.total_count == 25
+    assert result.has_next
+    assert len(result.dreams) == 20
+    assert result.dreams[0].dream_date == date(2024, 1, 25)
+    assert result.dreams[0].id == str(uuid.UUID(result.dreams[0].id))
+    assert result.dreams[0].user_id == str(user.id)
+    assert result.dreams[0].body_text == LONG_BODY
+
+@pytest.mark.asyncio
+async def test_card_fields_list(db, user):
+    result = await DreamService().search_dreams(
+        user.id, "바다", db, skip=20, limit=20, fields=parse_fields("card")
+    )
+
+    assert len(result.dreams) == 5
+    assert not result.has_next and result.has_previous
+    card = result.dreams[0].model_dump(exclude_unset=True)
+    assert set(card) == set(DREAM_CARD_FIELDS)
+    assert card["body_preview"] == LONG_BODY[:settings.DREAM_PREVIEW_LENGTH]
+
+def test_endpoint_serializes_only_requested_fields(db, user):
+    app = FastAPI()
+    app.include_router(dreams.router, prefix="/dreams")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user.id)
+    client = TestClient(app)
+
+    full = client.get("/dreams/", params={"limit": 20})
+    card = client.get("/dreams/", params={"limit": 20, "fields": "card"})
+    assert full.status_code == card.status_code == 200
+    assert set(card.json()["dreams"][0]) == set(DREAM_CARD_FIELDS)
+    assert card.json()["total_count"] == 25
+    assert len(card.content) * 5 < len(full.content)
+
+    titles = client.get("/dreams/", params={"fields": "title"}).json()["dreams"]
+    assert titles[0] == {"id": titles[0]["id"], "title": "꿈 25"}
+    assert client.get("/dreams/", params={"fields": "title,secret"}).status_code == 400
+
+def test_post_list_item_hides_anonymous_author():
+    user_id = uuid.uuid4()
+    row = SimpleNamespace(
+        id=uuid.UUID(int=1), user_id=user_id, dream_id=None, content="꿈 이야기",
+        tags=None, is_anonymous=True, created_at=datetime(2024, 1, 1)
+    )
+    assert _post_list_item(row) == {
+        "id": str(uuid.UUID(int=1)), "content": "꿈 이야기", "tags": [], "is_anonymous": True,
+        "created_at": "2024-01-01T00:00:00", "dream_id": None, "user": {"id": None, "name": "익명"}
+    }
+    row.is_anonymous = False
+    assert _post_list_item(row)["user"] == {"id": str(user_id), "name": f"사용자{str(user_id)[:8]}"}
@@ -2,12 +2,21 @@
 꿈 서비스 테스트
 """
 import pytest
-from unittest.mock import Mock, patch
+import hashlib
+import os
+from unittest.mock import Mock, AsyncMock, patch
 from datetime import date, datetime
 from app.services.dream_service import DreamService
+from app.services.file_service import file_service
 from app.schemas.dream import DreamCreate, DreamUpdate, EmotionType
 from app.models.dream import Dream
 
+def dream_row(**values):
+    """목록 조회 결과 행 (컬럼 이름 → 값)"""
+    values.setdefault("created_at", datetime(2024, 1, 15, 8, 0))
+    values.setdefault("updated_at", datetime(2024, 1, 15, 8, 0))
+    return Mock(_asdict=Mock(return_value=values))
+
 class TestDreamService:
     def setup_method(self):
         self.dream_service = DreamService()
@@ -66,7 +75,7 @@ class TestDreamService:
         """사용자 꿈 목록 조회 (필터링) 테스트"""
         # Mock 꿈 객체들
         mock_dreams = [
-            Dream(
+            dream_row(
                 id="dream-1",
                 user_id="user-123",
                 dream_date=date(2024, 1, 15),
@@ -78,7 +87,7 @@ class TestDreamService:
                 characters=[],
                 symbols=[]
             ),
-            Dream(
+            dream_row(
                 id="dream-2",
                 user_id="user-123",
                 dream_date=date(2024, 1, 14),
@@ -95,6 +104,7 @@ class TestDreamService:
         # Mock 쿼리 체인
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
+        mock_query.with_entities.return_value = mock_query
         mock_query.count.return_value = 2
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
@@ -240,7 +250,7 @@ class TestDreamService:
         """꿈 검색 테스트"""
         # Mock 검색 결과
         mock_dreams = [
-            Dream(
+            dream_row(
                 id="dream-1",
                 user_id="user-123",
                 dream_date=date(2024, 1, 15),
@@ -257,6 +267,7 @@ class TestDreamService:
         # Mock 쿼리
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
+        mock_query.with_entities.return_value = mock_query
         mock_query.count.return_value = 1
         mock_query.order_by.return_value = mock_query
         mock_query.offset.return_value = mock_query
@@ -270,3 +281,78 @@ class TestDreamService:
         assert len(result.dreams) == 1
         assert result.dreams[0].title == "바다 꿈"
         assert result.total_count == 1
+
+    @pytest.mark.asyncio
+    async def test_upload_audio_streams_chunks(self, tmp_path):
+        """오디오 업로드 청크 스트리밍 테스트"""
+        chunks = [b"a" * 10, b"b" * 10, b""]
+        audio_file = Mock()
+        audio_file.filename = "voice.wav"
+        audio_file.read = AsyncMock(side_effect=chunks)
+        mock_tasks = Mock()
+        
+        with patch("app.services.dream_service.settings") as mock_settings, \
+             patch.dict("sys.modules", {"app.workers.tasks": mock_tasks}):
+            mock_settings.AUDIO_UPLOAD_DIR = str(tmp_path)
+            mock_settings.AUDIO_UPLOAD_CHUNK_SIZE = 10
+            mock_settings.AUDIO_MAX_UPLOAD_BYTES = 100
+            result = await self.dream_service.upload_audio("user-123", audio_file, self.mock_db)
+        
+        expected_hash = hashlib.sha256(b"a" * 10 + b"b" * 10).hexdigest()
+        assert result.file_size == 20
+        assert result.content_hash == expected_hash
+        assert result.audio_file_path == f"audio/user-123/{expected_hash}.wav"
+        assert os.path.exists(tmp_path / "user-123" / f"{expected_hash}.wav")
+        mock_tasks.extract_audio_duration.delay.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_audio_size_limit(self, tmp_path):
+        """오디오 업로드 크기 제한 테스트"""
+        audio_file = Mock()
+        audio_file.filename = "voice.wav"
+        audio_file.read = AsyncMock(side_effect=[b"a" * 10, b"a" * 10, b""])
+        
+        with patch("app.services.dream_service.settings") as mock_settings:
+            mock_settings.AUDIO_UPLOAD_DIR = str(tmp_path)
+            mock_settings.AUDIO_UPLOAD_CHUNK_SIZE = 10
+            mock_settings.AUDIO_MAX_UPLOAD_BYTES = 15
+            with pytest.raises(ValueError):
+                await self.dream_service.upload_audio("user-123", audio_file, self.mock_db)
+        
+        # 임시 파일이 남지 않아야 함
+        assert os.listdir(tmp_path / "user-123") == []
+
+    @pytest.mark.asyncio
+    async def test_upload_audio_succeeds_when_enqueue_fails(self, tmp_path):
+        """길이 추출 작업 등록 실패 시에도 업로드 성공 (파일 유지)"""
+        audio_file = Mock()
+        audio_file.filename = "voice.wav"
+        audio_file.read = AsyncMock(side_effect=[b"a" * 10, b""])
+        mock_tasks = Mock()
+        mock_tasks.extract_audio_duration.delay.side_effect = ConnectionError("broker down")
+        
+        with patch("app.services.dream_service.settings") as mock_settings, \
+             patch.dict("sys.modules", {"app.workers.tasks": mock_tasks}):
+            mock_settings.AUDIO_UPLOAD_DIR = str(tmp_path)
+            mock_settings.AUDIO_UPLOAD_CHUNK_SIZE = 10
+            mock_settings.AUDIO_MAX_UPLOAD_BYTES = 100
+            result = await self.dream_service.upload_audio("user-123", audio_file, self.mock_db)
+        
+        assert result.duration is None
+        assert os.path.exists(tmp_path / "user-123" / f"{result.content_hash}.wav")
+
+    def test_audio_duration_read_for_own_upload(self, tmp_path):
+        """추출된 오디오 길이는 본인 경로일 때만 꿈 값에 포함"""
+        (tmp_path / "user-123").mkdir()
+        (tmp_path / "user-123" / "abc.wav.json").write_text('{"duration": 12.5}')
+        
+        with patch.dict(file_service.roots, {"audio": str(tmp_path)}):
+            own = self.dream_service._dream_values(
+                "user-123", DreamCreate(dream_date=date(2024, 1, 15), audio_file_path="audio/user-123/abc.wav")
+            )
+            other = self.dream_service._dream_values(
+                "user-456", DreamCreate(dream_date=date(2024, 1, 15), audio_file_path="audio/user-123/abc.wav")
+            )
+        
+        assert own["audio_duration"] == 12.5
+        assert other["audio_duration"] is None
@@ -0,0 +1,35 @@
+"""
+임베딩 모델 로딩 테스트
+"""
+import numpy as np
+import pytest
+from app.core.config import settings
+from app.services.embedding import HashingEncoder, load_embedding_model
+from app.services.similarity import cosine_similarity
+
+def test_hashing_encoder_is_deterministic_and_normalized():
+    encoder = HashingEncoder(dimension=128)
+
+    first, second = encoder.encode(["바닷가를 걷는 꿈", "바닷가를 걷는 꿈"])
+
+    assert first.shape == (128,)
+    assert np.array_equal(first, second)
+    assert np.linalg.norm(first) == pytest.approx(1.0)
+
+def test_hashing_encoder_similar_texts_score_higher():
+    encoder = HashingEncoder()
+    base, similar, different = encoder.encode([
+        "어두운 바닷가를 혼자 걷고 있었다",
+        "어두운 바닷가를 친구와 걷고 있었다",
+        "시험 시간에 늦어서 버스를 놓쳤다",
+    ])
+
+    assert cosine_similarity(base, similar) > cosine_similarity(base, different)
+
+def test_load_embedding_model_backend(monkeypatch):
+    monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "hashing")
+    assert isinstance(load_embedding_model(), HashingEncoder)
+
+    monkeypatch.setattr(settings, "EMBEDDING_BACKEND", "unknown")
+    with pytest.raises(ValueError):
+        load_embedding_model()
@@ -0,0 +1,129 @@
+"""
+파일 제공 테스트 (경로 확인, 서명 URL, ETag/304, Range)
+"""
+import hashlib
+import uuid
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_visualization import DreamVisualization
+from app.models.community import CommunityPost  # noqa: F401
+from app.api.v1.endpoints import files
+from app.core.database import get_db
+from app.core.security import get_optional_current_user
+from app.services.file_service import FileService
+
+CONTENT_HASH = hashlib.sha256(b"original").hexdigest()
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """임시 디렉토리를 작업 디렉토리로 사용 (visualizations/, uploads/audio/)"""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "visualizations").mkdir()
+    (tmp_path / "visualizations" / "dream_visualization_1.jpg").write_bytes(b"original")
+    (tmp_path / "visualizations" / f"{CONTENT_HASH}_256w.webp").write_bytes(b"thumbnail")
+    (tmp_path / "uploads" / "audio" / "user-1").mkdir(parents=True)
+    (tmp_path / "uploads" / "audio" / "user-1" / f"{'a' * 64}.wav").write_bytes(bytes(range(256)) * 4)
+    service = FileService()
+    service.roots = {"visualizations": "visualizations", "audio": "uploads/audio"}
+    monkeypatch.setattr(files, "file_service", service)
+    return service
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    User.metadata.create_all(engine, tables=[User.__table__, Dream.__table__, DreamVisualization.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+@pytest.fixture
+def owner(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    dream = Dream(id=uuid.uuid4(), user_id=user.id, dream_date=date(2024, 1, 1))
+    db.add_all([user, dream, DreamVisualization(
+        dream_id=dream.id, user_id=user.id, image_path="visualizations/dream_visualization_1.jpg",
+        art_style="surreal", content_hash=CONTENT_HASH
+    )])
+    db.commit()
+    return user
+
+def make_client(db, user=None):
+    app = FastAPI()
+    app.include_router(files.router, prefix="/files")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_optional_current_user] = lambda: user
+    return TestClient(app)
+
+def test_resolve_rejects_unknown_prefix_and_traversal(storage):
+    assert storage.resolve("visualizations/dream_visualization_1.jpg").endswith("dream_visualization_1.jpg")
+    for path in ["etc/passwd", "visualizations/../secret", "audio/../../x", "visualizations/"]:
+        with pytest.raises(ValueError):
+            storage.resolve(path)
+
+def test_signed_url_is_stable_within_window_and_expires(storage):
+    storage.url_ttl = 3600
+    url, expires = storage.sign("visualizations/a.jpg", now=7200)
+
+    assert storage.sign("visualizations/a.jpg", now=7200 + 3599) == (url, expires)
+    assert expires == 4 * 3600
+    signature = url.split("signature=")[1]
+    assert storage.verify_signature("visualizations/a.jpg", expires, signature, now=expires - 1)
+    assert not storage.verify_signature("visualizations/a.jpg", expires, signature, now=expires + 1)
+    assert not storage.verify_signature("visualizations/b.jpg", expires, signature, now=expires - 1)
+
+def test_can_access_checks_owner(storage, db, owner):
+    other_id = uuid.uuid4()
+
+    assert storage.can_access("visualizations/dream_visualization_1.jpg", owner.id, db)
+    assert storage.can_access(f"visualizations/{CONTENT_HASH}_256w.webp", owner.id, db)
+    assert not storage.can_access("visualizations/dream_visualization_1.jpg", other_id, db)
+    assert storage.can_access("audio/user-1/x.wav", "user-1", db)
+    assert not storage.can_access("audio/user-1/x.wav", "user-2", db)
+
+def test_serves_with_content_etag_and_304(storage, db, owner):
+    client = make_client(db, SimpleNamespace(id=owner.id))
+
+    response = client.get("/files/visualizations/dream_visualization_1.jpg")
+    assert response.status_code == 200
+    assert response.content == b"original"
+    assert response.headers["etag"] == f'"{CONTENT_HASH}"'
+    assert "immutable" in response.headers["cache-control"]
+
+    derivative = client.get(f"/files/visualizations/{CONTENT_HASH}_256w.webp")
+    assert derivative.headers["etag"] == f'"{CONTENT_HASH}_256w.webp"'
+    assert derivative.headers["content-type"] == "image/webp"
+
+    cached = client.get(
+        "/files/visualizations/dream_visualization_1.jpg",
+        headers={"If-None-Match": f'W/"other", "{CONTENT_HASH}"'}
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+def test_access_control(storage, db, owner):
+    assert make_client(db).get("/files/visualizations/dream_visualization_1.jpg").status_code == 401
+    assert make_client(db, SimpleNamespace(id=uuid.uuid4())).get(
+        "/files/visualizations/dream_visualization_1.jpg"
+    ).status_code == 404
+    assert make_client(db, SimpleNamespace(id=owner.id)).get("/files/visualizations/missing.jpg").status_code == 404
+
+def test_signed_url_and_range_request(storage, db):
+    client = make_client(db)
+    path = f"audio/user-1/{'a' * 64}.wav"
+    url, _ = storage.sign(path)
+
+    partial = client.get(url, headers={"Range": "bytes=100-199"})
+    assert partial.status_code == 206
+    assert partial.headers["content-range"] == "bytes 100-199/1024"
+    assert partial.content == (bytes(range(256)) * 4)[100:200]
+
+    assert client.get(url.replace("signature=", "signature=x")).status_code == 403
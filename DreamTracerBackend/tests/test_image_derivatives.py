@@ -0,0 +1,59 @@
+"""
+시각화 이미지 파생본 생성 테스트
+"""
+import os
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+from app.services.image_derivatives import ImageDerivativeService
+
+@pytest.fixture
+def source_image(tmp_path):
+    path = tmp_path / "visualizations" / "dream_visualization_1.jpg"
+    path.parent.mkdir()
+    Image.new("RGB", (1024, 768), (30, 60, 120)).save(path, format="JPEG")
+    return str(path)
+
+def test_generates_thumbnails_and_full_size_variants(source_image):
+    service = ImageDerivativeService(widths=[256, 512, 2048], formats=["webp", "jpeg"], quality=70)
+
+    result = service.generate(source_image)
+
+    # 원본보다 큰 썸네일은 만들지 않고, 원본 크기는 jpeg 없이 변환 포맷만
+    assert set(result["variants"]) == {"256", "512", "1024"}
+    assert set(result["variants"]["256"]) == {"webp", "jpeg"}
+    assert set(result["variants"]["1024"]) == {"webp"}
+    assert (result["width"], result["height"]) == (1024, 768)
+
+    thumbnail = result["variants"]["256"]["webp"]
+    assert os.path.dirname(thumbnail) == os.path.dirname(source_image)
+    assert os.path.basename(thumbnail) == f"{result['content_hash']}_256w.webp"
+    with Image.open(thumbnail) as image:
+        assert image.format == "WEBP"
+        assert image.size == (256, 192)
+
+def test_existing_derivatives_are_not_reencoded(source_image):
+    service = ImageDerivativeService(widths=[256], formats=["webp"])
+    first = service.generate(source_image)
+    path = first["variants"]["256"]["webp"]
+    modified = os.path.getmtime(path)
+    os.utime(path, (modified - 100, modified - 100))
+
+    second = service.generate(source_image)
+
+    assert second == first
+    assert os.path.getmtime(path) == modified - 100
+
+def test_unreadable_image_raises(tmp_path):
+    dummy = tmp_path / "dummy.jpg"
+    dummy.write_text("# Dream Visualization\n")
+
+    with pytest.raises(OSError):
+        ImageDerivativeService(widths=[256], formats=["webp"]).generate(str(dummy))
+
+def test_paths_lists_all_variant_files():
+    derivatives = {"variants": {"256": {"webp": "a.webp", "jpeg": "a.jpg"}, "1024": {"avif": "b.avif"}}}
+
+    assert sorted(ImageDerivativeService(widths=[256], formats=["webp"]).paths(derivatives)) == ["a.jpg", "a.webp", "b.avif"]
+    assert ImageDerivativeService(widths=[256], formats=["webp"]).paths(None) == []
@@ -0,0 +1,101 @@
+"""
+Prometheus 메트릭 테스트
+"""
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from app.core.config import settings
+from app.core.metrics import PrometheusMiddleware, render_metrics, track_llm_call
+
+def sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+class TestPrometheusMiddleware:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        app = FastAPI()
+        app.add_middleware(PrometheusMiddleware)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+            return {"id": item_id}
+
+        self.client = TestClient(app)
+
+    def test_route_template_label(self):
+        """경로 파라미터 대신 라우트 템플릿으로 기록"""
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = sample("dreamtracer_http_request_duration_seconds_count", labels)
+
+        self.client.get("/items/a")
+        self.client.get("/items/b")
+
+        assert sample("dreamtracer_http_request_duration_seconds_count", labels) == before + 2
+
+    def test_db_queries_per_request(self):
+        """요청 안에서 실행된 쿼리 수 집계"""
+        labels = {"route": "/items/{item_id}"}
+        before = sample("dreamtracer_db_queries_per_request_sum", labels)
+
+        self.client.get("/items/a")
+
+        assert sample("dreamtracer_db_queries_per_request_sum", labels) == before + 2
+
+    def test_unmatched_route(self):
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = sample("dreamtracer_http_request_duration_seconds_count", labels)
+
+        self.client.get("/missing")
+
+        assert sample("dreamtracer_http_request_duration_seconds_count", labels) == before + 1
+
+def test_track_llm_call_counts_errors():
+    labels = {"provider": "gemini", "operation": "test"}
+    before = sample("dreamtracer_llm_call_errors_total", labels)
+
+    with pytest.raises(RuntimeError):
+        with track_llm_call("gemini", "test"):
+            raise RuntimeError("quota")
+
+    assert sample("dreamtracer_llm_call_errors_total", labels) == before + 1
+    body, content_type = render_metrics()
+    assert b"dreamtracer_llm_call_duration_seconds" in body
+    assert content_type.startswith("text/plain")
+
+class TestQueryDiagnostics:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        app = FastAPI()
+        app.add_middleware(PrometheusMiddleware)
+
+        @app.get("/loop/{n}")
+        def loop(n: int):
+            with self.engine.connect() as conn:
+                for i in range(n):
+                    conn.execute(text("SELECT :i"), {"i": i})
+            return {"n": n}
+
+        self.client = TestClient(app)
+
+    def test_n_plus_one_flagged(self, caplog):
+        labels = {"route": "/loop/{n}"}
+        before = sample("dreamtracer_db_n_plus_one_requests_total", labels)
+
+        self.client.get(f"/loop/{settings.N_PLUS_ONE_THRESHOLD}")
+        self.client.get("/loop/1")
+
+        assert sample("dreamtracer_db_n_plus_one_requests_total", labels) == before + 1
+        assert "N+1 쿼리 의심 [GET /loop/{n}]" in caplog.text
+
+    def test_slow_query_logged_with_endpoint(self, caplog):
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0):
+            self.client.get("/loop/1")
+
+        assert "느린 쿼리" in caplog.text
+        assert "[GET /loop/{n}]" in caplog.text
@@ -0,0 +1,67 @@
+"""
+요청 프로파일링 미들웨어 테스트
+"""
+import os
+import pytest
+from unittest.mock import patch
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core.config import settings
+from app.core.profiling import ProfilingMiddleware
+
+pytest.importorskip("pyinstrument")
+
+class TestProfilingMiddleware:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        app = FastAPI()
+        app.add_middleware(ProfilingMiddleware)
+
+        @app.get("/api/v1/ping")
+        async def ping():
+            return {"pong": True}
+
+        self.client = TestClient(app)
+        self.output_dir = str(tmp_path)
+        with patch.object(settings, "PROFILING_TOKEN", "secret"), \
+             patch.object(settings, "PROFILING_OUTPUT_DIR", self.output_dir):
+            yield
+
+    def test_without_token_not_profiled(self):
+        response = self.client.get("/api/v1/ping")
+
+        assert response.json() == {"pong": True}
+        assert "x-profile-id" not in response.headers
+        assert os.listdir(self.output_dir) == []
+
+    def test_wrong_token_not_profiled(self):
+        response = self.client.get("/api/v1/ping", headers={"X-Profile-Token": "wrong"})
+
+        assert "x-profile-id" not in response.headers
+
+    def test_non_ascii_token_not_profiled(self):
+        response = self.client.get("/api/v1/ping", headers={"X-Profile-Token": "비밀".encode("utf-8")})
+
+        assert response.status_code == 200
+        assert "x-profile-id" not in response.headers
+
+    def test_query_token_not_accepted(self):
+        response = self.client.get("/api/v1/ping?profile_token=secret")
+
+        assert "x-profile-id" not in response.headers
+
+    def test_profile_saved_to_file(self):
+        response = self.client.get("/api/v1/ping", headers={"X-Profile-Token": "secret"})
+
+        assert response.json() == {"pong": True}
+        profile_id = response.headers["x-profile-id"]
+        assert sorted(os.listdir(self.output_dir)) == [f"{profile_id}.html", f"{profile_id}.speedscope.json"]
+
+    def test_profile_returned_inline(self):
+        response = self.client.get(
+            "/api/v1/ping",
+            headers={"X-Profile-Token": "secret", "X-Profile-Output": "inline"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/html")
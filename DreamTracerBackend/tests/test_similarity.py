@@ -0,0 +1,26 @@
+"""
+꿈 임베딩 유사도 계산 테스트
+"""
+import numpy as np
+import pytest
+from app.services.similarity import cosine_similarity, similar_pairs
+
+def test_cosine_similarity():
+    assert cosine_similarity(np.array([1.0, 0.0]), np.array([2.0, 0.0])) == pytest.approx(1.0)
+    assert cosine_similarity(np.array([1.0, 0.0]), np.array([0.0, 3.0])) == pytest.approx(0.0)
+
+def test_similar_pairs_threshold_and_order():
+    embeddings = {
+        "a": np.array([1.0, 0.0]),
+        "b": np.array([0.9, 0.1]),
+        "c": np.array([0.0, 1.0]),
+    }
+
+    pairs = similar_pairs(embeddings, 0.5)
+
+    assert [(id1, id2) for id1, id2, _ in pairs] == [("a", "b")]
+    assert pairs[0][2] == pytest.approx(cosine_similarity(embeddings["a"], embeddings["b"]))
+
+def test_similar_pairs_empty():
+    assert similar_pairs({}, 0.3) == []
+    assert similar_pairs({"a": np.array([1.0, 0.0])}, 0.3) == []
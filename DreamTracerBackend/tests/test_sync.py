@@ -0,0 +1,146 @@
+"""
+앱 델타 동기화 테스트
+"""
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis
+from app.models.dream_visualization import DreamVisualization
+from app.models.sync import SyncTombstone
+from app.api.v1.endpoints import sync
+from app.core.config import settings
+from app.core.database import delete_in_batches, get_db
+from app.core.security import get_current_user
+from app.services.sync_service import decode_sync_cursor, dream_tombstones_insert, encode_sync_cursor
+
+OLD = datetime(2024, 1, 1, 8, 0)
+
+@pytest.fixture
+def db_tables():
+    return [User.__table__, Dream.__table__, DreamAnalysis.__table__, DreamVisualization.__table__, SyncTombstone.__table__]
+
+@pytest.fixture
+def client(db, user):
+    app = FastAPI()
+    app.include_router(sync.router, prefix="/sync")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user.id)
+    return TestClient(app)
+
+def upsert(client_id, **dream):
+    return {"type": "upsert_dream", "client_id": client_id, "dream": {"dream_date": "2024-03-01", **dream}}
+
+def pull_all(client, cursor=None):
+    """has_more가 false가 될 때까지 받아온 응답 목록"""
+    responses = []
+    while True:
+        response = client.post("/sync", json={"cursor": cursor}).json()
+        responses.append(response)
+        cursor = response["cursor"]
+        if not response["has_more"]:
+            return responses
+
+def test_cursor_round_trip():
+    dream_id = uuid.uuid4()
+    synced_at = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    cursor = encode_sync_cursor(synced_at, {"dreams": (OLD, dream_id), "analyses": None})
+    assert decode_sync_cursor(cursor) == (synced_at, {"dreams": (OLD.replace(tzinfo=timezone.utc), dream_id)})
+    with pytest.raises(ValueError):
+        decode_sync_cursor("not-a-cursor")
+
+def test_offline_writes_are_idempotent(client, db):
+    operations = [
+        upsert("local-1", title="바다 꿈", body_text="바다를 걸었다", emotion_tags=["happy"]),
+        upsert("local-2", title="하늘 꿈"),
+        upsert("local-3", lucidity_level=9),
+        {"type": "delete_dream", "client_id": "local-2"},
+    ]
+    first = client.post("/sync", json={"operations": operations}).json()
+    assert [result["status"] for result in first["results"]] == ["created", "created", "failed", "deleted"]
+    assert "lucidity_level" in first["results"][2]["error"]
+
+    # 응답을 못 받은 앱이 같은 작업을 다시 보내도 중복 생성되지 않음
+    retry = client.post("/sync", json={"operations": operations}).json()
+    assert [result["status"] for result in retry["results"]] == ["updated", "created", "failed", "deleted"]
+    assert retry["results"][0]["id"] == first["results"][0]["id"]
+    assert db.query(Dream).count() == 1
+    assert db.query(SyncTombstone).filter(SyncTombstone.client_id == "local-2").count() == 2
+
+    # 보낸 필드만 수정 (본문 유지)
+    client.post("/sync", json={"operations": [upsert("local-1", title="깊은 바다 꿈")]})
+    dream = db.query(Dream).one()
+    db.refresh(dream)
+    assert (dream.title, dream.body_text, dream.client_id) == ("깊은 바다 꿈", "바다를 걸었다", "local-1")
+
+    too_many = [upsert(f"local-{i}") for i in range(settings.SYNC_MAX_OPERATIONS + 1)]
+    assert client.post("/sync", json={"operations": too_many}).status_code == 422
+
+def test_pull_pages_changes_and_tombstones(client, db, user, monkeypatch):
+    monkeypatch.setattr(settings, "SYNC_PAGE_SIZE", 2)
+    dreams = [
+        Dream(user_id=user.id, dream_date=date(2024, 1, day), title=f"꿈 {day}", emotion_tags=[],
+              characters=[], symbols=[], updated_at=OLD + timedelta(minutes=day))
+        for day in range(1, 6)
+    ]
+    other = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add_all(dreams + [other, Dream(
+        user_id=other.id, dream_date=date(2024, 1, 1), emotion_tags=[], characters=[], symbols=[], updated_at=OLD
+    )])
+    db.flush()
+    db.add_all([
+        DreamAnalysis(dream_id=dreams[0].id, summary_text="요약", keywords=["바다"], created_at=OLD, updated_at=OLD),
+        DreamVisualization(dream_id=dreams[1].id, user_id=dreams[1].user_id, image_path="visualizations/a.png", art_style="anime",
+                           created_at=OLD, updated_at=OLD),
+    ])
+    db.commit()
+
+    responses = pull_all(client)
+    assert [len(response["dreams"]) for response in responses] == [2, 2, 1]
+    assert [dream["title"] for response in responses for dream in response["dreams"]] == [f"꿈 {day}" for day in range(1, 6)]
+    assert responses[0]["analyses"][0]["summary_text"] == "요약"
+    assert responses[0]["visualizations"][0]["art_style"] == "anime"
+    assert not any(response["full_resync"] for response in responses)
+    cursor = responses[-1]["cursor"]
+
+    # 따라잡은 뒤에는 변경된 것만
+    assert client.post("/sync", json={"cursor": cursor}).json()["dreams"] == []
+    dreams[2].title = "수정한 꿈"
+    dreams[2].updated_at = datetime(2024, 2, 1)
+    # 재분석은 같은 분석 행을 덮어씀
+    analysis = db.query(DreamAnalysis).one()
+    analysis.summary_text = "새 요약"
+    analysis.updated_at = datetime(2024, 2, 1)
+    db.commit()
+    deleted_id = dreams[4].id
+    delete_in_batches(
+        db, Dream, Dream.id == deleted_id,
+        before_delete=lambda ids: db.execute(dream_tombstones_insert(Dream.id.in_(ids)))
+    )
+
+    changes = client.post("/sync", json={"cursor": cursor}).json()
+    assert [dream["title"] for dream in changes["dreams"]] == ["수정한 꿈"]
+    assert [analysis["summary_text"] for analysis in changes["analyses"]] == ["새 요약"]
+    assert changes["tombstones"][0]["entity_type"] == "dream"
+    assert changes["tombstones"][0]["entity_id"] == str(deleted_id)
+
+def test_recent_changes_are_resent_within_overlap(client, db, user):
+    db.add(Dream(user_id=user.id, dream_date=date.today(), emotion_tags=[], characters=[], symbols=[],
+                 updated_at=datetime.now(timezone.utc).replace(tzinfo=None)))
+    db.commit()
+
+    first = client.post("/sync", json={}).json()
+    second = client.post("/sync", json={"cursor": first["cursor"]}).json()
+    assert len(first["dreams"]) == len(second["dreams"]) == 1
+
+def test_stale_cursor_requires_full_resync(client):
+    stale = encode_sync_cursor(
+        datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS + 1),
+        {"dreams": (datetime(2030, 1, 1), uuid.uuid4())}
+    )
+    assert client.post("/sync", json={"cursor": stale}).json()["full_resync"]
+    assert client.post("/sync", json={"cursor": "bad"}).status_code == 400
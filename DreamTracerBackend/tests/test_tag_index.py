@@ -0,0 +1,123 @@
+"""
+커뮤니티 태그 역색인과 비트맵 테스트
+"""
+import asyncio
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from app.models.user import User
+from app.models.community import CommunityPost
+from app.core.bitmap import ARRAY_MAX, RoaringBitmap
+from app.core.config import settings
+from app.schemas.community import CommunityPostCreate, CommunityPostUpdate
+from app.services.community_service import CommunityService
+from app.services.tag_index_service import TAG_INDEX_CHANGES_KEY, TagIndexService
+
+@pytest.fixture
+def user(db):
+    user = User(id=uuid.uuid4(), auth_provider="firebase")
+    db.add(user)
+    tag_sets = [["바다"], ["바다", "하늘"], ["하늘"], ["바다", "숲"], []]
+    db.add_all([
+        CommunityPost(user_id=user.id, content=f"꿈 이야기 {i}", tags=tag_sets[i % 5], is_anonymous=True,
+                      created_at=datetime(2024, 1, 1) + timedelta(hours=i))
+        for i in range(20)
+    ])
+    db.commit()
+    return user
+
+@pytest.fixture
+def index(fake_redis):
+    index = TagIndexService()
+    with patch("app.services.community_service.tag_index_service", index):
+        yield index, fake_redis
+
+def test_bitmap_containers_and_set_operations():
+    evens = RoaringBitmap(range(0, 3 * ARRAY_MAX, 2))  # 첫 청크는 비트셋
+    sparse = RoaringBitmap([3, 4, 70000, 200000])
+    assert len(evens) == 3 * ARRAY_MAX // 2
+    assert isinstance(evens._chunks[0], int) and isinstance(sparse._chunks[0], list)
+    assert list(evens & sparse) == [4]
+    assert evens.and_cardinality(sparse) == 1
+    assert list(RoaringBitmap.union(sparse, RoaringBitmap([5])).descending()) == [200000, 70000, 5, 4, 3]
+    assert RoaringBitmap.intersection(evens, sparse, RoaringBitmap([4, 70000])) == RoaringBitmap([4])
+
+    # 원소가 줄면 다시 정렬 리스트 컨테이너
+    for value in range(0, 3 * ARRAY_MAX, 4):
+        evens.discard(value)
+    assert isinstance(evens._chunks[0], list) and 2 in evens and 4 not in evens
+    assert list(evens)[:3] == [2, 6, 10]
+
+@pytest.mark.asyncio
+async def test_rebuild_and_tag_queries(db, user, index):
+    service, _ = index
+    await service.ensure_current(db)
+    assert len(service.posts) == 20
+
+    assert len(service.match(["바다"])) == 12
+    assert len(service.match(["바다", "하늘"])) == 4
+    assert len(service.match(["하늘", "숲"], match_all=False)) == 12
+    assert not service.match(["바다", "없는 태그"])
+    assert service.tag_counts() == [
+        {"tag": "바다", "count": 12}, {"tag": "하늘", "count": 8}, {"tag": "숲", "count": 4}
+    ]
+
+    newest = service.page(service.match(["바다", "하늘"]), 0, 2)
+    contents = [db.get(CommunityPost, post_id).content for post_id in newest]
+    assert contents == ["꿈 이야기 16", "꿈 이야기 11"]
+
+@pytest.mark.asyncio
+async def test_changes_applied_from_stream(db, user, index):
+    service, fake = index
+    community = CommunityService()
+    await service.ensure_current(db)
+
+    created = await community.create_post(
+        user.id, CommunityPostCreate(content="새로 꾼 바다와 숲 꿈", tags=["숲", "바다"]), db
+    )
+    page = await community.get_posts(skip=0, limit=3, db=db, tags_filter=["숲", "바다"])
+    assert page["total_count"] == 5 and page["posts"][0]["id"] == str(created.id)
+
+    # SQLite는 문자열을 UUID 컬럼에 바인딩하지 못하므로 UUID로 전달
+    created_id = uuid.UUID(created.id)
+    await community.update_post(created_id, user.id, CommunityPostUpdate(tags=["하늘"]), db)
+    page = await community.get_posts(skip=0, limit=20, db=db, tags_filter=["숲", "하늘"], tags_match="any")
+    assert page["total_count"] == 13 and page["posts"][0]["id"] == str(created.id)
+
+    await community.delete_post(created_id, user.id, db)
+    assert (await community.get_popular_tags(db))[1] == {"tag": "하늘", "count": 8}
+
+    # 다른 프로세스의 색인은 로그가 잘려 읽지 못한 변경이 있으면 DB에서 다시 만듦
+    other = TagIndexService()
+    await other.ensure_current(db)
+    last_seen = other.last_change_id
+    for _ in range(3):
+        await service.publish("delete", uuid.uuid4())
+    fake.store[TAG_INDEX_CHANGES_KEY] = fake.store[TAG_INDEX_CHANGES_KEY][-2:]
+    with patch.object(other, "_build", wraps=other._build) as build:
+        await other.ensure_current(db)
+    build.assert_called_once()
+    assert other.last_change_id != last_seen and len(other.posts) == 20
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_rebuild_once(db, user, index):
+    service, _ = index
+    with patch.object(service, "_build", wraps=service._build) as build:
+        await asyncio.gather(*[service.ensure_current(db) for _ in range(3)])
+    build.assert_called_once()
+    assert len(service.posts) == 20
+
+@pytest.mark.asyncio
+async def test_search_tag_facets(db, user, index, monkeypatch):
+    monkeypatch.setattr(settings, "COMMUNITY_TAG_FACET_LIMIT", 2)
+    result = await CommunityService().search_posts("이야기 1", db)
+    # "꿈 이야기 1", "꿈 이야기 10" ~ "꿈 이야기 19"
+    assert result["total_count"] == 11
+    assert result["tag_facets"] == [{"tag": "바다", "count": 7}, {"tag": "하늘", "count": 5}]
+
+    # 패싯은 최신 COMMUNITY_TAG_FACET_SCAN_LIMIT개 결과 안에서만 계산 ("꿈 이야기 19" ~ "꿈 이야기 16")
+    monkeypatch.setattr(settings, "COMMUNITY_TAG_FACET_SCAN_LIMIT", 4)
+    result = await CommunityService().search_posts("이야기 1", db)
+    assert result["total_count"] == 11
+    assert result["tag_facets"] == [{"tag": "바다", "count": 2}, {"tag": "하늘", "count": 2}]
@@ -0,0 +1,155 @@
+"""
+커뮤니티 인기 순위와 참여 카운터 write-behind 테스트
+"""
+import time
+import uuid
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from app.models.community import CommunityPost
+from app.core.config import settings
+from app.schemas.community import CommunityPostCreate
+from app.services.community_service import CommunityService, post_cache_key
+from app.services.trending_service import (
+    TrendingService, ENGAGEMENT_FLUSH_LOCK_KEY, FLUSHING_BATCH_KEY, FLUSHING_ENGAGEMENT_KEY, PENDING_ENGAGEMENT_KEY,
+    TRENDING_DECAYED_AT_KEY, TRENDING_POSTS_KEY, TRENDING_SEEDED_KEY, TRENDING_TAGS_KEY
+)
+
+@pytest.fixture
+def redis(fake_redis):
+    service = TrendingService()
+    with patch("app.services.community_service.trending_service", service):
+        yield fake_redis, service
+
+async def create_posts(community, user, db, count):
+    posts = []
+    for i in range(count):
+        posts.append(await community.create_post(
+            user.id, CommunityPostCreate(content=f"꿈 이야기 {i} 입니다", tags=["바다"] if i % 2 else ["숲"]), db
+        ))
+    return [uuid.UUID(post.id) for post in posts]
+
+@pytest.mark.asyncio
+async def test_trending_feed_ranked_by_engagement(db, user, redis):
+    fake, _ = redis
+    community = CommunityService()
+    first, second, third = await create_posts(community, user, db, 3)
+
+    for _ in range(2):
+        await community.get_post(second, db)
+    assert await community.add_reaction(third, str(user.id), db)
+    assert not await community.add_reaction(third, str(user.id), db)  # 같은 사용자 반응은 한 번만
+
+    page = await community.get_posts(skip=0, limit=2, db=db, sort="trending")
+    assert [post["id"] for post in page["posts"]] == [str(third), str(second)]
+    assert page["total_count"] == 3 and page["has_next"]
+    assert await community.get_trending_tags(db) == [{"tag": "숲", "score": 7.0}, {"tag": "바다", "score": 4.0}]
+
+    # 서비스 밖에서 삭제된 포스트 (사용자 탈퇴 등)는 본문 캐시 만료 뒤 응답에서 빠지고 순위에서도 제거
+    db.query(CommunityPost).filter(CommunityPost.id == third).delete()
+    db.commit()
+    del fake.store[post_cache_key(str(third))]
+    page = await community.get_posts(skip=0, limit=2, db=db, sort="trending")
+    assert [post["id"] for post in page["posts"]] == [str(second)]
+    assert str(third) not in fake.store[TRENDING_POSTS_KEY]
+
+    with pytest.raises(ValueError):
+        await community.get_posts(skip=0, limit=2, db=db, tags_filter=["바다"], sort="trending")
+
+@pytest.mark.asyncio
+async def test_empty_ranking_seeded_from_db(db, user, redis):
+    fake, _ = redis
+    community = CommunityService()
+    first, second = await create_posts(community, user, db, 2)
+    db.query(CommunityPost).filter(CommunityPost.id == first).update({"view_count": 5})
+    db.commit()
+    fake.store.clear()  # 배포 직후 / Redis 초기화
+
+    page = await community.get_posts(skip=0, limit=2, db=db, sort="trending")
+    assert [post["id"] for post in page["posts"]] == [str(first), str(second)]
+    assert set(fake.store[TRENDING_TAGS_KEY]) == {"숲", "바다"}
+
+@pytest.mark.asyncio
+async def test_empty_ranking_falls_back_to_latest(db, user, redis):
+    fake, _ = redis
+    db.add_all([
+        CommunityPost(user_id=user.id, content=f"오래된 꿈 이야기 {i}", tags=[], is_anonymous=True,
+                      created_at=datetime(2024, 1, 1) + timedelta(hours=i))
+        for i in range(3)
+    ])
+    db.commit()
+
+    # 오래된 포스트는 감쇠 후 최소 점수 미만이라 순위를 채우지 못하므로 최신순으로 응답
+    page = await CommunityService().get_posts(skip=0, limit=2, db=db, sort="trending")
+    assert [post["content"] for post in page["posts"]] == ["오래된 꿈 이야기 2", "오래된 꿈 이야기 1"]
+    assert TRENDING_POSTS_KEY not in fake.store and TRENDING_SEEDED_KEY in fake.store
+
+def test_decay_halves_scores_per_half_life(redis, monkeypatch):
+    fake, service = redis
+    monkeypatch.setattr(settings, "COMMUNITY_TRENDING_SIZE", 2)
+    fake.store[TRENDING_POSTS_KEY] = {"a": 8.0, "b": 4.0, "c": 2.0, "d": 0.015}
+    fake.store[TRENDING_TAGS_KEY] = {"바다": 6.0}
+
+    assert service.decay() == 1.0  # 첫 실행은 기준 시각만 기록
+    fake.store[TRENDING_DECAYED_AT_KEY] = str(time.time() - settings.COMMUNITY_TRENDING_HALF_LIFE)
+    assert service.decay() == pytest.approx(0.5, rel=1e-3)
+    # 최소 점수 미만(d)과 상위 COMMUNITY_TRENDING_SIZE개 밖(c)은 제거
+    assert fake.store[TRENDING_POSTS_KEY] == pytest.approx({"a": 4.0, "b": 2.0}, rel=1e-3)
+    assert fake.store[TRENDING_TAGS_KEY] == pytest.approx({"바다": 3.0}, rel=1e-3)
+
+@pytest.mark.asyncio
+async def test_engagement_counters_flushed_in_batch(db, user, redis):
+    fake, service = redis
+    community = CommunityService()
+    first, second = await create_posts(community, user, db, 2)
+    for _ in range(3):
+        await community.get_post(first, db)
+    await community.add_reaction(second, str(user.id), db)
+    # 이전 실행이 DB 반영 전에 실패해 남은 카운터
+    fake.store[FLUSHING_ENGAGEMENT_KEY] = {f"{second}:view": "5"}
+
+    assert service.flush_engagement(db) == 1
+    assert service.flush_engagement(db) == 2
+    assert service.flush_engagement(db) == 0
+    assert PENDING_ENGAGEMENT_KEY not in fake.store and FLUSHING_ENGAGEMENT_KEY not in fake.store
+
+    db.expire_all()
+    counts = {post.id: (post.view_count, post.reaction_count) for post in db.query(CommunityPost)}
+    assert counts == {first: (3, 0), second: (5, 1)}
+
+@pytest.mark.asyncio
+async def test_flush_not_reapplied_after_failure_before_cleanup(db, user, redis, monkeypatch):
+    fake, service = redis
+    community = CommunityService()
+    post_id, = await create_posts(community, user, db, 1)
+    await community.get_post(post_id, db)
+
+    # DB 커밋 후 FLUSHING 키를 지우기 전에 실패
+    delete = fake.delete
+    monkeypatch.setattr(fake, "delete", lambda *keys: (_ for _ in ()).throw(ConnectionError("redis down")))
+    with pytest.raises(ConnectionError):
+        service.flush_engagement(db)
+    monkeypatch.setattr(fake, "delete", delete)
+    assert FLUSHING_ENGAGEMENT_KEY in fake.store and FLUSHING_BATCH_KEY in fake.store
+    assert ENGAGEMENT_FLUSH_LOCK_KEY not in fake.store
+
+    assert service.flush_engagement(db) == 0
+    assert FLUSHING_ENGAGEMENT_KEY not in fake.store and FLUSHING_BATCH_KEY not in fake.store
+    db.expire_all()
+    assert db.get(CommunityPost, post_id).view_count == 1
+
+@pytest.mark.asyncio
+async def test_concurrent_flush_skipped_while_locked(db, user, redis):
+    fake, service = redis
+    community = CommunityService()
+    post_id, = await create_posts(community, user, db, 1)
+    await community.get_post(post_id, db)
+
+    fake.store[ENGAGEMENT_FLUSH_LOCK_KEY] = "other-worker"
+    assert service.flush_engagement(db) == 0
+    assert PENDING_ENGAGEMENT_KEY in fake.store
+    assert fake.store[ENGAGEMENT_FLUSH_LOCK_KEY] == "other-worker"
+
+    del fake.store[ENGAGEMENT_FLUSH_LOCK_KEY]
+    assert service.flush_engagement(db) == 1
+    assert ENGAGEMENT_FLUSH_LOCK_KEY not in fake.store
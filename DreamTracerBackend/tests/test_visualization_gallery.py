@@ -0,0 +1,130 @@
+"""
+시각화 갤러리 조회 테스트 (키셋 페이지네이션, 개수 캐시)
+"""
+import uuid
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models.user import User
+from app.models.dream import Dream
+from app.models.dream_analysis import DreamAnalysis  # noqa: F401 (관계 매핑 설정용)
+from app.models.dream_visualization import DreamVisualization
+from app.models.community import CommunityPost  # noqa: F401
+from app.services.visualization_service import (
+    VisualizationService, decode_gallery_cursor, encode_gallery_cursor, gallery_count_key
+)
+
+class FakeRedis:
+    """get/set/delete만 흉내내는 테스트용 Redis"""
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = str(value)
+        return True
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+class FakeAsyncRedis:
+    """같은 저장소를 쓰는 비동기 클라이언트"""
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def get(self, key):
+        return self.redis.get(key)
+
+    async def set(self, key, value, ex=None):
+        return self.redis.set(key, value, ex=ex)
+
+class TestVisualizationGallery:
+    def setup_method(self):
+        self.engine = create_engine("sqlite://")
+        tables = [User.__table__, Dream.__table__, DreamVisualization.__table__]
+        User.metadata.create_all(self.engine, tables=tables)
+        self.db = sessionmaker(bind=self.engine)()
+        self.service = VisualizationService.__new__(VisualizationService)
+        self.fake_redis = FakeRedis()
+
+        self.user = User(id=uuid.uuid4(), auth_provider="firebase")
+        other_user = User(id=uuid.uuid4(), auth_provider="firebase")
+        dreams = [
+            Dream(id=uuid.uuid4(), user_id=self.user.id, dream_date=date(2024, 1, 1), title=f"꿈 {i}")
+            for i in range(2)
+        ]
+        other_dream = Dream(id=uuid.uuid4(), user_id=other_user.id, dream_date=date(2024, 1, 1))
+        self.db.add_all([self.user, other_user, *dreams, other_dream])
+
+        started = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        # 같은 created_at을 가진 항목이 있어도 id로 순서가 정해지는지 확인
+        self.visualizations = [
+            DreamVisualization(
+                id=uuid.uuid4(), dream_id=dreams[i % 2].id, user_id=self.user.id, image_path=f"v{i}.jpg", art_style="surreal",
+                created_at=started + timedelta(minutes=i // 2)
+            )
+            for i in range(5)
+        ]
+        self.db.add_all(self.visualizations)
+        self.db.add(DreamVisualization(
+            dream_id=other_dream.id, user_id=other_user.id, image_path="other.jpg", art_style="anime", created_at=started
+        ))
+        self.db.commit()
+        self.user_id = self.user.id
+
+    def teardown_method(self):
+        self.db.close()
+
+    async def _page(self, **kwargs):
+        return await self.service.get_gallery_page(self.user_id, self.db, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_all_items_once(self):
+        seen = []
+        cursor = None
+        while True:
+            page = await self._page(limit=2, cursor=cursor)
+            seen.extend(row.id for row in page["visualizations"])
+            if not page["has_more"]:
+                assert page["next_cursor"] is None
+                break
+            cursor = page["next_cursor"]
+
+        expected = sorted(self.visualizations, key=lambda v: (v.created_at, v.id), reverse=True)
+        assert seen == [v.id for v in expected]
+
+    @pytest.mark.asyncio
+    async def test_page_is_single_query_with_dream_title(self):
+        statements = []
+        event.listen(self.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        page = await self._page(limit=20)
+
+        assert len(statements) == 1
+        assert {row.dream_title for row in page["visualizations"]} == {"꿈 0", "꿈 1"}
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached_and_invalidated(self):
+        with patch("app.services.visualization_service.redis_client", self.fake_redis), \
+                patch("app.services.visualization_service.async_redis_client", FakeAsyncRedis(self.fake_redis)):
+            assert await self.service.get_gallery_count(self.user_id, self.db) == 5
+            assert self.fake_redis.get(gallery_count_key(str(self.user_id))) == "5"
+
+            # 캐시된 값은 DB를 다시 조회하지 않음
+            self.fake_redis.set(gallery_count_key(str(self.user_id)), 7)
+            assert await self.service.get_gallery_count(self.user_id, self.db) == 7
+
+            self.service.invalidate_gallery_count(str(self.user_id))
+            assert await self.service.get_gallery_count(self.user_id, self.db) == 5
+
+    def test_cursor_round_trip_and_invalid_cursor(self):
+        created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        visualization_id = uuid.uuid4()
+
+        assert decode_gallery_cursor(encode_gallery_cursor(created_at, visualization_id)) == (created_at, visualization_id)
+        with pytest.raises(ValueError):
+            decode_gallery_cursor("not-a-cursor")
@@ -0,0 +1,147 @@
+"""
+시각화 작업 관리 서비스 테스트
+"""
+import pytest
+from unittest.mock import Mock, patch
+from app.services.visualization_job_service import VisualizationJobService
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+
+    def hset(self, key, mapping):
+        self.redis.hashes.setdefault(key, {}).update({k: str(v) for k, v in mapping.items()})
+
+    def expire(self, key, ttl):
+        pass
+
+    def execute(self):
+        pass
+
+class FakeRedis:
+    """SET NX/XX와 해시만 흉내내는 테스트용 Redis"""
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.hashes = {}
+
+    def set(self, key, value, nx=False, xx=False, ex=None):
+        if (nx and key in self.store) or (xx and key not in self.store):
+            return None
+        self.store[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def delete(self, key):
+        self.store.pop(key, None)
+
+    def eval(self, script, numkeys, key, value):
+        """RELEASE_KEY_SCRIPT (값이 같을 때만 삭제)"""
+        if self.store.get(key) == value:
+            del self.store[key]
+            return 1
+        return 0
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+class TestVisualizationJobService:
+    def setup_method(self):
+        self.service = VisualizationJobService()
+        self.mock_db = Mock()
+        self.dream = Mock(
+            id="dream-123", user_id="user-1", title="바다 꿈", body_text="바다에서 수영하는 꿈",
+            dream_type="normal", location="바다", emotion_tags=["happy"], characters=[], symbols=["물"]
+        )
+        self.fake_redis = FakeRedis()
+        self.mock_tasks = Mock()
+
+    def _enqueue(self, art_style="surreal"):
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis), \
+             patch.dict("sys.modules", {"app.workers.visualization_tasks": self.mock_tasks}):
+            return self.service.enqueue(self.dream, art_style, self.mock_db)
+
+    def test_duplicate_requests_share_job(self):
+        """같은 꿈/스타일/내용의 중복 요청은 같은 작업 ID를 공유"""
+        first_id, first_created = self._enqueue()
+        second_id, second_created = self._enqueue()
+
+        assert first_created is True
+        assert second_created is False
+        assert first_id == second_id
+        self.mock_tasks.generate_visualization_task.apply_async.assert_called_once()
+        assert self.fake_redis.hashes[self.service.status_key(first_id)]["user_id"] == "user-1"
+
+    def test_style_or_content_change_creates_new_job(self):
+        """스타일이나 내용이 바뀌면 새 작업 생성"""
+        first_id, _ = self._enqueue()
+        other_style_id, other_style_created = self._enqueue(art_style="watercolor")
+        self.dream.symbols = ["물", "배"]
+        changed_id, changed_created = self._enqueue()
+
+        assert other_style_created is True and changed_created is True
+        assert len({first_id, other_style_id, changed_id}) == 3
+
+    def test_key_held_through_queue_wait_and_refreshed_on_start(self):
+        """큐 대기 동안 키를 유지하고 작업이 시작되면 실행 시간 기준으로 다시 설정"""
+        job_id, _ = self._enqueue()
+        key = next(iter(self.fake_redis.store))
+        assert self.fake_redis.ttls[key] == self.service.queue_lock_ttl
+
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis):
+            self.service.start(job_id, key)
+        assert self.fake_redis.ttls[key] == self.service.lock_ttl
+        assert self.fake_redis.hashes[self.service.status_key(job_id)]["stage"] == "generating"
+
+    def test_completed_result_is_reused_until_deleted(self):
+        """완료된 결과는 재사용하고, 결과 시각화가 삭제되었으면 새 작업 생성"""
+        job_id, _ = self._enqueue()
+        key = next(iter(self.fake_redis.store))
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis):
+            self.service.complete(job_id, key, "viz-1")
+
+        self.mock_db.query.return_value.filter.return_value.first.return_value = ("viz-1",)
+        reused_id, reused_created = self._enqueue()
+        assert (reused_id, reused_created) == (job_id, False)
+
+        self.mock_db.query.return_value.filter.return_value.first.return_value = None
+        new_id, new_created = self._enqueue()
+        assert new_created is True
+        assert new_id != job_id
+
+    def test_failed_job_releases_key(self):
+        """실패한 작업은 키를 해제해 재요청 허용"""
+        job_id, _ = self._enqueue()
+        key = next(iter(self.fake_redis.store))
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis):
+            self.service.fail(job_id, key, "gemini error")
+
+        assert self.fake_redis.store == {}
+        assert self.fake_redis.hashes[self.service.status_key(job_id)]["stage"] == "failed"
+
+    def test_stale_job_does_not_release_newer_key(self):
+        """실패한 작업의 키를 다른 요청이 이미 새 작업으로 바꿨으면 그 키는 그대로 둠"""
+        failed_id, _ = self._enqueue()
+        key = next(iter(self.fake_redis.store))
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis):
+            self.service.update_status(failed_id, 'failed')
+        retried_id, retried_created = self._enqueue()
+        assert retried_created is True and self.fake_redis.store[key] == retried_id
+
+        # 늦게 도착한 이전 작업의 실패 처리
+        with patch("app.services.visualization_job_service.redis_client", self.fake_redis):
+            self.service.fail(failed_id, key, "gemini error")
+        assert self.fake_redis.store[key] == retried_id
+
+    def test_key_released_when_enqueue_fails(self):
+        """큐 추가 실패 시 키 해제"""
+        self.mock_tasks.generate_visualization_task.apply_async.side_effect = RuntimeError("broker down")
+        with pytest.raises(RuntimeError):
+            self._enqueue()
+        assert self.fake_redis.store == {}
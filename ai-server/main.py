@@ -13,6 +13,8 @@ import os
 from dotenv import load_dotenv
 import httpx
 import json
+import time
+from metrics import setup_metrics, observe_llm_call
 
 # 환경 변수 로드
 load_dotenv()
@@ -36,9 +38,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus 메트릭 (/metrics)
+setup_metrics(app)
+
 # OpenRouter 설정
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
 
 # 무료 모델 목록
 FREE_MODELS = {
@@ -102,6 +107,7 @@ class OpenRouterClient:
     
     async def chat_completion(self, model: str, messages: List[Dict], max_tokens: int = 200):
         """OpenRouter 채팅 완성 API 호출"""
+        started_at = time.perf_counter()
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -116,6 +122,7 @@ class OpenRouterClient:
                     timeout=30.0
                 )
                 
+                observe_llm_call("openrouter", model, started_at, response.status_code == 200)
                 if response.status_code == 200:
                     return response.json()
                 else:
@@ -123,6 +130,7 @@ class OpenRouterClient:
                     return None
                     
         except Exception as e:
+            observe_llm_call("openrouter", model, started_at, False)
             logger.error(f"OpenRouter API 호출 실패: {e}")
             return None
     
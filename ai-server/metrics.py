@@ -0,0 +1,86 @@
+"""
+꿈결 AI 서버 Prometheus 메트릭
+요청 지연 시간, 처리 중인 요청 수, OpenRouter 호출 시간 수집
+"""
+from prometheus_client import (
+    Counter, Gauge, Histogram, CollectorRegistry, CONTENT_TYPE_LATEST, REGISTRY, generate_latest
+)
+from fastapi import FastAPI, Response
+import os
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LLM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "ggumgyeol_ai_http_request_duration_seconds",
+    "HTTP 요청 처리 시간",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "ggumgyeol_ai_http_requests_in_progress",
+    "처리 중인 HTTP 요청 수",
+    ["method"],
+    multiprocess_mode="livesum"
+)
+LLM_CALL_DURATION = Histogram(
+    "ggumgyeol_ai_llm_call_duration_seconds",
+    "LLM API 호출 시간",
+    ["provider", "model"],
+    buckets=LLM_BUCKETS
+)
+LLM_CALL_ERRORS = Counter(
+    "ggumgyeol_ai_llm_call_errors_total",
+    "LLM API 호출 실패 수",
+    ["provider", "model"]
+)
+
+def observe_llm_call(provider: str, model: str, started_at: float, ok: bool) -> None:
+    """LLM 호출 결과 기록 (started_at은 time.perf_counter() 값)"""
+    LLM_CALL_DURATION.labels(provider, model).observe(time.perf_counter() - started_at)
+    if not ok:
+        LLM_CALL_ERRORS.labels(provider, model).inc()
+
+class PrometheusMiddleware:
+    """요청별 지연 시간/처리 중인 요청 수 수집 (라우트 템플릿 기준 라벨)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.labels(method).inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUEST_DURATION.labels(method, route, str(status["code"])).observe(time.perf_counter() - start)
+            HTTP_REQUESTS_IN_PROGRESS.labels(method).dec()
+
+def setup_metrics(app: FastAPI) -> None:
+    """미들웨어와 /metrics 엔드포인트 등록"""
+    registry = REGISTRY
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
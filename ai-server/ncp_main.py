@@ -13,8 +13,10 @@ import os
 from dotenv import load_dotenv
 import httpx
 import json
-import boto3
+import time
 from botocore.exceptions import ClientError
+from storage import create_object_storage
+from metrics import setup_metrics, observe_llm_call
 
 # 환경 변수 로드
 load_dotenv()
@@ -38,23 +40,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus 메트릭 (/metrics)
+setup_metrics(app)
+
 # NCP 설정
 NCP_ACCESS_KEY = os.getenv("NCP_ACCESS_KEY")
 NCP_SECRET_KEY = os.getenv("NCP_SECRET_KEY")
 NCP_REGION = os.getenv("NCP_REGION", "KR")
 
-# NCP Object Storage 클라이언트
-ncp_s3 = boto3.client(
-    's3',
-    endpoint_url=f'https://kr.object.ncloudstorage.com',
-    aws_access_key_id=NCP_ACCESS_KEY,
-    aws_secret_access_key=NCP_SECRET_KEY,
-    region_name=NCP_REGION
-)
+# NCP Object Storage (STORAGE_BACKEND=local 이면 로컬 파일시스템)
+object_storage = create_object_storage()
 
 # OpenRouter 설정
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
 
 # 무료 모델 목록
 FREE_MODELS = {
@@ -121,6 +120,7 @@ class OpenRouterClient:
     
     async def chat_completion(self, model: str, messages: List[Dict], max_tokens: int = 200):
         """OpenRouter 채팅 완성 API 호출"""
+        started_at = time.perf_counter()
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
@@ -135,6 +135,7 @@ class OpenRouterClient:
                     timeout=30.0
                 )
                 
+                observe_llm_call("openrouter", model, started_at, response.status_code == 200)
                 if response.status_code == 200:
                     return response.json()
                 else:
@@ -142,6 +143,7 @@ class OpenRouterClient:
                     return None
                     
         except Exception as e:
+            observe_llm_call("openrouter", model, started_at, False)
             logger.error(f"OpenRouter API 호출 실패: {e}")
             return None
     
@@ -151,27 +153,21 @@ class OpenRouterClient:
             # 이미지 생성 (시뮬레이션)
             image_data = f"Generated image for: {prompt}"
             
-            # NCP Object Storage에 저장
-            bucket_name = "ggumgyeol-dream-images"
-            object_key = f"dreams/{datetime.now().strftime('%Y/%m/%d')}/{hash(prompt)}.jpg"
-            
+            # NCP Object Storage에 저장 (콘텐츠 해시 키, 동일 이미지는 재업로드 생략)
             try:
-                ncp_s3.put_object(
-                    Bucket=bucket_name,
-                    Key=object_key,
-                    Body=image_data.encode('utf-8'),
-                    ContentType='image/jpeg'
+                stored = await object_storage.put(
+                    image_data.encode('utf-8'),
+                    content_type='image/jpeg',
+                    prefix="dreams"
                 )
-                
-                # 공개 URL 생성
-                image_url = f"https://kr.object.ncloudstorage.com/{bucket_name}/{object_key}"
+                image_url = stored.url
                 
                 return {
                     "image_url": image_url,
                     "ncp_storage_url": image_url,
                     "description": f"꿈의 시각화: {prompt[:50]}..."
                 }
-            except ClientError as e:
+            except (ClientError, OSError) as e:
                 logger.error(f"NCP Object Storage 오류: {e}")
                 # 폴백: 기본 이미지 URL
                 return {
@@ -0,0 +1,181 @@
+"""
+꿈결 오브젝트 스토리지 계층
+콘텐츠 주소 지정(SHA-256) 기반 비동기 업로드 (NCP Object Storage / 로컬 파일시스템)
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import hashlib
+import io
+import logging
+import os
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# 멀티파트 업로드 기준 크기 (이 크기 이상이면 파트 단위로 나눠 업로드)
+MULTIPART_THRESHOLD = int(os.getenv("STORAGE_MULTIPART_THRESHOLD", 8 * 1024 * 1024))
+MULTIPART_CHUNKSIZE = int(os.getenv("STORAGE_MULTIPART_CHUNKSIZE", 8 * 1024 * 1024))
+
+# 블로킹 스토리지 호출 전용 스레드 풀 (이벤트 루프 보호)
+_storage_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("STORAGE_MAX_WORKERS", 8)),
+    thread_name_prefix="storage"
+)
+
+CONTENT_TYPE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+    "audio/wav": "wav",
+    "audio/mpeg": "mp3",
+}
+
+def content_hash(data: bytes) -> str:
+    """데이터의 SHA-256 해시 (hex)"""
+    return hashlib.sha256(data).hexdigest()
+
+def content_key(digest: str, prefix: str, content_type: str) -> str:
+    """콘텐츠 주소 기반 오브젝트 키 생성 (동일 데이터는 항상 동일 키)"""
+    extension = CONTENT_TYPE_EXTENSIONS.get(content_type, "bin")
+    # 앞 2자리로 디렉토리를 분산해 한 경로에 파일이 몰리지 않게 함
+    return f"{prefix.strip('/')}/{digest[:2]}/{digest}.{extension}"
+
+@dataclass
+class StoredObject:
+    key: str
+    url: str
+    sha256: str
+    size: int
+    deduplicated: bool  # 이미 존재해 업로드를 건너뛴 경우 True
+
+class ObjectStorage(ABC):
+    """오브젝트 스토리지 공통 인터페이스 (백엔드는 _exists/_write/url_for 구현)"""
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_storage_executor, lambda: func(*args, **kwargs))
+
+    @abstractmethod
+    def _exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        ...
+
+    @abstractmethod
+    def url_for(self, key: str) -> str:
+        ...
+
+    async def exists(self, key: str) -> bool:
+        """오브젝트 존재 여부 확인"""
+        return await self._run(self._exists, key)
+
+    async def put(self, data: bytes, content_type: str, prefix: str = "objects") -> StoredObject:
+        """
+        콘텐츠 주소 기반 업로드
+        이미 같은 해시의 오브젝트가 있으면 업로드를 건너뜀
+        """
+        digest = content_hash(data)
+        key = content_key(digest, prefix, content_type)
+
+        if await self.exists(key):
+            logger.info(f"중복 오브젝트 업로드 생략: {key}")
+            return StoredObject(key=key, url=self.url_for(key), sha256=digest, size=len(data), deduplicated=True)
+
+        await self._run(self._write, key, data, content_type)
+        logger.info(f"오브젝트 업로드 완료: {key} ({len(data)} bytes)")
+        return StoredObject(key=key, url=self.url_for(key), sha256=digest, size=len(data), deduplicated=False)
+
+class S3ObjectStorage(ObjectStorage):
+    """S3 호환 스토리지 (NCP Object Storage)"""
+
+    def __init__(self, client, bucket: str, public_base_url: str):
+        from boto3.s3.transfer import TransferConfig
+
+        self.client = client
+        self.bucket = bucket
+        self.public_base_url = public_base_url.rstrip("/")
+        self.transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            use_threads=False  # 이미 전용 스레드 풀에서 실행됨
+        )
+
+    def _exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        # upload_fileobj는 임계값 이상이면 자동으로 멀티파트 업로드를 사용
+        self.client.upload_fileobj(
+            io.BytesIO(data),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=self.transfer_config
+        )
+
+    def url_for(self, key: str) -> str:
+        return f"{self.public_base_url}/{self.bucket}/{key}"
+
+class LocalObjectStorage(ObjectStorage):
+    """로컬 파일시스템 스토리지 (개발/테스트용)"""
+
+    def __init__(self, root: str, public_base_url: Optional[str] = None):
+        self.root = root
+        self.public_base_url = (public_base_url or f"file://{os.path.abspath(root)}").rstrip("/")
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, *key.split("/"))
+
+    def _exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def _write(self, key: str, data: bytes, content_type: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체해 부분 기록된 파일이 노출되지 않게 함
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def url_for(self, key: str) -> str:
+        return f"{self.public_base_url}/{key}"
+
+def create_object_storage() -> ObjectStorage:
+    """환경 변수(STORAGE_BACKEND)에 따라 스토리지 백엔드 생성"""
+    backend = os.getenv("STORAGE_BACKEND", "ncp").lower()
+
+    if backend == "local":
+        return LocalObjectStorage(
+            root=os.getenv("LOCAL_STORAGE_ROOT", "./storage"),
+            public_base_url=os.getenv("LOCAL_STORAGE_BASE_URL")
+        )
+
+    import boto3
+
+    endpoint_url = os.getenv("NCP_STORAGE_ENDPOINT", "https://kr.object.ncloudstorage.com")
+    client = boto3.client(
+        's3',
+        endpoint_url=endpoint_url,
+        aws_access_key_id=os.getenv("NCP_ACCESS_KEY"),
+        aws_secret_access_key=os.getenv("NCP_SECRET_KEY"),
+        region_name=os.getenv("NCP_REGION", "KR")
+    )
+    return S3ObjectStorage(
+        client=client,
+        bucket=os.getenv("NCP_STORAGE_BUCKET", "ggumgyeol-dream-images"),
+        public_base_url=endpoint_url
+    )
@@ -0,0 +1,46 @@
+"""
+오브젝트 스토리지 테스트 (로컬 백엔드)
+"""
+import asyncio
+import os
+import pytest
+from storage import LocalObjectStorage, ObjectStorage, content_key
+
+class CountingStorage(LocalObjectStorage):
+    """실제 기록 횟수를 세는 로컬 스토리지"""
+    def __init__(self, root):
+        super().__init__(root, public_base_url="https://cdn.example.com")
+        self.writes = 0
+
+    def _write(self, key, data, content_type):
+        self.writes += 1
+        super()._write(key, data, content_type)
+
+def test_same_bytes_written_once_with_same_url(tmp_path):
+    storage = CountingStorage(str(tmp_path))
+    data = b"dream image bytes"
+
+    first = asyncio.run(storage.put(data, "image/png", prefix="dreams"))
+    second = asyncio.run(storage.put(data, "image/png", prefix="dreams"))
+
+    assert storage.writes == 1
+    assert (first.deduplicated, second.deduplicated) == (False, True)
+    assert first.key == second.key == content_key(first.sha256, "dreams", "image/png")
+    assert first.url == second.url == f"https://cdn.example.com/{first.key}"
+    with open(os.path.join(tmp_path, *first.key.split("/")), "rb") as f:
+        assert f.read() == data
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")]
+
+    other = asyncio.run(storage.put(b"other bytes", "image/png", prefix="dreams"))
+    assert storage.writes == 2 and other.key != first.key
+
+def test_incomplete_backend_fails_on_creation():
+    class MissingWrite(ObjectStorage):
+        def _exists(self, key):
+            return False
+
+        def url_for(self, key):
+            return key
+
+    with pytest.raises(TypeError):
+        MissingWrite()
@@ -0,0 +1,3 @@
+"""
+꿈결 종단 간 부하 테스트 (가짜 LLM/임베딩 백엔드로 오프라인 실행)
+"""
@@ -0,0 +1,138 @@
+"""
+꿈결 종단 간 부하 테스트 실행
+
+사용법 (저장소 루트에서, 백엔드는 가짜 LLM 서버와 해싱 인코더로 실행):
+    python -m loadtest.fake_llm --port 8600 &
+    GEMINI_API_ENDPOINT=http://localhost:8600 EMBEDDING_BACKEND=hashing uvicorn main:app  # DreamTracerBackend
+    python -m loadtest --users 50 --duration 120 --ramp-up 20 -o loadtest.json
+    python -m loadtest --wait-mode stream --weights analyze=1,dashboard=1
+"""
+from loadtest.scenarios import ScenarioConfig, VirtualUser, parse_weights
+from loadtest.stats import StatsCollector, format_summary
+from datetime import datetime
+from typing import Any, Dict, Optional
+import argparse
+import asyncio
+import httpx
+import json
+import platform
+import random
+import sys
+import time
+import uuid
+
+async def fetch_fake_llm_stats(url: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not url:
+        return None
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            return (await client.get(f"{url}/_fake/stats")).json()
+    except httpx.HTTPError as e:
+        print(f"가짜 LLM 서버 통계 조회 실패: {e}")
+        return None
+
+async def run(args) -> Dict[str, Any]:
+    config = ScenarioConfig(
+        base_url=args.base_url.rstrip("/"),
+        ai_server_url=args.ai_server_url.rstrip("/") if args.ai_server_url else None,
+        wait_mode=args.wait_mode,
+        poll_interval=args.poll_interval,
+        analysis_timeout=args.analysis_timeout,
+        think_time=args.think_time,
+    )
+    if args.weights:
+        config.weights.update(parse_weights(args.weights))
+
+    stats = StatsCollector()
+    run_id = args.run_id or uuid.uuid4().hex[:8]
+    limits = httpx.Limits(max_connections=args.users * 4, max_keepalive_connections=args.users * 4)
+    deadline = time.monotonic() + args.ramp_up + args.duration
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        async def start_user(index: int) -> None:
+            # 램프업 구간에 사용자를 균등하게 투입
+            await asyncio.sleep(args.ramp_up * index / args.users)
+            user = VirtualUser(index, run_id, client, stats, config, random.Random(f"{args.seed}-{index}"))
+            await user.run(deadline)
+
+        async def report_progress() -> None:
+            while True:
+                await asyncio.sleep(10)
+                total = stats.summary()["total"]
+                print(f"[{stats.duration:6.0f}s] 요청 {total['requests']:,}건, {total['throughput']:.1f} req/s, "
+                      f"p95 {total['p95'] * 1000:.0f}ms, 오류율 {total['error_rate']:.2%}")
+
+        async def discard_ramp_up() -> None:
+            await asyncio.sleep(args.ramp_up)
+            stats.reset()
+
+        background = [asyncio.create_task(report_progress())]
+        if args.exclude_ramp_up and args.ramp_up > 0:
+            background.append(asyncio.create_task(discard_ramp_up()))
+        try:
+            await asyncio.gather(*(start_user(index) for index in range(args.users)))
+        finally:
+            stats.stop()
+            for task in background:
+                task.cancel()
+
+    return {
+        "metadata": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "run_id": run_id,
+            "base_url": config.base_url,
+            "ai_server_url": config.ai_server_url,
+            "users": args.users,
+            "duration": args.duration,
+            "ramp_up": args.ramp_up,
+            "think_time": args.think_time,
+            "wait_mode": args.wait_mode,
+            "weights": config.weights,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "fake_llm": await fetch_fake_llm_stats(args.fake_llm_url),
+        **stats.summary(),
+    }
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="꿈결 종단 간 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000", help="백엔드 API 주소")
+    parser.add_argument("--ai-server-url", help="ai-server 주소 (지정 시 ai_server 시나리오 포함)")
+    parser.add_argument("--fake-llm-url", default="http://localhost:8600", help="결과에 포함할 가짜 LLM 서버 통계 주소")
+    parser.add_argument("-u", "--users", type=int, default=20, help="동시 가상 사용자 수")
+    parser.add_argument("-d", "--duration", type=float, default=60.0, help="램프업 이후 측정 시간 (초)")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="사용자 투입 시간 (초)")
+    parser.add_argument("--exclude-ramp-up", action="store_true", help="램프업 구간 결과 제외")
+    parser.add_argument("--think-time", type=float, default=1.0, help="시나리오 사이 평균 대기 시간 (초)")
+    parser.add_argument("--wait-mode", choices=["poll", "stream"], default="poll", help="분석 완료 대기 방식")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    parser.add_argument("--analysis-timeout", type=float, default=120.0, help="분석 완료 대기 최대 시간 (초)")
+    parser.add_argument("--weights", help="시나리오 가중치 (예: record=3,analyze=2,feed=4,dashboard=3,ai_server=1)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청별 타임아웃 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--run-id", help="가상 사용자 이메일 구분자 (같은 값이면 기존 사용자 재사용)")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--max-error-rate", type=float, help="전체 오류율이 이 값을 넘으면 종료 코드 1 (CI용)")
+    args = parser.parse_args(argv)
+
+    print(f"가상 사용자 {args.users}명, 램프업 {args.ramp_up:.0f}s + 측정 {args.duration:.0f}s → {args.base_url}")
+    report = asyncio.run(run(args))
+
+    print()
+    print(format_summary(report))
+    if report["fake_llm"]:
+        print(f"\n가짜 LLM 응답: {report['fake_llm']['counts']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.max_error_rate is not None and report["total"]["error_rate"] > args.max_error_rate:
+        print(f"\n오류율 {report['total']['error_rate']:.2%} > 허용 {args.max_error_rate:.2%}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+가짜 LLM 서버 (Gemini generateContent + OpenAI 호환 chat/completions)
+
+실제 API 대신 지연 시간/오류 분포를 설정할 수 있는 응답을 돌려줌
+- 지연 시간: 중앙값과 p99로 정한 로그정규분포
+- 오류: 500 비율, 429(레이트 리밋) 비율, 타임아웃(응답 지연) 비율
+
+사용법 (저장소 루트에서):
+    python -m loadtest.fake_llm --port 8600 --latency-median 0.8 --latency-p99 5 --error-rate 0.02
+
+백엔드: GEMINI_API_ENDPOINT=http://localhost:8600
+ai-server: OPENROUTER_BASE_URL=http://localhost:8600/api/v1
+
+실행 중 설정 변경/통계 조회:
+    curl -X POST localhost:8600/_fake/config -d '{"error_rate": 0.1}' -H 'Content-Type: application/json'
+    curl localhost:8600/_fake/stats
+"""
+from collections import Counter
+from dataclasses import asdict, dataclass
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from typing import Any, Callable, Dict, Optional
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+
+# 정규분포 99 백분위수의 z값
+Z_99 = 2.326
+
+@dataclass
+class FaultConfig:
+    latency_median: float = 0.8  # 초
+    latency_p99: float = 5.0
+    error_rate: float = 0.0  # 500 응답 비율
+    rate_limit_rate: float = 0.0  # 429 응답 비율
+    timeout_rate: float = 0.0  # hang_seconds 동안 응답하지 않는 비율
+    hang_seconds: float = 60.0
+    seed: Optional[int] = None
+
+class FakeLLM:
+    def __init__(self, config: FaultConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.counts: Counter = Counter()
+        self.started_at = time.time()
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            if not hasattr(self.config, key):
+                raise ValueError(f"알 수 없는 설정: {key}")
+            if key == "seed":
+                self.config.seed = value
+                self.rng.seed(value)
+            else:
+                setattr(self.config, key, float(value))
+
+    def latency(self) -> float:
+        config = self.config
+        if config.latency_median <= 0:
+            return 0.0
+        sigma = max(math.log(max(config.latency_p99, config.latency_median) / config.latency_median), 0.0) / Z_99
+        return self.rng.lognormvariate(math.log(config.latency_median), sigma)
+
+    def outcome(self) -> str:
+        """ok | error | rate_limited | timeout"""
+        roll = self.rng.random()
+        for name, rate in (
+            ("timeout", self.config.timeout_rate),
+            ("rate_limited", self.config.rate_limit_rate),
+            ("error", self.config.error_rate),
+        ):
+            if roll < rate:
+                return name
+            roll -= rate
+        return "ok"
+
+    async def respond(self, api: str, body: Callable[[], Dict[str, Any]]) -> JSONResponse:
+        outcome = self.outcome()
+        self.counts[f"{api}.{outcome}"] += 1
+
+        if outcome == "timeout":
+            await asyncio.sleep(self.config.hang_seconds)
+            return JSONResponse({"error": {"code": 504, "message": "fake timeout"}}, status_code=504)
+
+        await asyncio.sleep(self.latency())
+        if outcome == "rate_limited":
+            return JSONResponse(
+                {"error": {"code": 429, "message": "fake rate limit", "status": "RESOURCE_EXHAUSTED"}},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+        if outcome == "error":
+            return JSONResponse({"error": {"code": 500, "message": "fake error", "status": "INTERNAL"}}, status_code=500)
+        return JSONResponse(body())
+
+def fake_completion(prompt: str) -> str:
+    """프롬프트가 요구하는 JSON 형식에 맞춘 그럴듯한 응답 텍스트"""
+    if '"summary"' in prompt:
+        return json.dumps({
+            "summary": "낯선 바닷가를 걸으며 오래된 친구를 찾는 꿈입니다. 잃어버린 관계에 대한 그리움이 드러납니다.",
+            "keywords": ["바다", "친구", "길", "그리움", "파도"],
+            "emotional_flow": "처음에는 불안했지만 친구를 만난 뒤 안도감으로 바뀌었습니다.",
+        }, ensure_ascii=False)
+    if '"symbols"' in prompt:
+        return json.dumps({
+            "symbols": [
+                {"symbol": "바다", "interpretation": "무의식과 감정의 깊이", "significance": "억눌린 감정의 표현"},
+                {"symbol": "길", "interpretation": "삶의 방향", "significance": "선택에 대한 고민"},
+            ]
+        }, ensure_ascii=False)
+    if '"insight"' in prompt:
+        return json.dumps({
+            "insight": "최근 꿈에서 물과 이동에 관한 상징이 반복됩니다. 변화에 대한 기대와 불안이 함께 나타납니다.",
+            "pattern": "이동과 탐색",
+            "recommendation": "잠들기 전 하루의 감정을 짧게 적어보세요.",
+        }, ensure_ascii=False)
+    if "JSON" in prompt:
+        # ai-server 분석 프롬프트 (한국어 키)
+        return json.dumps({
+            "요약": "하늘을 나는 꿈으로 자유에 대한 열망이 드러납니다.",
+            "키워드": ["하늘", "비행", "자유"],
+            "감정 톤": "긍정적",
+            "상징": [{"symbol": "하늘", "meaning": "가능성"}],
+            "테마": ["자유"],
+            "인사이트": ["새로운 시도를 준비하고 있습니다."],
+            "반성 질문": ["지금 가장 벗어나고 싶은 것은 무엇인가요?"],
+            "꿈 타입": "일반몽",
+            "명료도 점수": 0.6,
+            "감정 강도": 0.7,
+        }, ensure_ascii=False)
+    if "영어로 작성" in prompt:
+        return "A lone figure walking along a misty shoreline at dusk, soft waves, glowing lanterns, dreamlike atmosphere"
+    return "이 꿈에서 찾고 있던 사람은 지금 당신에게 어떤 의미인가요?"
+
+def _gemini_prompt(payload: Dict[str, Any]) -> str:
+    return "\n".join(
+        part.get("text", "")
+        for content in payload.get("contents", [])
+        for part in content.get("parts", [])
+    )
+
+def _chat_prompt(payload: Dict[str, Any]) -> str:
+    return "\n".join(str(message.get("content", "")) for message in payload.get("messages", []))
+
+def create_app(config: FaultConfig) -> FastAPI:
+    fake = FakeLLM(config)
+    app = FastAPI(title="가짜 LLM 서버")
+    app.state.fake = fake
+
+    # Gemini: POST /v1beta/models/gemini-pro:generateContent
+    @app.post("/{version}/models/{model_action}")
+    async def generate_content(version: str, model_action: str, request: Request):
+        model, _, action = model_action.partition(":")
+        if action != "generateContent":
+            return JSONResponse({"error": {"code": 404, "message": f"지원하지 않는 동작: {action}"}}, status_code=404)
+        text = fake_completion(_gemini_prompt(await request.json()))
+        return await fake.respond("gemini", lambda: {
+            "candidates": [{
+                "content": {"parts": [{"text": text}], "role": "model"},
+                "finishReason": "STOP",
+                "index": 0,
+            }],
+            "usageMetadata": {"promptTokenCount": 200, "candidatesTokenCount": len(text), "totalTokenCount": 200 + len(text)},
+        })
+
+    # OpenAI 호환 (OpenRouter): POST /api/v1/chat/completions, /v1/chat/completions
+    @app.post("/api/v1/chat/completions")
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        payload = await request.json()
+        text = fake_completion(_chat_prompt(payload))
+        return await fake.respond("chat", lambda: {
+            "id": f"fake-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": payload.get("model", "fake"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": 200, "completion_tokens": len(text), "total_tokens": 200 + len(text)},
+        })
+
+    @app.get("/_fake/stats")
+    async def stats():
+        return {"uptime": time.time() - fake.started_at, "config": asdict(fake.config), "counts": dict(fake.counts)}
+
+    @app.post("/_fake/config")
+    async def update_config(request: Request):
+        try:
+            fake.update(await request.json())
+        except (ValueError, TypeError) as e:
+            return JSONResponse({"detail": str(e)}, status_code=400)
+        return asdict(fake.config)
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    return app
+
+def main(argv=None) -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="가짜 LLM 서버 (Gemini/OpenRouter 호환)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--latency-median", type=float, default=0.8, help="응답 지연 중앙값 (초)")
+    parser.add_argument("--latency-p99", type=float, default=5.0, help="응답 지연 p99 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="응답하지 않는(hang) 요청 비율")
+    parser.add_argument("--hang-seconds", type=float, default=60.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    config = FaultConfig(
+        latency_median=args.latency_median,
+        latency_p99=args.latency_p99,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+if __name__ == "__main__":
+    main()
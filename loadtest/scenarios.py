@@ -0,0 +1,245 @@
+"""
+가상 사용자 시나리오
+
+- record: 꿈 기록 (일부는 커뮤니티에 공유)
+- analyze: 꿈 기록 → 분석 요청 → 완료까지 폴링 또는 SSE 스트리밍
+- feed: 커뮤니티 피드/인기 태그/시각화 갤러리 탐색
+- dashboard: 꿈 목록, 통계, 일일 인사이트, 패턴 조회
+- ai_server: ai-server 꿈 분석 API 호출 (--ai-server-url 지정 시)
+
+요청 이름은 경로 템플릿(예: POST /dreams/{id}/analyze)으로 기록해 요청별로 집계
+"""
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from loadtest.stats import StatsCollector
+from typing import Awaitable, Callable, Dict, Optional
+import asyncio
+import httpx
+import random
+import time
+
+API_PREFIX = "/api/v1"
+
+DREAM_SENTENCES = [
+    "어두운 바닷가를 혼자 걷고 있었다",
+    "오래된 학교 복도에서 친구를 찾아 헤맸다",
+    "하늘을 날다가 갑자기 떨어지기 시작했다",
+    "누군가 나를 쫓아와서 계속 도망쳤다",
+    "돌아가신 할머니가 웃으며 밥을 차려주셨다",
+    "끝없이 이어지는 계단을 올라갔다",
+    "시험 시간에 늦어서 버스를 놓쳤다",
+    "물속에서도 숨을 쉴 수 있었다",
+    "낯선 도시의 골목에서 길을 잃었다",
+    "집 안의 문을 열 때마다 다른 방이 나왔다",
+]
+EMOTIONS = ["happy", "sad", "fearful", "peaceful", "excited", "confused", "nostalgic", "anxious", "calm"]
+SYMBOLS = ["바다", "계단", "학교", "물", "하늘", "문", "길", "집", "버스", "고양이"]
+TAGS = ["자각몽", "악몽", "비행", "물", "가족", "학교", "추격", "반복되는꿈"]
+TERMINAL_STAGES = {"completed", "failed"}
+
+@dataclass
+class ScenarioConfig:
+    base_url: str
+    ai_server_url: Optional[str] = None
+    wait_mode: str = "poll"  # poll | stream
+    poll_interval: float = 1.0
+    analysis_timeout: float = 120.0
+    think_time: float = 1.0  # 시나리오 사이 평균 대기 시간 (지수분포)
+    share_ratio: float = 0.3
+    weights: Dict[str, float] = field(default_factory=lambda: {
+        "record": 3, "analyze": 2, "feed": 4, "dashboard": 3, "ai_server": 1,
+    })
+
+class VirtualUser:
+    def __init__(self, index: int, run_id: str, client: httpx.AsyncClient, stats: StatsCollector,
+                 config: ScenarioConfig, rng: random.Random):
+        self.index = index
+        self.email = f"loadtest+{run_id}-{index}@example.com"
+        self.client = client
+        self.stats = stats
+        self.config = config
+        self.rng = rng
+        self.headers: Dict[str, str] = {}
+
+    async def request(self, method: str, path: str, name: str, base_url: Optional[str] = None,
+                      expected: tuple = (), **kwargs) -> Optional[httpx.Response]:
+        """요청 실행 후 기록 (4xx/5xx와 전송 오류는 실패로 집계, 실패 시 None 반환)"""
+        url = f"{base_url or self.config.base_url}{path}"
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, headers=self.headers, **kwargs)
+        except httpx.HTTPError as e:
+            self.stats.record(name, time.perf_counter() - started, type(e).__name__)
+            return None
+
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400 and response.status_code not in expected:
+            self.stats.record(name, elapsed, f"HTTP {response.status_code}")
+            return None
+        self.stats.record(name, elapsed)
+        return response
+
+    # 인증
+
+    async def login(self) -> bool:
+        """
+        부하 테스트 사용자 생성 후 로그인
+        이메일/비밀번호 가입 API가 없으므로 비밀번호 검증을 하지 않는 firebase 제공자로 가입
+        (이미 있는 사용자면 400이 오므로 무시)
+        """
+        await self.request(
+            "POST", f"{API_PREFIX}/auth/register", "POST /auth/register", expected=(400,),
+            json={"email": self.email, "auth_provider": "firebase", "display_name": f"부하테스트 {self.index}"},
+        )
+        response = await self.request(
+            "POST", f"{API_PREFIX}/auth/login", "POST /auth/login",
+            data={"username": self.email, "password": "loadtest"},
+        )
+        if response is None:
+            return False
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        return True
+
+    # 시나리오
+
+    def _dream_payload(self) -> Dict:
+        sentences = self.rng.sample(DREAM_SENTENCES, self.rng.randint(2, 5))
+        return {
+            "dream_date": (date.today() - timedelta(days=self.rng.randint(0, 6))).isoformat(),
+            "title": sentences[0][:30],
+            "body_text": ". ".join(sentences) + ".",
+            "lucidity_level": self.rng.randint(1, 5),
+            "emotion_tags": self.rng.sample(EMOTIONS, self.rng.randint(1, 3)),
+            "dream_type": self.rng.choice(["normal", "lucid", "nightmare", "recurring"]),
+            "sleep_quality": self.rng.randint(1, 5),
+            "symbols": self.rng.sample(SYMBOLS, self.rng.randint(0, 3)),
+        }
+
+    async def record_dream(self) -> Optional[str]:
+        payload = self._dream_payload()
+        response = await self.request("POST", f"{API_PREFIX}/dreams/", "POST /dreams/", json=payload)
+        if response is None:
+            return None
+        dream_id = response.json()["id"]
+
+        if self.rng.random() < self.config.share_ratio:
+            await self.request(
+                "POST", f"{API_PREFIX}/community/posts", "POST /community/posts",
+                json={"content": payload["body_text"], "tags": self.rng.sample(TAGS, 2), "dream_id": dream_id},
+            )
+        return dream_id
+
+    async def _wait_by_polling(self, task_id: str) -> str:
+        while True:
+            response = await self.request("GET", f"{API_PREFIX}/analysis/task/{task_id}", "GET /analysis/task/{id}")
+            if response is not None:
+                status = response.json()["status"]
+                if status in TERMINAL_STAGES:
+                    return status
+            await asyncio.sleep(self.config.poll_interval)
+
+    async def _wait_by_stream(self, dream_id: str) -> str:
+        name = "GET /dreams/{id}/analysis/events"
+        url = f"{self.config.base_url}{API_PREFIX}/dreams/{dream_id}/analysis/events"
+        started = time.perf_counter()
+        try:
+            async with self.client.stream("GET", url, headers=self.headers, timeout=None) as response:
+                if response.status_code >= 400:
+                    self.stats.record(name, time.perf_counter() - started, f"HTTP {response.status_code}")
+                    return "failed"
+                async for line in response.aiter_lines():
+                    if line.startswith("event: ") and line[len("event: "):] in TERMINAL_STAGES:
+                        self.stats.record(name, time.perf_counter() - started)
+                        return line[len("event: "):]
+        except httpx.HTTPError as e:
+            self.stats.record(name, time.perf_counter() - started, type(e).__name__)
+            return "failed"
+        self.stats.record(name, time.perf_counter() - started, "스트림 종료")
+        return "failed"
+
+    async def analyze_dream(self) -> None:
+        dream_id = await self.record_dream()
+        if dream_id is None:
+            return
+
+        started = time.perf_counter()
+        response = await self.request("POST", f"{API_PREFIX}/dreams/{dream_id}/analyze", "POST /dreams/{id}/analyze")
+        if response is None:
+            return
+
+        if self.config.wait_mode == "stream":
+            wait = self._wait_by_stream(dream_id)
+        else:
+            wait = self._wait_by_polling(response.json()["task_id"])
+
+        # 분석 요청부터 완료 이벤트까지 걸린 시간 (사용자가 체감하는 분석 대기 시간)
+        try:
+            status = await asyncio.wait_for(wait, self.config.analysis_timeout)
+        except asyncio.TimeoutError:
+            status = "timeout"
+        elapsed = time.perf_counter() - started
+        self.stats.record("flow: 분석 완료까지", elapsed, None if status == "completed" else f"분석 {status}")
+
+        if status == "completed":
+            await self.request("GET", f"{API_PREFIX}/dreams/{dream_id}/analysis", "GET /dreams/{id}/analysis")
+
+    async def browse_feed(self) -> None:
+        await self.request("GET", f"{API_PREFIX}/community/posts", "GET /community/posts",
+                           params={"skip": 0, "limit": 20})
+        await self.request("GET", f"{API_PREFIX}/community/tags/popular", "GET /community/tags/popular")
+        await self.request("GET", f"{API_PREFIX}/visualizations/gallery", "GET /visualizations/gallery",
+                           params={"skip": 0, "limit": 20})
+
+    async def open_dashboard(self) -> None:
+        started = time.perf_counter()
+        # 앱 대시보드는 아래 요청을 동시에 보냄
+        responses = await asyncio.gather(
+            self.request("GET", f"{API_PREFIX}/dreams/", "GET /dreams/", params={"skip": 0, "limit": 20}),
+            self.request("GET", f"{API_PREFIX}/dreams/stats/overview", "GET /dreams/stats/overview"),
+            self.request("GET", f"{API_PREFIX}/analysis/insights/daily", "GET /analysis/insights/daily"),
+            self.request("GET", f"{API_PREFIX}/analysis/patterns", "GET /analysis/patterns"),
+        )
+        failed = sum(response is None for response in responses)
+        self.stats.record("flow: 대시보드", time.perf_counter() - started, f"요청 {failed}건 실패" if failed else None)
+
+    async def ai_server_analyze(self) -> None:
+        payload = self._dream_payload()
+        await self.request(
+            "POST", "/api/v1/dreams/analyze", "ai-server POST /dreams/analyze", base_url=self.config.ai_server_url,
+            json={"dream_text": payload["body_text"], "dream_title": payload["title"],
+                  "emotion_tags": payload["emotion_tags"], "model": "dialogpt-small"},
+        )
+
+    def scenarios(self) -> Dict[str, Callable[[], Awaitable]]:
+        scenarios = {
+            "record": self.record_dream,
+            "analyze": self.analyze_dream,
+            "feed": self.browse_feed,
+            "dashboard": self.open_dashboard,
+        }
+        if self.config.ai_server_url:
+            scenarios["ai_server"] = self.ai_server_analyze
+        return scenarios
+
+    async def run(self, deadline: float) -> None:
+        """deadline(time.monotonic 기준)까지 가중치에 따라 시나리오를 골라 반복 실행"""
+        if not await self.login():
+            return
+        scenarios = self.scenarios()
+        names = [name for name in scenarios if self.config.weights.get(name, 0) > 0]
+        if not names:
+            return
+        weights = [self.config.weights[name] for name in names]
+
+        while time.monotonic() < deadline:
+            await scenarios[self.rng.choices(names, weights)[0]]()
+            if self.config.think_time > 0:
+                await asyncio.sleep(min(self.rng.expovariate(1 / self.config.think_time), max(deadline - time.monotonic(), 0)))
+
+def parse_weights(text: str) -> Dict[str, float]:
+    """'record=3,analyze=1' 형식 파싱"""
+    weights = {}
+    for item in filter(None, (part.strip() for part in text.split(","))):
+        name, _, value = item.partition("=")
+        weights[name.strip()] = float(value)
+    return weights
@@ -0,0 +1,94 @@
+"""
+부하 테스트 요청 결과 집계 (처리량, 지연 시간 백분위수, 오류율)
+"""
+from collections import Counter, defaultdict
+from typing import Any, Dict, List, Optional
+import time
+import unicodedata
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """선형 보간 백분위수 (sorted_values는 정렬된 상태)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+class StatsCollector:
+    """요청 이름(메서드 + 경로 템플릿)별 지연 시간과 오류 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, Counter] = defaultdict(Counter)
+        self.started_at = time.perf_counter()
+        self.finished_at: Optional[float] = None
+
+    def record(self, name: str, elapsed: float, error: Optional[str] = None) -> None:
+        self.latencies[name].append(elapsed)
+        if error:
+            self.errors[name][error] += 1
+
+    def reset(self) -> None:
+        """램프업 구간 결과를 버리고 측정 다시 시작"""
+        self.latencies.clear()
+        self.errors.clear()
+        self.started_at = time.perf_counter()
+
+    def stop(self) -> None:
+        self.finished_at = time.perf_counter()
+
+    @property
+    def duration(self) -> float:
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def _row(self, name: str, latencies: List[float], errors: Counter) -> Dict[str, Any]:
+        values = sorted(latencies)
+        failures = sum(errors.values())
+        return {
+            "name": name,
+            "requests": len(values),
+            "failures": failures,
+            "error_rate": failures / len(values) if values else 0.0,
+            "throughput": len(values) / self.duration if self.duration else 0.0,
+            "mean": sum(values) / len(values) if values else 0.0,
+            "p50": percentile(values, 0.50),
+            "p95": percentile(values, 0.95),
+            "p99": percentile(values, 0.99),
+            "max": values[-1] if values else 0.0,
+            "errors": dict(errors),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        rows = [self._row(name, self.latencies[name], self.errors[name]) for name in sorted(self.latencies)]
+        # 흐름(flow:*)은 개별 요청을 묶은 것이므로 전체 합계에서 제외
+        requests = [name for name in self.latencies if not name.startswith("flow:")]
+        total_errors: Counter = Counter()
+        for name in requests:
+            total_errors.update(self.errors[name])
+        total = self._row("전체", [value for name in requests for value in self.latencies[name]], total_errors)
+        return {"duration": self.duration, "requests": rows, "total": total}
+
+def _ljust(text: str, width: int) -> str:
+    """한글 등 전각 문자를 두 칸으로 계산해 왼쪽 정렬"""
+    display = sum(2 if unicodedata.east_asian_width(char) in "WF" else 1 for char in text)
+    return text + " " * max(width - display, 0)
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    header = (
+        f"{_ljust('요청', 48)} {'건수':>5} {'req/s':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'오류율':>5}"
+    )
+    lines = [header, "-" * 104]
+    for row in summary["requests"] + [summary["total"]]:
+        lines.append(
+            f"{_ljust(row['name'], 48)} {row['requests']:>7} {row['throughput']:>8.2f} "
+            f"{row['p50'] * 1000:>7.0f}ms {row['p95'] * 1000:>7.0f}ms {row['p99'] * 1000:>7.0f}ms "
+            f"{row['error_rate']:>7.2%}"
+        )
+    errors = [(row["name"], reason, count) for row in summary["requests"] for reason, count in row["errors"].items()]
+    if errors:
+        lines.append("")
+        lines.append("오류")
+        for name, reason, count in sorted(errors, key=lambda item: -item[2]):
+            lines.append(f"  {name}: {reason} × {count}")
+    return "\n".join(lines)